@@ -11,6 +11,9 @@ Usage:
     
     # Or run evaluations from command line
     python -m src.evaluation.run_evaluation --model gpt4 --type classification
+
+    # Dedicated background-job worker (set jobs.workers: 0 on web replicas)
+    python app.py worker --workers 4
 """
 
 import os
@@ -81,14 +84,15 @@ def run_cli_evaluation(
     model: str,
     evaluation_type: str,
     config_path: str = "config/settings.yaml",
-    save_results: bool = True
+    save_results: bool = True,
+    streaming: bool = False
 ):
     """Run evaluation from command line"""
     print(f"Running {evaluation_type} evaluation on {model}...")
     
     try:
         client = create_client_from_config(config_path)
-        evaluator = ModelEvaluator(client)
+        evaluator = ModelEvaluator(client, streaming=streaming)
         
         if evaluation_type == "classification":
             result = evaluator.evaluate_classification(model)
@@ -123,6 +127,9 @@ def run_cli_evaluation(
             print(f"  Mean:   {lm.mean_latency:.3f}s")
             print(f"  Median: {lm.median_latency:.3f}s")
             print(f"  P95:    {lm.p95_latency:.3f}s")
+            if lm.mean_ttft:
+                print(f"  TTFT p50/p95: {lm.p50_ttft:.3f}s / {lm.p95_ttft:.3f}s")
+                print(f"  Inter-token:  {lm.mean_inter_token_latency * 1000:.1f}ms")
             
         if save_results:
             result.save()
@@ -186,6 +193,7 @@ def main():
     eval_parser.add_argument("--type", required=True, choices=["classification", "dialog", "general"], help="Evaluation type")
     eval_parser.add_argument("--config", default="config/settings.yaml", help="Config file path")
     eval_parser.add_argument("--no-save", action="store_true", help="Don't save results")
+    eval_parser.add_argument("--stream", action="store_true", help="Stream completions to record TTFT and inter-token latency")
     
     # Compare command
     compare_parser = subparsers.add_parser("compare", help="Compare two models")
@@ -194,6 +202,11 @@ def main():
     compare_parser.add_argument("--type", default="classification", choices=["classification", "dialog", "general", "all"], help="Evaluation type (use 'all' to run all types)")
     compare_parser.add_argument("--config", default="config/settings.yaml", help="Config file path")
     
+    # Job worker command
+    worker_parser = subparsers.add_parser("worker", help="Run background jobs from the shared job store")
+    worker_parser.add_argument("--config", default="config/settings.yaml", help="Config file path")
+    worker_parser.add_argument("--workers", type=int, default=None, help="Concurrent jobs (default: jobs.workers from settings)")
+    
     args = parser.parse_args()
     
     setup_logging()
@@ -210,7 +223,8 @@ def main():
             model=args.model,
             evaluation_type=args.type,
             config_path=args.config,
-            save_results=not args.no_save
+            save_results=not args.no_save,
+            streaming=args.stream
         )
         
     elif args.command == "compare":
@@ -221,6 +235,13 @@ def main():
             config_path=args.config
         )
 
+    elif args.command == "worker":
+        from src.jobs.worker import main as run_job_worker
+        worker_args = ["--config", args.config]
+        if args.workers is not None:
+            worker_args += ["--workers", str(args.workers)]
+        run_job_worker(worker_args)
+
 
 if __name__ == "__main__":
     main()
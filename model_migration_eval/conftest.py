@@ -0,0 +1,11 @@
+"""pytest root: makes ``src.*`` importable and keeps discovery in ``tests/``."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# tools/test_*.py are manual scripts against live Azure endpoints
+collect_ignore_glob = ["tools/*", "samples/*"]
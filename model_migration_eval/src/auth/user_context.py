@@ -32,6 +32,7 @@ class UserContext:
         │   ├── tool_calling/
         │   └── topics/
         └── results/
+            └── checkpoints/
     """
 
     _DATA_TYPES = ("classification", "dialog", "general", "rag", "tool_calling")
@@ -59,6 +60,16 @@ class UserContext:
         """Evaluation / comparison results  (was: ``data/results/``)"""
         return self.base / "results"
 
+    @property
+    def checkpoints_dir(self) -> Path:
+        """Per-scenario checkpoint journals for resumable evaluation runs"""
+        return self.results_dir / "checkpoints"
+
+    @property
+    def result_store_dir(self) -> Path:
+        """Content-addressed results reused when inputs are unchanged"""
+        return self.results_dir / "result_store"
+
     @property
     def history_dir(self) -> Path:
         return self.prompts_dir / "history"
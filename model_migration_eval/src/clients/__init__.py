@@ -8,8 +8,18 @@ from .azure_openai import (
     CompletionResult,
     create_client_from_config
 )
+from .response_cache import ResponseCache, CacheMissError
+from .response_parser import ParsedResponse, parse_response
 from .tts_client import TTSClient, TTSConfig, TTSResult, load_tts_config_from_settings
-from .realtime_client import RealtimeClient, RealtimeConfig, RealtimeResult, is_realtime_available
+from .realtime_client import (
+    RealtimeClient,
+    RealtimeConfig,
+    RealtimeResult,
+    RealtimePoolConfig,
+    RealtimeSessionPool,
+    is_realtime_available,
+    load_realtime_pool_config_from_settings,
+)
 
 __all__ = [
     'AzureOpenAIClient',
@@ -17,6 +27,10 @@ __all__ = [
     'RequestMetrics',
     'CompletionResult',
     'create_client_from_config',
+    'ResponseCache',
+    'CacheMissError',
+    'ParsedResponse',
+    'parse_response',
     'TTSClient',
     'TTSConfig',
     'load_tts_config_from_settings',
@@ -24,5 +38,8 @@ __all__ = [
     'RealtimeClient',
     'RealtimeConfig',
     'RealtimeResult',
+    'RealtimePoolConfig',
+    'RealtimeSessionPool',
+    'load_realtime_pool_config_from_settings',
     'is_realtime_available',
 ]
@@ -8,7 +8,6 @@ import json
 import random
 import time
 import asyncio
-import hashlib
 import logging
 import threading
 import collections
@@ -29,7 +28,6 @@ import yaml
 import httpx
 from openai import AzureOpenAI, AsyncAzureOpenAI, OpenAI, AsyncOpenAI
 from openai.types.chat import ChatCompletion
-import diskcache
 
 # Azure Identity — optional; falls back to API key if not installed
 try:
@@ -38,9 +36,17 @@ try:
 except ImportError:
     _HAS_AZURE_IDENTITY = False
 
+from .rate_limiter import AdaptiveRateLimiter, estimate_request_tokens
+from .response_cache import CacheMissError, ResponseCache
+from .response_parser import ParsedResponse, parse_response
+
 logger = logging.getLogger(__name__)
 
 
+class _LeaderCancelled(Exception):
+    """Set on a single-flight future whose leader was cancelled."""
+
+
 @dataclass
 class ModelConfig:
     """Configuration for a specific model deployment"""
@@ -57,6 +63,8 @@ class ModelConfig:
     model_family: Optional[str] = None  # "gpt4", "gpt5", "mistral", "gemini", or "realtime" — determines prompt style guidelines
     backend: str = "azure"  # "azure" for Azure OpenAI, "gemini" for Google Gemini, "realtime" for Realtime API
     max_concurrent: Optional[int] = None  # Per-model concurrency limit (None → use global default)
+    rpm_limit: Optional[int] = None  # Deployment requests/minute quota (None → learn from x-ratelimit headers)
+    tpm_limit: Optional[int] = None  # Deployment tokens/minute quota (None → learn from x-ratelimit headers)
     # Realtime-specific settings (only used when backend="realtime")
     voice: Optional[str] = None  # TTS/realtime voice: "alloy", "echo", "shimmer", etc.
     turn_detection: Optional[str] = None  # "server_vad" or None for manual
@@ -75,6 +83,7 @@ class RequestMetrics:
     start_time: float
     end_time: float = 0.0
     ttft: float = 0.0  # Time to first token
+    inter_token_latency: float = 0.0  # Mean gap between streamed content chunks
     total_time: float = 0.0
     prompt_tokens: int = 0
     completion_tokens: int = 0
@@ -114,20 +123,17 @@ class CompletionResult:
     metrics: RequestMetrics
     raw_response: Optional[ChatCompletion] = None
     parsed_json: Optional[Dict] = None
+    parsed: Optional[ParsedResponse] = field(default=None, repr=False)
     
     def __post_init__(self):
-        """Try to parse content as JSON if possible"""
-        # Safety: if content arrived as dict (SDK v2 json_object mode), serialise it
-        if isinstance(self.content, dict):
-            self.parsed_json = self.content
-            self.content = json.dumps(self.content, ensure_ascii=False)
-        elif self.content is None:
-            self.content = ""
-        elif self.content and not self.parsed_json:
-            try:
-                self.parsed_json = json.loads(self.content)
-            except json.JSONDecodeError:
-                pass
+        """Parse the content once; metrics reuse ``self.parsed``."""
+        # SDK v2 json_object mode may hand us a dict — parse_response
+        # serialises it to the canonical text
+        if self.parsed is None:
+            self.parsed = parse_response(self.content)
+        self.content = self.parsed.text
+        if self.parsed_json is None and self.parsed.is_json:
+            self.parsed_json = self.parsed.data
 
 
 class AzureOpenAIClient:
@@ -256,7 +262,17 @@ class AzureOpenAIClient:
         self.metrics_history: collections.deque = collections.deque(maxlen=5000)
         
         # Cache setup
-        self._cache: Optional[diskcache.Cache] = None
+        self._cache: Optional[ResponseCache] = None
+
+        # Shared RPM/TPM budget per deployment — every evaluation, compare
+        # and consistency run against the same deployment draws from it.
+        self.rate_limiter = AdaptiveRateLimiter()
+
+        # Single-flight registry for identical deterministic async requests:
+        # (loop id, request key) → Future of the leader's CompletionResult
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        self._deduplicated_requests = 0
+        self._stats_lock = threading.Lock()  # counters are bumped from several loops/threads
 
         # Gemini OpenAI-compatible clients (lazy — created on first Gemini model use)
         self._gemini_client: Optional[OpenAI] = None
@@ -396,6 +412,10 @@ class AzureOpenAIClient:
     def register_model(self, name: str, config: ModelConfig):
         """Register a model configuration by name"""
         self.models[name] = config
+        if config.rpm_limit or config.tpm_limit:
+            self.rate_limiter.configure(
+                config.deployment_name, rpm=config.rpm_limit, tpm=config.tpm_limit,
+            )
         
     def register_models_from_config(self, config_path: str):
         """Load and register models from config file"""
@@ -411,9 +431,44 @@ class AzureOpenAIClient:
         logger.info("register_models_from_config: registered %d models: %s",
                      len(self.models), list(self.models.keys()))
             
-    def enable_caching(self, cache_dir: str = ".cache/prompts"):
-        """Enable response caching for repeated queries"""
-        self._cache = diskcache.Cache(cache_dir)
+    def enable_caching(
+        self,
+        cache_dir: str = ".cache/prompts",
+        ttl_seconds: Optional[float] = None,
+        size_limit_bytes: Optional[int] = None,
+        replay_only: bool = False,
+    ):
+        """Enable response caching for repeated queries.
+
+        Args:
+            cache_dir: Directory for the on-disk store.
+            ttl_seconds: Expire entries this long after they were written
+                (``None`` → never).
+            size_limit_bytes: Evict least-recently-used entries beyond this
+                size (``None`` → 1 GiB).
+            replay_only: Serve only cached responses; a miss, or any
+                request made without ``use_cache``, raises
+                ``CacheMissError`` instead of calling the API.
+        """
+        self._cache = ResponseCache(
+            cache_dir,
+            ttl_seconds=ttl_seconds,
+            size_limit_bytes=size_limit_bytes,
+            replay_only=replay_only,
+        )
+
+    @property
+    def replay_only(self) -> bool:
+        """True when only cached responses may be served (no API calls)."""
+        return self._cache is not None and self._cache.replay_only
+
+    def _refuse_uncached(self, model_name: str) -> None:
+        """Raise ``CacheMissError`` for a request that would bypass the cache in replay-only mode."""
+        if self.replay_only:
+            raise CacheMissError(
+                f"Replay-only mode: refusing uncached request to '{model_name}' — "
+                f"only cache-backed calls can be re-scored offline."
+            )
 
     @staticmethod
     def build_json_schema_format(name: str, schema: Dict[str, Any], strict: bool = True) -> Dict[str, Any]:
@@ -455,15 +510,56 @@ class AzureOpenAIClient:
             },
         }
         
-    def _get_cache_key(self, model: str, messages: List[Dict], **kwargs) -> str:
-        """Generate cache key from request parameters"""
-        cache_data = {
-            'model': model,
-            'messages': messages,
-            **kwargs
+    def _get_cache_key(self, config: ModelConfig, request_params: Dict[str, Any]) -> str:
+        """Generate cache key from the canonical request parameters.
+
+        Keys on exactly what is sent to the API (after the
+        system→developer swap, token-limit naming, etc.) plus the backend,
+        so any prompt, data or model-config change produces a new key.
+        """
+        return ResponseCache.make_key({'backend': config.backend, **request_params})
+
+    @staticmethod
+    def _result_to_cache(result: CompletionResult) -> Dict[str, Any]:
+        """Compact, JSON-serialisable form of a result for the cache."""
+        m = result.metrics
+        return {
+            'content': result.content,
+            'model': m.model,
+            'ttft': m.ttft,
+            'inter_token_latency': m.inter_token_latency,
+            'total_time': m.total_time,
+            'prompt_tokens': m.prompt_tokens,
+            'completion_tokens': m.completion_tokens,
+            'total_tokens': m.total_tokens,
+            'cached_tokens': m.cached_tokens,
+            'reasoning_tokens': m.reasoning_tokens,
         }
-        cache_str = json.dumps(cache_data, sort_keys=True)
-        return hashlib.sha256(cache_str.encode()).hexdigest()
+
+    @staticmethod
+    def _result_from_cache(payload: Dict[str, Any], model_name: str) -> CompletionResult:
+        """Rebuild a ``CompletionResult`` from a cached payload.
+
+        Timing and usage are those of the original call, so re-scoring a
+        replayed run reports the same latency/cost figures.
+        """
+        now = time.time()
+        metrics = RequestMetrics(
+            request_id=f"{model_name}_cached_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
+            model=payload.get('model', ''),
+            start_time=now,
+            end_time=now,
+            ttft=payload.get('ttft', 0.0),
+            inter_token_latency=payload.get('inter_token_latency', 0.0),
+            total_time=payload.get('total_time', 0.0),
+            prompt_tokens=payload.get('prompt_tokens', 0),
+            completion_tokens=payload.get('completion_tokens', 0),
+            total_tokens=payload.get('total_tokens', 0),
+            cached_tokens=payload.get('cached_tokens', 0),
+            reasoning_tokens=payload.get('reasoning_tokens', 0),
+            status="success",
+        )
+        return CompletionResult(content=payload.get('content', ''), metrics=metrics)
     
     def _is_gemini_backend(self, config: ModelConfig) -> bool:
         """Check if this model uses the Gemini OpenAI-compatible backend."""
@@ -743,12 +839,107 @@ class AzureOpenAIClient:
             
         if stream:
             request_params['stream'] = True
+            # Final chunk carries token usage (otherwise streamed calls report 0)
+            request_params['stream_options'] = {'include_usage': True}
             
         # Reasoning-model specific: reasoning_effort
         if reasoning_effort:
             request_params['reasoning_effort'] = reasoning_effort
         
         return request_params
+
+    # ------------------------------------------------------------------
+    # Rate-limited API calls (shared per-deployment RPM/TPM budget)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _usage_tokens(response: Any) -> Optional[int]:
+        usage = getattr(response, 'usage', None)
+        return getattr(usage, 'total_tokens', None) if usage else None
+
+    def _create_completion(self, active_client, config: ModelConfig, request_params: Dict[str, Any]):
+        """Call ``chat.completions.create`` under the deployment's rate budget.
+
+        Uses ``with_raw_response`` so the ``x-ratelimit-*`` headers can
+        feed the adaptive limiter, then returns the parsed completion.
+        """
+        deployment = config.deployment_name
+        estimated = estimate_request_tokens(request_params)
+        self.rate_limiter.acquire_sync(deployment, estimated)
+        raw = active_client.chat.completions.with_raw_response.create(**request_params)
+        self.rate_limiter.update_from_headers(deployment, raw.headers)
+        response = raw.parse()
+        actual = self._usage_tokens(response)
+        if actual is not None:
+            self.rate_limiter.settle(deployment, estimated, actual)
+        return response
+
+    async def _stream_completion_async(
+        self,
+        active_client,
+        config: ModelConfig,
+        request_params: Dict[str, Any],
+        metrics: RequestMetrics,
+    ) -> str:
+        """Consume a streamed completion, recording TTFT and inter-token latency.
+
+        Finalizes *metrics* (usage comes from the ``include_usage`` chunk)
+        and returns the concatenated content.
+        """
+        deployment = config.deployment_name
+        estimated = estimate_request_tokens(request_params)
+        await self.rate_limiter.acquire(deployment, estimated)
+        raw = await active_client.chat.completions.with_raw_response.create(**request_params)
+        self.rate_limiter.update_from_headers(deployment, raw.headers)
+        stream = raw.parse()
+
+        parts: List[str] = []
+        first_at = last_at = 0.0
+        chunk_count = 0
+        usage_chunk = None
+        try:
+            async for chunk in stream:
+                if getattr(chunk, 'usage', None):
+                    usage_chunk = chunk
+                if chunk.choices and chunk.choices[0].delta.content:
+                    now = time.time()
+                    if not chunk_count:
+                        first_at = now
+                        metrics.ttft = now - metrics.start_time
+                    last_at = now
+                    chunk_count += 1
+                    parts.append(chunk.choices[0].delta.content)
+        except BaseException:
+            # Cancelled (or failed) mid-stream: close the response now so
+            # the deployment stops generating tokens for a dead consumer.
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                try:
+                    await asyncio.shield(close())
+                except BaseException:
+                    pass
+            raise
+
+        metrics.finalize(completion=usage_chunk)
+        if usage_chunk is None:
+            metrics.status = "success"
+        if chunk_count > 1:
+            metrics.inter_token_latency = (last_at - first_at) / (chunk_count - 1)
+        if metrics.total_tokens:
+            self.rate_limiter.settle(deployment, estimated, metrics.total_tokens)
+        return "".join(parts)
+
+    async def _create_completion_async(self, active_client, config: ModelConfig, request_params: Dict[str, Any]):
+        """Async counterpart of :meth:`_create_completion`."""
+        deployment = config.deployment_name
+        estimated = estimate_request_tokens(request_params)
+        await self.rate_limiter.acquire(deployment, estimated)
+        raw = await active_client.chat.completions.with_raw_response.create(**request_params)
+        self.rate_limiter.update_from_headers(deployment, raw.headers)
+        response = raw.parse()
+        actual = self._usage_tokens(response)
+        if actual is not None:
+            self.rate_limiter.settle(deployment, estimated, actual)
+        return response
     
     def complete(
         self,
@@ -787,11 +978,14 @@ class AzureOpenAIClient:
         )
             
         # Check cache
+        cache_key = None
         if use_cache and self._cache:
-            cache_key = self._get_cache_key(model_name, messages, **request_params)
+            cache_key = self._get_cache_key(config, request_params)
             cached = self._cache.get(cache_key)
-            if cached:
-                return cached
+            if cached is not None:
+                return self._result_from_cache(cached, model_name)
+        else:
+            self._refuse_uncached(model_name)
         
         # Initialize metrics
         metrics = RequestMetrics(
@@ -809,7 +1003,7 @@ class AzureOpenAIClient:
                 active_client = self.client
 
             # Make the API call
-            response = active_client.chat.completions.create(**request_params)
+            response = self._create_completion(active_client, config, request_params)
             
             # Extract content — SDK v2 may return a parsed dict with
             # response_format={"type": "json_object"}, so normalise to str.
@@ -837,8 +1031,8 @@ class AzureOpenAIClient:
             )
             
             # Cache if enabled
-            if use_cache and self._cache:
-                self._cache.set(cache_key, result)
+            if cache_key:
+                self._cache.set(cache_key, self._result_to_cache(result))
                 
             # Store metrics
             self.metrics_history.append(metrics)
@@ -861,7 +1055,7 @@ class AzureOpenAIClient:
                     start_time=time.time(),
                 )
                 request_params["model"] = config.deployment_name
-                response = self.client.chat.completions.create(**request_params)
+                response = self._create_completion(self.client, config, request_params)
                 if isinstance(response, str):
                     raw_content = response
                 else:
@@ -875,8 +1069,8 @@ class AzureOpenAIClient:
                 metrics.finalize(completion=response if not isinstance(response, str) else None)
                 self.metrics_history.append(metrics)
                 result = CompletionResult(content=content, metrics=metrics, raw_response=response)
-                if use_cache and self._cache:
-                    self._cache.set(cache_key, result)
+                if cache_key:
+                    self._cache.set(cache_key, self._result_to_cache(result))
                 return result
             metrics.finalize(error=str(e))
             self.metrics_history.append(metrics)
@@ -888,9 +1082,22 @@ class AzureOpenAIClient:
         model_name: str = "gpt4",
         response_format: Optional[Dict] = None,
         tools: Optional[List[Dict]] = None,
+        use_cache: bool = False,
+        dedupe: bool = True,
         **kwargs
     ) -> CompletionResult:
-        """Async version of complete()"""
+        """Async version of complete()
+
+        ``use_cache`` consults the shared response cache (when enabled);
+        leave it off for calls that need an independent sample, such as
+        consistency repeats or generation retries.  In replay-only mode
+        such calls raise ``CacheMissError`` instead of reaching the API.
+
+        ``dedupe`` coalesces this call with an identical in-flight request
+        when the request is deterministic (``temperature == 0`` and a
+        ``seed`` is set) — both callers receive the same result.  Pass
+        ``dedupe=False`` when an independent sample is required.
+        """
         if model_name not in self.models:
             raise ValueError(f"Model '{model_name}' not registered.")
             
@@ -902,7 +1109,70 @@ class AzureOpenAIClient:
             tools=tools,
             **kwargs
         )
-            
+
+        cache_key = None
+        if use_cache and self._cache:
+            cache_key = self._get_cache_key(config, request_params)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return self._result_from_cache(cached, model_name)
+        else:
+            self._refuse_uncached(model_name)
+
+        if not (dedupe and self._is_deterministic_request(request_params)):
+            return await self._complete_async_request(config, model_name, request_params, cache_key)
+
+        # Single-flight: futures are loop-bound, so key on the running loop too
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), cache_key or self._get_cache_key(config, request_params))
+        joined = False
+        while True:
+            leader = self._inflight.get(flight_key)
+            if leader is None:
+                break
+            if not joined:
+                joined = True
+                with self._stats_lock:
+                    self._deduplicated_requests += 1
+            try:
+                return await asyncio.shield(leader)
+            except _LeaderCancelled:
+                # The leader's own caller was cancelled — the first follower
+                # to get here re-issues the request, the rest follow it
+                continue
+
+        future = loop.create_future()
+        self._inflight[flight_key] = future
+        try:
+            result = await self._complete_async_request(config, model_name, request_params, cache_key)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # Never cancel the shared future: followers (possibly other
+            # users' jobs) did not ask for it and take over instead
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved — followers re-raise it themselves
+            raise
+        finally:
+            self._inflight.pop(flight_key, None)
+
+    @staticmethod
+    def _is_deterministic_request(request_params: Dict[str, Any]) -> bool:
+        """True when identical requests should yield identical completions."""
+        return request_params.get('temperature') == 0 and request_params.get('seed') is not None
+
+    async def _complete_async_request(
+        self,
+        config: ModelConfig,
+        model_name: str,
+        request_params: Dict[str, Any],
+        cache_key: Optional[str] = None,
+    ) -> CompletionResult:
+        """Send one chat completion with transient-error retries and auth fallback."""
         # Gemini free tier is very restrictive (5 RPM, ~20 RPD) and
         # often returns 429/503.  We retry generously with exponential
         # backoff + jitter for ALL transient HTTP errors.
@@ -928,27 +1198,36 @@ class AzureOpenAIClient:
                 else:
                     active_client = self.async_client
 
-                response = await active_client.chat.completions.create(**request_params)
-                # Guard: very rarely the SDK returns a raw string instead
-                # of a ChatCompletion object (transient API edge case).
-                if isinstance(response, str):
-                    raw_content = response
-                else:
-                    raw_content = response.choices[0].message.content if response.choices else ""
-                if isinstance(raw_content, dict):
-                    content = json.dumps(raw_content, ensure_ascii=False)
-                elif raw_content is None:
-                    content = ""
+                if request_params.get('stream'):
+                    response = None
+                    content = await self._stream_completion_async(
+                        active_client, config, request_params, metrics,
+                    )
                 else:
-                    content = raw_content
-                metrics.finalize(completion=response if not isinstance(response, str) else None)
+                    response = await self._create_completion_async(active_client, config, request_params)
+                    # Guard: very rarely the SDK returns a raw string instead
+                    # of a ChatCompletion object (transient API edge case).
+                    if isinstance(response, str):
+                        raw_content = response
+                    else:
+                        raw_content = response.choices[0].message.content if response.choices else ""
+                    if isinstance(raw_content, dict):
+                        content = json.dumps(raw_content, ensure_ascii=False)
+                    elif raw_content is None:
+                        content = ""
+                    else:
+                        content = raw_content
+                    metrics.finalize(completion=response if not isinstance(response, str) else None)
                 self.metrics_history.append(metrics)
 
-                return CompletionResult(
+                result = CompletionResult(
                     content=content,
                     metrics=metrics,
                     raw_response=response
                 )
+                if cache_key:
+                    self._cache.set(cache_key, self._result_to_cache(result))
+                return result
             except Exception as e:
                 # --- Transient errors (429/5xx) → retry with backoff + jitter ---
                 from openai import APIStatusError
@@ -974,6 +1253,10 @@ class AzureOpenAIClient:
                     # Try to honour the server's suggested retry delay
                     _default_wait = min(2 ** _attempt * 2, 120)
                     wait = self._parse_retry_after(e, default=_default_wait)
+                    # Pause every caller sharing this deployment, not just
+                    # this one, so concurrent tasks don't pile more 429s on.
+                    if _status == 429:
+                        self.rate_limiter.penalize(config.deployment_name, wait)
                     # Gemini free tier (5 RPM): enforce minimum spacing so
                     # we don't immediately hit the per-minute limit again.
                     if _is_gemini:
@@ -1006,24 +1289,62 @@ class AzureOpenAIClient:
                         start_time=time.time(),
                     )
                     request_params["model"] = config.deployment_name
-                    response = await self.async_client.chat.completions.create(**request_params)
-                    if isinstance(response, str):
-                        raw_content = response
-                    else:
-                        raw_content = response.choices[0].message.content if response.choices else ""
-                    if isinstance(raw_content, dict):
-                        content = json.dumps(raw_content, ensure_ascii=False)
-                    elif raw_content is None:
-                        content = ""
+                    if request_params.get('stream'):
+                        response = None
+                        content = await self._stream_completion_async(
+                            self.async_client, config, request_params, metrics,
+                        )
                     else:
-                        content = raw_content
-                    metrics.finalize(completion=response if not isinstance(response, str) else None)
+                        response = await self._create_completion_async(self.async_client, config, request_params)
+                        if isinstance(response, str):
+                            raw_content = response
+                        else:
+                            raw_content = response.choices[0].message.content if response.choices else ""
+                        if isinstance(raw_content, dict):
+                            content = json.dumps(raw_content, ensure_ascii=False)
+                        elif raw_content is None:
+                            content = ""
+                        else:
+                            content = raw_content
+                        metrics.finalize(completion=response if not isinstance(response, str) else None)
                     self.metrics_history.append(metrics)
-                    return CompletionResult(content=content, metrics=metrics, raw_response=response)
+                    result = CompletionResult(content=content, metrics=metrics, raw_response=response)
+                    if cache_key:
+                        self._cache.set(cache_key, self._result_to_cache(result))
+                    return result
                 metrics.finalize(error=str(e))
                 self.metrics_history.append(metrics)
                 raise
             
+    async def stream_complete_async(
+        self,
+        messages: List[Dict[str, str]],
+        model_name: str = "gpt4",
+        response_format: Optional[Dict] = None,
+        tools: Optional[List[Dict]] = None,
+        use_cache: bool = False,
+        dedupe: bool = True,
+        **kwargs
+    ) -> CompletionResult:
+        """Streaming variant of :meth:`complete_async`.
+
+        The response is streamed (with ``stream_options.include_usage``) so
+        the returned ``CompletionResult`` carries ``metrics.ttft`` and
+        ``metrics.inter_token_latency`` in addition to the usual token
+        counts.  Retries, rate limiting, caching and single-flight behave
+        exactly as in :meth:`complete_async`.
+        """
+        return await self.complete_async(
+            messages,
+            model_name=model_name,
+            response_format=response_format,
+            tools=tools,
+            use_cache=use_cache,
+            dedupe=dedupe,
+            stream=True,
+            **kwargs
+        )
+
     def stream_complete(
         self,
         messages: List[Dict[str, str]],
@@ -1044,6 +1365,7 @@ class AzureOpenAIClient:
             
         config = self.models[model_name]
         
+        self._refuse_uncached(model_name)
         request_params = self._build_request_params(
             config, messages, stream=True, **kwargs
         )
@@ -1065,9 +1387,17 @@ class AzureOpenAIClient:
             else:
                 active_client = self.client
 
-            stream = active_client.chat.completions.create(**request_params)
+            deployment = config.deployment_name
+            estimated = estimate_request_tokens(request_params)
+            self.rate_limiter.acquire_sync(deployment, estimated)
+            raw = active_client.chat.completions.with_raw_response.create(**request_params)
+            self.rate_limiter.update_from_headers(deployment, raw.headers)
+            stream = raw.parse()
+            usage_chunk = None
             
             for chunk in stream:
+                if getattr(chunk, 'usage', None):
+                    usage_chunk = chunk
                 if chunk.choices and chunk.choices[0].delta.content:
                     content = chunk.choices[0].delta.content
                     
@@ -1078,9 +1408,10 @@ class AzureOpenAIClient:
                     full_content += content
                     yield content
                     
-            metrics.end_time = time.time()
-            metrics.total_time = metrics.end_time - metrics.start_time
+            metrics.finalize(completion=usage_chunk)
             metrics.status = "success"
+            if metrics.total_tokens:
+                self.rate_limiter.settle(deployment, estimated, metrics.total_tokens)
             self.metrics_history.append(metrics)
             
             return CompletionResult(content=full_content, metrics=metrics)
@@ -1092,8 +1423,9 @@ class AzureOpenAIClient:
             
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary statistics of all requests"""
+        cache_stats = self._cache.stats() if self._cache else {"enabled": False}
         if not self.metrics_history:
-            return {"total_requests": 0}
+            return {"total_requests": 0, "cache": cache_stats}
             
         successful = [m for m in self.metrics_history if m.status == "success"]
         
@@ -1101,7 +1433,8 @@ class AzureOpenAIClient:
             return {
                 "total_requests": len(self.metrics_history),
                 "successful_requests": 0,
-                "error_rate": 1.0
+                "error_rate": 1.0,
+                "cache": cache_stats,
             }
             
         import numpy as np
@@ -1123,7 +1456,10 @@ class AzureOpenAIClient:
             "tokens": {
                 "total": sum(tokens),
                 "mean_per_request": sum(tokens) / len(tokens)
-            }
+            },
+            "deduplicated_requests": self._deduplicated_requests,
+            "rate_limits": self.rate_limiter.snapshot(),
+            "cache": cache_stats,
         }
         
     def clear_metrics(self):
@@ -1159,7 +1495,13 @@ def create_client_from_config(config_path: str = "config/settings.yaml") -> Azur
     # Cache settings
     cache_config = config.get('caching', {})
     if cache_config.get('enabled', False):
-        client.enable_caching(cache_config.get('cache_dir', '.cache/prompts'))
+        size_mb = cache_config.get('size_limit_mb')
+        client.enable_caching(
+            cache_config.get('cache_dir', '.cache/prompts'),
+            ttl_seconds=cache_config.get('ttl_seconds'),
+            size_limit_bytes=int(size_mb * 1024 * 1024) if size_mb else None,
+            replay_only=bool(cache_config.get('replay_only', False)),
+        )
         
     return client
 
@@ -0,0 +1,299 @@
+"""
+Adaptive Per-Deployment Rate Limiter
+====================================
+
+Shared request/token budget for every call that targets the same Azure
+OpenAI deployment.  One ``AdaptiveRateLimiter`` is owned by
+``AzureOpenAIClient`` so that concurrent evaluations, batch comparisons
+and consistency runs all draw from the **same** RPM/TPM quota instead of
+each holding its own semaphore.
+
+Each deployment gets two token buckets:
+
+* **requests** — capacity = requests-per-minute, refilled continuously
+* **tokens**   — capacity = tokens-per-minute, charged with the estimated
+  prompt tokens plus ``max_tokens`` and refunded once real usage is known
+
+Limits can be seeded from ``ModelConfig.rpm_limit`` / ``tpm_limit``; when
+unset they are learned from the ``x-ratelimit-*`` response headers.  A
+429 pauses the whole deployment until its ``Retry-After`` elapses and
+shrinks the learned capacity so the next window starts below the ceiling.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WINDOW_SECONDS = 60.0
+_BACKOFF_FACTOR = 0.9       # multiplicative decrease applied on 429
+_MAX_WAIT_SLICE = 1.0       # re-check the bucket at least once per second
+
+
+@dataclass
+class _Bucket:
+    """Continuous-refill token bucket (capacity per 60 s window)."""
+    capacity: Optional[float] = None   # None → unlimited until learned
+    level: float = 0.0
+    updated: float = field(default_factory=time.monotonic)
+
+    def refill(self, now: float) -> None:
+        if self.capacity is None:
+            return
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.level = min(
+                self.capacity,
+                self.level + elapsed * self.capacity / _WINDOW_SECONDS,
+            )
+        self.updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until *amount* units are available (0 when ready)."""
+        if self.capacity is None:
+            return 0.0
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) * _WINDOW_SECONDS / self.capacity
+
+    def set_capacity(self, capacity: float) -> None:
+        if capacity <= 0:
+            return
+        if self.capacity is None:
+            self.level = capacity
+        self.capacity = capacity
+        self.level = min(self.level, capacity)
+
+
+@dataclass
+class _DeploymentState:
+    requests: _Bucket = field(default_factory=_Bucket)
+    tokens: _Bucket = field(default_factory=_Bucket)
+    blocked_until: float = 0.0
+    throttled: int = 0
+    waited_seconds: float = 0.0
+
+
+class AdaptiveRateLimiter:
+    """RPM + TPM limiter keyed by deployment name.
+
+    Thread-safe: state is guarded by a ``threading.Lock`` so the sync
+    :meth:`acquire_sync` path (Flask request threads) and the async
+    :meth:`acquire` path (shared evaluation loop) share one budget.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: Dict[str, _DeploymentState] = {}
+        # Shared in-flight caps: loop → {deployment: (Semaphore, limit)}.
+        # Weak keys drop a loop's semaphores once the loop is gone.
+        self._semaphores: "weakref.WeakKeyDictionary[Any, Dict[str, Tuple[asyncio.Semaphore, int]]]" = \
+            weakref.WeakKeyDictionary()
+
+    # ── Configuration ───────────────────────────────────────────────────
+
+    def _state(self, deployment: str) -> _DeploymentState:
+        state = self._states.get(deployment)
+        if state is None:
+            state = self._states[deployment] = _DeploymentState()
+        return state
+
+    def configure(
+        self,
+        deployment: str,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+    ) -> None:
+        """Seed static limits for *deployment* (learned values override later)."""
+        with self._lock:
+            state = self._state(deployment)
+            if rpm:
+                state.requests.set_capacity(float(rpm))
+            if tpm:
+                state.tokens.set_capacity(float(tpm))
+
+    def semaphore(self, deployment: str, limit: int) -> asyncio.Semaphore:
+        """Return the in-flight cap shared by every caller on this loop.
+
+        ``asyncio.Semaphore`` binds to the running loop, so semaphores are
+        kept per loop (weakly, so closed loops do not pin them);
+        evaluations normally share the single background loop and
+        therefore share one semaphore per deployment.  When callers ask
+        for different limits the largest one applies: raising the limit
+        releases the extra slots into the existing semaphore.
+
+        Must be called from a coroutine (outside a running loop there is
+        nothing to share, so a private semaphore is returned).
+        """
+        limit = max(1, limit)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.Semaphore(limit)
+        with self._lock:
+            per_loop = self._semaphores.get(loop)
+            if per_loop is None:
+                per_loop = self._semaphores[loop] = {}
+            entry = per_loop.get(deployment)
+            if entry is None:
+                sem = asyncio.Semaphore(limit)
+                per_loop[deployment] = (sem, limit)
+                return sem
+            sem, current = entry
+            if limit > current:
+                for _ in range(limit - current):
+                    sem.release()
+                per_loop[deployment] = (sem, limit)
+            return sem
+
+    # ── Acquire ─────────────────────────────────────────────────────────
+
+    def _try_reserve(self, deployment: str, tokens: int) -> float:
+        """Reserve budget if available; otherwise return seconds to wait."""
+        with self._lock:
+            state = self._state(deployment)
+            now = time.monotonic()
+            if state.blocked_until > now:
+                return state.blocked_until - now
+            state.requests.refill(now)
+            state.tokens.refill(now)
+            wait = max(state.requests.wait_for(1), state.tokens.wait_for(tokens))
+            if wait > 0:
+                return wait
+            if state.requests.capacity is not None:
+                state.requests.level -= 1
+            if state.tokens.capacity is not None:
+                state.tokens.level -= min(tokens, state.tokens.capacity)
+            return 0.0
+
+    def _record_wait(self, deployment: str, seconds: float) -> None:
+        with self._lock:
+            self._state(deployment).waited_seconds += seconds
+
+    async def acquire(self, deployment: str, tokens: int = 0) -> None:
+        """Wait until one request and *tokens* tokens fit the budget."""
+        waited = 0.0
+        while True:
+            wait = self._try_reserve(deployment, tokens)
+            if wait <= 0:
+                break
+            wait = min(wait, _MAX_WAIT_SLICE)
+            waited += wait
+            await asyncio.sleep(wait)
+        if waited:
+            self._record_wait(deployment, waited)
+
+    def acquire_sync(self, deployment: str, tokens: int = 0) -> None:
+        """Blocking variant of :meth:`acquire` for the sync client."""
+        waited = 0.0
+        while True:
+            wait = self._try_reserve(deployment, tokens)
+            if wait <= 0:
+                break
+            wait = min(wait, _MAX_WAIT_SLICE)
+            waited += wait
+            time.sleep(wait)
+        if waited:
+            self._record_wait(deployment, waited)
+
+    # ── Feedback ────────────────────────────────────────────────────────
+
+    def settle(self, deployment: str, estimated: int, actual: int) -> None:
+        """Refund (or charge) the difference between estimated and real usage."""
+        with self._lock:
+            bucket = self._state(deployment).tokens
+            if bucket.capacity is None:
+                return
+            bucket.level = min(bucket.capacity, bucket.level + (estimated - actual))
+
+    def update_from_headers(self, deployment: str, headers: Optional[Mapping[str, Any]]) -> None:
+        """Adapt the buckets to the server's ``x-ratelimit-*`` headers.
+
+        ``x-ratelimit-limit-*`` (when present) sets the capacity directly.
+        Otherwise the largest ``remaining`` value seen is used as the
+        capacity estimate, and the current level is clamped to what the
+        server says is actually left so we never run ahead of the quota.
+        """
+        if not headers:
+            return
+
+        def _header(name: str) -> Optional[float]:
+            try:
+                value = headers.get(name)
+                return float(value) if value not in (None, "") else None
+            except (TypeError, ValueError):
+                return None
+
+        with self._lock:
+            state = self._state(deployment)
+            now = time.monotonic()
+            for bucket, kind in ((state.requests, "requests"), (state.tokens, "tokens")):
+                limit = _header(f"x-ratelimit-limit-{kind}")
+                remaining = _header(f"x-ratelimit-remaining-{kind}")
+                if limit:
+                    bucket.set_capacity(limit)
+                elif remaining is not None and (bucket.capacity is None or remaining > bucket.capacity):
+                    bucket.set_capacity(remaining)
+                if remaining is not None and bucket.capacity is not None:
+                    bucket.refill(now)
+                    bucket.level = min(bucket.level, remaining)
+
+    def penalize(self, deployment: str, retry_after: float) -> None:
+        """Pause the deployment after a 429 and back off its capacity."""
+        with self._lock:
+            state = self._state(deployment)
+            now = time.monotonic()
+            state.blocked_until = max(state.blocked_until, now + max(0.0, retry_after))
+            state.throttled += 1
+            for bucket in (state.requests, state.tokens):
+                if bucket.capacity is not None:
+                    bucket.capacity = max(1.0, bucket.capacity * _BACKOFF_FACTOR)
+                    bucket.level = 0.0
+                    bucket.updated = now
+        logger.info(
+            "Rate limiter: %s throttled — pausing %.1fs", deployment, retry_after,
+        )
+
+    # ── Introspection ───────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the current limits per deployment (for metrics/UI)."""
+        with self._lock:
+            now = time.monotonic()
+            out: Dict[str, Dict[str, Any]] = {}
+            for name, state in self._states.items():
+                state.requests.refill(now)
+                state.tokens.refill(now)
+                out[name] = {
+                    "rpm_limit": state.requests.capacity,
+                    "tpm_limit": state.tokens.capacity,
+                    "requests_available": state.requests.level if state.requests.capacity else None,
+                    "tokens_available": state.tokens.level if state.tokens.capacity else None,
+                    "throttled": state.throttled,
+                    "waited_seconds": round(state.waited_seconds, 3),
+                    "paused_for": max(0.0, state.blocked_until - now),
+                }
+            return out
+
+
+def estimate_request_tokens(request_params: Dict[str, Any]) -> int:
+    """Rough token cost of a chat request: prompt chars / 4 plus the output cap."""
+    chars = 0
+    for msg in request_params.get("messages", []) or []:
+        content = msg.get("content", "")
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict):
+                    chars += len(str(part.get("text", "")))
+    for tool in request_params.get("tools", []) or []:
+        chars += len(str(tool))
+    max_out = request_params.get("max_completion_tokens") or request_params.get("max_tokens") or 0
+    return chars // 4 + int(max_out)
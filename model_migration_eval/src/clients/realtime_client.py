@@ -8,17 +8,30 @@ Provides an async WebSocket client for the Azure OpenAI Realtime API
 The client manages a single WebSocket session, sends PCM16 audio,
 and collects the response transcript plus any tool-call events.
 
-Architecture note: each evaluation scenario creates a fresh session
-because the system instructions differ per scenario/task.
+Sessions can be pooled (:class:`RealtimeSessionPool`): warm connections
+are kept per deployment and voice, the conversation items of a finished
+scenario are deleted before the connection is reused, and
+``session.update`` is only re-sent when the session configuration
+(instructions, tools, voice, …) differs from what the connection already
+has.  ``ws_connect_time_ms`` reports the handshake on its own (0 for a
+reused connection) and is not part of ``session_time_ms`` /
+``time_to_first_audio_ms``, which measure the model turn only.
 """
 
 import asyncio
-import base64
 import json
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from ..utils.audio_utils import (
+    AudioBuffer,
+    AudioSegment,
+    BYTES_PER_SECOND,
+    PCMBuffer,
+    iter_b64_frames,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -71,7 +84,8 @@ class RealtimeToolCall:
 class RealtimeResult:
     """Result from a single Realtime API interaction."""
     transcript: str = ""
-    audio_data: bytes = b""
+    audio_data: AudioBuffer = b""   # empty when sent with keep_audio=False
+    output_audio_bytes: int = 0     # counted even when the audio is discarded
     tool_calls: List[RealtimeToolCall] = field(default_factory=list)
     # Timing
     session_time_ms: float = 0.0
@@ -84,6 +98,152 @@ class RealtimeResult:
     output_audio_tokens: int = 0
     # Response status ("completed", "incomplete", "cancelled", "failed")
     response_status: str = ""
+    # Pooling — whether a warm connection was reused and whether a
+    # session.update had to be sent for this scenario
+    session_reused: bool = False
+    session_updated: bool = True
+
+    @property
+    def output_audio_duration_ms(self) -> float:
+        return self.output_audio_bytes / BYTES_PER_SECOND * 1000.0
+
+
+@dataclass
+class RealtimePoolConfig:
+    """Session pool settings (``settings.yaml → realtime.session_pool``)."""
+    enabled: bool = True
+    max_idle_per_deployment: int = 4
+    max_session_age_seconds: float = 1500.0   # service caps sessions at 30 min
+    idle_timeout_seconds: float = 120.0
+
+
+def load_realtime_pool_config_from_settings(settings: dict) -> RealtimePoolConfig:
+    """Build a ``RealtimePoolConfig`` from the ``realtime.session_pool`` section."""
+    pool_cfg = settings.get('realtime', {}).get('session_pool', {}) or {}
+    return RealtimePoolConfig(
+        enabled=bool(pool_cfg.get('enabled', True)),
+        max_idle_per_deployment=max(0, int(pool_cfg.get('max_idle_per_deployment', 4))),
+        max_session_age_seconds=float(pool_cfg.get('max_session_age_seconds', 1500.0)),
+        idle_timeout_seconds=float(pool_cfg.get('idle_timeout_seconds', 120.0)),
+    )
+
+
+def _session_payload(config: RealtimeConfig) -> Dict[str, Any]:
+    """The ``session`` object sent with ``session.update`` for *config*."""
+    session: Dict[str, Any] = {
+        "modalities": config.modalities or ["text", "audio"],
+        "instructions": config.instructions,
+        "voice": config.voice,
+        "input_audio_format": config.input_audio_format,
+        "output_audio_format": config.output_audio_format,
+        "temperature": config.temperature,
+        "max_response_output_tokens": config.max_response_output_tokens,
+        # None → manual mode (we commit the buffer ourselves)
+        "turn_detection": config.turn_detection or None,
+    }
+    if config.tools:
+        session["tools"] = config.tools
+    return session
+
+
+def _is_open(ws) -> bool:
+    state = getattr(ws, "state", None)
+    return state is None or getattr(state, "name", "OPEN") == "OPEN"
+
+
+# ── Session pool ────────────────────────────────────────────────────────────
+
+class _PooledSession:
+    """A live WebSocket plus what has been configured on it."""
+
+    __slots__ = ("ws", "key", "session_key", "created", "last_used")
+
+    def __init__(self, ws, key: Tuple[int, str, str]):
+        self.ws = ws
+        self.key = key                      # (loop id, deployment, voice)
+        self.session_key: Optional[str] = None
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+
+class RealtimeSessionPool:
+    """Warm Realtime connections keyed by (event loop, deployment, voice).
+
+    The voice is part of the key because the service refuses to change it
+    once a session has produced audio.  Connections are bound to the loop
+    that opened them, so callers on another loop never see them.  Idle
+    connections past ``idle_timeout_seconds`` or older than
+    ``max_session_age_seconds`` are closed instead of being reused.
+    """
+
+    def __init__(self, config: Optional[RealtimePoolConfig] = None):
+        self.config = config or RealtimePoolConfig()
+        self._idle: Dict[Tuple[int, str, str], List[_PooledSession]] = {}
+        self._closing: Set["asyncio.Task"] = set()
+        self._stats = {"connects": 0, "reuses": 0, "session_updates": 0, "discarded": 0}
+
+    @staticmethod
+    def _key(deployment: str, voice: str) -> Tuple[int, str, str]:
+        return (id(asyncio.get_running_loop()), deployment, voice)
+
+    def _usable(self, sess: _PooledSession, now: float) -> bool:
+        return (
+            _is_open(sess.ws)
+            and now - sess.created < self.config.max_session_age_seconds
+            and now - sess.last_used < self.config.idle_timeout_seconds
+        )
+
+    def take(self, deployment: str, voice: str, session_key: str) -> Optional[_PooledSession]:
+        """Pop an idle session, preferring one already configured with *session_key*."""
+        idle = self._idle.get(self._key(deployment, voice))
+        if not idle:
+            return None
+        now = time.monotonic()
+        for sess in [s for s in idle if not self._usable(s, now)]:
+            idle.remove(sess)
+            self.discard(sess)
+        if not idle:
+            return None
+        match = next((s for s in reversed(idle) if s.session_key == session_key), None)
+        sess = match or idle[-1]
+        idle.remove(sess)
+        self._stats["reuses"] += 1
+        return sess
+
+    def put(self, sess: _PooledSession) -> None:
+        """Return a clean session to the pool (or close it when full)."""
+        sess.last_used = time.monotonic()
+        idle = self._idle.setdefault(sess.key, [])
+        if len(idle) >= self.config.max_idle_per_deployment or not _is_open(sess.ws):
+            self.discard(sess)
+            return
+        idle.append(sess)
+
+    def discard(self, sess: _PooledSession) -> None:
+        """Close *sess* in the background."""
+        self._stats["discarded"] += 1
+        task = asyncio.ensure_future(self._close(sess.ws))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(ws) -> None:
+        try:
+            await ws.close()
+        except Exception as e:
+            logger.debug("Closing pooled Realtime session failed: %s", e)
+
+    async def close(self) -> None:
+        """Close every idle session owned by the running loop."""
+        loop_id = id(asyncio.get_running_loop())
+        for key in [k for k in self._idle if k[0] == loop_id]:
+            for sess in self._idle.pop(key):
+                await self._close(sess.ws)
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats, idle=sum(len(v) for v in self._idle.values()))
+
+
 
 
 # ── Client ──────────────────────────────────────────────────────────────────
@@ -103,26 +263,32 @@ class RealtimeClient:
         api_key: Optional[str] = None,
         api_version: str = "2025-04-01-preview",
         token_provider=None,
+        session_pool: Optional[RealtimeSessionPool] = None,
     ):
         if not _WS_AVAILABLE:
             raise RuntimeError(
                 "websockets package not installed.  "
                 "Install with: pip install websockets>=12.0"
             )
-        # Normalize endpoint: remove trailing slash, strip https://
+        # Normalize endpoint: remove trailing slash, strip the scheme.
+        # Plain http:// / ws:// (e.g. the local emulator) keeps an
+        # unencrypted socket; everything else uses wss://
         self._endpoint = endpoint.rstrip("/")
-        if self._endpoint.startswith("https://"):
-            self._endpoint = self._endpoint[len("https://"):]
-        elif self._endpoint.startswith("http://"):
-            self._endpoint = self._endpoint[len("http://"):]
+        self._scheme = "wss"
+        for prefix, scheme in (("https://", "wss"), ("http://", "ws"), ("wss://", "wss"), ("ws://", "ws")):
+            if self._endpoint.startswith(prefix):
+                self._endpoint = self._endpoint[len(prefix):]
+                self._scheme = scheme
+                break
         self._api_key = api_key
         self._api_version = api_version
         self._token_provider = token_provider
+        self._pool = session_pool
 
     def _build_ws_url(self, deployment: str) -> str:
         """Build the WebSocket URL for a Realtime session."""
         return (
-            f"wss://{self._endpoint}/openai/realtime"
+            f"{self._scheme}://{self._endpoint}/openai/realtime"
             f"?api-version={self._api_version}"
             f"&deployment={deployment}"
         )
@@ -136,186 +302,98 @@ class RealtimeClient:
             return {"api-key": self._api_key}
         return {}
 
+    async def _connect(self, deployment: str):
+        """Open a new WebSocket to *deployment*."""
+        return await websockets.connect(
+            self._build_ws_url(deployment),
+            additional_headers=self._build_headers(),
+            open_timeout=60,
+            close_timeout=10,
+            max_size=16 * 1024 * 1024,  # 16 MB
+        )
+
     async def send_audio(
         self,
-        audio_data: bytes,
+        audio_data: Union[AudioSegment, AudioBuffer],
         config: RealtimeConfig,
         timeout: float = 60.0,
         max_retries: int = 3,
+        pooled: Optional[bool] = None,
+        keep_audio: bool = True,
     ) -> RealtimeResult:
-        """Open a session, send audio, and collect the response.
+        """Send audio on a (pooled or fresh) session and collect the response.
 
         Args:
-            audio_data: Raw PCM16 audio bytes to send.
+            audio_data: PCM16 audio to send — an ``AudioSegment`` (whose
+                pre-encoded base64, when cached, is framed without
+                re-encoding) or raw bytes / a memoryview.
             config: Session configuration (instructions, tools, etc.).
             timeout: Maximum seconds to wait for a complete response.
             max_retries: Number of retries for transient connection failures.
+            pooled: Use the session pool (default: whenever the client has
+                an enabled one).  Pass ``False`` from a throwaway event
+                loop (``asyncio.run``) — pooled connections are bound to
+                the loop that opened them.
+            keep_audio: Keep the response audio in ``audio_data``.  With
+                ``False`` deltas are only counted (``output_audio_bytes``)
+                — enough when only the transcript is scored.
 
         Returns:
             RealtimeResult with transcript, tool calls, and metrics.
         """
-        result = RealtimeResult()
-        url = self._build_ws_url(config.deployment_name)
-        headers = self._build_headers()
-
-        t_start = time.perf_counter()
-        t_first_audio = None
-
-        for attempt in range(1, max_retries + 1):
+        pool = self._pool if pooled is not False and self._pool and self._pool.config.enabled else None
+        payload = _session_payload(config)
+        session_key = json.dumps(payload, sort_keys=True)
+
+        attempt = 0
+        while True:
+            result = RealtimeResult()
+            sess = pool.take(config.deployment_name, config.voice, session_key) if pool else None
+            reused = sess is not None
+            reusable = False
+            if not reused:
+                attempt += 1
+            t_start = time.perf_counter()
             try:
-                t_ws_start = time.perf_counter()
-                async with websockets.connect(
-                    url,
-                    additional_headers=headers,
-                    open_timeout=60,
-                    close_timeout=10,
-                    max_size=16 * 1024 * 1024,  # 16 MB
-                ) as ws:
-                    result.ws_connect_time_ms = (time.perf_counter() - t_ws_start) * 1000
-
-                    # 1. Configure session
-                    session_update = {
-                        "type": "session.update",
-                        "session": {
-                            "modalities": config.modalities or ["text", "audio"],
-                            "instructions": config.instructions,
-                            "voice": config.voice,
-                            "input_audio_format": config.input_audio_format,
-                            "output_audio_format": config.output_audio_format,
-                            "temperature": config.temperature,
-                            "max_response_output_tokens": config.max_response_output_tokens,
-                        },
-                    }
-                    if config.turn_detection:
-                        session_update["session"]["turn_detection"] = config.turn_detection
-                    else:
-                        session_update["session"]["turn_detection"] = None  # manual mode
-
-                    if config.tools:
-                        session_update["session"]["tools"] = config.tools
-
-                    await ws.send(json.dumps(session_update))
-
-                    # 2. Send audio in chunks (64KB each to avoid frame size limits)
-                    chunk_size = 65536
-                    for i in range(0, len(audio_data), chunk_size):
-                        chunk = audio_data[i:i + chunk_size]
-                        encoded = base64.b64encode(chunk).decode("ascii")
-                        await ws.send(json.dumps({
-                            "type": "input_audio_buffer.append",
-                            "audio": encoded,
-                        }))
-
-                    # 3. Commit audio and request response
-                    await ws.send(json.dumps({"type": "input_audio_buffer.commit"}))
-                    await ws.send(json.dumps({"type": "response.create"}))
-
-                    # 4. Collect response events
-                    audio_chunks: List[bytes] = []
-                    transcript_parts: List[str] = []
-                    tool_calls: Dict[str, RealtimeToolCall] = {}
-
-                    done = False
-                    deadline = time.perf_counter() + timeout
-
-                    while not done and time.perf_counter() < deadline:
-                        try:
-                            raw = await asyncio.wait_for(
-                                ws.recv(),
-                                timeout=max(0.1, deadline - time.perf_counter()),
-                            )
-                        except asyncio.TimeoutError:
-                            logger.warning("Realtime session timed out after %.1fs", timeout)
-                            break
-
-                        event = json.loads(raw)
-                        etype = event.get("type", "")
-
-                        if etype == "response.audio.delta":
-                            if t_first_audio is None:
-                                t_first_audio = time.perf_counter()
-                            delta = event.get("delta", "")
-                            if delta:
-                                audio_chunks.append(base64.b64decode(delta))
-
-                        elif etype == "response.audio_transcript.delta":
-                            delta = event.get("delta", "")
-                            if delta:
-                                transcript_parts.append(delta)
-
-                        elif etype == "response.text.delta":
-                            # Text-only modality responses
-                            delta = event.get("delta", "")
-                            if delta:
-                                transcript_parts.append(delta)
-
-                        elif etype == "response.function_call_arguments.delta":
-                            cid = event.get("call_id", "")
-                            if cid not in tool_calls:
-                                tool_calls[cid] = RealtimeToolCall(call_id=cid)
-                            tool_calls[cid].arguments += event.get("delta", "")
-
-                        elif etype == "response.function_call_arguments.done":
-                            cid = event.get("call_id", "")
-                            if cid in tool_calls:
-                                tool_calls[cid].name = event.get("name", tool_calls[cid].name)
-                                tool_calls[cid].arguments = event.get("arguments", tool_calls[cid].arguments)
-
-                        elif etype == "response.output_item.added":
-                            item = event.get("item", {})
-                            if item.get("type") == "function_call":
-                                cid = item.get("call_id", "")
-                                if cid and cid not in tool_calls:
-                                    tool_calls[cid] = RealtimeToolCall(
-                                        call_id=cid,
-                                        name=item.get("name", ""),
-                                    )
-
-                        elif etype == "response.done":
-                            # Extract usage info and status
-                            response = event.get("response", {})
-                            result.response_status = response.get("status", "")
-                            if result.response_status == "incomplete":
-                                incomplete_reason = response.get("status_details", {}).get(
-                                    "reason", "unknown"
-                                )
-                                logger.warning(
-                                    "Realtime response incomplete (reason=%s, "
-                                    "deployment=%s, output_tokens=%s)",
-                                    incomplete_reason,
-                                    config.deployment_name,
-                                    response.get("usage", {}).get("output_tokens", "?"),
-                                )
-                            usage = response.get("usage", {})
-                            result.input_tokens = usage.get("input_tokens", 0)
-                            result.output_tokens = usage.get("output_tokens", 0)
-                            # input/output_token_details may be a dict (v1.5)
-                            # or a list of dicts (v1) — handle both gracefully.
-                            input_details = usage.get("input_token_details", {})
-                            output_details = usage.get("output_token_details", {})
-                            if isinstance(input_details, list):
-                                input_details = {k: v for d in input_details if isinstance(d, dict) for k, v in d.items()}
-                            if isinstance(output_details, list):
-                                output_details = {k: v for d in output_details if isinstance(d, dict) for k, v in d.items()}
-                            result.input_audio_tokens = input_details.get("audio_tokens", 0) if isinstance(input_details, dict) else 0
-                            result.output_audio_tokens = output_details.get("audio_tokens", 0) if isinstance(output_details, dict) else 0
-                            done = True
-
-                        elif etype == "error":
-                            error = event.get("error", {})
-                            raise RuntimeError(
-                                f"Realtime API error: {error.get('code', 'unknown')}: "
-                                f"{error.get('message', str(error))}"
-                            )
-
-                    result.transcript = "".join(transcript_parts)
-                    result.audio_data = b"".join(audio_chunks)
-                    result.tool_calls = list(tool_calls.values())
-
-                # Connection succeeded — break out of retry loop
+                if sess is None:
+                    ws = await self._connect(config.deployment_name)
+                    result.ws_connect_time_ms = (time.perf_counter() - t_start) * 1000
+                    sess = _PooledSession(
+                        ws, (id(asyncio.get_running_loop()), config.deployment_name, config.voice),
+                    )
+                    if pool:
+                        pool._stats["connects"] += 1
+                result.session_reused = reused
+
+                # The model turn is timed from here — the handshake is reported
+                # separately in ws_connect_time_ms
+                t_start = time.perf_counter()
+
+                # 1. Configure session (only when the connection isn't already)
+                result.session_updated = sess.session_key != session_key
+                if result.session_updated:
+                    await sess.ws.send(json.dumps({"type": "session.update", "session": payload}))
+                    sess.session_key = session_key
+                    if pool:
+                        pool._stats["session_updates"] += 1
+
+                # 2–4. Stream audio, request and collect the response
+                item_ids, done = await self._run_turn(
+                    sess.ws, audio_data, config, result, timeout, t_start, keep_audio,
+                )
+                result.session_time_ms = (time.perf_counter() - t_start) * 1000
+
+                # 5. Reset the conversation so the next scenario starts clean
+                if pool and done:
+                    reusable = await self._reset_conversation(sess.ws, item_ids)
                 break
 
             except (OSError, TimeoutError, websockets.exceptions.WebSocketException) as e:
+                if reused:
+                    # The server dropped an idle pooled connection — reconnect
+                    # straight away without spending a retry
+                    logger.debug("Pooled Realtime session unusable (%s); reconnecting", e)
+                    continue
                 # Transient connection / handshake failures — retry
                 if attempt < max_retries:
                     wait = min(2 ** attempt, 10)  # 2s, 4s, 8s (cap 10s)
@@ -339,19 +417,192 @@ class RealtimeClient:
                 result.session_time_ms = (time.perf_counter() - t_start) * 1000
                 raise
 
-        result.session_time_ms = (time.perf_counter() - t_start) * 1000
-        if t_first_audio is not None:
-            result.time_to_first_audio_ms = (t_first_audio - t_start) * 1000
+            finally:
+                if sess is not None:
+                    if reusable:
+                        pool.put(sess)
+                    elif pool:
+                        pool.discard(sess)
+                    else:
+                        await RealtimeSessionPool._close(sess.ws)
 
         logger.info(
             "Realtime session: transcript=%d chars, audio=%.0f ms, "
-            "tools=%d, session=%.0f ms, ttfa=%.0f ms (attempt %d/%d)",
+            "tools=%d, session=%.0f ms, ttfa=%.0f ms, connect=%.0f ms%s (attempt %d/%d)",
             len(result.transcript),
-            len(result.audio_data) / 48.0 if result.audio_data else 0,
+            result.output_audio_duration_ms,
             len(result.tool_calls),
             result.session_time_ms,
             result.time_to_first_audio_ms,
-            attempt,
+            result.ws_connect_time_ms,
+            " (reused)" if result.session_reused else "",
+            max(attempt, 1),
             max_retries,
         )
         return result
+
+    async def _run_turn(
+        self,
+        ws,
+        audio_data: Union[AudioSegment, AudioBuffer],
+        config: RealtimeConfig,
+        result: RealtimeResult,
+        timeout: float,
+        t_start: float,
+        keep_audio: bool = True,
+    ) -> Tuple[List[str], bool]:
+        """Send one utterance and read events until ``response.done``.
+
+        Fills *result* and returns the ids of the conversation items the
+        turn created, plus whether the response completed in time.
+        """
+        # 2. Send audio in frames of 64 KB of base64 (frame size limits).
+        #    Payloads are plain base64, so the frame is built by
+        #    concatenation rather than json.dumps
+        if isinstance(audio_data, AudioSegment):
+            frames = audio_data.iter_b64_frames()
+        else:
+            frames = iter_b64_frames(audio_data)
+        for payload in frames:
+            await ws.send('{"type":"input_audio_buffer.append","audio":"' + payload + '"}')
+
+        # 3. Commit audio and request response
+        await ws.send(json.dumps({"type": "input_audio_buffer.commit"}))
+        await ws.send(json.dumps({"type": "response.create"}))
+
+        # 4. Collect response events
+        audio_buf = PCMBuffer() if keep_audio else None
+        transcript_parts: List[str] = []
+        tool_calls: Dict[str, RealtimeToolCall] = {}
+        item_ids: List[str] = []
+        t_first_audio = None
+
+        done = False
+        deadline = time.perf_counter() + timeout
+
+        while not done and time.perf_counter() < deadline:
+            try:
+                raw = await asyncio.wait_for(
+                    ws.recv(),
+                    timeout=max(0.1, deadline - time.perf_counter()),
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Realtime session timed out after %.1fs", timeout)
+                break
+
+            event = json.loads(raw)
+            etype = event.get("type", "")
+
+            if etype == "response.audio.delta":
+                if t_first_audio is None:
+                    t_first_audio = time.perf_counter()
+                delta = event.get("delta", "")
+                if delta:
+                    if audio_buf is not None:
+                        result.output_audio_bytes += audio_buf.append_b64(delta)
+                    else:
+                        # Decoded size without decoding: 3 bytes per 4 chars
+                        result.output_audio_bytes += len(delta) // 4 * 3 - delta[-2:].count("=")
+
+            elif etype == "response.audio_transcript.delta":
+                delta = event.get("delta", "")
+                if delta:
+                    transcript_parts.append(delta)
+
+            elif etype == "response.text.delta":
+                # Text-only modality responses
+                delta = event.get("delta", "")
+                if delta:
+                    transcript_parts.append(delta)
+
+            elif etype == "conversation.item.created":
+                item_id = event.get("item", {}).get("id")
+                if item_id:
+                    item_ids.append(item_id)
+
+            elif etype == "response.function_call_arguments.delta":
+                cid = event.get("call_id", "")
+                if cid not in tool_calls:
+                    tool_calls[cid] = RealtimeToolCall(call_id=cid)
+                tool_calls[cid].arguments += event.get("delta", "")
+
+            elif etype == "response.function_call_arguments.done":
+                cid = event.get("call_id", "")
+                if cid in tool_calls:
+                    tool_calls[cid].name = event.get("name", tool_calls[cid].name)
+                    tool_calls[cid].arguments = event.get("arguments", tool_calls[cid].arguments)
+
+            elif etype == "response.output_item.added":
+                item = event.get("item", {})
+                if item.get("type") == "function_call":
+                    cid = item.get("call_id", "")
+                    if cid and cid not in tool_calls:
+                        tool_calls[cid] = RealtimeToolCall(
+                            call_id=cid,
+                            name=item.get("name", ""),
+                        )
+
+            elif etype == "response.done":
+                # Extract usage info and status
+                response = event.get("response", {})
+                result.response_status = response.get("status", "")
+                if result.response_status == "incomplete":
+                    incomplete_reason = response.get("status_details", {}).get(
+                        "reason", "unknown"
+                    )
+                    logger.warning(
+                        "Realtime response incomplete (reason=%s, "
+                        "deployment=%s, output_tokens=%s)",
+                        incomplete_reason,
+                        config.deployment_name,
+                        response.get("usage", {}).get("output_tokens", "?"),
+                    )
+                usage = response.get("usage", {})
+                result.input_tokens = usage.get("input_tokens", 0)
+                result.output_tokens = usage.get("output_tokens", 0)
+                # input/output_token_details may be a dict (v1.5)
+                # or a list of dicts (v1) — handle both gracefully.
+                input_details = usage.get("input_token_details", {})
+                output_details = usage.get("output_token_details", {})
+                if isinstance(input_details, list):
+                    input_details = {k: v for d in input_details if isinstance(d, dict) for k, v in d.items()}
+                if isinstance(output_details, list):
+                    output_details = {k: v for d in output_details if isinstance(d, dict) for k, v in d.items()}
+                result.input_audio_tokens = input_details.get("audio_tokens", 0) if isinstance(input_details, dict) else 0
+                result.output_audio_tokens = output_details.get("audio_tokens", 0) if isinstance(output_details, dict) else 0
+                done = True
+
+            elif etype == "error":
+                error = event.get("error", {})
+                raise RuntimeError(
+                    f"Realtime API error: {error.get('code', 'unknown')}: "
+                    f"{error.get('message', str(error))}"
+                )
+
+        result.transcript = "".join(transcript_parts)
+        result.audio_data = audio_buf.view() if audio_buf is not None else b""
+        result.tool_calls = list(tool_calls.values())
+        if t_first_audio is not None:
+            result.time_to_first_audio_ms = (t_first_audio - t_start) * 1000
+        return item_ids, done
+
+    async def _reset_conversation(self, ws, item_ids: List[str], timeout: float = 5.0) -> bool:
+        """Delete the turn's conversation items; ``False`` if the session should be dropped."""
+        pending = set(item_ids)
+        try:
+            for item_id in item_ids:
+                await ws.send(json.dumps({"type": "conversation.item.delete", "item_id": item_id}))
+            deadline = time.perf_counter() + timeout
+            while pending:
+                raw = await asyncio.wait_for(ws.recv(), timeout=max(0.1, deadline - time.perf_counter()))
+                event = json.loads(raw)
+                etype = event.get("type", "")
+                if etype == "conversation.item.deleted":
+                    pending.discard(event.get("item_id"))
+                elif etype == "error":
+                    logger.debug("Realtime conversation reset failed: %s", event.get("error"))
+                    return False
+        except (asyncio.TimeoutError, OSError, websockets.exceptions.WebSocketException) as e:
+            logger.debug("Realtime conversation reset failed: %s", e)
+            return False
+        return True
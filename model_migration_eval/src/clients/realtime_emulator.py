@@ -0,0 +1,424 @@
+"""
+Offline Realtime API Emulator
+=============================
+
+A local WebSocket server that speaks the subset of the Azure OpenAI
+Realtime protocol used by :class:`~.realtime_client.RealtimeClient`, so
+the realtime path can be exercised and benchmarked without a
+``gpt-realtime`` deployment:
+
+* ``session.update`` → ``session.updated``
+* ``input_audio_buffer.append`` / ``commit`` / ``clear`` (with
+  ``conversation.item.created`` for the committed user turn)
+* ``response.create`` → ``response.text.delta`` (text modality) or
+  ``response.audio_transcript.delta`` + ``response.audio.delta`` (audio),
+  function-call items and argument deltas when the session has tools,
+  and ``response.done`` with usage (including audio token details)
+* ``conversation.item.delete`` → ``conversation.item.deleted``
+
+Timing and failures come from an :class:`EmulatorProfile`: handshake
+and first-token latency distributions, an output token rate, and the
+probability of rejected handshakes, ``error`` events, dropped
+connections and ``incomplete`` responses.
+
+Point a client at it with an ``http://`` endpoint::
+
+    python -m src.clients.realtime_emulator --port 8765 --first-token-ms 400
+
+    # settings.yaml → realtime.endpoint: "http://127.0.0.1:8765"
+
+``tools/benchmark_realtime.py`` drives it to measure sessions per second,
+event-loop lag and memory per concurrent session.
+"""
+
+import argparse
+import asyncio
+import base64
+import itertools
+import json
+import logging
+import math
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import websockets
+    from websockets.asyncio.server import serve as _ws_serve
+    _WS_AVAILABLE = True
+except ImportError:
+    _WS_AVAILABLE = False
+
+# Approximate audio token rates of the Realtime models
+_INPUT_AUDIO_TOKENS_PER_SECOND = 10.0
+_OUTPUT_AUDIO_MS_PER_TOKEN = 50.0
+_PCM_BYTES_PER_MS = 48          # PCM16 24 kHz mono
+
+
+# ── Profile ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class LatencyDistribution:
+    """Latency in milliseconds: ``fixed``, ``uniform``, ``normal`` or ``lognormal``.
+
+    ``mean_ms`` / ``stddev_ms`` describe the resulting distribution (for
+    ``uniform`` the range is ``mean ± stddev``); samples are never negative.
+    """
+    kind: str = "lognormal"
+    mean_ms: float = 0.0
+    stddev_ms: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.mean_ms <= 0:
+            return 0.0
+        if self.kind == "fixed" or self.stddev_ms <= 0:
+            return self.mean_ms
+        if self.kind == "uniform":
+            return max(0.0, rng.uniform(self.mean_ms - self.stddev_ms, self.mean_ms + self.stddev_ms))
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(self.mean_ms, self.stddev_ms))
+        # lognormal with the requested mean/stddev
+        sigma2 = math.log(1 + (self.stddev_ms / self.mean_ms) ** 2)
+        mu = math.log(self.mean_ms) - sigma2 / 2
+        return rng.lognormvariate(mu, math.sqrt(sigma2))
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "LatencyDistribution":
+        return cls(**(data or {}))
+
+
+@dataclass
+class EmulatorProfile:
+    """Behaviour of the emulated deployment."""
+    handshake_latency: LatencyDistribution = field(
+        default_factory=lambda: LatencyDistribution("lognormal", 150.0, 50.0))
+    first_token_latency: LatencyDistribution = field(
+        default_factory=lambda: LatencyDistribution("lognormal", 400.0, 150.0))
+    tokens_per_second: float = 50.0
+    tokens_per_delta: int = 4
+    output_tokens: LatencyDistribution = field(      # tokens per response (same sampler)
+        default_factory=lambda: LatencyDistribution("normal", 60.0, 20.0))
+    tool_call_probability: float = 1.0             # when the session has tools
+    # Error injection (probabilities per handshake / per response)
+    handshake_error_rate: float = 0.0              # HTTP 503 instead of the upgrade
+    error_event_rate: float = 0.0                  # ``error`` event instead of a response
+    disconnect_rate: float = 0.0                   # connection dropped mid-response
+    incomplete_rate: float = 0.0                   # ``response.done`` with status incomplete
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EmulatorProfile":
+        data = dict(data)
+        for key in ("handshake_latency", "first_token_latency", "output_tokens"):
+            if isinstance(data.get(key), dict):
+                data[key] = LatencyDistribution.from_dict(data[key])
+        return cls(**data)
+
+
+# ── Server ──────────────────────────────────────────────────────────────────
+
+class RealtimeEmulator:
+    """Local Realtime protocol stand-in.
+
+    Usage::
+
+        async with RealtimeEmulator(EmulatorProfile(seed=1)) as emu:
+            client = RealtimeClient(emu.endpoint, api_key="unused")
+            result = await client.send_audio(audio, config)
+
+    ``start_in_thread()`` / ``stop()`` run it on a private loop instead,
+    so it does not share (and skew) the event loop being measured.
+    """
+
+    def __init__(self, profile: Optional[EmulatorProfile] = None, host: str = "127.0.0.1", port: int = 0):
+        if not _WS_AVAILABLE:
+            raise RuntimeError(
+                "websockets package not installed.  "
+                "Install with: pip install websockets>=13.0"
+            )
+        self.profile = profile or EmulatorProfile()
+        self.host = host
+        self.port = port
+        self._rng = random.Random(self.profile.seed)
+        self._ids = itertools.count(1)
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {
+            "connections": 0, "rejected": 0, "responses": 0,
+            "errors": 0, "disconnects": 0, "incomplete": 0,
+        }
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    # ── Lifecycle ───────────────────────────────────────────────────────
+
+    async def start(self) -> "RealtimeEmulator":
+        self._server = await _ws_serve(
+            self._handle, self.host, self.port,
+            process_request=self._process_request,
+            max_size=16 * 1024 * 1024,
+        )
+        self.port = next(iter(self._server.sockets)).getsockname()[1]
+        logger.info("Realtime emulator listening on %s", self.endpoint)
+        return self
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "RealtimeEmulator":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def start_in_thread(self) -> "RealtimeEmulator":
+        """Serve from a daemon thread with its own event loop."""
+        ready = threading.Event()
+
+        def _run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=_run, name="realtime-emulator", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def stop(self) -> None:
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    # ── Connection handling ─────────────────────────────────────────────
+
+    def _next_id(self, prefix: str) -> str:
+        return f"{prefix}_{next(self._ids):08d}"
+
+    async def _process_request(self, connection, request):
+        """Handshake hook: add latency and inject rejected upgrades."""
+        await asyncio.sleep(self.profile.handshake_latency.sample(self._rng) / 1000.0)
+        if self._rng.random() < self.profile.handshake_error_rate:
+            self.stats["rejected"] += 1
+            return connection.respond(503, "Injected handshake failure\n")
+        return None
+
+    async def _handle(self, ws) -> None:
+        self.stats["connections"] += 1
+        state: Dict[str, Any] = {"session": {}, "input_bytes": 0, "items": set(), "response": None}
+        try:
+            async for raw in ws:
+                try:
+                    event = json.loads(raw)
+                except ValueError:
+                    await self._send_error(ws, "invalid_request_error", "Invalid JSON")
+                    continue
+                await self._dispatch(ws, state, event)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        finally:
+            task = state.get("response")
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def _dispatch(self, ws, state: Dict[str, Any], event: Dict[str, Any]) -> None:
+        etype = event.get("type", "")
+        if etype == "session.update":
+            state["session"].update(event.get("session") or {})
+            await ws.send(json.dumps({"type": "session.updated", "session": state["session"]}))
+        elif etype == "input_audio_buffer.append":
+            audio = event.get("audio", "")
+            state["input_bytes"] += len(audio) // 4 * 3 - audio[-2:].count("=")
+        elif etype == "input_audio_buffer.clear":
+            state["input_bytes"] = 0
+            await ws.send(json.dumps({"type": "input_audio_buffer.cleared"}))
+        elif etype == "input_audio_buffer.commit":
+            item_id = self._next_id("item")
+            state["items"].add(item_id)
+            state["committed_bytes"] = state["input_bytes"]
+            state["input_bytes"] = 0
+            await ws.send(json.dumps({"type": "input_audio_buffer.committed", "item_id": item_id}))
+            await ws.send(json.dumps({
+                "type": "conversation.item.created",
+                "item": {"id": item_id, "type": "message", "role": "user"},
+            }))
+        elif etype == "response.create":
+            # Responses stream concurrently with further client events
+            state["response"] = asyncio.ensure_future(self._respond_safely(ws, state))
+        elif etype == "conversation.item.delete":
+            item_id = event.get("item_id")
+            if item_id in state["items"]:
+                state["items"].discard(item_id)
+                await ws.send(json.dumps({"type": "conversation.item.deleted", "item_id": item_id}))
+            else:
+                await self._send_error(ws, "invalid_request_error", f"Item {item_id} not found")
+        else:
+            await self._send_error(ws, "invalid_request_error", f"Unsupported event type {etype!r}")
+
+    async def _send_error(self, ws, code: str, message: str) -> None:
+        await ws.send(json.dumps({"type": "error", "error": {"type": code, "code": code, "message": message}}))
+
+    # ── Responses ───────────────────────────────────────────────────────
+
+    async def _respond_safely(self, ws, state: Dict[str, Any]) -> None:
+        try:
+            await self._respond(ws, state)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    async def _respond(self, ws, state: Dict[str, Any]) -> None:
+        p, rng = self.profile, self._rng
+        session = state["session"]
+        response_id = self._next_id("resp")
+        await ws.send(json.dumps({"type": "response.created", "response": {"id": response_id}}))
+        await asyncio.sleep(p.first_token_latency.sample(rng) / 1000.0)
+
+        if rng.random() < p.error_event_rate:
+            self.stats["errors"] += 1
+            await self._send_error(ws, "server_error", "Injected server error")
+            return
+
+        n_tokens = max(1, int(p.output_tokens.sample(rng)))
+        drop_at = rng.randrange(n_tokens) if rng.random() < p.disconnect_rate else None
+        incomplete = rng.random() < p.incomplete_rate
+        if incomplete:
+            n_tokens = max(1, n_tokens // 2)
+        audio_out = "audio" in (session.get("modalities") or ["text", "audio"])
+        tools = session.get("tools") or []
+
+        item_id = self._next_id("item")
+        state["items"].add(item_id)
+        await ws.send(json.dumps({
+            "type": "conversation.item.created",
+            "item": {"id": item_id, "type": "message", "role": "assistant"},
+        }))
+
+        if tools and rng.random() < p.tool_call_probability:
+            tool = rng.choice(tools)
+            name = tool.get("name") or (tool.get("function") or {}).get("name", "tool")
+            call_id = self._next_id("call")
+            await ws.send(json.dumps({
+                "type": "response.output_item.added",
+                "item": {"id": item_id, "type": "function_call", "call_id": call_id, "name": name},
+            }))
+            arguments = json.dumps({"query": "emulated"})
+            for i in range(0, len(arguments), 8):
+                await ws.send(json.dumps({
+                    "type": "response.function_call_arguments.delta",
+                    "call_id": call_id, "delta": arguments[i:i + 8],
+                }))
+            await ws.send(json.dumps({
+                "type": "response.function_call_arguments.done",
+                "call_id": call_id, "name": name, "arguments": arguments,
+            }))
+        else:
+            text_delta = "lorem " * p.tokens_per_delta
+            audio_delta = base64.b64encode(
+                bytes(int(_OUTPUT_AUDIO_MS_PER_TOKEN * _PCM_BYTES_PER_MS * p.tokens_per_delta))
+            ).decode("ascii")
+            interval = p.tokens_per_delta / p.tokens_per_second if p.tokens_per_second > 0 else 0.0
+            for sent in range(0, n_tokens, p.tokens_per_delta):
+                if drop_at is not None and sent >= drop_at:
+                    self.stats["disconnects"] += 1
+                    # Abort without a close handshake, as a dropped network would
+                    ws.transport.abort()
+                    return
+                if audio_out:
+                    await ws.send(json.dumps({"type": "response.audio.delta", "delta": audio_delta}))
+                    await ws.send(json.dumps({"type": "response.audio_transcript.delta", "delta": text_delta}))
+                else:
+                    await ws.send(json.dumps({"type": "response.text.delta", "delta": text_delta}))
+                if interval:
+                    await asyncio.sleep(interval)
+
+        input_audio_tokens = int(
+            state.get("committed_bytes", 0) / (_PCM_BYTES_PER_MS * 1000) * _INPUT_AUDIO_TOKENS_PER_SECOND
+        )
+        input_text_tokens = len(session.get("instructions") or "") // 4
+        output_audio_tokens = n_tokens if audio_out else 0
+        status = "incomplete" if incomplete else "completed"
+        if incomplete:
+            self.stats["incomplete"] += 1
+        self.stats["responses"] += 1
+        await ws.send(json.dumps({
+            "type": "response.done",
+            "response": {
+                "id": response_id,
+                "status": status,
+                "status_details": {"reason": "max_output_tokens"} if incomplete else None,
+                "usage": {
+                    "input_tokens": input_audio_tokens + input_text_tokens,
+                    "output_tokens": n_tokens + output_audio_tokens,
+                    "input_token_details": {"audio_tokens": input_audio_tokens, "text_tokens": input_text_tokens},
+                    "output_token_details": {"audio_tokens": output_audio_tokens, "text_tokens": n_tokens},
+                },
+            },
+        }))
+
+
+# ── CLI ─────────────────────────────────────────────────────────────────────
+
+def build_profile_from_args(args: argparse.Namespace) -> EmulatorProfile:
+    """Profile from the options added by :func:`add_profile_arguments`."""
+    return EmulatorProfile(
+        handshake_latency=LatencyDistribution(args.latency_kind, args.handshake_ms, args.handshake_ms / 3),
+        first_token_latency=LatencyDistribution(args.latency_kind, args.first_token_ms, args.first_token_ms / 3),
+        tokens_per_second=args.tokens_per_second,
+        output_tokens=LatencyDistribution("normal", args.output_tokens, args.output_tokens / 3),
+        handshake_error_rate=args.handshake_error_rate,
+        error_event_rate=args.error_rate,
+        disconnect_rate=args.disconnect_rate,
+        incomplete_rate=args.incomplete_rate,
+        seed=args.seed,
+    )
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-kind", default="lognormal",
+                        choices=["fixed", "uniform", "normal", "lognormal"])
+    parser.add_argument("--handshake-ms", type=float, default=150.0, help="Mean handshake latency")
+    parser.add_argument("--first-token-ms", type=float, default=400.0, help="Mean time to first delta")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--output-tokens", type=float, default=60.0, help="Mean output tokens per response")
+    parser.add_argument("--handshake-error-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an error event per response")
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    parser.add_argument("--incomplete-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Offline Azure OpenAI Realtime API emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    async def _serve() -> None:
+        async with RealtimeEmulator(build_profile_from_args(args), args.host, args.port) as emu:
+            # Parsed by tools/benchmark_realtime.py to find the port
+            print(f"listening on {emu.endpoint}", flush=True)
+            await asyncio.Future()
+
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
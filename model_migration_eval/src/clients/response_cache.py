@@ -0,0 +1,122 @@
+"""
+Completion Response Cache
+=========================
+
+Disk-backed cache shared by ``AzureOpenAIClient.complete`` and
+``complete_async``.  Entries are keyed on the canonical request
+parameters produced by ``_build_request_params`` (so a prompt, data or
+model-config change always misses) and stored as compact JSON rather than
+pickled SDK objects.
+
+Supports:
+
+* **TTL** — entries expire ``ttl_seconds`` after they were written
+* **size bound** — diskcache evicts least-recently-used entries once the
+  store exceeds ``size_limit_bytes``
+* **replay-only** — misses raise :class:`CacheMissError` instead of
+  calling the API, for offline re-scoring of a previous run
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import diskcache
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_SIZE_LIMIT = 1024 ** 3   # 1 GiB (diskcache default)
+
+
+class CacheMissError(RuntimeError):
+    """Raised in replay-only mode when a request has no cached response."""
+
+
+class ResponseCache:
+    """Compact, bounded response cache with hit/miss/byte counters."""
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache/prompts",
+        ttl_seconds: Optional[float] = None,
+        size_limit_bytes: Optional[int] = None,
+        replay_only: bool = False,
+    ):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds or None
+        self.replay_only = replay_only
+        self._store = diskcache.Cache(
+            cache_dir,
+            size_limit=size_limit_bytes or _DEFAULT_SIZE_LIMIT,
+            eviction_policy="least-recently-used",
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    @staticmethod
+    def make_key(request_params: Dict[str, Any]) -> str:
+        """SHA-256 of the canonical (sorted, compact) request parameters."""
+        canonical = json.dumps(
+            request_params, sort_keys=True, separators=(",", ":"),
+            ensure_ascii=False, default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for *key* or ``None``.
+
+        In replay-only mode a miss raises :class:`CacheMissError`.
+        """
+        blob = self._store.get(key)
+        payload = None
+        if blob is not None:
+            try:
+                payload = json.loads(blob)
+            except (TypeError, ValueError):
+                # Legacy pickled entry or corruption — treat as a miss
+                self._store.delete(key)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.bytes_read += len(blob)
+        if payload is None and self.replay_only:
+            raise CacheMissError(
+                f"Replay-only cache miss for request {key[:12]}… — "
+                f"no recorded response to re-score."
+            )
+        return payload
+
+    def set(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store *payload* (a JSON-serialisable dict) under *key*."""
+        blob = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        self._store.set(key, blob, expire=self.ttl_seconds)
+        with self._lock:
+            self.bytes_written += len(blob)
+
+    def clear(self) -> int:
+        """Drop every entry; returns the number removed."""
+        return self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for ``get_metrics_summary``."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "replay_only": self.replay_only,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bytes_read": self.bytes_read,
+                "bytes_written": self.bytes_written,
+                "size_bytes": self._store.volume(),
+                "entries": len(self._store),
+                "ttl_seconds": self.ttl_seconds,
+            }
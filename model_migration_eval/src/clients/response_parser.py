@@ -0,0 +1,187 @@
+"""
+Parse-Once Model Responses
+==========================
+
+Every model response is parsed exactly once, when its ``CompletionResult``
+is built, into a :class:`ParsedResponse` holding the canonical text, the
+decoded JSON (if any), the recovery strategy that produced it and the time
+parsing took.  Classification extraction, quality and consistency metrics
+all consume that object instead of re-running ``json.loads`` and regexes
+over the same text.
+
+Strategies, tried in order:
+
+* ``native``   – the SDK already handed us a dict / list
+* ``direct``   – the text is valid JSON as-is
+* ``fenced``   – valid JSON inside a markdown code fence
+* ``embedded`` – the first balanced ``{…}`` / ``[…]`` span in surrounding prose
+* ``repaired`` – JSON truncated mid-stream, closed with the minimal suffix
+* ``none``     – no JSON could be recovered
+
+``embedded`` and ``repaired`` share one left-to-right scan that jumps
+between structural characters, so the cost is linear in the response
+length (the old greedy ``\\{[\\s\\S]*\\}`` regex could backtrack over the
+whole text).
+"""
+
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+NATIVE = "native"
+DIRECT = "direct"
+FENCED = "fenced"
+EMBEDDED = "embedded"
+REPAIRED = "repaired"
+NONE = "none"
+
+_FENCE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+_STRUCTURAL = re.compile(r'[\[\]{}"\\]')
+_CLOSER = {'{': '}', '[': ']'}
+
+
+@dataclass
+class ParsedResponse:
+    """One model response, parsed once."""
+    text: str
+    data: Any = None
+    strategy: str = NONE
+    parse_ms: float = 0.0
+
+    @property
+    def is_json(self) -> bool:
+        return self.strategy != NONE
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'text': self.text,
+            'data': self.data,
+            'strategy': self.strategy,
+            'parse_ms': self.parse_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'ParsedResponse':
+        return cls(
+            text=payload.get('text', ''),
+            data=payload.get('data'),
+            strategy=payload.get('strategy', NONE),
+            parse_ms=float(payload.get('parse_ms') or 0.0),
+        )
+
+
+def scan_json(text: str) -> Tuple[Any, str]:
+    """Recover JSON embedded in prose or truncated mid-stream.
+
+    Returns ``(parsed, EMBEDDED | REPAIRED)`` or ``(None, NONE)``.
+    Quotes and closers outside a ``{``/``[`` are ignored, and a balanced
+    span that does not decode is skipped so scanning continues after it.
+    """
+    stack: List[str] = []       # expected closing chars
+    start = -1
+    in_string = False
+    escape_at = -1
+
+    for m in _STRUCTURAL.finditer(text):
+        ch = m.group()
+        pos = m.start()
+        if not stack:
+            if ch in _CLOSER:
+                start = pos
+                stack.append(_CLOSER[ch])
+            continue
+        if in_string:
+            if escape_at >= 0 and pos == escape_at + 1:
+                escape_at = -1
+                continue
+            escape_at = -1
+            if ch == '\\':
+                escape_at = pos
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in _CLOSER:
+            stack.append(_CLOSER[ch])
+        elif ch == stack[-1]:
+            stack.pop()
+            if not stack:
+                try:
+                    return json.loads(text[start:pos + 1]), EMBEDDED
+                except ValueError:
+                    continue
+
+    if not stack:
+        return None, NONE
+
+    # Ran out of text inside a structure — close open strings/containers
+    suffix = ('"' if in_string else '') + ''.join(reversed(stack))
+    fragment = text[start:]
+    try:
+        parsed = json.loads(fragment + suffix)
+    except ValueError:
+        return None, NONE
+    logger.info(
+        "Repaired truncated JSON by appending '%s' (%d chars recovered)",
+        suffix, len(fragment),
+    )
+    return parsed, REPAIRED
+
+
+def _parse_text(text: str) -> Tuple[Any, str]:
+    cleaned = text.strip()
+    if not cleaned:
+        return None, NONE
+    try:
+        return json.loads(cleaned), DIRECT
+    except ValueError:
+        pass
+    if cleaned.startswith('```'):
+        match = _FENCE.search(cleaned)
+        if match:
+            cleaned = match.group(1)
+            try:
+                return json.loads(cleaned), FENCED
+            except ValueError:
+                pass
+    return scan_json(cleaned)
+
+
+def parse_response(content: Any) -> ParsedResponse:
+    """Parse a raw model response (str, SDK dict/list or ``None``)."""
+    t0 = time.perf_counter()
+    if isinstance(content, (dict, list)):
+        text = json.dumps(content, ensure_ascii=False)
+        data, strategy = content, NATIVE
+    else:
+        text = "" if content is None else str(content)
+        data, strategy = _parse_text(text)
+    return ParsedResponse(
+        text=text,
+        data=data,
+        strategy=strategy,
+        parse_ms=(time.perf_counter() - t0) * 1000,
+    )
+
+
+def ensure_parsed(response: Any) -> ParsedResponse:
+    """Return *response* if it is already a :class:`ParsedResponse`, else parse it."""
+    if isinstance(response, ParsedResponse):
+        return response
+    return parse_response(response)
+
+
+def summarise_parse_costs(parsed: List[ParsedResponse]) -> Dict[str, Any]:
+    """Total parse time and strategy histogram for one run."""
+    strategies: Dict[str, int] = {}
+    total_ms = 0.0
+    for p in parsed:
+        strategies[p.strategy] = strategies.get(p.strategy, 0) + 1
+        total_ms += p.parse_ms
+    return {'parse_time_ms': total_ms, 'parse_strategies': strategies}
@@ -8,15 +8,24 @@ repeated evaluation runs don't re-synthesize the same text.
 
 The client produces raw PCM16 audio at 24 kHz mono — the native
 input format for the Azure Realtime API.
+
+:meth:`TTSClient.synthesize_async` is the path used from the shared
+evaluation loop: cache reads and the blocking SDK call run in worker
+threads, cache misses are synthesized concurrently up to
+``max_concurrent`` and within ``rpm_limit`` (drawn from the same
+``AdaptiveRateLimiter`` as the text calls, keyed by the TTS deployment),
+and identical in-flight requests are coalesced.
 """
 
+import asyncio
 import base64
 import logging
 import time
+import weakref
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from ..utils.audio_utils import AudioSegment, TTSAudioCache
+from ..utils.audio_utils import AudioSegment, TTSAudioCache, shared_tts_cache
 
 logger = logging.getLogger(__name__)
 
@@ -33,12 +42,16 @@ class TTSConfig:
     response_format: str = "pcm"   # "pcm" → raw PCM16 24 kHz mono
     cache_enabled: bool = True
     cache_dir: str = ".cache/tts_audio"
+    cache_size_limit_bytes: Optional[int] = None  # LRU eviction beyond this (default 2 GiB)
+    max_concurrent: int = 4        # concurrent synthesis calls (cache misses)
+    rpm_limit: Optional[int] = None  # TTS requests per minute (None → learned/unlimited)
 
 
 def load_tts_config_from_settings(settings: dict) -> TTSConfig:
     """Build a ``TTSConfig`` from the ``realtime.tts`` section of settings.yaml."""
     rt = settings.get('realtime', {})
     tts_cfg = rt.get('tts', {})
+    size_mb = tts_cfg.get('cache_size_limit_mb')
     return TTSConfig(
         model=tts_cfg.get('deployment_name', 'gpt-4o-mini-tts'),
         voice=tts_cfg.get('voice', 'alloy'),
@@ -46,6 +59,9 @@ def load_tts_config_from_settings(settings: dict) -> TTSConfig:
         response_format=tts_cfg.get('response_format', 'pcm'),
         cache_enabled=bool(tts_cfg.get('cache_enabled', True)),
         cache_dir=tts_cfg.get('cache_dir', '.cache/tts_audio'),
+        cache_size_limit_bytes=int(size_mb * 1024 * 1024) if size_mb else None,
+        max_concurrent=max(1, int(tts_cfg.get('max_concurrent', 4))),
+        rpm_limit=int(tts_cfg['rpm_limit']) if tts_cfg.get('rpm_limit') else None,
     )
 
 
@@ -66,20 +82,31 @@ class TTSClient:
         from src.clients.azure_openai import AzureOpenAIClient
         tts = TTSClient(openai_client.client, config=TTSConfig())
         result = tts.synthesize("Hello world")
-        # result.audio.data  → raw PCM16 bytes
+        # result.audio.data  → raw PCM16 (bytes, or a memoryview on cache hits)
     """
 
-    def __init__(self, openai_client, config: Optional[TTSConfig] = None):
+    def __init__(self, openai_client, config: Optional[TTSConfig] = None, rate_limiter=None):
         """
         Args:
             openai_client: An ``openai.AzureOpenAI`` (sync) client instance.
             config: TTS configuration.
+            rate_limiter: Optional shared ``AdaptiveRateLimiter``; the TTS
+                deployment gets its own budget within it.
         """
         self._client = openai_client
         self.config = config or TTSConfig()
         self._cache: Optional[TTSAudioCache] = None
         if self.config.cache_enabled:
-            self._cache = TTSAudioCache(self.config.cache_dir)
+            self._cache = shared_tts_cache(self.config.cache_dir, self.config.cache_size_limit_bytes)
+        self._limiter = rate_limiter
+        if self._limiter is not None and self.config.rpm_limit:
+            self._limiter.configure(self.config.model, rpm=self.config.rpm_limit)
+        # (loop id, voice, text) → task, so concurrent scenarios sharing a
+        # prompt trigger a single synthesis
+        self._inflight: Dict[Tuple[int, str, str], "asyncio.Task"] = {}
+        # loop → Semaphore; weak keys so closed loops are dropped
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+            weakref.WeakKeyDictionary()
 
     def synthesize(self, text: str, voice: Optional[str] = None) -> TTSResult:
         """Convert *text* to audio, using cache when available.
@@ -100,7 +127,12 @@ class TTSClient:
                 logger.debug("TTS cache hit for voice=%s len=%d", voice, len(text))
                 return TTSResult(audio=cached, tts_latency_ms=0.0, cached=True)
 
-        # Call Azure OpenAI TTS
+        if self._limiter is not None:
+            self._limiter.acquire_sync(self.config.model)
+        return self._synthesize_uncached(text, voice)
+
+    def _synthesize_uncached(self, text: str, voice: str) -> TTSResult:
+        """Call the TTS deployment (blocking) and store the result in the cache."""
         t0 = time.perf_counter()
         response = self._client.audio.speech.create(
             model=self.config.model,
@@ -113,7 +145,8 @@ class TTSClient:
         audio_bytes = response.read()
         latency = (time.perf_counter() - t0) * 1000.0
 
-        segment = AudioSegment(data=audio_bytes)
+        # Encoded once here; the Realtime client frames it without re-encoding
+        segment = AudioSegment(data=audio_bytes, encoded=base64.b64encode(audio_bytes))
         logger.info(
             "TTS synthesized: voice=%s len=%d chars -> %.0f ms audio (%.0f ms latency)",
             voice, len(text), segment.duration_ms, latency,
@@ -125,6 +158,59 @@ class TTSClient:
 
         return TTSResult(audio=segment, tts_latency_ms=latency, cached=False)
 
+    def cache_stats(self) -> Optional[dict]:
+        """Hit rate, bytes served and size of the audio cache (``None`` if disabled)."""
+        return self._cache.stats() if self._cache else None
+
     def synthesize_batch(self, texts: List[str], voice: Optional[str] = None) -> List[TTSResult]:
         """Synthesize a list of texts sequentially (cache makes this fast on reruns)."""
         return [self.synthesize(t, voice) for t in texts]
+
+    # ── Async ───────────────────────────────────────────────────────────
+
+    async def synthesize_async(self, text: str, voice: Optional[str] = None) -> TTSResult:
+        """Non-blocking :meth:`synthesize` for use on the evaluation loop.
+
+        Cache hits return after a threaded file read; misses wait for a
+        slot (``max_concurrent``) and the TTS request budget, then run the
+        SDK call in a worker thread.  Concurrent calls for the same
+        (text, voice) share one synthesis.
+        """
+        voice = voice or self.config.voice
+
+        if self._cache:
+            cached = await asyncio.to_thread(self._cache.get, text, voice)
+            if cached is not None:
+                logger.debug("TTS cache hit for voice=%s len=%d", voice, len(text))
+                return TTSResult(audio=cached, tts_latency_ms=0.0, cached=True)
+
+        loop_id = id(asyncio.get_running_loop())
+        key = (loop_id, voice, text)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._synthesize_limited(text, voice))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        # shield: one waiter being cancelled must not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: Tuple[int, str, str], task: "asyncio.Task") -> None:
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every waiter was cancelled
+
+    async def _synthesize_limited(self, text: str, voice: str) -> TTSResult:
+        loop = asyncio.get_running_loop()
+        sem = self._semaphores.get(loop)
+        if sem is None:
+            sem = self._semaphores[loop] = asyncio.Semaphore(self.config.max_concurrent)
+        async with sem:
+            if self._limiter is not None:
+                await self._limiter.acquire(self.config.model)
+            return await asyncio.to_thread(self._synthesize_uncached, text, voice)
+
+    async def synthesize_batch_async(
+        self, texts: List[str], voice: Optional[str] = None,
+    ) -> List[TTSResult]:
+        """Synthesize *texts* concurrently (bounded as in :meth:`synthesize_async`)."""
+        return list(await asyncio.gather(*(self.synthesize_async(t, voice) for t in texts)))
@@ -14,6 +14,7 @@ from .comparator import ModelComparator
 from .foundry_evaluator import FoundryEvaluator, is_foundry_available, create_foundry_evaluator_from_config
 from .realtime_metrics import RealtimeMetrics
 from .realtime_evaluator import RealtimeEvaluator
+from .result_store import ResultStore
 
 __all__ = [
     'MetricsCalculator',
@@ -30,4 +31,5 @@ __all__ = [
     'create_foundry_evaluator_from_config',
     'RealtimeMetrics',
     'RealtimeEvaluator',
+    'ResultStore',
 ]
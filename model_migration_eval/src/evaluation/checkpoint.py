@@ -0,0 +1,141 @@
+"""
+Per-Scenario Checkpoint Journal
+===============================
+
+Append-only JSONL journal that lets an interrupted evaluation resume
+without re-calling the API for scenarios that already finished.
+
+Each line records one completed scenario::
+
+    {"model": "gpt4", "eval_type": "classification", "scenario_id": "C-001",
+     "prompt_hash": "…", "data_hash": "…", "outcome": {…}}
+
+A journaled outcome is reused only when the model, evaluation type,
+scenario id, prompt/config hash **and** scenario data hash all match, so
+editing a prompt, a scenario or the model settings invalidates exactly the
+affected entries.  Once a run has an outcome for every one of its
+scenarios it removes *its own* entries from the journal (the file goes away
+when nothing else is left), so concurrent runs of the same (model, type)
+pair never wipe each other's progress; entries only survive interrupted or
+partially failed runs.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JournalKey = Tuple[str, str, str]   # (scenario_id, prompt_hash, data_hash)
+
+
+def fingerprint(obj: Any) -> str:
+    """Stable SHA-256 of a JSON-serialisable object (or dataclass)."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        obj = asdict(obj)
+    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CheckpointJournal:
+    """Append-only JSONL journal for one (model, evaluation type) pair."""
+
+    # One lock per journal path so concurrent evaluations of the same
+    # model/type (e.g. two browser tabs) never interleave partial lines.
+    _locks: Dict[str, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, checkpoint_dir: str, model_name: str, evaluation_type: str):
+        self.model_name = model_name
+        self.evaluation_type = evaluation_type
+        self.path = Path(checkpoint_dir) / f"{model_name}_{evaluation_type}.jsonl"
+        with self._locks_guard:
+            self._lock = self._locks.setdefault(str(self.path.resolve()), threading.Lock())
+
+    def load(self) -> Dict[JournalKey, Dict[str, Any]]:
+        """Return ``{(scenario_id, prompt_hash, data_hash): outcome}``.
+
+        Later entries win; a torn final line (crash mid-write) is skipped.
+        """
+        entries: Dict[JournalKey, Dict[str, Any]] = {}
+        if not self.path.exists():
+            return entries
+        with self._lock, open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if rec.get("model") != self.model_name or rec.get("eval_type") != self.evaluation_type:
+                    continue
+                key = (rec.get("scenario_id", ""), rec.get("prompt_hash", ""), rec.get("data_hash", ""))
+                entries[key] = rec.get("outcome")
+        return entries
+
+    def append(self, key: JournalKey, outcome: Dict[str, Any]) -> None:
+        """Append one finished scenario (flushed so a crash keeps it)."""
+        scenario_id, prompt_hash, data_hash = key
+        line = json.dumps({
+            "model": self.model_name,
+            "eval_type": self.evaluation_type,
+            "scenario_id": scenario_id,
+            "prompt_hash": prompt_hash,
+            "data_hash": data_hash,
+            "outcome": outcome,
+        }, ensure_ascii=False, default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+
+    def remove(self, keys: Iterable[JournalKey]) -> None:
+        """Drop the entries for *keys*, keeping everything else.
+
+        The journal is rewritten atomically (tmp + replace) and deleted
+        only when no entries remain, so a run that finishes never throws
+        away progress journaled by another run of the same pair.
+        """
+        drop = set(keys)
+        if not drop:
+            return
+        with self._lock:
+            if not self.path.exists():
+                return
+            kept = []
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue
+                    key = (rec.get("scenario_id", ""), rec.get("prompt_hash", ""), rec.get("data_hash", ""))
+                    if key not in drop:
+                        kept.append(line if line.endswith("\n") else line + "\n")
+            if not kept:
+                self.path.unlink(missing_ok=True)
+                return
+            tmp = self.path.with_suffix(".jsonl.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(kept)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+
+def prompt_file_hash(path: Optional[Path]) -> str:
+    """SHA-256 of a prompt file's bytes ('' when there is no file)."""
+    if path is None:
+        return ""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return ""
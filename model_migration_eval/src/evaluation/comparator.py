@@ -8,6 +8,8 @@ and Foundry LLM-as-judge submissions run concurrently.
 
 import json
 import asyncio
+import math
+import random
 import uuid
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, field
@@ -25,15 +27,24 @@ from .metrics import (
     LatencyMetrics,
     QualityMetrics,
     ToolCallingMetrics,
-    MetricsCalculator
 )
 from .realtime_evaluator import RealtimeEvaluator
 from .realtime_metrics import RealtimeMetrics
+from .result_store import ResultStore
+from .sequential import SequentialMonitor
+from .significance import paired_significance
 from ..clients.azure_openai import AzureOpenAIClient
+from ..utils import cancellation
+from ..utils.results_index import record_saved_result
 
 logger = logging.getLogger(__name__)
 
 
+def _report_status(result_a: EvaluationResult, result_b: EvaluationResult) -> str:
+    """``"cancelled"`` if either side of a comparison is a partial run."""
+    return 'cancelled' if 'cancelled' in (result_a.status, result_b.status) else 'completed'
+
+
 @dataclass
 class ComparisonDimension:
     """A single dimension of comparison between models"""
@@ -44,9 +55,12 @@ class ComparisonDimension:
     percent_change: float
     better_model: str
     significance: str  # 'high', 'medium', 'low', 'negligible'
+    # Paired bootstrap CI of (B − A), when the dimension has one
+    ci_low: Optional[float] = None
+    ci_high: Optional[float] = None
     
     def to_dict(self) -> Dict:
-        return {
+        d = {
             'dimension': self.dimension,
             'model_a_value': self.model_a_value,
             'model_b_value': self.model_b_value,
@@ -55,6 +69,10 @@ class ComparisonDimension:
             'better_model': self.better_model,
             'significance': self.significance
         }
+        if self.ci_low is not None and self.ci_high is not None:
+            d['ci_low'] = self.ci_low
+            d['ci_high'] = self.ci_high
+        return d
 
 
 @dataclass
@@ -75,6 +93,8 @@ class ComparisonReport:
     foundry_meta: Optional[Dict[str, Any]] = None
     migration_readiness: Optional[Dict[str, Any]] = None
     batch_id: Optional[str] = None
+    adaptive: Optional[Dict[str, Any]] = None
+    status: str = "completed"  # "cancelled" when built from partial runs
     
     @staticmethod
     def _sanitize(obj):
@@ -108,24 +128,29 @@ class ComparisonReport:
             'foundry_meta': self.foundry_meta,
             'migration_readiness': self.migration_readiness,
             'batch_id': self.batch_id,
+            'adaptive': self.adaptive,
+            'status': self.status,
         }
         return self._sanitize(raw)
         
     def save(self, output_dir: str = "data/results"):
-        """Save comparison report to JSON file (atomic write to prevent truncation)"""
+        """Save comparison report to JSON file (atomic write to prevent truncation)
+        and record it in the directory's results index."""
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
         filename = f"comparison_{self.model_a}_vs_{self.model_b}_{self.evaluation_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         final_path = output_path / filename
         tmp_path = final_path.with_suffix('.json.tmp')
+        data = self.to_dict()
         try:
             with open(tmp_path, 'w', encoding='utf-8') as f:
-                json.dump(self.to_dict(), f, indent=2)
+                json.dump(data, f, indent=2)
             tmp_path.replace(final_path)
         except BaseException:
             tmp_path.unlink(missing_ok=True)
             raise
+        record_saved_result(output_dir, filename, data)
             
     def to_markdown(self) -> str:
         """Generate markdown summary of comparison"""
@@ -166,6 +191,9 @@ class ModelComparator:
         acceptance_thresholds: Optional[Dict[str, Dict[str, float]]] = None,
         prompt_loader = None,
         data_loader = None,
+        batch_fan_out: int = 3,
+        result_store: Optional[ResultStore] = None,
+        adaptive: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize the comparator.
@@ -179,11 +207,23 @@ class ModelComparator:
             acceptance_thresholds: Pre-loaded thresholds dict (avoids re-reading YAML)
             prompt_loader: Optional PromptLoader for user-specific prompts
             data_loader: Optional DataLoader for user-specific test data
+            batch_fan_out: Max candidate models evaluated concurrently in
+                ``compare_models_batch_async``
+            result_store: Optional ``ResultStore``; when set, a model whose
+                prompt, scenario data and config are unchanged since a
+                previous complete run is served from the store
+            adaptive: Sequential early-stopping options
+                (``settings.yaml → evaluation.adaptive_comparison``):
+                ``enabled``, ``batch_size``, ``min_fraction``, ``alpha``,
+                ``seed``
         """
         self.client = client
         self.evaluator = evaluator or ModelEvaluator(client)
         self.foundry_evaluator = foundry_evaluator
         self.parallel_models = parallel_models
+        self.batch_fan_out = max(1, batch_fan_out)
+        self.result_store = result_store
+        self.adaptive_settings: Dict[str, Any] = dict(adaptive or {})
         self._prompt_loader = prompt_loader
         self._data_loader = data_loader
         self._realtime_evaluator: Optional[RealtimeEvaluator] = None
@@ -219,6 +259,8 @@ class ModelComparator:
         run_evaluations: bool = True,
         existing_results: Optional[Tuple[EvaluationResult, EvaluationResult]] = None,
         include_foundry: bool = False,
+        force_fresh: bool = False,
+        adaptive: Optional[bool] = None,
     ) -> ComparisonReport:
         """
         Compare two models on a specific evaluation type.
@@ -229,6 +271,8 @@ class ModelComparator:
             run_evaluations=run_evaluations,
             existing_results=existing_results,
             include_foundry=include_foundry,
+            force_fresh=force_fresh,
+            adaptive=adaptive,
         ))
 
     async def compare_models_async(
@@ -239,18 +283,41 @@ class ModelComparator:
         run_evaluations: bool = True,
         existing_results: Optional[Tuple[EvaluationResult, EvaluationResult]] = None,
         include_foundry: bool = False,
+        force_fresh: bool = False,
+        adaptive: Optional[bool] = None,
     ) -> ComparisonReport:
         """
         Async comparison: evaluates both models in parallel (when
         ``parallel_models`` is enabled), then optionally submits both
         Foundry evaluations concurrently.
+
+        Unless ``force_fresh`` is set, models with an unchanged prompt,
+        scenario file and config are served from ``result_store``.
+
+        With ``adaptive`` (default: ``adaptive_settings['enabled']``)
+        classification runs are fed in random mini-batches and stop as
+        soon as the sequential monitor shows the outcome is settled; see
+        :mod:`.sequential`.
         """
+        if adaptive is None:
+            adaptive = bool(self.adaptive_settings.get('enabled', False))
+        adaptive_info: Optional[Dict[str, Any]] = None
+
         # Get evaluation results
         if existing_results:
             result_a, result_b = existing_results
+        elif run_evaluations and adaptive and self._supports_adaptive(model_a, model_b, evaluation_type):
+            result_a, result_b, adaptive_info = await self._run_adaptive_evaluations_async(
+                model_a, model_b, evaluation_type, force_fresh=force_fresh
+            )
         elif run_evaluations:
+            if adaptive:
+                logger.info(
+                    f"Adaptive comparison only applies to text classification; "
+                    f"running the full {evaluation_type} set"
+                )
             result_a, result_b = await self._run_evaluations_async(
-                model_a, model_b, evaluation_type
+                model_a, model_b, evaluation_type, force_fresh=force_fresh
             )
         else:
             raise ValueError("Must provide existing_results or set run_evaluations=True")
@@ -258,9 +325,11 @@ class ModelComparator:
         foundry_scores_a: Optional[Dict[str, Any]] = None
         foundry_scores_b: Optional[Dict[str, Any]] = None
         foundry_meta: Optional[Dict[str, Any]] = None
+        status = _report_status(result_a, result_b)
 
         # Optional: submit both model outputs to Foundry LLM-as-judge
-        if include_foundry:
+        # (not for a cancelled comparison — its partial report is saved as is)
+        if include_foundry and not cancellation.is_cancelled():
             foundry_meta = {
                 'enabled': True,
                 'completed': False,
@@ -275,6 +344,9 @@ class ModelComparator:
                     result_a, result_b, evaluation_type, model_a, model_b, foundry_meta
                 )
 
+        # Statistical significance tests (paired by scenario)
+        statistical_significance = self._paired_significance(result_a, result_b)
+
         # Generate comparison dimensions
         dimensions = self._generate_dimensions(
             result_a,
@@ -282,10 +354,16 @@ class ModelComparator:
             evaluation_type,
             foundry_scores_a=foundry_scores_a,
             foundry_scores_b=foundry_scores_b,
+            statistical_significance=statistical_significance,
         )
         
         # Generate summary
         summary = self._generate_summary(dimensions, model_a, model_b)
+        if adaptive_info is not None:
+            summary['adaptive'] = {
+                k: adaptive_info[k]
+                for k in ('scenarios_used', 'scenarios_total', 'stopped_early', 'estimated_tokens_saved')
+            }
         if include_foundry:
             foundry_dims = [d for d in dimensions if d.dimension.endswith('(Foundry)')]
             summary['foundry'] = {
@@ -305,16 +383,6 @@ class ModelComparator:
             result_b, evaluation_type, model_b
         )
         
-        # Statistical significance tests
-        statistical_significance = None
-        if result_a.raw_results and result_b.raw_results:
-            try:
-                statistical_significance = MetricsCalculator.calculate_statistical_significance(
-                    result_a.raw_results, result_b.raw_results
-                )
-            except Exception:
-                pass
-        
         return ComparisonReport(
             model_a=model_a,
             model_b=model_b,
@@ -330,6 +398,8 @@ class ModelComparator:
             foundry_scores_b=foundry_scores_b,
             foundry_meta=foundry_meta,
             migration_readiness=migration_readiness,
+            adaptive=adaptive_info,
+            status=status,
         )
         
     def compare_models_batch(
@@ -339,6 +409,7 @@ class ModelComparator:
         evaluation_type: str = "classification",
         include_foundry: bool = False,
         progress_callback: Optional[Callable[[int, int, str, Optional[ComparisonReport]], None]] = None,
+        force_fresh: bool = False,
     ) -> List[ComparisonReport]:
         """Compare model_a against multiple model_b's, evaluating A only once.
 
@@ -350,6 +421,8 @@ class ModelComparator:
             include_foundry: Whether to run Foundry LLM-as-judge evaluations.
             progress_callback: Optional ``(completed_idx, total, current_model_b,
                 report_or_None)`` called after each pair completes.
+            force_fresh: Re-run every model even if ``result_store`` holds
+                a result for unchanged inputs.
 
         Returns:
             List of ComparisonReport — one per model_b.
@@ -358,6 +431,7 @@ class ModelComparator:
             model_a, model_b_list, evaluation_type,
             include_foundry=include_foundry,
             progress_callback=progress_callback,
+            force_fresh=force_fresh,
         ))
 
     async def compare_models_batch_async(
@@ -367,134 +441,147 @@ class ModelComparator:
         evaluation_type: str = "classification",
         include_foundry: bool = False,
         progress_callback: Optional[Callable[[int, int, str, Optional[ComparisonReport]], None]] = None,
+        force_fresh: bool = False,
     ) -> List[ComparisonReport]:
         """Async batch comparison: evaluates model_a once, then each model_b.
 
-        Foundry scores for model_a are also submitted once and reused.
+        Candidates run concurrently (up to ``batch_fan_out`` at a time, each
+        additionally bounded by its deployment's own limit) and
+        ``progress_callback`` fires in completion order.  Foundry scores for
+        model_a are also submitted once and reused.
         """
         batch_id = uuid.uuid4().hex[:12]
         total = len(model_b_list)
-        reports: List[ComparisonReport] = []
 
         # 1. Evaluate model A once
         logger.info(f"[Batch {batch_id}] Evaluating model_a={model_a} ({evaluation_type})")
-        result_a = await self._evaluate_single_model_async(model_a, evaluation_type)
+        result_a = await self._evaluate_single_model_async(
+            model_a, evaluation_type, force_fresh=force_fresh
+        )
 
         # 2. Foundry for model_a (once)
         foundry_scores_a: Optional[Dict[str, Any]] = None
         foundry_meta_a: Optional[Dict[str, Any]] = None
-        if include_foundry and self.foundry_evaluator is not None:
+        if include_foundry and self.foundry_evaluator is not None and not cancellation.is_cancelled():
             logger.info(f"[Batch {batch_id}] Submitting Foundry evaluation for model_a={model_a}")
             foundry_scores_a, foundry_meta_a = await self._submit_foundry_single(
                 result_a, evaluation_type, model_a
             )
 
-        # 3. For each model_b: evaluate, optionally Foundry, compare
-        for idx, model_b in enumerate(model_b_list):
-            logger.info(
-                f"[Batch {batch_id}] Comparing {model_a} vs {model_b} "
-                f"({idx + 1}/{total})"
-            )
+        # 3. Fan out over the candidates: each model_b is a different
+        # deployment with its own quota (enforced by the client's shared
+        # per-deployment limiter), so evaluate up to ``batch_fan_out`` at once.
+        fan_out = asyncio.Semaphore(max(1, self.batch_fan_out))
+        done = 0
 
-            # Notify that this comparison is *starting* so the UI can
-            # update the progress label immediately (before the eval runs).
+        def _notify(*args, **kwargs) -> None:
             if progress_callback:
                 try:
-                    progress_callback(idx, total, model_b, None, starting=True)
+                    progress_callback(*args, **kwargs)
                 except Exception:
                     pass
 
-            try:
-                self._validate_modality(model_a, model_b)
-                result_b = await self._evaluate_single_model_async(model_b, evaluation_type)
-
-                # Foundry for model_b
-                f_scores_b: Optional[Dict[str, Any]] = None
-                f_meta: Optional[Dict[str, Any]] = None
-                if include_foundry:
-                    f_meta = {
-                        'enabled': True,
-                        'completed': False,
-                        'errors': [],
-                        'model_a': foundry_meta_a or {'eval_id': None, 'run_id': None, 'report_url': None},
-                        'model_b': {'eval_id': None, 'run_id': None, 'report_url': None},
-                    }
-                    if self.foundry_evaluator is None:
-                        f_meta['errors'].append('Foundry evaluator is not configured.')
-                    else:
-                        logger.info(f"[Batch {batch_id}] Submitting Foundry for model_b={model_b}")
-                        f_scores_b, f_meta_b = await self._submit_foundry_single(
-                            result_b, evaluation_type, model_b
-                        )
-                        f_meta['model_b'] = f_meta_b or {'eval_id': None, 'run_id': None, 'report_url': None}
-                        if f_scores_b is None:
-                            f_meta['errors'].append(f"No Foundry scores returned for {model_b}.")
-                        if foundry_scores_a is None:
-                            f_meta['errors'].append(f"No Foundry scores returned for {model_a}.")
-                        f_meta['completed'] = bool(foundry_scores_a and f_scores_b)
-
-                # Build comparison report
-                dimensions = self._generate_dimensions(
-                    result_a, result_b, evaluation_type,
-                    foundry_scores_a=foundry_scores_a,
-                    foundry_scores_b=f_scores_b,
-                )
-                summary = self._generate_summary(dimensions, model_a, model_b)
-                if include_foundry:
-                    foundry_dims = [d for d in dimensions if d.dimension.endswith('(Foundry)')]
-                    summary['foundry'] = {
-                        'enabled': True,
-                        'metrics_compared': len(foundry_dims),
-                        'completed': bool(foundry_scores_a and f_scores_b),
-                        'errors': (f_meta or {}).get('errors', []),
-                    }
-                recommendations = self._generate_recommendations(
-                    dimensions, result_a, result_b, model_a, model_b
+        async def _compare_one(idx: int, model_b: str) -> Tuple[int, str, Optional[ComparisonReport]]:
+            async with fan_out:
+                if cancellation.is_cancelled():
+                    return idx, model_b, None
+                logger.info(
+                    f"[Batch {batch_id}] Comparing {model_a} vs {model_b} "
+                    f"({idx + 1}/{total})"
                 )
-                migration_readiness = self._evaluate_migration_readiness(
-                    result_b, evaluation_type, model_b
-                )
-                statistical_significance = None
-                if result_a.raw_results and result_b.raw_results:
-                    try:
-                        statistical_significance = MetricsCalculator.calculate_statistical_significance(
-                            result_a.raw_results, result_b.raw_results
-                        )
-                    except Exception:
-                        pass
-
-                report = ComparisonReport(
-                    model_a=model_a,
-                    model_b=model_b,
-                    timestamp=datetime.now().isoformat(),
-                    evaluation_type=evaluation_type,
-                    dimensions=dimensions,
-                    summary=summary,
-                    recommendations=recommendations,
-                    raw_results_a=result_a.raw_results,
-                    raw_results_b=result_b.raw_results,
-                    statistical_significance=statistical_significance,
-                    foundry_scores_a={'aggregated': foundry_scores_a.get('aggregated', {})} if foundry_scores_a else None,
-                    foundry_scores_b={'aggregated': f_scores_b.get('aggregated', {})} if f_scores_b else None,
-                    foundry_meta=f_meta,
-                    migration_readiness=migration_readiness,
-                    batch_id=batch_id,
-                )
-                reports.append(report)
-
-                if progress_callback:
-                    try:
-                        progress_callback(idx + 1, total, model_b, report)
-                    except Exception:
-                        pass
-
-            except Exception as exc:
-                logger.error(f"[Batch {batch_id}] Failed {model_a} vs {model_b}: {exc}")
-                if progress_callback:
-                    try:
-                        progress_callback(idx + 1, total, model_b, None)
-                    except Exception:
-                        pass
+                # Notify that this comparison is *starting* so the UI can
+                # update the progress label immediately (before the eval runs).
+                _notify(done, total, model_b, None, starting=True)
+                try:
+                    self._validate_modality(model_a, model_b)
+                    result_b = await self._evaluate_single_model_async(
+                        model_b, evaluation_type, force_fresh=force_fresh
+                    )
+
+                    # Foundry for model_b
+                    f_scores_b: Optional[Dict[str, Any]] = None
+                    f_meta: Optional[Dict[str, Any]] = None
+                    if include_foundry and not cancellation.is_cancelled():
+                        f_meta = {
+                            'enabled': True,
+                            'completed': False,
+                            'errors': [],
+                            'model_a': foundry_meta_a or {'eval_id': None, 'run_id': None, 'report_url': None},
+                            'model_b': {'eval_id': None, 'run_id': None, 'report_url': None},
+                        }
+                        if self.foundry_evaluator is None:
+                            f_meta['errors'].append('Foundry evaluator is not configured.')
+                        else:
+                            logger.info(f"[Batch {batch_id}] Submitting Foundry for model_b={model_b}")
+                            f_scores_b, f_meta_b = await self._submit_foundry_single(
+                                result_b, evaluation_type, model_b
+                            )
+                            f_meta['model_b'] = f_meta_b or {'eval_id': None, 'run_id': None, 'report_url': None}
+                            if f_scores_b is None:
+                                f_meta['errors'].append(f"No Foundry scores returned for {model_b}.")
+                            if foundry_scores_a is None:
+                                f_meta['errors'].append(f"No Foundry scores returned for {model_a}.")
+                            f_meta['completed'] = bool(foundry_scores_a and f_scores_b)
+
+                    # Build comparison report
+                    statistical_significance = self._paired_significance(result_a, result_b)
+                    dimensions = self._generate_dimensions(
+                        result_a, result_b, evaluation_type,
+                        foundry_scores_a=foundry_scores_a,
+                        foundry_scores_b=f_scores_b,
+                        statistical_significance=statistical_significance,
+                    )
+                    summary = self._generate_summary(dimensions, model_a, model_b)
+                    if include_foundry:
+                        foundry_dims = [d for d in dimensions if d.dimension.endswith('(Foundry)')]
+                        summary['foundry'] = {
+                            'enabled': True,
+                            'metrics_compared': len(foundry_dims),
+                            'completed': bool(foundry_scores_a and f_scores_b),
+                            'errors': (f_meta or {}).get('errors', []),
+                        }
+                    recommendations = self._generate_recommendations(
+                        dimensions, result_a, result_b, model_a, model_b
+                    )
+                    migration_readiness = self._evaluate_migration_readiness(
+                        result_b, evaluation_type, model_b
+                    )
+
+                    report = ComparisonReport(
+                        model_a=model_a,
+                        model_b=model_b,
+                        timestamp=datetime.now().isoformat(),
+                        evaluation_type=evaluation_type,
+                        dimensions=dimensions,
+                        summary=summary,
+                        recommendations=recommendations,
+                        raw_results_a=result_a.raw_results,
+                        raw_results_b=result_b.raw_results,
+                        statistical_significance=statistical_significance,
+                        foundry_scores_a={'aggregated': foundry_scores_a.get('aggregated', {})} if foundry_scores_a else None,
+                        foundry_scores_b={'aggregated': f_scores_b.get('aggregated', {})} if f_scores_b else None,
+                        foundry_meta=f_meta,
+                        migration_readiness=migration_readiness,
+                        batch_id=batch_id,
+                        status=_report_status(result_a, result_b),
+                    )
+                    return idx, model_b, report
+                except Exception as exc:
+                    logger.error(f"[Batch {batch_id}] Failed {model_a} vs {model_b}: {exc}")
+                    return idx, model_b, None
+
+        # Reports are delivered in completion order — a slow or failing
+        # candidate never holds back the others.
+        tasks = [_compare_one(idx, mb) for idx, mb in enumerate(model_b_list)]
+        finished: Dict[int, Optional[ComparisonReport]] = {}
+        for fut in asyncio.as_completed(tasks):
+            idx, model_b, report = await fut
+            done += 1
+            finished[idx] = report
+            _notify(done, total, model_b, report)
+
+        # Return reports in the caller's candidate order
+        reports = [finished[i] for i in range(total) if finished.get(i) is not None]
 
         logger.info(f"[Batch {batch_id}] Completed {len(reports)}/{total} comparisons")
         return reports
@@ -503,26 +590,197 @@ class ModelComparator:
         self,
         model: str,
         evaluation_type: str,
+        force_fresh: bool = False,
     ) -> 'EvaluationResult':
         """Evaluate a single model for the given evaluation type.
 
         Dispatches to the ``RealtimeEvaluator`` when the model's backend
         is ``"realtime"``, otherwise uses the standard ``ModelEvaluator``.
+        Text evaluations are looked up in (and written back to)
+        ``result_store`` by content fingerprint unless ``force_fresh``.
         """
         cfg = self.client.models.get(model)
         if cfg and cfg.backend == "realtime":
             return await self._evaluate_realtime_model(model, evaluation_type)
 
+        key, cached = await self._stored_result(model, evaluation_type, force_fresh)
+        if cached is not None:
+            return cached
+
         if evaluation_type == "classification":
-            return await self.evaluator.evaluate_classification_async(model)
+            result = await self.evaluator.evaluate_classification_async(model)
         elif evaluation_type == "dialog":
-            return await self.evaluator.evaluate_dialog_async(model)
+            result = await self.evaluator.evaluate_dialog_async(model)
         elif evaluation_type == "rag":
-            return await self.evaluator.evaluate_rag_async(model)
+            result = await self.evaluator.evaluate_rag_async(model)
         elif evaluation_type == "tool_calling":
-            return await self.evaluator.evaluate_tool_calling_async(model)
+            result = await self.evaluator.evaluate_tool_calling_async(model)
+        else:
+            result = await self.evaluator.evaluate_general_async(model)
+
+        # Only complete runs are reusable; partial ones must be retried
+        if key is not None and not result.errors and result.status == 'completed':
+            await asyncio.to_thread(self.result_store.put, key, result.to_dict())
+        return result
+
+    async def _stored_result(
+        self,
+        model: str,
+        evaluation_type: str,
+        force_fresh: bool = False,
+    ) -> Tuple[Optional[str], Optional[EvaluationResult]]:
+        """Return ``(fingerprint, stored result or None)`` from ``result_store``."""
+        if self.result_store is None:
+            return None, None
+        key = await asyncio.to_thread(
+            self.evaluator.result_fingerprint, model, evaluation_type,
+        )
+        if force_fresh:
+            return key, None
+        cached = await asyncio.to_thread(self.result_store.get, key)
+        if cached is None:
+            return key, None
+        logger.info(
+            f"Reusing stored {evaluation_type} result for {model} "
+            f"from {cached.get('timestamp')} (inputs unchanged)"
+        )
+        return key, EvaluationResult.from_dict(cached)
+
+    # ── Adaptive (sequential) comparison ────────────────────────────────
+
+    def _supports_adaptive(self, model_a: str, model_b: str, evaluation_type: str) -> bool:
+        if evaluation_type != "classification":
+            return False
+        for model in (model_a, model_b):
+            cfg = self.client.models.get(model)
+            if cfg and cfg.backend == "realtime":
+                return False
+        return True
+
+    async def _run_adaptive_evaluations_async(
+        self,
+        model_a: str,
+        model_b: str,
+        evaluation_type: str,
+        force_fresh: bool = False,
+    ) -> Tuple[EvaluationResult, EvaluationResult, Dict[str, Any]]:
+        """Evaluate both models on random mini-batches until the outcome is settled.
+
+        After each batch (once ``min_fraction`` of the scenarios has run)
+        a :class:`SequentialMonitor` look checks whether model B's
+        migration-readiness verdict can still change — or, without
+        acceptance thresholds, whether accuracy / latency already differ
+        clearly.  Stopped runs are partial, so they are never written to
+        ``result_store``; if both models already have stored complete
+        results those are used instead and no API calls are made.
+        """
+        self._validate_modality(model_a, model_b)
+        opts = self.adaptive_settings
+        batch_size = max(1, int(opts.get('batch_size', 10)))
+        min_fraction = float(opts.get('min_fraction', 0.3))
+        alpha = float(opts.get('alpha', 0.05))
+
+        scenarios = self.evaluator.data_loader.load_classification_scenarios()
+        total = len(scenarios)
+        info: Dict[str, Any] = {
+            'enabled': True,
+            'scenarios_total': total,
+            'scenarios_used': total,
+            'stopped_early': False,
+            'reason': '',
+            'batch_size': batch_size,
+            'alpha': alpha,
+            'looks': [],
+            'estimated_tokens_saved': 0,
+        }
+
+        (key_a, stored_a), (key_b, stored_b) = await asyncio.gather(
+            self._stored_result(model_a, evaluation_type, force_fresh),
+            self._stored_result(model_b, evaluation_type, force_fresh),
+        )
+        if stored_a is not None and stored_b is not None:
+            info['reason'] = 'complete results reused from result store'
+            return stored_a, stored_b, info
+
+        order = random.Random(opts.get('seed')).sample(scenarios, total)
+        min_scenarios = max(batch_size, math.ceil(min_fraction * total))
+        monitor = SequentialMonitor(total, alpha=alpha)
+        outcomes = {model_a: [], model_b: []}
+        errors = {model_a: [], model_b: []}
+
+        async def _collect(model: str, batch: List[Any]) -> None:
+            outs, errs = await self.evaluator.collect_classification_outcomes_async(
+                model, batch, keep_checkpoint=True,
+            )
+            outcomes[model].extend(outs)
+            errors[model].extend(errs)
+
+        used = 0
+        while used < total:
+            if cancellation.is_cancelled():
+                info['reason'] = 'cancelled'
+                break
+            batch = order[used:used + batch_size]
+            if self.parallel_models:
+                await asyncio.gather(_collect(model_a, batch), _collect(model_b, batch))
+            else:
+                await _collect(model_a, batch)
+                await _collect(model_b, batch)
+            used += len(batch)
+            if used < min_scenarios or used >= total:
+                continue
+
+            interim_a = self.evaluator.aggregate_classification_outcomes(model_a, outcomes[model_a], errors[model_a])
+            interim_b = self.evaluator.aggregate_classification_outcomes(model_b, outcomes[model_b], errors[model_b])
+            look = monitor.look(
+                interim_a.raw_results,
+                interim_b.raw_results,
+                self._evaluate_migration_readiness(interim_b, evaluation_type, model_b),
+                used,
+            )
+            info['looks'].append(look.to_dict())
+            if look.stop:
+                info['stopped_early'] = True
+                info['reason'] = look.reason
+                break
+
+        info['scenarios_used'] = used
+        result_a = self.evaluator.aggregate_classification_outcomes(model_a, outcomes[model_a], errors[model_a])
+        result_b = self.evaluator.aggregate_classification_outcomes(model_b, outcomes[model_b], errors[model_b])
+
+        if info['stopped_early']:
+            saved = 0.0
+            for model, res in ((model_a, result_a), (model_b, result_b)):
+                tokens = [r.get('tokens') or 0 for r in res.raw_results]
+                if tokens:
+                    runs = (self.evaluator.consistency_runs
+                            if self.evaluator._should_measure_consistency(model, True) else 1)
+                    saved += sum(tokens) / len(tokens) * runs * (total - used)
+            info['estimated_tokens_saved'] = int(saved)
+            logger.info(
+                f"Adaptive comparison {model_a} vs {model_b} stopped after "
+                f"{used}/{total} scenarios ({info['reason']}); "
+                f"~{info['estimated_tokens_saved']} tokens saved"
+            )
+        elif info['reason'] == 'cancelled' or 'cancelled' in (result_a.status, result_b.status):
+            info['reason'] = 'cancelled'
+            for res in (result_a, result_b):
+                res.status = 'cancelled'
         else:
-            return await self.evaluator.evaluate_general_async(model)
+            if not info['reason']:
+                info['reason'] = 'all scenarios evaluated'
+            for key, res in ((key_a, result_a), (key_b, result_b)):
+                if key is not None and not res.errors:
+                    await asyncio.to_thread(self.result_store.put, key, res.to_dict())
+
+        # Batches keep their journal entries so an interrupted adaptive run
+        # resumes; release them once this run has finished cleanly.
+        if info['reason'] != 'cancelled':
+            for model in (model_a, model_b):
+                if all(o is not None for o in outcomes[model]):
+                    await self.evaluator.release_classification_checkpoint(model, order[:used])
+
+        return result_a, result_b, info
 
     async def _evaluate_realtime_model(
         self,
@@ -537,6 +795,7 @@ class ModelComparator:
         """
         if self._realtime_evaluator is None:
             from ..clients.tts_client import load_tts_config_from_settings
+            from ..clients.realtime_client import load_realtime_pool_config_from_settings
             # Resolve optional dedicated endpoint for voice models
             rt_cfg = self._realtime_settings
             raw_ep = rt_cfg.get('endpoint', '')
@@ -557,10 +816,12 @@ class ModelComparator:
                 prompt_loader=self._prompt_loader,
                 data_loader=self._data_loader,
                 tts_config=tts_config,
-                max_concurrent=2,
+                max_concurrent=int(rt_cfg.get('max_concurrent', 2)),
                 realtime_endpoint=realtime_endpoint if realtime_endpoint else None,
                 realtime_api_version=realtime_api_version if realtime_api_version else None,
                 tts_endpoint=tts_endpoint,
+                metrics_calc=self.evaluator.metrics_calc,
+                session_pool=load_realtime_pool_config_from_settings({'realtime': rt_cfg}),
             )
         return await self._realtime_evaluator.evaluate_async(
             model, evaluation_type
@@ -572,15 +833,17 @@ class ModelComparator:
         evaluation_type: str,
         model_name: str,
     ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
-        """Submit a single model's results to Foundry and return (scores, meta)."""
+        """Submit a single model's results to Foundry and return (scores, meta).
+
+        Completion is awaited on the shared Foundry poller, so no thread is
+        held while the run is in progress.
+        """
         meta: Dict[str, Any] = {'eval_id': None, 'run_id': None, 'report_url': None}
         try:
-            res = await asyncio.to_thread(
-                self.foundry_evaluator.submit_evaluation,
+            res = await self.foundry_evaluator.submit_evaluation_async(
                 raw_results=result.raw_results,
                 evaluation_type=evaluation_type,
                 model_name=model_name,
-                poll=True,
             )
             meta = {
                 'eval_id': res.get('eval_id'),
@@ -621,16 +884,20 @@ class ModelComparator:
         self,
         model_a: str,
         model_b: str,
-        evaluation_type: str
+        evaluation_type: str,
+        force_fresh: bool = False,
     ) -> Tuple[EvaluationResult, EvaluationResult]:
         """Run evaluations for both models (sync wrapper)."""
-        return _run_in_loop(self._run_evaluations_async(model_a, model_b, evaluation_type))
+        return _run_in_loop(self._run_evaluations_async(
+            model_a, model_b, evaluation_type, force_fresh=force_fresh
+        ))
 
     async def _run_evaluations_async(
         self,
         model_a: str,
         model_b: str,
-        evaluation_type: str
+        evaluation_type: str,
+        force_fresh: bool = False,
     ) -> Tuple[EvaluationResult, EvaluationResult]:
         """Run evaluations for both models, optionally in parallel.
 
@@ -639,19 +906,9 @@ class ModelComparator:
         self._validate_modality(model_a, model_b)
 
         def _get_coro(model: str):
-            cfg = self.client.models.get(model)
-            if cfg and cfg.backend == "realtime":
-                return self._evaluate_realtime_model(model, evaluation_type)
-            if evaluation_type == "classification":
-                return self.evaluator.evaluate_classification_async(model)
-            elif evaluation_type == "dialog":
-                return self.evaluator.evaluate_dialog_async(model)
-            elif evaluation_type == "rag":
-                return self.evaluator.evaluate_rag_async(model)
-            elif evaluation_type == "tool_calling":
-                return self.evaluator.evaluate_tool_calling_async(model)
-            else:
-                return self.evaluator.evaluate_general_async(model)
+            return self._evaluate_single_model_async(
+                model, evaluation_type, force_fresh=force_fresh
+            )
 
         if self.parallel_models:
             logger.info(f"Running {evaluation_type} evaluation for {model_a} and {model_b} in parallel")
@@ -692,22 +949,30 @@ class ModelComparator:
         model_b: str,
         foundry_meta: Dict[str, Any],
     ) -> Tuple[Optional[Dict], Optional[Dict], Dict]:
-        """Submit both Foundry evaluations concurrently via a thread pool.
+        """Submit both Foundry evaluations concurrently.
 
-        ``submit_evaluation`` is a blocking call (polls for completion), so
-        we run both inside ``asyncio.to_thread`` to overlap their I/O waits.
+        Each submission returns as soon as its run is created; both are
+        then awaited on the shared Foundry poller rather than on two
+        blocked polling threads.
         """
         foundry_scores_a: Optional[Dict[str, Any]] = None
         foundry_scores_b: Optional[Dict[str, Any]] = None
 
         async def _submit(raw_results, model_name, meta_key):
+            def _submitted(sub) -> None:
+                foundry_meta[meta_key] = {
+                    'eval_id': sub.eval_id,
+                    'run_id': sub.run_id,
+                    'report_url': sub.report_url,
+                    'status': sub.status,
+                }
+
             try:
-                res = await asyncio.to_thread(
-                    self.foundry_evaluator.submit_evaluation,
+                res = await self.foundry_evaluator.submit_evaluation_async(
                     raw_results=raw_results,
                     evaluation_type=evaluation_type,
                     model_name=model_name,
-                    poll=True,
+                    on_submitted=_submitted,
                 )
                 foundry_meta[meta_key] = {
                     'eval_id': res.get('eval_id'),
@@ -741,8 +1006,14 @@ class ModelComparator:
         evaluation_type: str,
         foundry_scores_a: Optional[Dict[str, Any]] = None,
         foundry_scores_b: Optional[Dict[str, Any]] = None,
+        statistical_significance: Optional[Dict[str, Any]] = None,
     ) -> List[ComparisonDimension]:
-        """Generate comparison dimensions from results"""
+        """Generate comparison dimensions from results.
+
+        Dimensions with a paired bootstrap CI in
+        ``statistical_significance['bootstrap']`` carry it, and are only
+        rated above 'negligible' when the CI excludes zero.
+        """
         dimensions = []
         
         # Classification metrics
@@ -920,7 +1191,36 @@ class ModelComparator:
                     self._create_dimension("TTS Cache Hit Rate %", rt_a.tts_cache_hit_rate, rt_b.tts_cache_hit_rate, higher_better=True)
                 )
 
+        intervals = ((statistical_significance or {}).get('bootstrap') or {}).get('metrics') or {}
+        for dim in dimensions:
+            ci = intervals.get(dim.dimension)
+            if not ci:
+                continue
+            dim.ci_low, dim.ci_high = ci['ci_low'], ci['ci_high']
+            if not ci['excludes_zero']:
+                dim.significance = 'negligible'
+
         return dimensions
+
+    def _paired_significance(
+        self,
+        result_a: EvaluationResult,
+        result_b: EvaluationResult,
+    ) -> Optional[Dict[str, Any]]:
+        """Paired tests + bootstrap CIs over both runs' raw results."""
+        if not (result_a.raw_results and result_b.raw_results):
+            return None
+        calc = self.evaluator.metrics_calc
+        try:
+            return paired_significance(
+                result_a.raw_results,
+                result_b.raw_results,
+                cost_rates_a=calc.get_cost_rates(result_a.model_name),
+                cost_rates_b=calc.get_cost_rates(result_b.model_name),
+            )
+        except Exception as e:
+            logger.warning(f"Significance tests failed for {result_a.model_name} vs {result_b.model_name}: {e}")
+            return None
         
     def _create_dimension(
         self,
@@ -14,13 +14,17 @@ import asyncio
 import re
 import traceback
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 import logging
 
 from ..clients.azure_openai import AzureOpenAIClient, CompletionResult
+from ..clients.response_parser import ParsedResponse, parse_response
+from .checkpoint import CheckpointJournal, fingerprint, prompt_file_hash
 from ..utils.prompt_loader import PromptLoader
+from ..utils import cancellation, raw_results_store, run_events
+from ..utils.results_index import record_saved_result
 from ..utils.category_parser import extract_categories_from_prompt as _extract_categories_from_prompt
 from ..utils.data_loader import (
     DataLoader, 
@@ -235,6 +239,7 @@ class EvaluationResult:
     realtime_metrics: Optional['RealtimeMetrics'] = None
     raw_results: List[Dict] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
+    status: str = "completed"  # "cancelled" for a partial run stopped by the user
     
     def to_dict(self) -> Dict:
         return {
@@ -251,23 +256,74 @@ class EvaluationResult:
             'raw_results': self.raw_results,
             'error_count': len(self.errors),
             'errors': self.errors,
+            'status': self.status,
         }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EvaluationResult':
+        """Rebuild a result from :meth:`to_dict` output (e.g. a saved JSON file)."""
+        from .realtime_metrics import RealtimeMetrics
+
+        def _build(metrics_cls, payload):
+            if not payload:
+                return None
+            names = {f.name for f in fields(metrics_cls)}
+            return metrics_cls(**{k: v for k, v in payload.items() if k in names})
+
+        classification = _build(ClassificationMetrics, data.get('classification_metrics'))
+        if classification is not None and classification.confusion_matrix is not None:
+            import numpy as np
+            classification.confusion_matrix = np.array(classification.confusion_matrix)
+
+        return cls(
+            model_name=data.get('model_name', ''),
+            evaluation_type=data.get('evaluation_type', ''),
+            timestamp=data.get('timestamp', ''),
+            scenarios_tested=int(data.get('scenarios_tested') or 0),
+            classification_metrics=classification,
+            consistency_metrics=_build(ConsistencyMetrics, data.get('consistency_metrics')),
+            latency_metrics=_build(LatencyMetrics, data.get('latency_metrics')),
+            quality_metrics=_build(QualityMetrics, data.get('quality_metrics')),
+            tool_calling_metrics=_build(ToolCallingMetrics, data.get('tool_calling_metrics')),
+            realtime_metrics=_build(RealtimeMetrics, data.get('realtime_metrics')),
+            raw_results=data.get('raw_results') or [],
+            errors=data.get('errors') or [],
+            status=data.get('status') or 'completed',
+        )
         
     def save(self, output_dir: str = "data/results"):
-        """Save results to JSON file (atomic write to prevent truncation)"""
+        """Save results to JSON file (atomic write to prevent truncation)
+        and record it in the directory's results index."""
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
         filename = f"{self.model_name}_{self.evaluation_type}_{self.timestamp.replace(':', '-')}.json"
         final_path = output_path / filename
         tmp_path = final_path.with_suffix('.json.tmp')
+        data = self.to_dict()
+        if self.raw_results and raw_results_store.is_enabled():
+            # Per-scenario rows go to a columnar sidecar; the JSON keeps the summary
+            try:
+                sidecar = raw_results_store.write_sidecar(final_path, self.raw_results)
+                data = {**data, 'raw_results': [], 'raw_results_sidecar': sidecar}
+            except Exception as e:
+                logger.warning(f"Columnar raw results failed for {filename}, keeping them inline: {e}")
         try:
             with open(tmp_path, 'w', encoding='utf-8') as f:
-                json.dump(self.to_dict(), f, indent=2)
+                json.dump(data, f, indent=2)
             tmp_path.replace(final_path)
         except BaseException:
             tmp_path.unlink(missing_ok=True)
             raise
+        record_saved_result(output_dir, filename, data)
+
+
+def _mark_if_cancelled(result: EvaluationResult, outcomes: List[Optional[Dict]]) -> EvaluationResult:
+    """Flag *result* as partial when the job was cancelled before every scenario ran."""
+    if cancellation.is_cancelled() and any(o is None for o in outcomes):
+        result.status = 'cancelled'
+        result.scenarios_tested = sum(1 for o in outcomes if o is not None)
+    return result
 
 
 class ModelEvaluator:
@@ -283,6 +339,10 @@ class ModelEvaluator:
         data_loader: Optional[DataLoader] = None,
         consistency_runs: int = 3,
         max_concurrent: int = 5,
+        streaming: bool = False,
+        checkpoint_dir: Optional[str] = None,
+        log_scenarios: bool = False,
+        metrics_calc: Optional[MetricsCalculator] = None,
     ):
         """
         Initialize the evaluator.
@@ -293,27 +353,217 @@ class ModelEvaluator:
             data_loader: DataLoader instance (optional)
             consistency_runs: Number of runs for consistency testing
             max_concurrent: Max parallel API calls (semaphore limit)
+            streaming: Stream every completion so TTFT and inter-token
+                latency are recorded per scenario
+            checkpoint_dir: Directory for per-scenario checkpoint journals;
+                when set, interrupted runs resume instead of starting over
+            log_scenarios: Log one OK/FAIL line per classification scenario
+            metrics_calc: Shared (stateless) ``MetricsCalculator``; one is
+                created when omitted (``log_scenarios`` then applies to it)
         """
         self.client = client
         self.prompt_loader = prompt_loader or PromptLoader()
         self.data_loader = data_loader or DataLoader()
-        self.metrics_calc = MetricsCalculator()
+        self.metrics_calc = metrics_calc or MetricsCalculator(log_scenarios=log_scenarios)
         self.consistency_runs = consistency_runs
         self.max_concurrent = max(1, max_concurrent)
+        self.streaming = streaming
+        self.checkpoint_dir = checkpoint_dir
+
+    async def _complete(self, **kwargs) -> CompletionResult:
+        """Route a completion through the streaming or plain client call."""
+        if self.streaming:
+            return await self.client.stream_complete_async(**kwargs)
+        return await self.client.complete_async(**kwargs)
+
+    @staticmethod
+    def _parsed_responses(entries: List[Any]) -> List[ParsedResponse]:
+        """Rebuild ``ParsedResponse`` objects from scenario outcomes.
+
+        Outcomes carry ``ParsedResponse.to_dict()`` so the parse survives
+        the checkpoint JSON round-trip; plain strings (journals written
+        before responses were parsed once) are parsed here.
+        """
+        return [
+            ParsedResponse.from_dict(e) if isinstance(e, dict) else parse_response(e)
+            for e in entries
+        ]
+
+    @staticmethod
+    def _streaming_timings(raw_results: List[Dict]) -> Dict[str, List[float]]:
+        """Collect per-request TTFT / inter-token values from raw results.
+
+        Returns kwargs for ``calculate_latency_metrics``; values are zero
+        (and ignored there) for non-streaming runs.
+        """
+        ttfts: List[float] = []
+        itls: List[float] = []
+        for r in raw_results:
+            if 'ttfts' in r:
+                ttfts.extend(r.get('ttfts') or [])
+                itls.extend(r.get('inter_token_latencies') or [])
+            else:
+                ttfts.append(r.get('ttft', 0.0))
+                itls.append(r.get('inter_token_latency', 0.0))
+        return {'ttft_values': ttfts, 'inter_token_values': itls}
+
+    def _run_fingerprint(self, model_name: str, evaluation_type: str, **options) -> str:
+        """Hash of everything besides the scenario that shapes an outcome.
+
+        Covers the resolved prompt file, the model's ``ModelConfig`` and
+        run options (consistency, streaming), so a change to any of them
+        invalidates journaled outcomes.
+        """
+        prompt_type = _EVAL_PROMPT_TYPES.get(evaluation_type)
+        prompt_path = self.prompt_loader._resolve_path(model_name, prompt_type) if prompt_type else None
+        config = self.client.models.get(model_name)
+        return fingerprint({
+            'prompt': prompt_file_hash(prompt_path),
+            'config': asdict(config) if config else None,
+            'streaming': self.streaming,
+            'consistency_runs': self.consistency_runs,
+            **options,
+        })
+
+    def result_fingerprint(self, model_name: str, evaluation_type: str, **options) -> str:
+        """Content address of a whole evaluation run.
+
+        Extends :meth:`_run_fingerprint` with the bytes of the scenario
+        file, so a ``ResultStore`` entry is reused only when the prompt,
+        the scenario data and the model config are all unchanged.
+        """
+        return fingerprint({
+            'model': model_name,
+            'evaluation_type': evaluation_type,
+            'run': self._run_fingerprint(model_name, evaluation_type, **options),
+            'data': prompt_file_hash(self.data_loader.scenario_file(evaluation_type)),
+        })
+
+    async def _gather_checkpointed(
+        self,
+        model_name: str,
+        evaluation_type: str,
+        items: List[Any],
+        process,
+        keep_checkpoint: bool = False,
+        **options,
+    ) -> List[Optional[Dict]]:
+        """Run ``process(item)`` for every scenario, resuming from the journal.
+
+        Without ``checkpoint_dir`` this is a plain ``asyncio.gather``.
+        Otherwise outcomes already journaled under the same
+        (model, type, scenario id, prompt/config hash, data hash) are
+        reused, only the missing scenarios hit the API, and each new
+        outcome is appended as soon as it finishes.  All outcomes are
+        JSON round-tripped so a resumed run aggregates exactly the same
+        data as an uninterrupted one.  Once every scenario has an outcome
+        this call's entries are removed from the journal (other runs'
+        entries are left alone); ``keep_checkpoint=True`` keeps them so a
+        caller feeding scenarios in batches can release them itself with
+        :meth:`release_checkpoint` when the whole run is done.
+
+        Every finished scenario is also published as a ``scenario`` event
+        on the current run's event stream (see ``utils.run_events``).
+
+        When the current job is cancelled the scenarios still running are
+        cancelled too (closing their requests) and come back as ``None``;
+        journaled outcomes are kept so a later run resumes from them.
+        """
+        total = len(items)
+        completed = 0
+
+        def _announce(item: Any, out: Optional[Dict]) -> None:
+            nonlocal completed
+            completed += 1
+            run_events.emit('scenario', {
+                'model': model_name,
+                'evaluation_type': evaluation_type,
+                'scenario_id': getattr(item, 'id', ''),
+                'ok': out is not None,
+                'latency': (out or {}).get('latency'),
+                'completed': completed,
+                'total': total,
+            })
+
+        if not self.checkpoint_dir:
+            async def _plain(item: Any) -> Optional[Dict]:
+                out = await process(item)
+                _announce(item, out)
+                return out
+            return await cancellation.gather_partial([_plain(it) for it in items])
+
+        journal = CheckpointJournal(self.checkpoint_dir, model_name, evaluation_type)
+        keys = self._checkpoint_keys(model_name, evaluation_type, items, **options)
+        done = await asyncio.to_thread(journal.load)
+        outcomes: List[Optional[Dict]] = [done.get(k) for k in keys]
+        pending = [i for i, o in enumerate(outcomes) if o is None]
+        if len(pending) < len(items):
+            completed = len(items) - len(pending)
+            logger.info(
+                f"Resuming {evaluation_type} for {model_name}: "
+                f"{completed}/{len(items)} scenarios from checkpoint"
+            )
+            run_events.emit('progress', {
+                'model': model_name,
+                'evaluation_type': evaluation_type,
+                'completed': completed,
+                'total': total,
+                'resumed': True,
+            })
+
+        async def _run(i: int) -> None:
+            out = await process(items[i])
+            _announce(items[i], out)
+            if out is None:
+                return
+            out = json.loads(json.dumps(out, default=str))
+            outcomes[i] = out
+            await asyncio.to_thread(journal.append, keys[i], out)
+
+        await cancellation.gather_partial([_run(i) for i in pending])
+
+        if not keep_checkpoint and all(o is not None for o in outcomes):
+            await asyncio.to_thread(journal.remove, keys)
+        return outcomes
+
+    def _checkpoint_keys(
+        self, model_name: str, evaluation_type: str, items: List[Any], **options,
+    ) -> List[Tuple[str, str, str]]:
+        run_hash = self._run_fingerprint(model_name, evaluation_type, **options)
+        return [(getattr(it, 'id', ''), run_hash, fingerprint(it)) for it in items]
+
+    async def release_checkpoint(
+        self, model_name: str, evaluation_type: str, items: List[Any], **options,
+    ) -> None:
+        """Remove the journal entries of *items* (see ``keep_checkpoint``).
+
+        *options* must be the ones the scenarios were evaluated with so the
+        keys match.  No-op without ``checkpoint_dir``.
+        """
+        if not self.checkpoint_dir or not items:
+            return
+        journal = CheckpointJournal(self.checkpoint_dir, model_name, evaluation_type)
+        keys = self._checkpoint_keys(model_name, evaluation_type, items, **options)
+        await asyncio.to_thread(journal.remove, keys)
 
     def _get_model_semaphore(self, model_name: str) -> "asyncio.Semaphore":
-        """Return a semaphore respecting the per-model concurrency limit.
+        """Return the deployment's shared semaphore for in-flight requests.
 
         If the model's ``ModelConfig.max_concurrent`` is set, the effective
         limit is ``min(global, per-model)`` so that low-RPM backends like
-        Gemini free-tier don't exhaust their quota.
+        Gemini free-tier don't exhaust their quota.  The semaphore is owned
+        by the client's rate limiter and keyed by deployment, so concurrent
+        evaluations of the same deployment share one budget; RPM/TPM pacing
+        happens inside ``complete_async``.
         """
         limit = self.max_concurrent
+        deployment = model_name
         if model_name in self.client.models:
-            model_limit = self.client.models[model_name].max_concurrent
-            if model_limit is not None:
-                limit = min(limit, model_limit)
-        return asyncio.Semaphore(max(1, limit))
+            config = self.client.models[model_name]
+            deployment = config.deployment_name
+            if config.max_concurrent is not None:
+                limit = min(limit, config.max_concurrent)
+        return self.client.rate_limiter.semaphore(deployment, max(1, limit))
 
     def _should_measure_consistency(
         self, model_name: str, measure_consistency: bool
@@ -322,12 +572,20 @@ class ModelEvaluator:
 
         Returns *False* (auto-disabling consistency) when the model uses a
         rate-limited backend such as Gemini free-tier (5 RPM, ~20 RPD),
-        where the extra requests would quickly exhaust the daily quota.
-        For all other backends the caller's original ``measure_consistency``
-        flag is honoured.
+        where the extra requests would quickly exhaust the daily quota,
+        or when the client replays cached responses only — repeats are
+        independent samples and never come from the cache.  Otherwise the
+        caller's original ``measure_consistency`` flag is honoured.
         """
         if not measure_consistency:
             return False
+        if self.client.replay_only:
+            logger.info(
+                "[SKIP-CONSISTENCY] Consistency runs disabled for '%s' "
+                "(replay-only cache).",
+                model_name,
+            )
+            return False
         config = self.client.models.get(model_name)
         if config is not None and getattr(config, "backend", "azure") == "gemini":
             logger.info(
@@ -390,6 +648,27 @@ class ModelEvaluator:
         ``self.max_concurrent``).  Consistency runs for each scenario also
         execute in parallel within the same semaphore.
         """
+        outcomes, errors = await self.collect_classification_outcomes_async(
+            model_name, scenarios, measure_consistency
+        )
+        return self.aggregate_classification_outcomes(model_name, outcomes, errors)
+
+    async def collect_classification_outcomes_async(
+        self,
+        model_name: str,
+        scenarios: Optional[List[ClassificationScenario]] = None,
+        measure_consistency: bool = True,
+        keep_checkpoint: bool = False,
+    ) -> Tuple[List[Optional[Dict]], List[str]]:
+        """Run the classification scenarios and return ``(outcomes, errors)``.
+
+        One outcome per scenario, in order (``None`` for failed ones).
+        Outcomes from several calls can be concatenated and handed to
+        :meth:`aggregate_classification_outcomes` — the adaptive
+        comparison feeds scenarios in mini-batches this way, passing
+        ``keep_checkpoint=True`` so an interrupted adaptive run can resume
+        and calling :meth:`release_classification_checkpoint` at the end.
+        """
         self._check_prompts_exist(model_name, 'classification')
         measure_consistency = self._should_measure_consistency(model_name, measure_consistency)
 
@@ -429,12 +708,7 @@ class ModelEvaluator:
         except Exception:
             pass
 
-        result = EvaluationResult(
-            model_name=model_name,
-            evaluation_type="classification",
-            timestamp=datetime.now().isoformat(),
-            scenarios_tested=len(scenarios)
-        )
+        errors: List[str] = []
 
         async def _process_one(scenario: ClassificationScenario) -> Optional[Dict]:
             """Process a single scenario + optional consistency runs."""
@@ -446,38 +720,41 @@ class ModelEvaluator:
                         customer_message=scenario.customer_input,
                         context=scenario.get_context_dict(),
                     )
-                    completion = await self.client.complete_async(
+                    completion = await self._complete(
                         messages=messages,
                         model_name=model_name,
-                        response_format={"type": "json_object"}
+                        response_format={"type": "json_object"},
+                        use_cache=True,
                     )
                 # Semaphore released here — safe for consistency runs
 
                 prediction = self.metrics_calc.extract_classification_from_response(
-                    completion.content
+                    completion.parsed
                 )
                 
-                pred_cat = prediction.get('category', 'unknown')
-                exp_cat = scenario.expected_category
-                match = 'OK' if self.metrics_calc._normalise_category(pred_cat) == self.metrics_calc._normalise_category(exp_cat) else 'FAIL'
-                logger.info(
-                    f"  [{match}] {scenario.id}: predicted='{pred_cat}' "
-                    f"expected='{exp_cat}' (latency={completion.metrics.total_time:.2f}s)"
-                )
+                if self.metrics_calc.log_scenarios:
+                    pred_cat = prediction.get('category', 'unknown')
+                    exp_cat = scenario.expected_category
+                    match = 'OK' if self.metrics_calc._normalise_category(pred_cat) == self.metrics_calc._normalise_category(exp_cat) else 'FAIL'
+                    logger.info(
+                        f"  [{match}] {scenario.id}: predicted='{pred_cat}' "
+                        f"expected='{exp_cat}' (latency={completion.metrics.total_time:.2f}s)"
+                    )
 
                 # Consistency runs (semaphore already released, no deadlock)
-                consistency_responses: Optional[List[str]] = None
+                consistency_responses: Optional[List[Dict]] = None
                 if measure_consistency:
-                    consistency_responses = [completion.content]
+                    consistency_responses = [completion.parsed.to_dict()]
                     
                     async def _one_repeat():
                         async with sem:
-                            r = await self.client.complete_async(
+                            r = await self._complete(
                                 messages=messages,
                                 model_name=model_name,
-                                response_format={"type": "json_object"}
+                                response_format={"type": "json_object"},
+                                dedupe=False,
                             )
-                            return r.content
+                            return r.parsed.to_dict()
                     
                     repeats = await asyncio.gather(
                         *[_one_repeat() for _ in range(self.consistency_runs - 1)]
@@ -486,6 +763,7 @@ class ModelEvaluator:
 
                 return {
                         'prediction': prediction,
+                        'parsed': completion.parsed.to_dict(),
                         'ground_truth': {
                             'expected_category': scenario.expected_category,
                             'expected_subcategory': scenario.expected_subcategory,
@@ -510,6 +788,8 @@ class ModelEvaluator:
                             },
                             'predicted': prediction,
                             'latency': completion.metrics.total_time,
+                            'ttft': completion.metrics.ttft,
+                            'inter_token_latency': completion.metrics.inter_token_latency,
                             'tokens': completion.metrics.total_tokens,
                             'token_detail': {
                                 'prompt': completion.metrics.prompt_tokens,
@@ -522,11 +802,43 @@ class ModelEvaluator:
                     }
             except Exception as e:
                 logger.error(f"Error evaluating scenario {scenario.id}: {e}\n{traceback.format_exc()}")
-                result.errors.append(f"{scenario.id}: {str(e)}")
+                errors.append(f"{scenario.id}: {str(e)}")
                 return None
 
         # Launch all scenarios in parallel
-        outcomes = await asyncio.gather(*[_process_one(s) for s in scenarios])
+        outcomes = await self._gather_checkpointed(
+            model_name, 'classification', scenarios, _process_one,
+            keep_checkpoint=keep_checkpoint, measure_consistency=measure_consistency,
+        )
+        return outcomes, errors
+
+    async def release_classification_checkpoint(
+        self,
+        model_name: str,
+        scenarios: List[ClassificationScenario],
+        measure_consistency: bool = True,
+    ) -> None:
+        """Remove the journal entries written by batched
+        :meth:`collect_classification_outcomes_async` calls."""
+        await self.release_checkpoint(
+            model_name, 'classification', scenarios,
+            measure_consistency=self._should_measure_consistency(model_name, measure_consistency),
+        )
+
+    def aggregate_classification_outcomes(
+        self,
+        model_name: str,
+        outcomes: List[Optional[Dict]],
+        errors: Optional[List[str]] = None,
+    ) -> EvaluationResult:
+        """Build the classification ``EvaluationResult`` from scenario outcomes."""
+        result = EvaluationResult(
+            model_name=model_name,
+            evaluation_type="classification",
+            timestamp=datetime.now().isoformat(),
+            scenarios_tested=len(outcomes),
+            errors=list(errors or []),
+        )
 
         # Aggregate results (maintain order)
         predictions = []
@@ -534,18 +846,23 @@ class ModelEvaluator:
         latencies = []
         token_data = []
         raw_results = []
+        parsed_responses = []
         responses_for_consistency = []
 
         for out in outcomes:
             if out is None:
                 continue
             predictions.append(out['prediction'])
+            parsed_responses.append(
+                ParsedResponse.from_dict(out['parsed']) if out.get('parsed')
+                else parse_response(out['prediction'].get('raw_response', ''))
+            )
             ground_truth.append(out['ground_truth'])
             latencies.append(out['latency'])
             token_data.append(out['token_data'])
             raw_results.append(out['raw'])
             if out.get('consistency_responses'):
-                responses_for_consistency.append(out['consistency_responses'])
+                responses_for_consistency.append(self._parsed_responses(out['consistency_responses']))
 
         # Calculate metrics
         if predictions:
@@ -553,11 +870,10 @@ class ModelEvaluator:
                 predictions, ground_truth
             )
             result.latency_metrics = self.metrics_calc.calculate_latency_metrics(
-                latencies, token_data=token_data, model_name=model_name
-            )
-            result.quality_metrics = self.metrics_calc.calculate_quality_metrics(
-                [p.get('raw_response', '') for p in predictions]
+                latencies, token_data=token_data, model_name=model_name,
+                **self._streaming_timings(raw_results),
             )
+            result.quality_metrics = self.metrics_calc.calculate_quality_metrics(parsed_responses)
             
         if responses_for_consistency:
             result.consistency_metrics = self.metrics_calc.calculate_consistency_metrics(
@@ -566,7 +882,7 @@ class ModelEvaluator:
             
         result.scenarios_tested = len(predictions)
         result.raw_results = raw_results
-        return result
+        return _mark_if_cancelled(result, outcomes)
         
     def evaluate_dialog(
         self,
@@ -626,9 +942,10 @@ class ModelEvaluator:
                         model=model_name,
                         conversation=scenario.get_conversation_list()
                     )
-                    completion = await self.client.complete_async(
+                    completion = await self._complete(
                         messages=messages,
-                        model_name=model_name
+                        model_name=model_name,
+                        use_cache=True,
                     )
                 # Semaphore released here — safe for consistency runs
 
@@ -641,17 +958,18 @@ class ModelEvaluator:
                 )
 
                 # Consistency runs (semaphore already released, no deadlock)
-                consistency_responses: Optional[List[str]] = None
+                consistency_responses: Optional[List[Dict]] = None
                 if measure_consistency:
-                    consistency_responses = [completion.content]
+                    consistency_responses = [completion.parsed.to_dict()]
 
                     async def _one_repeat():
                         async with sem:
-                            r = await self.client.complete_async(
+                            r = await self._complete(
                                 messages=messages,
-                                model_name=model_name
+                                model_name=model_name,
+                                dedupe=False,
                             )
-                            return r.content
+                            return r.parsed.to_dict()
 
                     repeats = await asyncio.gather(
                         *[_one_repeat() for _ in range(self.consistency_runs - 1)]
@@ -659,9 +977,15 @@ class ModelEvaluator:
                     consistency_responses.extend(repeats)
 
                 return {
-                        'completion': completion,
+                        'content': completion.content,
+                        'latency': completion.metrics.total_time,
+                        'token_data': {
+                            'prompt_tokens': completion.metrics.prompt_tokens,
+                            'completion_tokens': completion.metrics.completion_tokens,
+                            'cached_tokens': completion.metrics.cached_tokens,
+                            'reasoning_tokens': completion.metrics.reasoning_tokens,
+                        },
                         'response_questions': response_questions,
-                        'scenario': scenario,
                         'raw': {
                             'scenario_id': scenario.id,
                             'conversation': scenario.get_conversation_list(),
@@ -671,6 +995,8 @@ class ModelEvaluator:
                             'question_count': len(response_questions),
                             'expected_turns': scenario.expected_resolution_turns,
                             'latency': completion.metrics.total_time,
+                            'ttft': completion.metrics.ttft,
+                            'inter_token_latency': completion.metrics.inter_token_latency,
                             'tokens': completion.metrics.total_tokens,
                             'token_detail': {
                                 'prompt': completion.metrics.prompt_tokens,
@@ -686,7 +1012,9 @@ class ModelEvaluator:
                 result.errors.append(f"{scenario.id}: {str(e)}")
                 return None
 
-        outcomes = await asyncio.gather(*[_process_one(s) for s in scenarios])
+        outcomes = await self._gather_checkpointed(
+            model_name, 'dialog', scenarios, _process_one, measure_consistency=measure_consistency,
+        )
 
         # Aggregate
         latencies = []
@@ -702,21 +1030,14 @@ class ModelEvaluator:
         responses_for_consistency = []
         raw_results = []
 
-        for out in outcomes:
+        for s, out in zip(scenarios, outcomes):
             if out is None:
                 continue
-            c = out['completion']
-            s = out['scenario']
-            latencies.append(c.metrics.total_time)
-            token_data.append({
-                'prompt_tokens': c.metrics.prompt_tokens,
-                'completion_tokens': c.metrics.completion_tokens,
-                'cached_tokens': c.metrics.cached_tokens,
-                'reasoning_tokens': c.metrics.reasoning_tokens,
-            })
+            latencies.append(out['latency'])
+            token_data.append(out['token_data'])
             generated_questions.append(out['response_questions'])
             expected_questions.append(s.get_follow_up_rules_list())
-            dialog_responses.append(c.content)
+            dialog_responses.append(out['content'])
             dialog_context_gaps.append(s.get_context_gaps_list())
             dialog_rules.append(s.get_follow_up_rules_list())
             dialog_optimal.append(s.optimal_follow_up)
@@ -724,12 +1045,13 @@ class ModelEvaluator:
             question_counts.append(len(out['response_questions']))
             raw_results.append(out['raw'])
             if out.get('consistency_responses'):
-                responses_for_consistency.append(out['consistency_responses'])
+                responses_for_consistency.append(self._parsed_responses(out['consistency_responses']))
 
         # Calculate metrics
         if latencies:
             result.latency_metrics = self.metrics_calc.calculate_latency_metrics(
-                latencies, token_data=token_data, model_name=model_name
+                latencies, token_data=token_data, model_name=model_name,
+                **self._streaming_timings(raw_results),
             )
             
         if generated_questions:
@@ -781,7 +1103,7 @@ class ModelEvaluator:
             
         result.scenarios_tested = len(dialog_responses)
         result.raw_results = raw_results
-        return result
+        return _mark_if_cancelled(result, outcomes)
         
     def evaluate_general(
         self,
@@ -827,11 +1149,15 @@ class ModelEvaluator:
                 else:
                     messages = [{"role": "user", "content": test.prompt}]
 
+                # Repeated runs must be independent samples — only a
+                # single-run test may be served from the response cache.
                 async def _one_run():
                     async with sem:
-                        return await self.client.complete_async(
+                        return await self._complete(
                             messages=messages,
-                            model_name=model_name
+                            model_name=model_name,
+                            use_cache=test.run_count == 1,
+                            dedupe=test.run_count == 1,
                         )
 
                 completions = await asyncio.gather(
@@ -839,6 +1165,8 @@ class ModelEvaluator:
                 )
                 test_responses = [c.content for c in completions]
                 test_latencies = [c.metrics.total_time for c in completions]
+                test_ttfts = [c.metrics.ttft for c in completions]
+                test_itls = [c.metrics.inter_token_latency for c in completions]
                 test_token_data = [
                     {
                         'prompt_tokens': c.metrics.prompt_tokens,
@@ -860,6 +1188,8 @@ class ModelEvaluator:
                         'prompt': test.prompt,
                         'responses': test_responses,
                         'latencies': test_latencies,
+                        'ttfts': test_ttfts,
+                        'inter_token_latencies': test_itls,
                         'expected_behavior': test.expected_behavior,
                         'token_detail': test_token_data,
                     },
@@ -869,7 +1199,9 @@ class ModelEvaluator:
                 result.errors.append(f"{test.id}: {str(e)}")
                 return None
 
-        outcomes = await asyncio.gather(*[_process_one(t) for t in test_cases])
+        outcomes = await self._gather_checkpointed(
+            model_name, 'general', test_cases, _process_one,
+        )
 
         latencies = []
         responses = []
@@ -885,7 +1217,8 @@ class ModelEvaluator:
 
         if latencies:
             result.latency_metrics = self.metrics_calc.calculate_latency_metrics(
-                latencies, token_data=token_data, model_name=model_name
+                latencies, token_data=token_data, model_name=model_name,
+                **self._streaming_timings(raw_results),
             )
             
         if responses:
@@ -894,7 +1227,7 @@ class ModelEvaluator:
             )
             
         result.raw_results = raw_results
-        return result
+        return _mark_if_cancelled(result, outcomes)
 
     # ── RAG evaluation ────────────────────────────────────────────────
 
@@ -952,9 +1285,10 @@ class ModelEvaluator:
                         query=scenario.query,
                         context=scenario.context,
                     )
-                    completion = await self.client.complete_async(
+                    completion = await self._complete(
                         messages=messages,
                         model_name=model_name,
+                        use_cache=True,
                     )
 
                 response_text = completion.content
@@ -977,16 +1311,17 @@ class ModelEvaluator:
                 )
 
                 # Consistency runs
-                consistency_responses: Optional[List[str]] = None
+                consistency_responses: Optional[List[Dict]] = None
                 if measure_consistency:
-                    consistency_responses = [response_text]
+                    consistency_responses = [completion.parsed.to_dict()]
 
                     async def _one_repeat():
                         async with sem:
-                            r = await self.client.complete_async(
+                            r = await self._complete(
                                 messages=messages, model_name=model_name,
+                                dedupe=False,
                             )
-                            return r.content
+                            return r.parsed.to_dict()
 
                     repeats = await asyncio.gather(
                         *[_one_repeat() for _ in range(self.consistency_runs - 1)]
@@ -1012,6 +1347,8 @@ class ModelEvaluator:
                         'groundedness': groundedness,
                         'relevance': relevance,
                         'latency': completion.metrics.total_time,
+                        'ttft': completion.metrics.ttft,
+                        'inter_token_latency': completion.metrics.inter_token_latency,
                         'tokens': completion.metrics.total_tokens,
                         'token_detail': {
                             'prompt': completion.metrics.prompt_tokens,
@@ -1027,7 +1364,9 @@ class ModelEvaluator:
                 result.errors.append(f"{scenario.id}: {str(e)}")
                 return None
 
-        outcomes = await asyncio.gather(*[_process_one(s) for s in scenarios])
+        outcomes = await self._gather_checkpointed(
+            model_name, 'rag', scenarios, _process_one, measure_consistency=measure_consistency,
+        )
 
         latencies = []
         groundedness_scores = []
@@ -1045,11 +1384,12 @@ class ModelEvaluator:
             token_data.append(out['token_data'])
             raw_results.append(out['raw'])
             if out.get('consistency_responses'):
-                responses_for_consistency.append(out['consistency_responses'])
+                responses_for_consistency.append(self._parsed_responses(out['consistency_responses']))
 
         if latencies:
             result.latency_metrics = self.metrics_calc.calculate_latency_metrics(
                 latencies, token_data=token_data, model_name=model_name,
+                **self._streaming_timings(raw_results),
             )
         if groundedness_scores:
             import numpy as _np
@@ -1066,7 +1406,7 @@ class ModelEvaluator:
 
         result.scenarios_tested = len(raw_results)
         result.raw_results = raw_results
-        return result
+        return _mark_if_cancelled(result, outcomes)
 
     # ── Tool Calling evaluation ───────────────────────────────────────
 
@@ -1124,9 +1464,10 @@ class ModelEvaluator:
                         query=scenario.query,
                         available_tools=tools_list,
                     )
-                    completion = await self.client.complete_async(
+                    completion = await self._complete(
                         messages=messages,
                         model_name=model_name,
+                        use_cache=True,
                     )
 
                 response_text = completion.content
@@ -1208,16 +1549,17 @@ class ModelEvaluator:
                 )
 
                 # Consistency runs
-                consistency_responses: Optional[List[str]] = None
+                consistency_responses: Optional[List[Dict]] = None
                 if measure_consistency:
-                    consistency_responses = [response_text]
+                    consistency_responses = [completion.parsed.to_dict()]
 
                     async def _one_repeat():
                         async with sem:
-                            r = await self.client.complete_async(
+                            r = await self._complete(
                                 messages=messages, model_name=model_name,
+                                dedupe=False,
                             )
-                            return r.content
+                            return r.parsed.to_dict()
 
                     repeats = await asyncio.gather(
                         *[_one_repeat() for _ in range(self.consistency_runs - 1)]
@@ -1246,6 +1588,8 @@ class ModelEvaluator:
                         'tool_accuracy': tool_accuracy,
                         'param_accuracy': param_accuracy,
                         'latency': completion.metrics.total_time,
+                        'ttft': completion.metrics.ttft,
+                        'inter_token_latency': completion.metrics.inter_token_latency,
                         'tokens': completion.metrics.total_tokens,
                         'token_detail': {
                             'prompt': completion.metrics.prompt_tokens,
@@ -1261,7 +1605,9 @@ class ModelEvaluator:
                 result.errors.append(f"{scenario.id}: {str(e)}")
                 return None
 
-        outcomes = await asyncio.gather(*[_process_one(s) for s in scenarios])
+        outcomes = await self._gather_checkpointed(
+            model_name, 'tool_calling', scenarios, _process_one, measure_consistency=measure_consistency,
+        )
 
         latencies = []
         tool_accuracies = []
@@ -1279,11 +1625,12 @@ class ModelEvaluator:
             token_data.append(out['token_data'])
             raw_results.append(out['raw'])
             if out.get('consistency_responses'):
-                responses_for_consistency.append(out['consistency_responses'])
+                responses_for_consistency.append(self._parsed_responses(out['consistency_responses']))
 
         if latencies:
             result.latency_metrics = self.metrics_calc.calculate_latency_metrics(
                 latencies, token_data=token_data, model_name=model_name,
+                **self._streaming_timings(raw_results),
             )
         if tool_accuracies:
             import numpy as _np
@@ -1306,62 +1653,101 @@ class ModelEvaluator:
 
         result.scenarios_tested = len(raw_results)
         result.raw_results = raw_results
-        return result
+        return _mark_if_cancelled(result, outcomes)
 
     # ── Full evaluation suite ─────────────────────────────────────────
         
     def run_full_evaluation(
         self,
         model_name: str,
-        save_results: bool = True
+        save_results: bool = True,
+        output_dir: str = "data/results",
+        progress_callback=None,
     ) -> Dict[str, EvaluationResult]:
         """
         Run complete evaluation suite on a model.
+
+        Delegates to :meth:`run_full_evaluation_async`, which runs every
+        evaluation type concurrently.
         
         Args:
             model_name: Name of registered model
             save_results: Whether to save results to files
+            output_dir: Directory for saved results
+            progress_callback: Optional ``fn(done, total, eval_type, result)``
             
         Returns:
             Dictionary of evaluation results by type
         """
-        results = {}
-        
-        logger.info(f"Starting full evaluation for {model_name}")
-        
-        # Classification evaluation
-        logger.info("Running classification evaluation...")
-        results['classification'] = self.evaluate_classification(model_name)
-        
-        # Dialog evaluation
-        logger.info("Running dialog evaluation...")
-        results['dialog'] = self.evaluate_dialog(model_name)
-        
-        # General evaluation
-        logger.info("Running general capability evaluation...")
-        results['general'] = self.evaluate_general(model_name)
+        return _run_in_loop(self.run_full_evaluation_async(
+            model_name, save_results, output_dir, progress_callback,
+        ))
 
-        # RAG evaluation
-        try:
-            logger.info("Running RAG evaluation...")
-            results['rag'] = self.evaluate_rag(model_name)
-        except FileNotFoundError:
-            logger.info("RAG test data not found — skipping")
+    async def run_full_evaluation_async(
+        self,
+        model_name: str,
+        save_results: bool = True,
+        output_dir: str = "data/results",
+        progress_callback=None,
+    ) -> Dict[str, EvaluationResult]:
+        """Run all evaluation types concurrently for one model.
 
-        # Tool Calling evaluation
-        try:
-            logger.info("Running tool calling evaluation...")
-            results['tool_calling'] = self.evaluate_tool_calling(model_name)
-        except FileNotFoundError:
-            logger.info("Tool calling test data not found — skipping")
-        
-        # Save results if requested
-        if save_results:
-            for eval_type, result in results.items():
-                result.save()
-                logger.info(f"Saved {eval_type} results")
-                
-        return results
+        Every type's scenarios are dispatched at once and queue on the
+        deployment's shared semaphore / rate limiter, so the quota stays
+        busy through each type's long tail and the suite takes about as
+        long as its largest type.  Each ``EvaluationResult`` is saved as
+        soon as its type finishes, and ``progress_callback(done, total,
+        eval_type, result)`` fires in completion order (``result`` is
+        ``None`` when a type is skipped or fails).
+
+        RAG and tool-calling are skipped when their test data is missing.
+        """
+        suite = {
+            'classification': self.evaluate_classification_async(model_name),
+            'dialog': self.evaluate_dialog_async(model_name),
+            'general': self.evaluate_general_async(model_name),
+            'rag': self.evaluate_rag_async(model_name),
+            'tool_calling': self.evaluate_tool_calling_async(model_name),
+        }
+        optional_types = {'rag', 'tool_calling'}
+        total = len(suite)
+        logger.info(f"Starting full evaluation for {model_name} ({total} types in parallel)")
+
+        async def _run_one(eval_type: str, coro) -> Tuple[str, Optional[EvaluationResult], Optional[BaseException]]:
+            try:
+                return eval_type, await coro, None
+            except Exception as e:
+                return eval_type, None, e
+
+        results: Dict[str, EvaluationResult] = {}
+        first_error: Optional[BaseException] = None
+        done = 0
+        for fut in asyncio.as_completed([_run_one(t, c) for t, c in suite.items()]):
+            eval_type, result, error = await fut
+            done += 1
+            if error is not None:
+                if isinstance(error, FileNotFoundError) and eval_type in optional_types:
+                    logger.info(f"{eval_type} test data not found — skipping")
+                else:
+                    logger.error(f"{eval_type} evaluation failed for {model_name}: {error}")
+                    first_error = first_error or error
+            else:
+                results[eval_type] = result
+                if save_results:
+                    await asyncio.to_thread(result.save, output_dir)
+                    logger.info(f"Saved {eval_type} results")
+            logger.info(f"Full evaluation progress for {model_name}: {done}/{total} ({eval_type} done)")
+            if progress_callback:
+                try:
+                    progress_callback(done, total, eval_type, result)
+                except Exception as cb_err:
+                    logger.warning(f"progress_callback failed: {cb_err}")
+
+        # A failing required type still raises (as the sequential runner
+        # did), but only after the other types have finished and saved.
+        if first_error is not None:
+            raise first_error
+        return {t: results[t] for t in suite if t in results}
         
     def _extract_questions(self, response: str) -> List[str]:
         """Extract questions from a response"""
@@ -1384,6 +1770,7 @@ import threading as _threading
 _loop: Optional[asyncio.AbstractEventLoop] = None
 _loop_thread: Optional[_threading.Thread] = None
 _loop_lock = _threading.Lock()
+_CANCEL_GRACE_SECONDS = 10.0
 
 
 def _ensure_loop() -> asyncio.AbstractEventLoop:
@@ -1416,26 +1803,38 @@ def _run_in_loop(coro):
     snapshot (including ``_current_run_id``) is captured via
     ``copy_context()`` and forwarded to the Task so that log-capture
     handlers running inside the coroutine can see the correct run-id.
+
+    **Cancellation**: the caller's cancellation token (see
+    ``utils.cancellation``) travels with the same snapshot.  If the task
+    is still running ``_CANCEL_GRACE_SECONDS`` after the token is
+    cancelled it is cancelled and :class:`OperationCancelled` is raised.
     """
     import contextvars as _ctx
 
     loop = _ensure_loop()
     ctx = _ctx.copy_context()
+    token = ctx.run(cancellation.current)
 
     # We cannot use asyncio.run_coroutine_threadsafe directly because
     # it does NOT propagate the caller's ContextVars.  Instead we
     # schedule a Task manually with the captured context.
     result_future: _cf.Future = _cf.Future()
+    unregister = [lambda: None]
 
     def _schedule():
         try:
             task = loop.create_task(coro, context=ctx)
             task.add_done_callback(_on_done)
+            # Scenario gathers stop on cancellation and keep partial
+            # results; anything still running after the grace period
+            # (Foundry polling, generation calls) is cancelled outright.
+            unregister[0] = cancellation.cancel_on(token, task, delay=_CANCEL_GRACE_SECONDS)
         except BaseException as exc:
             if not result_future.done():
                 result_future.set_exception(exc)
 
     def _on_done(task: asyncio.Task):
+        unregister[0]()
         if task.cancelled():
             result_future.cancel()
         elif task.exception() is not None:
@@ -1444,7 +1843,10 @@ def _run_in_loop(coro):
             result_future.set_result(task.result())
 
     loop.call_soon_threadsafe(_schedule)
-    return result_future.result()
+    try:
+        return result_future.result()
+    except _cf.CancelledError:
+        raise cancellation.OperationCancelled("cancelled")
 
 
 # Example usage
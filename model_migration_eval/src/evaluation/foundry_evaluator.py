@@ -12,15 +12,19 @@ Architecture:
     Foundry Runtime (LLM-as-judge)  ──►  Control Plane dashboard
 """
 
+import asyncio
 import json
 import os
 import re
+import threading
 import time
 import logging
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -517,6 +521,286 @@ def _get_testing_criteria(
     return criteria
 
 
+# ---------------------------------------------------------------------------
+# Shared run poller
+# ---------------------------------------------------------------------------
+
+_TERMINAL_STATUSES = ("completed", "failed")
+
+
+@dataclass
+class _TrackedRun:
+    openai_client: Any
+    eval_id: str
+    run_id: str
+    callback: Callable[[Any, str], None]
+    interval: float
+    deadline: float
+    next_check: float
+    started: float = field(default_factory=time.monotonic)
+
+
+class FoundryRunPoller:
+    """One background thread that polls every outstanding Foundry run.
+
+    Each tracked run is re-checked on its own schedule, starting at the
+    submission's ``poll_interval`` and backing off by ``backoff`` up to
+    ``max_interval``.  When a run reaches a terminal status (or its
+    deadline) its callback is handed to a small worker pool, so score
+    retrieval and retries never stall polling of the other runs.
+    """
+
+    def __init__(self, max_interval: float = 30.0, backoff: float = 1.5, callback_workers: int = 4):
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._cond = threading.Condition()
+        self._runs: Dict[str, _TrackedRun] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._callbacks = ThreadPoolExecutor(
+            max_workers=callback_workers, thread_name_prefix="foundry-callback",
+        )
+
+    def track(
+        self,
+        openai_client: Any,
+        eval_id: str,
+        run_id: str,
+        callback: Callable[[Any, str], None],
+        poll_interval: float = 5.0,
+        timeout: float = 600.0,
+    ) -> None:
+        """Start tracking a run; ``callback(run, status)`` fires once it ends.
+
+        ``status`` is ``'completed'``, ``'failed'`` or ``'timed_out'``.
+        """
+        now = time.monotonic()
+        with self._cond:
+            self._runs[run_id] = _TrackedRun(
+                openai_client=openai_client,
+                eval_id=eval_id,
+                run_id=run_id,
+                callback=callback,
+                interval=max(0.5, poll_interval),
+                deadline=now + timeout,
+                next_check=now + max(0.5, poll_interval),
+            )
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._loop, name="foundry-poller", daemon=True,
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def outstanding(self) -> int:
+        """Number of runs currently being polled."""
+        with self._cond:
+            return len(self._runs)
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._runs:
+                    self._cond.wait()
+                now = time.monotonic()
+                due = [r for r in self._runs.values() if r.next_check <= now]
+                if not due:
+                    wake = min(r.next_check for r in self._runs.values())
+                    self._cond.wait(timeout=max(0.0, wake - now))
+                    continue
+
+            for tracked in due:
+                self._check(tracked)
+
+    def _check(self, tracked: _TrackedRun) -> None:
+        run, status = None, None
+        try:
+            run = tracked.openai_client.evals.runs.retrieve(
+                run_id=tracked.run_id, eval_id=tracked.eval_id
+            )
+            status = run.status
+            elapsed = time.monotonic() - tracked.started
+            logger.info(f"[Foundry] Status: {status} ({elapsed:.0f}s) run={tracked.run_id}")
+        except Exception as e:
+            logger.warning(f"[Foundry] Poll failed for run {tracked.run_id}: {e}")
+
+        now = time.monotonic()
+        if status not in _TERMINAL_STATUSES and now >= tracked.deadline:
+            status = "timed_out"
+        if status in _TERMINAL_STATUSES or status == "timed_out":
+            with self._cond:
+                self._runs.pop(tracked.run_id, None)
+            self._callbacks.submit(self._fire, tracked, run, status)
+            return
+
+        with self._cond:
+            tracked.interval = min(tracked.interval * self.backoff, self.max_interval)
+            tracked.next_check = min(now + tracked.interval, tracked.deadline)
+
+    @staticmethod
+    def _fire(tracked: _TrackedRun, run: Any, status: str) -> None:
+        try:
+            tracked.callback(run, status)
+        except Exception:
+            logger.exception(f"[Foundry] Completion callback failed for run {tracked.run_id}")
+
+    def submit_callback(self, fn: Callable, *args) -> None:
+        """Run *fn* on the callback pool (used to launch retry attempts)."""
+        self._callbacks.submit(fn, *args)
+
+
+_poller: Optional[FoundryRunPoller] = None
+_poller_lock = threading.Lock()
+
+
+def get_run_poller() -> FoundryRunPoller:
+    """Return the process-wide Foundry run poller."""
+    global _poller
+    with _poller_lock:
+        if _poller is None:
+            _poller = FoundryRunPoller()
+        return _poller
+
+
+@dataclass
+class FoundrySubmission:
+    """Handle returned by :meth:`FoundryEvaluator.start_evaluation`.
+
+    ``eval_id`` / ``run_id`` / ``report_url`` describe the current attempt
+    (they change if a retry is launched); ``future`` resolves to the final
+    result dict.
+    """
+    model_name: str
+    evaluation_type: str
+    eval_name: str
+    eval_id: Optional[str] = None
+    run_id: Optional[str] = None
+    report_url: str = ""
+    status: str = "submitting"
+    future: Future = field(default_factory=Future)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "eval_id": self.eval_id,
+            "run_id": self.run_id,
+            "status": self.status,
+            "report_url": self.report_url,
+            "eval_name": self.eval_name,
+            "foundry_scores": None,
+        }
+
+
+class _SubmissionChain:
+    """Drives one submission through its attempts (see retry strategy)."""
+
+    def __init__(
+        self,
+        evaluator: "FoundryEvaluator",
+        submission: FoundrySubmission,
+        jsonl_path: str,
+        include_safety: bool,
+        poll_interval: float,
+        timeout: float,
+        on_complete: Optional[Callable[[Dict[str, Any]], None]],
+    ):
+        self.evaluator = evaluator
+        self.submission = submission
+        self.jsonl_path = jsonl_path
+        self.include_safety = include_safety
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.on_complete = on_complete
+        self.first_status = ""
+        self.is_internal = False
+
+    def start_attempt(self, stage: str, eval_name: str, include_safety: bool, attempt: int) -> None:
+        try:
+            info = self.evaluator._start_run(
+                self.submission.evaluation_type, eval_name, self.jsonl_path, include_safety,
+            )
+        except Exception as e:
+            logger.error(f"[Foundry] Attempt {attempt} raised {type(e).__name__}: {e}")
+            self.attempt_done(stage, {"status": "failed", "error": str(e)})
+            return
+
+        sub = self.submission
+        sub.eval_id, sub.run_id = info["eval_id"], info["run_id"]
+        sub.report_url, sub.status = info["report_url"], info["status"] or "queued"
+        _, openai_client = self.evaluator._clients()
+
+        def _on_terminal(run: Any, status: str) -> None:
+            result = self.evaluator._finish_run(info, run, status, self.timeout)
+            self.attempt_done(stage, result)
+
+        get_run_poller().track(
+            openai_client, info["eval_id"], info["run_id"], _on_terminal,
+            poll_interval=self.poll_interval, timeout=self.timeout,
+        )
+
+    def _retry(self, stage: str, suffix: str, include_safety: bool, attempt: int) -> None:
+        get_run_poller().submit_callback(
+            self.start_attempt, stage, f"{self.submission.eval_name}-{suffix}", include_safety, attempt,
+        )
+
+    def attempt_done(self, stage: str, result: Dict[str, Any]) -> None:
+        status = result.get("status")
+        if status == "completed":
+            if stage == "retry":
+                logger.info("[Foundry] Succeeded on attempt 2")
+            elif stage == "nosafety":
+                logger.info("[Foundry] Succeeded on final attempt (without safety evaluators)")
+            return self.finish(result)
+
+        if stage == "first":
+            # "failed"    → server error; could be transient OR systematic
+            # "timed_out" → evaluators just take too long, skip to reduced set
+            #
+            # InternalError / InternalServerError is almost certainly the
+            # safety evaluators crashing on the Foundry side, so skip the
+            # same-config retry and go directly to the nosafety attempt.
+            self.first_status = status
+            first_error = str(result.get("error", ""))
+            self.is_internal = "InternalError" in first_error or "InternalServerError" in first_error
+            if status == "failed" and self.include_safety and not self.is_internal:
+                logger.warning(
+                    "[Foundry] Attempt 1 failed (transient?) — retrying same configuration..."
+                )
+                return self._retry("retry", "retry2", True, attempt=2)
+            if self.is_internal:
+                logger.warning(
+                    "[Foundry] Attempt 1 failed with InternalServerError (likely safety evaluators) "
+                    "— skipping same-config retry."
+                )
+
+        if stage in ("first", "retry") and self.include_safety:
+            if self.first_status == "timed_out":
+                label = "Timed out"
+            elif self.is_internal:
+                label = "InternalServerError (safety evaluators)"
+            else:
+                label = "Still failing"
+            logger.warning(f"[Foundry] {label} — retrying WITHOUT safety evaluators...")
+            # If we skipped the same-config retry (internal error or timeout)
+            # this is attempt 2; otherwise attempt 3.
+            next_attempt = 2 if stage == "first" else 3
+            return self._retry("nosafety", "nosafety", False, attempt=next_attempt)
+
+        # Safety was already off (or this was the last attempt)
+        self.finish(result)
+
+    def finish(self, result: Dict[str, Any]) -> None:
+        sub = self.submission
+        sub.status = result.get("status", "failed")
+        sub.report_url = result.get("report_url") or sub.report_url
+        result.setdefault("eval_name", sub.eval_name)
+        if not sub.future.done():
+            sub.future.set_result(result)
+        if self.on_complete:
+            try:
+                self.on_complete(result)
+            except Exception:
+                logger.exception("[Foundry] on_complete callback failed")
+
+
 # ---------------------------------------------------------------------------
 # Main Foundry evaluation runner
 # ---------------------------------------------------------------------------
@@ -555,19 +839,65 @@ class FoundryEvaluator:
         self.grader_model = grader_model or "gpt-4.1"
         self.include_safety_evaluators = include_safety_evaluators
         self.timeout = timeout
+        self._clients_lock = threading.Lock()
+        self._credential = None
+        self._project_client = None
+        self._openai_client = None
 
-    def submit_evaluation(
+    # ------------------------------------------------------------------
+    # Shared clients (one credential / project client per evaluator)
+    # ------------------------------------------------------------------
+
+    def _clients(self):
+        """Return the shared ``(project_client, openai_client)`` pair.
+
+        Created on first use and reused by every submission, poll and
+        score retrieval so token acquisition and connection setup happen
+        once rather than per run.
+        """
+        with self._clients_lock:
+            if self._openai_client is None:
+                self._credential = DefaultAzureCredential()
+                self._project_client = AIProjectClient(
+                    endpoint=self.project_endpoint,
+                    credential=self._credential,
+                )
+                self._openai_client = self._project_client.get_openai_client()
+            return self._project_client, self._openai_client
+
+    def close(self) -> None:
+        """Close the shared clients (they are re-created on next use)."""
+        with self._clients_lock:
+            for obj in (self._openai_client, self._project_client, self._credential):
+                try:
+                    if obj is not None and hasattr(obj, "close"):
+                        obj.close()
+                except Exception:
+                    pass
+            self._credential = self._project_client = self._openai_client = None
+
+    # ------------------------------------------------------------------
+    # Submission API
+    # ------------------------------------------------------------------
+
+    def start_evaluation(
         self,
         raw_results: List[Dict],
         evaluation_type: str,
         model_name: str,
-        poll: bool = True,
+        on_complete: Optional[Callable[[Dict[str, Any]], None]] = None,
         poll_interval: float = 5.0,
         timeout: Optional[float] = None,
-    ) -> Dict[str, Any]:
+    ) -> "FoundrySubmission":
         """
-        Export results to JSONL, upload to Foundry, create an evaluation,
-        and optionally wait for completion.
+        Upload the dataset and create the evaluation run, then return
+        immediately — the shared :class:`FoundryRunPoller` tracks the run.
+
+        The returned submission carries ``eval_id`` / ``run_id`` of the
+        first attempt and a ``future`` that resolves to the final result
+        dict (see :meth:`submit_evaluation`) once the run — including any
+        retries — has finished.  ``on_complete`` is called with the same
+        dict from the poller's callback pool.
 
         Retry strategy (only when ``include_safety_evaluators`` is True):
 
@@ -577,20 +907,6 @@ class FoundryEvaluator:
         * **Timeout** (``status='timed_out'``): skip same-config retry
           (it will just timeout again) and go directly to the attempt
           without safety evaluators (fewer grader calls → faster).
-
-        Args:
-            raw_results: The raw_results from EvaluationResult
-            evaluation_type: 'classification', 'dialog', 'general', 'rag',
-                or 'tool_calling'
-            model_name: Local model key (e.g. 'gpt4', 'gpt4o') — used for naming
-            poll: Whether to wait for the run to complete
-            poll_interval: Seconds between status checks
-            timeout: Maximum seconds to wait (defaults to ``self.timeout``)
-
-        Returns:
-            Dict with keys:
-                - eval_id, run_id, status, report_url, evaluators,
-                  dataset_id, eval_name, foundry_scores
         """
         if timeout is None:
             timeout = self.timeout
@@ -606,245 +922,202 @@ class FoundryEvaluator:
         jsonl_path = export_to_jsonl(raw_results, evaluation_type, output_path=unique_jsonl)
         logger.info(f"[Foundry] Exported {len(raw_results)} results to {jsonl_path}")
 
-        # -- Attempt 1: original config ---------------------------------
-        include_safety = self.include_safety_evaluators
-        result = self._try_run(
-            raw_results, evaluation_type, model_name, eval_name,
-            jsonl_path, include_safety, poll, poll_interval, timeout,
-            attempt=1,
+        submission = FoundrySubmission(
+            model_name=model_name,
+            evaluation_type=evaluation_type,
+            eval_name=eval_name,
         )
-        if result["status"] == "completed":
-            return result
-
-        # -- Decide retry strategy based on failure mode ----------------
-        #  "failed"    → server error; could be transient OR systematic
-        #  "timed_out" → evaluators just take too long, skip to reduced set
-        #
-        # Optimisation: if the error message mentions InternalError /
-        # InternalServerError it is almost certainly the safety evaluators
-        # crashing on the Foundry side.  In that case, skip the same-config
-        # retry (it will just fail again after 2-5 min) and go directly to
-        # the nosafety attempt.
-        first_status = result["status"]
-        first_error = str(result.get("error", ""))
-        is_internal = "InternalError" in first_error or "InternalServerError" in first_error
-
-        if first_status == "failed" and include_safety and not is_internal:
-            # Attempt 2: same config (transient-error retry)
-            logger.warning(
-                "[Foundry] Attempt 1 failed (transient?) — retrying same configuration..."
-            )
-            result = self._try_run(
-                raw_results, evaluation_type, model_name,
-                f"{eval_name}-retry2",
-                jsonl_path, include_safety, poll, poll_interval, timeout,
-                attempt=2,
-            )
-            if result["status"] == "completed":
-                logger.info("[Foundry] Succeeded on attempt 2")
-                return result
-        elif is_internal:
-            logger.warning(
-                "[Foundry] Attempt 1 failed with InternalServerError (likely safety evaluators) "
-                "— skipping same-config retry."
-            )
-
-        # Attempt final: without safety (fewer evaluators → faster)
-        if include_safety:
-            if first_status == "timed_out":
-                label = "Timed out"
-            elif is_internal:
-                label = "InternalServerError (safety evaluators)"
-            else:
-                label = "Still failing"
-            logger.warning(
-                f"[Foundry] {label} — retrying WITHOUT safety evaluators..."
-            )
-            # If we skipped the same-config retry (internal error or timeout)
-            # this is attempt 2; otherwise attempt 3.
-            next_attempt = 2 if (is_internal or first_status == "timed_out") else 3
-            result = self._try_run(
-                raw_results, evaluation_type, model_name,
-                f"{eval_name}-nosafety",
-                jsonl_path, False, poll, poll_interval, timeout,
-                attempt=next_attempt,
-            )
-            if result["status"] == "completed":
-                logger.info(
-                    f"[Foundry] Succeeded on final attempt (without safety evaluators)"
-                )
-            return result
+        chain = _SubmissionChain(
+            evaluator=self,
+            submission=submission,
+            jsonl_path=jsonl_path,
+            include_safety=self.include_safety_evaluators,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            on_complete=on_complete,
+        )
+        chain.start_attempt("first", eval_name, self.include_safety_evaluators, attempt=1)
+        return submission
 
-        # Safety was already off; nothing more to try
-        return result
+    async def submit_evaluation_async(
+        self,
+        raw_results: List[Dict],
+        evaluation_type: str,
+        model_name: str,
+        on_submitted: Optional[Callable[["FoundrySubmission"], None]] = None,
+        poll_interval: float = 5.0,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Submit and await the final result without holding a thread.
 
-    # ------------------------------------------------------------------
-    # Internal: single attempt wrapper (catches exceptions)
-    # ------------------------------------------------------------------
+        Only the upload / create calls run in a worker thread; waiting is
+        done on the submission's future, which the shared poller resolves.
+        ``on_submitted`` receives the submission as soon as the run exists.
+        """
+        submission = await asyncio.to_thread(
+            self.start_evaluation,
+            raw_results, evaluation_type, model_name,
+            poll_interval=poll_interval, timeout=timeout,
+        )
+        if on_submitted:
+            on_submitted(submission)
+        return await asyncio.wrap_future(submission.future)
 
-    def _try_run(
+    def submit_evaluation(
         self,
-        raw_results, evaluation_type, model_name, eval_name,
-        jsonl_path, include_safety, poll, poll_interval, timeout,
-        attempt: int,
+        raw_results: List[Dict],
+        evaluation_type: str,
+        model_name: str,
+        poll: bool = True,
+        poll_interval: float = 5.0,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Run a single Foundry eval attempt, catching exceptions."""
-        try:
-            return self._run_evaluation(
-                raw_results=raw_results,
-                evaluation_type=evaluation_type,
-                model_name=model_name,
-                eval_name=eval_name,
-                jsonl_path=jsonl_path,
-                include_safety=include_safety,
-                poll=poll,
-                poll_interval=poll_interval,
-                timeout=timeout,
-            )
-        except Exception as e:
-            logger.error(
-                f"[Foundry] Attempt {attempt} raised {type(e).__name__}: {e}"
-            )
-            return {"status": "failed", "error": str(e)}
+        """
+        Export results to JSONL, upload to Foundry, create an evaluation,
+        and optionally wait for completion.
+
+        Blocking wrapper over :meth:`start_evaluation` (same retry
+        strategy); the wait is on the submission future, so polling itself
+        is still done by the single shared poller.
+
+        Args:
+            raw_results: The raw_results from EvaluationResult
+            evaluation_type: 'classification', 'dialog', 'general', 'rag',
+                or 'tool_calling'
+            model_name: Local model key (e.g. 'gpt4', 'gpt4o') — used for naming
+            poll: Whether to wait for the run to complete
+            poll_interval: Initial seconds between status checks
+            timeout: Maximum seconds to wait (defaults to ``self.timeout``)
+
+        Returns:
+            Dict with keys:
+                - eval_id, run_id, status, report_url, evaluators,
+                  dataset_id, eval_name, foundry_scores
+        """
+        submission = self.start_evaluation(
+            raw_results, evaluation_type, model_name,
+            poll_interval=poll_interval, timeout=timeout,
+        )
+        if not poll:
+            return submission.to_dict()
+        return submission.future.result()
 
     # ------------------------------------------------------------------
-    # Internal: single evaluation run (no retry)
+    # Internal: single evaluation run (no retry, no polling)
     # ------------------------------------------------------------------
 
-    def _run_evaluation(
+    def _start_run(
         self,
-        raw_results: List[Dict],
         evaluation_type: str,
-        model_name: str,
         eval_name: str,
         jsonl_path: str,
         include_safety: bool,
-        poll: bool,
-        poll_interval: float,
-        timeout: float,
     ) -> Dict[str, Any]:
-        """Execute a single Foundry evaluation run (upload → create → poll → retrieve)."""
-
-        credential = DefaultAzureCredential()
-        with (
-            AIProjectClient(
-                endpoint=self.project_endpoint,
-                credential=credential,
-            ) as project_client,
-            project_client.get_openai_client() as openai_client,
-        ):
-            # 2. Upload dataset
-            logger.info("[Foundry] Uploading dataset...")
-            dataset = project_client.datasets.upload_file(
-                name=f"{eval_name}-data",
-                version="1",
-                file_path=jsonl_path,
-            )
-            logger.info(f"[Foundry] Dataset uploaded: {dataset.name} (ID: {dataset.id})")
-
-            # 3. Build data source config
-            data_source_config = DataSourceConfigCustom(
-                {
-                    "type": "custom",
-                    "item_schema": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string"},
-                            "response": {"type": "string"},
-                            "context": {"type": "string"},
-                            "ground_truth": {"type": "string"},
-                        },
-                        "required": ["query", "response"],
+        """Upload → create evaluation → create run; returns the run descriptor."""
+        project_client, openai_client = self._clients()
+
+        # 2. Upload dataset
+        logger.info("[Foundry] Uploading dataset...")
+        dataset = project_client.datasets.upload_file(
+            name=f"{eval_name}-data",
+            version="1",
+            file_path=jsonl_path,
+        )
+        logger.info(f"[Foundry] Dataset uploaded: {dataset.name} (ID: {dataset.id})")
+
+        # 3. Build data source config
+        data_source_config = DataSourceConfigCustom(
+            {
+                "type": "custom",
+                "item_schema": {
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string"},
+                        "response": {"type": "string"},
+                        "context": {"type": "string"},
+                        "ground_truth": {"type": "string"},
                     },
-                    "include_sample_schema": False,
-                }
-            )
+                    "required": ["query", "response"],
+                },
+                "include_sample_schema": False,
+            }
+        )
 
-            # 4. Build testing criteria
-            testing_criteria = _get_testing_criteria(
-                evaluation_type, self.grader_model, include_safety=include_safety,
-            )
-            evaluator_names = [tc["name"] for tc in testing_criteria]
-            safety_label = "" if include_safety else " (safety evaluators EXCLUDED)"
-            logger.info(f"[Foundry] Evaluators{safety_label}: {evaluator_names}")
-
-            # 5. Create evaluation
-            logger.info("[Foundry] Creating evaluation...")
-            evaluation = openai_client.evals.create(
-                name=eval_name,
-                data_source_config=data_source_config,
-                testing_criteria=testing_criteria,
-            )
-            logger.info(f"[Foundry] Evaluation created: {evaluation.id}")
-
-            # 6. Create evaluation run
-            logger.info("[Foundry] Starting evaluation run...")
-            run = openai_client.evals.runs.create(
-                eval_id=evaluation.id,
-                name=f"{eval_name}-run",
-                data_source=CreateEvalJSONLRunDataSourceParam(
-                    type="jsonl",
-                    source=SourceFileID(type="file_id", id=dataset.id),
-                ),
-            )
-            logger.info(f"[Foundry] Run created: {run.id}")
+        # 4. Build testing criteria
+        testing_criteria = _get_testing_criteria(
+            evaluation_type, self.grader_model, include_safety=include_safety,
+        )
+        evaluator_names = [tc["name"] for tc in testing_criteria]
+        safety_label = "" if include_safety else " (safety evaluators EXCLUDED)"
+        logger.info(f"[Foundry] Evaluators{safety_label}: {evaluator_names}")
+
+        # 5. Create evaluation
+        logger.info("[Foundry] Creating evaluation...")
+        evaluation = openai_client.evals.create(
+            name=eval_name,
+            data_source_config=data_source_config,
+            testing_criteria=testing_criteria,
+        )
+        logger.info(f"[Foundry] Evaluation created: {evaluation.id}")
+
+        # 6. Create evaluation run
+        logger.info("[Foundry] Starting evaluation run...")
+        run = openai_client.evals.runs.create(
+            eval_id=evaluation.id,
+            name=f"{eval_name}-run",
+            data_source=CreateEvalJSONLRunDataSourceParam(
+                type="jsonl",
+                source=SourceFileID(type="file_id", id=dataset.id),
+            ),
+        )
+        logger.info(f"[Foundry] Run created: {run.id}")
 
-            # 7. Poll for completion
-            status = run.status
-            report_url = getattr(run, "report_url", None) or ""
-
-            if poll:
-                elapsed = 0.0
-                while status not in ("completed", "failed") and elapsed < timeout:
-                    time.sleep(poll_interval)
-                    elapsed += poll_interval
-                    run = openai_client.evals.runs.retrieve(
-                        run_id=run.id, eval_id=evaluation.id
-                    )
-                    status = run.status
-                    report_url = getattr(run, "report_url", None) or ""
-                    logger.info(f"[Foundry] Status: {status} ({elapsed:.0f}s)")
-
-                if status == "completed":
-                    logger.info(f"[Foundry] Evaluation completed -> {report_url}")
-                elif status == "failed":
-                    run_error = getattr(run, "error", None)
-                    logger.error(
-                        f"[Foundry] Evaluation run failed.  "
-                        f"error={run_error}  "
-                        f"run_id={run.id}  eval_id={evaluation.id}"
-                    )
-                else:
-                    # Polling expired but the run is still going on Foundry's
-                    # side.  Use a distinct status so the retry logic can
-                    # skip the same-config retry (it would just timeout again).
-                    status = "timed_out"
-                    logger.warning(f"[Foundry] Timed out after {timeout}s (run still in_progress on server)")
-
-            # 8. Retrieve per-row scores if completed
-            foundry_scores = None
-            run_error_str = ""
-            if status == "completed":
-                try:
-                    foundry_scores = self._retrieve_results_with_client(
-                        openai_client, evaluation.id, run.id
-                    )
-                except Exception as e:
-                    logger.warning(f"[Foundry] Failed to retrieve detailed scores: {e}")
-            elif status == "failed":
-                run_error_str = str(getattr(run, "error", "") or "")
-
-            return {
-                "eval_id": evaluation.id,
-                "run_id": run.id,
-                "status": status,
-                "report_url": report_url,
-                "evaluators": evaluator_names,
-                "dataset_id": dataset.id,
-                "eval_name": eval_name,
-                "foundry_scores": foundry_scores,
-                "error": run_error_str,
-            }
+        return {
+            "eval_id": evaluation.id,
+            "run_id": run.id,
+            "status": run.status,
+            "report_url": getattr(run, "report_url", None) or "",
+            "evaluators": evaluator_names,
+            "dataset_id": dataset.id,
+            "eval_name": eval_name,
+            "foundry_scores": None,
+            "error": "",
+        }
+
+    def _finish_run(self, info: Dict[str, Any], run: Any, status: str, timeout: float) -> Dict[str, Any]:
+        """Turn a terminal poll into the final result dict (retrieving scores)."""
+        result = dict(info)
+        result["status"] = status
+        if run is not None:
+            result["report_url"] = getattr(run, "report_url", None) or result.get("report_url", "")
+
+        # 7. Log the outcome
+        if status == "completed":
+            logger.info(f"[Foundry] Evaluation completed -> {result['report_url']}")
+        elif status == "failed":
+            run_error = getattr(run, "error", None)
+            logger.error(
+                f"[Foundry] Evaluation run failed.  "
+                f"error={run_error}  "
+                f"run_id={info['run_id']}  eval_id={info['eval_id']}"
+            )
+            result["error"] = str(run_error or "")
+        else:
+            # Polling expired but the run is still going on Foundry's
+            # side.  Use a distinct status so the retry logic can
+            # skip the same-config retry (it would just timeout again).
+            logger.warning(f"[Foundry] Timed out after {timeout}s (run still in_progress on server)")
+
+        # 8. Retrieve per-row scores if completed
+        if status == "completed":
+            try:
+                _, openai_client = self._clients()
+                result["foundry_scores"] = self._retrieve_results_with_client(
+                    openai_client, info["eval_id"], info["run_id"]
+                )
+            except Exception as e:
+                logger.warning(f"[Foundry] Failed to retrieve detailed scores: {e}")
+        return result
 
     # ------------------------------------------------------------------
     # Score retrieval
@@ -1055,20 +1328,13 @@ class FoundryEvaluator:
         """
         Public API: retrieve per-row scores from a completed Foundry run.
 
-        Opens its own AIProjectClient context so it can be called
-        independently of submit_evaluation.
+        Uses the evaluator's shared clients, so it can be called
+        independently of submit_evaluation without re-authenticating.
         """
-        credential = DefaultAzureCredential()
-        with (
-            AIProjectClient(
-                endpoint=self.project_endpoint,
-                credential=credential,
-            ) as project_client,
-            project_client.get_openai_client() as openai_client,
-        ):
-            return self._retrieve_results_with_client(
-                openai_client, eval_id, run_id
-            )
+        _, openai_client = self._clients()
+        return self._retrieve_results_with_client(
+            openai_client, eval_id, run_id
+        )
 
 
 # ---------------------------------------------------------------------------
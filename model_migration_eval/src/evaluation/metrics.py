@@ -3,21 +3,27 @@ Evaluation Metrics Module
 Provides comprehensive metrics calculation for model evaluation
 """
 
-import json
-import re
 import logging
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from collections import Counter
 import numpy as np
 
+from ..clients.response_parser import ParsedResponse, ensure_parsed, summarise_parse_costs
+
 logger = logging.getLogger(__name__)
-from sklearn.metrics import (
-    accuracy_score, 
-    precision_recall_fscore_support,
-    confusion_matrix,
-    cohen_kappa_score
-)
+
+
+def _safe_float(v, default=0.0):
+    """Convert to float safely — handles dicts, None, and non-numeric strings."""
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, dict):
+        v = v.get('score') or v.get('value') or v.get('confidence') or default
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return default
 
 
 @dataclass
@@ -88,6 +94,9 @@ class LatencyMetrics:
     max_latency: float = 0.0
     std_latency: float = 0.0
     mean_ttft: float = 0.0  # Time to first token
+    p50_ttft: float = 0.0              # streaming runs only
+    p95_ttft: float = 0.0
+    mean_inter_token_latency: float = 0.0  # seconds between streamed chunks
     # New: cost & token analytics
     tokens_per_second: float = 0.0
     cache_hit_rate: float = 0.0        # cached_tokens / prompt_tokens * 100
@@ -107,6 +116,9 @@ class LatencyMetrics:
             'max_latency': self.max_latency,
             'std_latency': self.std_latency,
             'mean_ttft': self.mean_ttft,
+            'p50_ttft': self.p50_ttft,
+            'p95_ttft': self.p95_ttft,
+            'mean_inter_token_latency': self.mean_inter_token_latency,
             'tokens_per_second': self.tokens_per_second,
             'cache_hit_rate': self.cache_hit_rate,
             'reasoning_token_pct': self.reasoning_token_pct,
@@ -133,6 +145,9 @@ class QualityMetrics:
     optimal_similarity: float = 0.0     # Similarity to the gold-standard optimal follow-up
     resolution_efficiency: float = 0.0  # Questions asked vs expected resolution turns
     question_count_avg: float = 0.0     # Average number of follow-up questions generated
+    # Parse cost of the run's JSON responses
+    parse_time_ms: float = 0.0          # Total time spent parsing responses
+    parse_strategies: Dict[str, int] = field(default_factory=dict)  # {strategy: count}
     
     def to_dict(self) -> Dict:
         return {
@@ -148,6 +163,8 @@ class QualityMetrics:
             'optimal_similarity': self.optimal_similarity,
             'resolution_efficiency': self.resolution_efficiency,
             'question_count_avg': self.question_count_avg,
+            'parse_time_ms': self.parse_time_ms,
+            'parse_strategies': self.parse_strategies,
         }
 
 
@@ -180,9 +197,15 @@ class MetricsCalculator:
         'default': {'input': 0.0025, 'output': 0.01, 'cached_input': 0.00125},
     }
 
-    def __init__(self, cost_rates: Optional[Dict[str, Dict[str, float]]] = None):
+    def __init__(
+        self,
+        cost_rates: Optional[Dict[str, Dict[str, float]]] = None,
+        log_scenarios: bool = False,
+    ):
         self._category_labels = []
         self.cost_rates: Dict[str, Dict[str, float]] = cost_rates or self._DEFAULT_COST_RATES
+        # Per-scenario OK/FAIL lines are noisy on large runs — opt-in only
+        self.log_scenarios = log_scenarios
 
     def get_cost_rates(self, model_name: Optional[str] = None) -> Dict[str, float]:
         """Return the per-1K-token rate dict for *model_name*.
@@ -198,6 +221,22 @@ class MetricsCalculator:
             return next(iter(self.cost_rates.values()))
         return {'input': 0.0025, 'output': 0.01, 'cached_input': 0.00125}
 
+    @staticmethod
+    def request_cost(
+        rates: Dict[str, float],
+        prompt_tokens: int = 0,
+        cached_tokens: int = 0,
+        completion_tokens: int = 0,
+        reasoning_tokens: int = 0,
+    ) -> float:
+        """USD cost of one request at *rates* (per 1K tokens)."""
+        return (
+            ((prompt_tokens - cached_tokens) / 1000) * rates.get('input', 0.0025)
+            + (cached_tokens / 1000) * rates.get('cached_input', 0.00125)
+            + ((completion_tokens - reasoning_tokens) / 1000) * rates.get('output', 0.01)
+            + (reasoning_tokens / 1000) * rates.get('reasoning', rates.get('output', 0.01))
+        )
+
     @staticmethod
     def _normalise_category(value) -> str:
         """Normalise a category value for comparison."""
@@ -220,119 +259,115 @@ class MetricsCalculator:
     def calculate_classification_metrics(
         self,
         predictions: List[Dict],
-        ground_truth: List[Dict]
+        ground_truth: List[Dict],
+        log_scenarios: Optional[bool] = None,
     ) -> ClassificationMetrics:
         """
         Calculate classification metrics comparing predictions to ground truth.
-        
+
+        Labels are encoded to integer codes once; accuracy, the confusion
+        matrix, weighted precision/recall/F1, kappa, per-category accuracy,
+        sub-field accuracies and calibration bins are then all derived from
+        NumPy arrays, so re-scoring archived runs with many thousands of
+        rows stays linear.
+
         Args:
             predictions: List of prediction dicts with 'category' key
             ground_truth: List of ground truth dicts with 'expected_category' key
-            
+            log_scenarios: Log one INFO line per scenario (defaults to the
+                calculator's ``log_scenarios`` setting)
+
         Returns:
             ClassificationMetrics object
         """
-        y_pred = [self._normalise_category(p.get('category', 'unknown')) for p in predictions]
-        y_true = [self._normalise_category(g.get('expected_category', g.get('category', 'unknown'))) for g in ground_truth]
-        
-        # Log per-scenario comparison for debugging
-        for i, (pred, true) in enumerate(zip(y_pred, y_true)):
-            match = 'OK' if pred == true else 'FAIL'
-            logger.info(f"  [{match}] Scenario {i+1}: predicted='{pred}' expected='{true}'")
-        
-        matches = sum(1 for p, t in zip(y_pred, y_true) if p == t)
-        logger.info(f"Classification results: {matches}/{len(y_pred)} correct ({matches/len(y_pred)*100:.1f}% accuracy)")
-        logger.info(f"Unique predicted categories: {sorted(set(y_pred))}")
-        logger.info(f"Unique expected categories:  {sorted(set(y_true))}")
-        
-        # Get unique labels
-        labels = sorted(list(set(y_true + y_pred)))
-        
-        # Calculate basic metrics
-        accuracy = accuracy_score(y_true, y_pred)
-        precision, recall, f1, _ = precision_recall_fscore_support(
-            y_true, y_pred, average='weighted', zero_division=0
-        )
-        
-        # Cohen's Kappa
-        try:
-            kappa = cohen_kappa_score(y_true, y_pred)
-        except (ValueError, TypeError):
-            kappa = 0.0
-            
-        # Per-category accuracy
-        category_accuracy = {}
-        for label in labels:
-            mask = [t == label for t in y_true]
-            if sum(mask) > 0:
-                correct = sum(1 for i, m in enumerate(mask) if m and y_pred[i] == label)
-                category_accuracy[label] = correct / sum(mask)
-                
-        # Confusion matrix
-        cm = confusion_matrix(y_true, y_pred, labels=labels)
-        
-        # --- NEW: Subcategory accuracy ---
-        sub_matches = 0
-        sub_total = 0
-        for p, g in zip(predictions, ground_truth):
+        n = min(len(predictions), len(ground_truth))
+        if n == 0:
+            return ClassificationMetrics(confusion_matrix=np.zeros((0, 0), dtype=np.int64))
+
+        # Single pass over the rows: normalise every field we compare
+        y_pred: List[str] = []
+        y_true: List[str] = []
+        confidences = np.empty(n, dtype=np.float64)
+        # Sub-fields: -1 = no ground truth, 0 = mismatch, 1 = match
+        sub_field = np.full((3, n), -1, dtype=np.int8)
+        for i, (p, g) in enumerate(zip(predictions, ground_truth)):
+            y_pred.append(self._normalise_category(p.get('category', 'unknown')))
+            y_true.append(self._normalise_category(g.get('expected_category', g.get('category', 'unknown'))))
+            confidences[i] = _safe_float(p.get('confidence', 0.0))
+
             exp_sub = g.get('expected_subcategory', '')
-            pred_sub = p.get('subcategory', '')
-            if exp_sub:  # Only count when ground truth exists
-                sub_total += 1
-                if self._normalise_category(pred_sub) == self._normalise_category(exp_sub):
-                    sub_matches += 1
-        subcategory_accuracy = sub_matches / sub_total if sub_total > 0 else 0.0
-        
-        # --- NEW: Priority accuracy ---
-        pri_matches = 0
-        pri_total = 0
-        for p, g in zip(predictions, ground_truth):
+            if exp_sub:
+                sub_field[0, i] = self._normalise_category(p.get('subcategory', '')) == self._normalise_category(exp_sub)
             exp_pri = g.get('expected_priority', '')
-            pred_pri = p.get('priority', '')
             if exp_pri:
-                pri_total += 1
-                if str(pred_pri).strip().lower() == str(exp_pri).strip().lower():
-                    pri_matches += 1
-        priority_accuracy = pri_matches / pri_total if pri_total > 0 else 0.0
-        
-        # --- NEW: Sentiment accuracy ---
-        sent_matches = 0
-        sent_total = 0
-        for p, g in zip(predictions, ground_truth):
+                sub_field[1, i] = str(p.get('priority', '')).strip().lower() == str(exp_pri).strip().lower()
             exp_sent = g.get('expected_sentiment', '')
-            pred_sent = p.get('sentiment', '')
             if exp_sent:
-                sent_total += 1
-                if str(pred_sent).strip().lower() == str(exp_sent).strip().lower():
-                    sent_matches += 1
-        sentiment_accuracy = sent_matches / sent_total if sent_total > 0 else 0.0
-        
-        # --- NEW: Confidence calibration ---
-        def _safe_float(v, default=0.0):
-            """Convert to float safely — handles dicts, None, and non-numeric strings."""
-            if isinstance(v, (int, float)):
-                return float(v)
-            if isinstance(v, dict):
-                v = v.get('score') or v.get('value') or v.get('confidence') or default
-            try:
-                return float(v)
-            except (TypeError, ValueError):
-                return default
+                sub_field[2, i] = str(p.get('sentiment', '')).strip().lower() == str(exp_sent).strip().lower()
+
+        # Encode labels once: codes index into the sorted label list
+        label_arr, codes = np.unique(np.array(y_true + y_pred, dtype=str), return_inverse=True)
+        labels = label_arr.tolist()
+        k = len(labels)
+        true_codes = codes[:n]
+        pred_codes = codes[n:]
+        correct = true_codes == pred_codes
+
+        if self.log_scenarios if log_scenarios is None else log_scenarios:
+            for i, (pred, true) in enumerate(zip(y_pred, y_true)):
+                match = 'OK' if correct[i] else 'FAIL'
+                logger.info(f"  [{match}] Scenario {i+1}: predicted='{pred}' expected='{true}'")
+
+        matches = int(correct.sum())
+        logger.info(f"Classification results: {matches}/{n} correct ({matches/n*100:.1f}% accuracy)")
+        logger.info(f"Unique predicted categories: {[labels[c] for c in np.unique(pred_codes)]}")
+        logger.info(f"Unique expected categories:  {[labels[c] for c in np.unique(true_codes)]}")
+
+        # Confusion matrix (rows = true, cols = predicted)
+        cm = np.bincount(true_codes * k + pred_codes, minlength=k * k).reshape(k, k)
+        tp = np.diag(cm).astype(np.float64)
+        support = cm.sum(axis=1).astype(np.float64)
+        predicted = cm.sum(axis=0).astype(np.float64)
+
+        accuracy = matches / n
+
+        # Support-weighted precision / recall / F1 (0 where undefined)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            prec_c = np.where(predicted > 0, tp / predicted, 0.0)
+            rec_c = np.where(support > 0, tp / support, 0.0)
+            f1_c = np.where(prec_c + rec_c > 0, 2 * prec_c * rec_c / (prec_c + rec_c), 0.0)
+        weights = support / n
+        precision = float(weights @ prec_c)
+        recall = float(weights @ rec_c)
+        f1 = float(weights @ f1_c)
+
+        # Cohen's Kappa from the marginals
+        p_expected = float(support @ predicted) / (n * n)
+        kappa = (accuracy - p_expected) / (1 - p_expected) if p_expected < 1 else 0.0
+
+        # Per-category accuracy (recall of each expected label)
+        category_accuracy = {
+            labels[c]: float(tp[c] / support[c]) for c in np.flatnonzero(support)
+        }
+
+        # Sub-field accuracy — only rows with a ground-truth value count
+        has_gt = sub_field >= 0
+        sub_totals = has_gt.sum(axis=1)
+        sub_matches = (sub_field == 1).sum(axis=1)
+        sub_acc = np.divide(sub_matches, sub_totals, out=np.zeros(3), where=sub_totals > 0)
+        subcategory_accuracy, priority_accuracy, sentiment_accuracy = (float(a) for a in sub_acc)
+
+        # Confidence calibration
+        avg_confidence = float(confidences.mean())
+        calibration_bins = self._calculate_calibration(confidences, correct)
 
-        confidences = [_safe_float(p.get('confidence', 0.0)) for p in predictions]
-        avg_confidence = np.mean(confidences) if confidences else 0.0
-        
-        calibration_bins = self._calculate_calibration(
-            confidences, y_pred, y_true
-        )
-        
         logger.info(
             f"Sub-field accuracy: subcategory={subcategory_accuracy:.1%} "
-            f"({sub_matches}/{sub_total}), priority={priority_accuracy:.1%} "
-            f"({pri_matches}/{pri_total}), sentiment={sentiment_accuracy:.1%} "
-            f"({sent_matches}/{sent_total}), avg_confidence={avg_confidence:.3f}"
+            f"({sub_matches[0]}/{sub_totals[0]}), priority={priority_accuracy:.1%} "
+            f"({sub_matches[1]}/{sub_totals[1]}), sentiment={sentiment_accuracy:.1%} "
+            f"({sub_matches[2]}/{sub_totals[2]}), avg_confidence={avg_confidence:.3f}"
         )
-        
+
         return ClassificationMetrics(
             accuracy=accuracy,
             precision=precision,
@@ -351,7 +386,7 @@ class MetricsCalculator:
         
     def calculate_consistency_metrics(
         self,
-        responses: List[List[str]]
+        responses: List[List[Any]]
     ) -> ConsistencyMetrics:
         """
         Calculate consistency metrics from multiple runs of the same prompts.
@@ -359,6 +394,7 @@ class MetricsCalculator:
         Args:
             responses: List of response lists, where each inner list contains
                       responses for the same prompt across multiple runs
+                      (``ParsedResponse`` objects or raw strings)
                       
         Returns:
             ConsistencyMetrics object
@@ -372,14 +408,15 @@ class MetricsCalculator:
         for response_set in responses:
             if len(response_set) < 2:
                 continue
+            parsed_set = [ensure_parsed(r) for r in response_set]
                 
             # Exact match reproducibility
-            unique_responses = len(set(response_set))
+            unique_responses = len({p.text for p in parsed_set})
             repro = 1.0 if unique_responses == 1 else 1.0 / unique_responses
             reproducibility_scores.append(repro)
             
             # Format consistency (check if all are valid JSON or all are not)
-            json_valid = [self._is_valid_json(r) for r in response_set]
+            json_valid = [p.is_json for p in parsed_set]
             format_consistent = 1.0 if len(set(json_valid)) == 1 else 0.5
             format_scores.append(format_consistent)
             
@@ -394,7 +431,8 @@ class MetricsCalculator:
         latencies: List[float],
         ttft_values: Optional[List[float]] = None,
         token_data: Optional[List[Dict]] = None,
-        model_name: Optional[str] = None
+        model_name: Optional[str] = None,
+        inter_token_values: Optional[List[float]] = None,
     ) -> LatencyMetrics:
         """
         Calculate latency metrics from timing measurements.
@@ -402,9 +440,11 @@ class MetricsCalculator:
         Args:
             latencies: List of total latency values in seconds
             ttft_values: Optional list of time-to-first-token values
+                (streaming runs); zero/missing entries are ignored
             token_data: Optional per-request token data [{prompt_tokens, completion_tokens,
                         cached_tokens, reasoning_tokens}]
             model_name: Model name for cost estimation (e.g. 'gpt4', 'gpt4o', 'gpt5')
+            inter_token_values: Optional per-request mean inter-token gaps
             
         Returns:
             LatencyMetrics object
@@ -413,6 +453,8 @@ class MetricsCalculator:
             return LatencyMetrics()
             
         latencies_arr = np.array(latencies)
+        ttft_arr = np.array([t for t in (ttft_values or []) if t and t > 0], dtype=float)
+        itl_arr = np.array([t for t in (inter_token_values or []) if t and t > 0], dtype=float)
         
         # Token analytics
         tokens_per_second = 0.0
@@ -440,18 +482,13 @@ class MetricsCalculator:
             # Cost estimation (per 1K tokens) — from centralized cost_rates
             rates = self.get_cost_rates(model_name)
             for d in token_data:
-                pt = d.get('prompt_tokens', 0)
-                ct = d.get('cached_tokens', 0)
-                comp = d.get('completion_tokens', 0)
-                rt = d.get('reasoning_tokens', 0)
-                uncached_prompt = pt - ct
-                req_cost = (
-                    (uncached_prompt / 1000) * rates.get('input', 0.0025)
-                    + (ct / 1000) * rates.get('cached_input', 0.00125)
-                    + ((comp - rt) / 1000) * rates.get('output', 0.01)
-                    + (rt / 1000) * rates.get('reasoning', rates.get('output', 0.01))
+                total_cost += self.request_cost(
+                    rates,
+                    prompt_tokens=d.get('prompt_tokens', 0),
+                    cached_tokens=d.get('cached_tokens', 0),
+                    completion_tokens=d.get('completion_tokens', 0),
+                    reasoning_tokens=d.get('reasoning_tokens', 0),
                 )
-                total_cost += req_cost
             cost_per_request = total_cost / len(token_data) if token_data else 0.0
         
         return LatencyMetrics(
@@ -462,7 +499,10 @@ class MetricsCalculator:
             min_latency=float(np.min(latencies_arr)),
             max_latency=float(np.max(latencies_arr)),
             std_latency=float(np.std(latencies_arr)),
-            mean_ttft=float(np.mean(ttft_values)) if ttft_values else 0.0,
+            mean_ttft=float(np.mean(ttft_arr)) if ttft_arr.size else 0.0,
+            p50_ttft=float(np.median(ttft_arr)) if ttft_arr.size else 0.0,
+            p95_ttft=float(np.percentile(ttft_arr, 95)) if ttft_arr.size else 0.0,
+            mean_inter_token_latency=float(np.mean(itl_arr)) if itl_arr.size else 0.0,
             tokens_per_second=tokens_per_second,
             cache_hit_rate=cache_hit_rate,
             reasoning_token_pct=reasoning_token_pct,
@@ -474,7 +514,7 @@ class MetricsCalculator:
         
     def calculate_quality_metrics(
         self,
-        responses: List[str],
+        responses: List[Any],
         expected_format: str = "json",
         required_fields: Optional[List[str]] = None
     ) -> QualityMetrics:
@@ -482,25 +522,31 @@ class MetricsCalculator:
         Calculate response quality metrics.
         
         Args:
-            responses: List of model responses
+            responses: List of model responses (``ParsedResponse`` objects
+                or raw strings, which are parsed here)
             expected_format: Expected format ('json', 'text', 'structured')
             required_fields: Required fields in JSON responses
             
         Returns:
-            QualityMetrics object
+            QualityMetrics object; for JSON responses it also reports the
+            run's total parse time and how many responses needed each
+            recovery strategy
         """
         if not responses:
             return QualityMetrics()
             
         format_scores = []
         completeness_scores = []
+        parsed_responses: List[ParsedResponse] = []
         
         required_fields = required_fields or ['classification', 'priority', 'sentiment']
         
         for response in responses:
             # Format compliance
             if expected_format == "json":
-                is_valid, parsed = self._is_valid_json(response, return_parsed=True)
+                parsed_response = ensure_parsed(response)
+                parsed_responses.append(parsed_response)
+                is_valid, parsed = parsed_response.is_json, parsed_response.data
                 format_scores.append(1.0 if is_valid else 0.0)
                 
                 # Completeness
@@ -516,7 +562,8 @@ class MetricsCalculator:
         return QualityMetrics(
             format_compliance=np.mean(format_scores),
             completeness=np.mean(completeness_scores),
-            instruction_following=np.mean(format_scores) * np.mean(completeness_scores)
+            instruction_following=np.mean(format_scores) * np.mean(completeness_scores),
+            **summarise_parse_costs(parsed_responses),
         )
         
     def calculate_follow_up_quality(
@@ -716,38 +763,46 @@ class MetricsCalculator:
 
     def _calculate_calibration(
         self,
-        confidences: List[float],
-        y_pred: List[str],
-        y_true: List[str],
+        confidences: np.ndarray,
+        correct: np.ndarray,
         n_bins: int = 5
     ) -> List[Dict]:
         """Calculate confidence calibration bins.
         
         Groups predictions into bins by confidence level, then computes the
         actual accuracy in each bin.  A well-calibrated model shows accuracy
-        close to its stated confidence.
+        close to its stated confidence.  Bins are half-open ``[lo, hi)``
+        except the last, which also takes ``1.0``; confidences outside
+        ``[0, 1]`` are ignored.
+
+        Args:
+            confidences: Stated confidence per scenario
+            correct: Boolean array, True where the prediction was right
         
         Returns list of dicts: [{bin, accuracy, confidence, count}]
         """
-        if not confidences or len(confidences) != len(y_pred):
+        confidences = np.asarray(confidences, dtype=np.float64)
+        correct = np.asarray(correct, dtype=bool)
+        if confidences.size == 0 or confidences.shape != correct.shape:
             return []
 
-        bins: List[Dict] = []
         edges = np.linspace(0, 1, n_bins + 1)
-        for i in range(n_bins):
-            lo, hi = edges[i], edges[i + 1]
-            indices = [
-                j for j, c in enumerate(confidences)
-                if (lo <= c < hi) or (i == n_bins - 1 and c == hi)
-            ]
-            if not indices:
-                continue
-            correct = sum(1 for j in indices if y_pred[j] == y_true[j])
+        idx = np.digitize(confidences, edges) - 1
+        idx[confidences == edges[-1]] = n_bins - 1
+        valid = (idx >= 0) & (idx < n_bins)
+        idx, conf, hit = idx[valid], confidences[valid], correct[valid]
+
+        counts = np.bincount(idx, minlength=n_bins)
+        hits = np.bincount(idx, weights=hit, minlength=n_bins)
+        conf_sums = np.bincount(idx, weights=conf, minlength=n_bins)
+
+        bins: List[Dict] = []
+        for i in np.flatnonzero(counts):
             bins.append({
-                'bin': f"{lo:.1f}-{hi:.1f}",
-                'accuracy': correct / len(indices),
-                'confidence': float(np.mean([confidences[j] for j in indices])),
-                'count': len(indices),
+                'bin': f"{edges[i]:.1f}-{edges[i + 1]:.1f}",
+                'accuracy': float(hits[i] / counts[i]),
+                'confidence': float(conf_sums[i] / counts[i]),
+                'count': int(counts[i]),
             })
         return bins
 
@@ -757,186 +812,14 @@ class MetricsCalculator:
         results_b: List[Dict],
     ) -> Dict[str, Any]:
         """Compute statistical significance tests for two sets of evaluation results.
-        
-        - McNemar test for classification accuracy (paired nominal outcomes).
-        - Paired t-test for latency.
-        
-        Returns dict with p-values and whether differences are significant.
-        """
-        from scipy import stats as sp_stats
-
-        sig: Dict[str, Any] = {}
-
-        # --- McNemar for classification accuracy ---
-        if results_a and results_b and len(results_a) == len(results_b):
-            # Build contingency: a_correct & b_wrong, a_wrong & b_correct
-            a_correct_b_wrong = 0
-            a_wrong_b_correct = 0
-            for ra, rb in zip(results_a, results_b):
-                ea = ra.get('expected', {}).get('category', '')
-                pa = ra.get('predicted', {}).get('category', '')
-                pb = rb.get('predicted', {}).get('category', '')
-                a_ok = (pa == ea)
-                b_ok = (pb == ea)
-                if a_ok and not b_ok:
-                    a_correct_b_wrong += 1
-                elif not a_ok and b_ok:
-                    a_wrong_b_correct += 1
-            n = a_correct_b_wrong + a_wrong_b_correct
-            if n > 0:
-                # McNemar chi-squared (with continuity correction)
-                chi2 = (abs(a_correct_b_wrong - a_wrong_b_correct) - 1) ** 2 / n
-                p_value = 1 - sp_stats.chi2.cdf(chi2, df=1)
-                sig['mcnemar'] = {
-                    'chi2': float(chi2),
-                    'p_value': float(p_value),
-                    'significant': bool(p_value < 0.05),
-                    'a_correct_b_wrong': int(a_correct_b_wrong),
-                    'a_wrong_b_correct': int(a_wrong_b_correct),
-                }
-            else:
-                sig['mcnemar'] = {'chi2': 0, 'p_value': 1.0, 'significant': False,
-                                  'a_correct_b_wrong': 0, 'a_wrong_b_correct': 0}
-
-        # --- Paired t-test for latency ---
-        lat_a = [r.get('latency', 0) for r in results_a if r.get('latency') is not None]
-        lat_b = [r.get('latency', 0) for r in results_b if r.get('latency') is not None]
-        if lat_a and lat_b and len(lat_a) == len(lat_b):
-            t_stat, p_value = sp_stats.ttest_rel(lat_a, lat_b)
-            sig['latency_ttest'] = {
-                't_statistic': float(t_stat),
-                'p_value': float(p_value),
-                'significant': bool(p_value < 0.05),
-            }
-        else:
-            sig['latency_ttest'] = {'t_statistic': 0, 'p_value': 1.0, 'significant': False}
-
-        return sig
 
-    def _is_valid_json(self, text, return_parsed: bool = False) -> Any:
-        """Check if text is valid JSON.  Accepts str or already-parsed dict/list.
-
-        If the raw text fails to parse, this method attempts several
-        recovery strategies:
-        1. Extract a JSON object/array embedded in surrounding prose.
-        2. Repair truncated JSON (close open strings, arrays, objects).
+        Thin wrapper over :func:`significance.paired_significance`: rows are
+        paired by ``scenario_id``; McNemar on accuracy, Wilcoxon signed-rank
+        on latency and paired bootstrap CIs (no cost CI without rates).
         """
-        try:
-            # Already parsed (SDK v2 json_object mode can return dict)
-            if isinstance(text, (dict, list)):
-                return (True, text) if return_parsed else True
-
-            if not isinstance(text, str):
-                return (False, None) if return_parsed else False
-
-            # Try to find JSON in the text
-            cleaned = text.strip()
-            
-            # Handle markdown code blocks
-            if cleaned.startswith('```'):
-                match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', cleaned)
-                if match:
-                    cleaned = match.group(1)
-
-            # --- Attempt 1: direct parse --------------------------------
-            try:
-                parsed = json.loads(cleaned)
-                return (True, parsed) if return_parsed else True
-            except json.JSONDecodeError:
-                pass
-
-            # --- Attempt 2: extract embedded JSON object/array ----------
-            # The model may prefix its JSON with conversational text,
-            # e.g. "Here is my classification:\n{...}".
-            json_match = re.search(r'(\{[\s\S]*\}|\[[\s\S]*\])', cleaned)
-            if json_match:
-                try:
-                    parsed = json.loads(json_match.group(1))
-                    return (True, parsed) if return_parsed else True
-                except json.JSONDecodeError:
-                    pass
-
-            # --- Attempt 3: repair truncated JSON -----------------------
-            # The realtime API may truncate the response mid-JSON when
-            # the output-token budget is exhausted.  Try to close any
-            # open strings, arrays, and objects.
-            repaired = self._repair_truncated_json(cleaned)
-            if repaired is not None:
-                return (True, repaired) if return_parsed else True
-
-            return (False, None) if return_parsed else False
-        except (TypeError, AttributeError):
-            return (False, None) if return_parsed else False
-
-    @staticmethod
-    def _repair_truncated_json(text: str) -> Optional[Dict]:
-        """Attempt to repair JSON truncated mid-stream.
+        from .significance import paired_significance
+        return paired_significance(results_a, results_b)
 
-        Returns the parsed dict/list on success, or *None* on failure.
-        Strategy: find the opening ``{`` or ``[``, then walk character-by-
-        character tracking nesting of braces, brackets and strings.
-        Append the minimal closing tokens to produce valid JSON.
-        """
-        # Find the first { or [
-        start = None
-        for i, ch in enumerate(text):
-            if ch in ('{', '['):
-                start = i
-                break
-        if start is None:
-            return None
-
-        fragment = text[start:]
-
-        # Track nesting via a simple stack-based state machine.
-        stack: List[str] = []      # expected closing chars
-        in_string = False
-        escape_next = False
-
-        for ch in fragment:
-            if escape_next:
-                escape_next = False
-                continue
-            if ch == '\\' and in_string:
-                escape_next = True
-                continue
-            if ch == '"':
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            # Outside a string
-            if ch == '{':
-                stack.append('}')
-            elif ch == '[':
-                stack.append(']')
-            elif ch in ('}', ']'):
-                if stack and stack[-1] == ch:
-                    stack.pop()
-
-        # Build suffix to close all open constructs
-        if not stack and not in_string:
-            # Text is already balanced — shouldn't need repair
-            return None
-
-        suffix = ''
-        if in_string:
-            suffix += '"'
-        # Close stack in reverse order
-        suffix += ''.join(reversed(stack))
-
-        try:
-            parsed = json.loads(fragment + suffix)
-            if isinstance(parsed, (dict, list)):
-                logger.info(
-                    "Repaired truncated JSON by appending '%s' (%d chars recovered)",
-                    suffix, len(fragment),
-                )
-                return parsed
-        except json.JSONDecodeError:
-            pass
-        return None
-            
     def extract_classification_from_response(self, response) -> Dict:
         """
         Extract classification data from model response.
@@ -948,19 +831,19 @@ class MetricsCalculator:
         - Gemini style:  {"classification": {"primary": "…", "secondary": "…", …}}
 
         Args:
-            response: Raw model response (str or dict)
+            response: ``ParsedResponse`` (e.g. ``CompletionResult.parsed``)
+                or a raw model response (str or dict), parsed here
 
         Returns:
-            Extracted classification dict
+            Extracted classification dict; ``parse_strategy`` records how
+            the JSON was recovered (see ``response_parser``)
         """
-        # SDK v2 may already hand us a dict — normalise to str for
-        # the raw_response field, but keep the parsed object.
-        if isinstance(response, dict):
-            is_valid, parsed = True, response
-        else:
-            is_valid, parsed = self._is_valid_json(response, return_parsed=True)
-
-        if is_valid and parsed:
+        parsed_response = ensure_parsed(response)
+        parsed = parsed_response.data
+        # Keep the original dict when the SDK handed us one; otherwise the text
+        response = response if isinstance(response, dict) else parsed_response.text
+
+        if parsed_response.is_json and parsed and isinstance(parsed, dict):
             # --- Resolve the nested "classification" block ----------------
             classification = parsed.get('classification', {})
 
@@ -1102,7 +985,8 @@ class MetricsCalculator:
                 'confidence': raw_conf,
                 'priority': raw_pri,
                 'sentiment': raw_sent,
-                'raw_response': response
+                'raw_response': response,
+                'parse_strategy': parsed_response.strategy,
             }
 
         logger.warning(
@@ -1116,6 +1000,7 @@ class MetricsCalculator:
             'priority': 'medium',
             'sentiment': 'neutral',
             'raw_response': response,
+            'parse_strategy': parsed_response.strategy,
             'parse_error': True
         }
 
@@ -25,8 +25,14 @@ import numpy as np
 
 from ..clients.azure_openai import AzureOpenAIClient, ModelConfig
 from ..clients.tts_client import TTSClient, TTSConfig
-from ..clients.realtime_client import RealtimeClient, RealtimeConfig, is_realtime_available
-from ..utils.audio_utils import AudioSegment, pcm16_duration_ms
+from ..clients.realtime_client import (
+    RealtimeClient,
+    RealtimeConfig,
+    RealtimePoolConfig,
+    RealtimeSessionPool,
+    is_realtime_available,
+)
+from ..utils.audio_utils import AudioSegment
 from ..utils.data_loader import (
     DataLoader,
     ClassificationScenario,
@@ -36,7 +42,8 @@ from ..utils.data_loader import (
     ToolCallingScenario,
 )
 from ..utils.prompt_loader import PromptLoader
-from .evaluator import EvaluationResult
+from ..utils import cancellation
+from .evaluator import EvaluationResult, _mark_if_cancelled
 from .metrics import (
     MetricsCalculator,
     ClassificationMetrics,
@@ -69,11 +76,13 @@ class RealtimeEvaluator:
         realtime_endpoint: Optional[str] = None,
         realtime_api_version: Optional[str] = None,
         tts_endpoint: Optional[str] = None,
+        metrics_calc: Optional[MetricsCalculator] = None,
+        session_pool: Optional[RealtimePoolConfig] = None,
     ):
         self.azure_client = azure_client
         self.prompt_loader = prompt_loader or PromptLoader()
         self.data_loader = data_loader or DataLoader()
-        self.metrics_calc = MetricsCalculator()
+        self.metrics_calc = metrics_calc or MetricsCalculator()
         self.consistency_runs = consistency_runs
         self.max_concurrent = max(1, max_concurrent)
 
@@ -92,8 +101,10 @@ class RealtimeEvaluator:
         self._tts: Optional[TTSClient] = None
         self._tts_openai_client = None  # separate OpenAI client if endpoint differs
 
-        # Realtime client — created lazily per model
+        # Realtime client — created lazily; warm sessions are pooled
+        # across scenarios unless the pool is disabled
         self._realtime: Optional[RealtimeClient] = None
+        self._pool_config = session_pool or RealtimePoolConfig()
 
     def _get_voice_token_provider(self):
         """Return the token provider for the voice endpoint.
@@ -133,9 +144,13 @@ class RealtimeEvaluator:
                         max_retries=3,
                         **auth_kwargs,
                     )
-                self._tts = TTSClient(self._tts_openai_client, self._tts_config)
+                client = self._tts_openai_client
             else:
-                self._tts = TTSClient(self.azure_client.client, self._tts_config)
+                client = self.azure_client.client
+            self._tts = TTSClient(
+                client, self._tts_config,
+                rate_limiter=getattr(self.azure_client, "rate_limiter", None),
+            )
         return self._tts
 
     def _ensure_realtime(self) -> RealtimeClient:
@@ -146,6 +161,7 @@ class RealtimeEvaluator:
                 endpoint=endpoint,
                 api_version=self._realtime_api_version,
                 token_provider=self._get_voice_token_provider(),
+                session_pool=RealtimeSessionPool(self._pool_config) if self._pool_config.enabled else None,
             )
         return self._realtime
 
@@ -190,18 +206,14 @@ class RealtimeEvaluator:
             scenarios_tested=len(scenarios),
         )
 
-        # Pre-synthesize all audio (sync — uses cache)
         tts = self._ensure_tts()
-        tts_results = {
-            s.id: tts.synthesize(s.customer_input, config.voice or "alloy")
-            for s in scenarios
-        }
-
         realtime = self._ensure_realtime()
 
         async def _process(scenario: ClassificationScenario):
             try:
-                tts_r = tts_results[scenario.id]
+                # Each scenario synthesizes its own audio so its Realtime
+                # session can start as soon as that audio is ready
+                tts_r = await tts.synthesize_async(scenario.customer_input, config.voice or "alloy")
                 instructions = self.prompt_loader.load_prompt(
                     model_name, "classification_agent_system",
                 )
@@ -215,7 +227,7 @@ class RealtimeEvaluator:
                 )
 
                 async with sem:
-                    rt_result = await realtime.send_audio(tts_r.audio.data, rt_config)
+                    rt_result = await realtime.send_audio(tts_r.audio, rt_config, keep_audio=False)
 
                 prediction = self.metrics_calc.extract_classification_from_response(
                     rt_result.transcript
@@ -240,12 +252,14 @@ class RealtimeEvaluator:
                         'ttfa_ms': rt_result.time_to_first_audio_ms,
                         'session_ms': rt_result.session_time_ms,
                         'ws_connect_ms': rt_result.ws_connect_time_ms,
+                        'session_reused': rt_result.session_reused,
                         'input_audio_duration_ms': tts_r.audio.duration_ms,
-                        'output_audio_duration_ms': pcm16_duration_ms(rt_result.audio_data),
+                        'output_audio_duration_ms': rt_result.output_audio_duration_ms,
                         'input_audio_tokens': rt_result.input_audio_tokens,
                         'output_audio_tokens': rt_result.output_audio_tokens,
                         'tts_latency_ms': tts_r.tts_latency_ms,
                         'tts_cached': tts_r.cached,
+                        'tts_cache_bytes': len(tts_r.audio.data) if tts_r.cached else 0,
                     },
                     'raw': {
                         'scenario_id': scenario.id,
@@ -273,7 +287,7 @@ class RealtimeEvaluator:
                 result.errors.append(f"{scenario.id}: {e}")
                 return None
 
-        outcomes = await asyncio.gather(*[_process(s) for s in scenarios])
+        outcomes = await cancellation.gather_partial([_process(s) for s in scenarios])
 
         predictions, ground_truth, latencies, token_data, raw_results = [], [], [], [], []
         rt_metrics_list = []
@@ -298,7 +312,7 @@ class RealtimeEvaluator:
         result.realtime_metrics = self._aggregate_rt_metrics(rt_metrics_list, model_name)
         result.scenarios_tested = len(predictions)
         result.raw_results = raw_results
-        return result
+        return _mark_if_cancelled(result, outcomes)
 
     # ── Dialog ──────────────────────────────────────────────────────────
 
@@ -329,7 +343,7 @@ class RealtimeEvaluator:
                 if not last_user:
                     last_user = "Hello, I need help."
 
-                tts_r = tts.synthesize(last_user, config.voice or "alloy")
+                tts_r = await tts.synthesize_async(last_user, config.voice or "alloy")
 
                 instructions = self.prompt_loader.load_prompt(model_name, "dialog_agent_system")
                 conv_text = "\n".join(
@@ -348,7 +362,7 @@ class RealtimeEvaluator:
                 )
 
                 async with sem:
-                    rt_result = await realtime.send_audio(tts_r.audio.data, rt_config)
+                    rt_result = await realtime.send_audio(tts_r.audio, rt_config, keep_audio=False)
 
                 import re
                 questions = re.findall(r'[^.!?\n]*\?', rt_result.transcript)
@@ -368,12 +382,14 @@ class RealtimeEvaluator:
                         'ttfa_ms': rt_result.time_to_first_audio_ms,
                         'session_ms': rt_result.session_time_ms,
                         'ws_connect_ms': rt_result.ws_connect_time_ms,
+                        'session_reused': rt_result.session_reused,
                         'input_audio_duration_ms': tts_r.audio.duration_ms,
-                        'output_audio_duration_ms': pcm16_duration_ms(rt_result.audio_data),
+                        'output_audio_duration_ms': rt_result.output_audio_duration_ms,
                         'input_audio_tokens': rt_result.input_audio_tokens,
                         'output_audio_tokens': rt_result.output_audio_tokens,
                         'tts_latency_ms': tts_r.tts_latency_ms,
                         'tts_cached': tts_r.cached,
+                        'tts_cache_bytes': len(tts_r.audio.data) if tts_r.cached else 0,
                     },
                     'raw': {
                         'scenario_id': scenario.id,
@@ -399,7 +415,7 @@ class RealtimeEvaluator:
                 result.errors.append(f"{scenario.id}: {e}")
                 return None
 
-        outcomes = await asyncio.gather(*[_process(s) for s in scenarios])
+        outcomes = await cancellation.gather_partial([_process(s) for s in scenarios])
 
         latencies, raw_results, rt_metrics_list = [], [], []
         dialog_responses, dialog_context_gaps, dialog_rules = [], [], []
@@ -458,7 +474,7 @@ class RealtimeEvaluator:
         result.realtime_metrics = self._aggregate_rt_metrics(rt_metrics_list, model_name)
         result.scenarios_tested = len(raw_results)
         result.raw_results = raw_results
-        return result
+        return _mark_if_cancelled(result, outcomes)
 
     # ── General ─────────────────────────────────────────────────────────
 
@@ -479,7 +495,7 @@ class RealtimeEvaluator:
         async def _process(test: GeneralTestCase):
             try:
                 prompt_text = test.prompt or "Hello"
-                tts_r = tts.synthesize(prompt_text, config.voice or "alloy")
+                tts_r = await tts.synthesize_async(prompt_text, config.voice or "alloy")
 
                 rt_config = RealtimeConfig(
                     deployment_name=config.deployment_name,
@@ -491,7 +507,7 @@ class RealtimeEvaluator:
                 )
 
                 async with sem:
-                    rt_result = await realtime.send_audio(tts_r.audio.data, rt_config)
+                    rt_result = await realtime.send_audio(tts_r.audio, rt_config, keep_audio=False)
 
                 return {
                     'response': rt_result.transcript,
@@ -505,12 +521,14 @@ class RealtimeEvaluator:
                         'ttfa_ms': rt_result.time_to_first_audio_ms,
                         'session_ms': rt_result.session_time_ms,
                         'ws_connect_ms': rt_result.ws_connect_time_ms,
+                        'session_reused': rt_result.session_reused,
                         'input_audio_duration_ms': tts_r.audio.duration_ms,
-                        'output_audio_duration_ms': pcm16_duration_ms(rt_result.audio_data),
+                        'output_audio_duration_ms': rt_result.output_audio_duration_ms,
                         'input_audio_tokens': rt_result.input_audio_tokens,
                         'output_audio_tokens': rt_result.output_audio_tokens,
                         'tts_latency_ms': tts_r.tts_latency_ms,
                         'tts_cached': tts_r.cached,
+                        'tts_cache_bytes': len(tts_r.audio.data) if tts_r.cached else 0,
                     },
                     'raw': {
                         'test_id': test.id,
@@ -533,7 +551,7 @@ class RealtimeEvaluator:
                 result.errors.append(f"{test.id}: {e}")
                 return None
 
-        outcomes = await asyncio.gather(*[_process(t) for t in test_cases])
+        outcomes = await cancellation.gather_partial([_process(t) for t in test_cases])
 
         latencies, responses, raw_results, rt_metrics_list = [], [], [], []
         for out in outcomes:
@@ -557,7 +575,7 @@ class RealtimeEvaluator:
         result.realtime_metrics = self._aggregate_rt_metrics(rt_metrics_list, model_name)
         result.scenarios_tested = len(raw_results)
         result.raw_results = raw_results
-        return result
+        return _mark_if_cancelled(result, outcomes)
 
     # ── RAG ─────────────────────────────────────────────────────────────
 
@@ -579,7 +597,7 @@ class RealtimeEvaluator:
 
         async def _process(scenario: RAGScenario):
             try:
-                tts_r = tts.synthesize(scenario.query, config.voice or "alloy")
+                tts_r = await tts.synthesize_async(scenario.query, config.voice or "alloy")
 
                 instructions = self.prompt_loader.load_prompt(model_name, "rag_agent_system")
                 full_instructions = (
@@ -597,7 +615,7 @@ class RealtimeEvaluator:
                 )
 
                 async with sem:
-                    rt_result = await realtime.send_audio(tts_r.audio.data, rt_config)
+                    rt_result = await realtime.send_audio(tts_r.audio, rt_config, keep_audio=False)
 
                 response_text = rt_result.transcript
                 context_words = set(scenario.context.lower().split())
@@ -619,12 +637,14 @@ class RealtimeEvaluator:
                         'ttfa_ms': rt_result.time_to_first_audio_ms,
                         'session_ms': rt_result.session_time_ms,
                         'ws_connect_ms': rt_result.ws_connect_time_ms,
+                        'session_reused': rt_result.session_reused,
                         'input_audio_duration_ms': tts_r.audio.duration_ms,
-                        'output_audio_duration_ms': pcm16_duration_ms(rt_result.audio_data),
+                        'output_audio_duration_ms': rt_result.output_audio_duration_ms,
                         'input_audio_tokens': rt_result.input_audio_tokens,
                         'output_audio_tokens': rt_result.output_audio_tokens,
                         'tts_latency_ms': tts_r.tts_latency_ms,
                         'tts_cached': tts_r.cached,
+                        'tts_cache_bytes': len(tts_r.audio.data) if tts_r.cached else 0,
                     },
                     'raw': {
                         'scenario_id': scenario.id,
@@ -649,7 +669,7 @@ class RealtimeEvaluator:
                 result.errors.append(f"{scenario.id}: {e}")
                 return None
 
-        outcomes = await asyncio.gather(*[_process(s) for s in scenarios])
+        outcomes = await cancellation.gather_partial([_process(s) for s in scenarios])
 
         latencies, raw_results, rt_metrics_list = [], [], []
         groundedness_scores, relevance_scores = [], []
@@ -676,7 +696,7 @@ class RealtimeEvaluator:
         result.realtime_metrics = self._aggregate_rt_metrics(rt_metrics_list, model_name)
         result.scenarios_tested = len(raw_results)
         result.raw_results = raw_results
-        return result
+        return _mark_if_cancelled(result, outcomes)
 
     # ── Tool Calling ────────────────────────────────────────────────────
 
@@ -698,7 +718,7 @@ class RealtimeEvaluator:
 
         async def _process(scenario: ToolCallingScenario):
             try:
-                tts_r = tts.synthesize(scenario.query, config.voice or "alloy")
+                tts_r = await tts.synthesize_async(scenario.query, config.voice or "alloy")
 
                 tools_list = scenario.get_tools_list()
                 instructions = self.prompt_loader.load_prompt(model_name, "tool_calling_agent_system")
@@ -726,7 +746,7 @@ class RealtimeEvaluator:
                 )
 
                 async with sem:
-                    rt_result = await realtime.send_audio(tts_r.audio.data, rt_config)
+                    rt_result = await realtime.send_audio(tts_r.audio, rt_config, keep_audio=False)
 
                 expected_calls = scenario.get_expected_calls_list()
 
@@ -770,12 +790,14 @@ class RealtimeEvaluator:
                         'ttfa_ms': rt_result.time_to_first_audio_ms,
                         'session_ms': rt_result.session_time_ms,
                         'ws_connect_ms': rt_result.ws_connect_time_ms,
+                        'session_reused': rt_result.session_reused,
                         'input_audio_duration_ms': tts_r.audio.duration_ms,
-                        'output_audio_duration_ms': pcm16_duration_ms(rt_result.audio_data),
+                        'output_audio_duration_ms': rt_result.output_audio_duration_ms,
                         'input_audio_tokens': rt_result.input_audio_tokens,
                         'output_audio_tokens': rt_result.output_audio_tokens,
                         'tts_latency_ms': tts_r.tts_latency_ms,
                         'tts_cached': tts_r.cached,
+                        'tts_cache_bytes': len(tts_r.audio.data) if tts_r.cached else 0,
                     },
                     'raw': {
                         'scenario_id': scenario.id,
@@ -801,7 +823,7 @@ class RealtimeEvaluator:
                 result.errors.append(f"{scenario.id}: {e}")
                 return None
 
-        outcomes = await asyncio.gather(*[_process(s) for s in scenarios])
+        outcomes = await cancellation.gather_partial([_process(s) for s in scenarios])
 
         latencies, raw_results, rt_metrics_list = [], [], []
         tool_accuracies, param_accuracies = [], []
@@ -831,7 +853,7 @@ class RealtimeEvaluator:
         result.realtime_metrics = self._aggregate_rt_metrics(rt_metrics_list, model_name)
         result.scenarios_tested = len(raw_results)
         result.raw_results = raw_results
-        return result
+        return _mark_if_cancelled(result, outcomes)
 
     # ── Aggregate realtime metrics ──────────────────────────────────────
 
@@ -845,12 +867,14 @@ class RealtimeEvaluator:
         ttfa = [m['ttfa_ms'] for m in rt_list if m.get('ttfa_ms', 0) > 0]
         sessions = [m['session_ms'] for m in rt_list]
         ws_connects = [m['ws_connect_ms'] for m in rt_list]
+        reused_count = sum(1 for m in rt_list if m.get('session_reused'))
         in_dur = [m['input_audio_duration_ms'] for m in rt_list]
         out_dur = [m['output_audio_duration_ms'] for m in rt_list]
         in_tok = [m['input_audio_tokens'] for m in rt_list]
         out_tok = [m['output_audio_tokens'] for m in rt_list]
         tts_lat = [m['tts_latency_ms'] for m in rt_list if not m.get('tts_cached')]
         tts_cached_count = sum(1 for m in rt_list if m.get('tts_cached'))
+        tts_cache_bytes = sum(m.get('tts_cache_bytes', 0) for m in rt_list)
 
         # Cost calculation
         rates = self.metrics_calc.get_cost_rates(model_name)
@@ -866,6 +890,7 @@ class RealtimeEvaluator:
             mean_time_to_first_audio_ms=float(np.mean(ttfa)) if ttfa else 0.0,
             mean_session_time_ms=float(np.mean(sessions)) if sessions else 0.0,
             mean_ws_connect_time_ms=float(np.mean(ws_connects)) if ws_connects else 0.0,
+            session_reuse_rate=reused_count / len(rt_list) * 100,
             p95_session_time_ms=float(np.percentile(sessions, 95)) if len(sessions) > 1 else (sessions[0] if sessions else 0.0),
             mean_input_audio_duration_ms=float(np.mean(in_dur)) if in_dur else 0.0,
             mean_output_audio_duration_ms=float(np.mean(out_dur)) if out_dur else 0.0,
@@ -873,6 +898,7 @@ class RealtimeEvaluator:
             mean_output_audio_tokens=float(np.mean(out_tok)) if out_tok else 0.0,
             mean_tts_latency_ms=float(np.mean(tts_lat)) if tts_lat else 0.0,
             tts_cache_hit_rate=(tts_cached_count / len(rt_list) * 100) if rt_list else 0.0,
+            tts_cache_bytes_served=tts_cache_bytes,
             audio_cost_per_request=total_audio_cost / len(rt_list) if rt_list else 0.0,
             total_audio_cost=total_audio_cost,
         )
@@ -20,8 +20,9 @@ class RealtimeMetrics:
     # Latency
     mean_time_to_first_audio_ms: float = 0.0
     mean_session_time_ms: float = 0.0
-    mean_ws_connect_time_ms: float = 0.0
+    mean_ws_connect_time_ms: float = 0.0   # handshakes only; not part of session time
     p95_session_time_ms: float = 0.0
+    session_reuse_rate: float = 0.0  # 0-100% of scenarios served by a pooled connection
 
     # Audio durations
     mean_input_audio_duration_ms: float = 0.0
@@ -33,7 +34,8 @@ class RealtimeMetrics:
 
     # TTS pipeline
     mean_tts_latency_ms: float = 0.0
-    tts_cache_hit_rate: float = 0.0  # 0-100%
+    tts_cache_hit_rate: float = 0.0  # 0-100% of scenarios whose audio came from the cache
+    tts_cache_bytes_served: int = 0  # audio bytes read from the cache instead of synthesized
 
     # Cost
     audio_cost_per_request: float = 0.0
@@ -45,12 +47,14 @@ class RealtimeMetrics:
             'mean_session_time_ms': self.mean_session_time_ms,
             'mean_ws_connect_time_ms': self.mean_ws_connect_time_ms,
             'p95_session_time_ms': self.p95_session_time_ms,
+            'session_reuse_rate': self.session_reuse_rate,
             'mean_input_audio_duration_ms': self.mean_input_audio_duration_ms,
             'mean_output_audio_duration_ms': self.mean_output_audio_duration_ms,
             'mean_input_audio_tokens': self.mean_input_audio_tokens,
             'mean_output_audio_tokens': self.mean_output_audio_tokens,
             'mean_tts_latency_ms': self.mean_tts_latency_ms,
             'tts_cache_hit_rate': self.tts_cache_hit_rate,
+            'tts_cache_bytes_served': self.tts_cache_bytes_served,
             'audio_cost_per_request': self.audio_cost_per_request,
             'total_audio_cost': self.total_audio_cost,
         }
@@ -0,0 +1,93 @@
+"""
+Content-Addressed Result Store
+==============================
+
+Keeps the last complete ``EvaluationResult`` for every
+(model, evaluation type, prompt, scenario data, model config) combination
+so that re-running a comparison whose inputs have not changed can be served
+from disk instead of re-calling the API.
+
+The key is a SHA-256 over:
+
+* the bytes of the resolved prompt file (``PromptLoader._resolve_path``)
+* the bytes of the scenario file (``DataLoader.scenario_file``)
+* the model's ``ModelConfig`` and the run options (streaming,
+  consistency runs, …)
+
+so editing a prompt, a scenario or a deployment setting always misses.
+Entries older than ``max_age_seconds`` are ignored (and removed), and
+callers can bypass the store entirely with ``force_fresh``.
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_AGE = 24 * 3600   # one day
+
+
+class ResultStore:
+    """One JSON file per result fingerprint under ``store_dir``."""
+
+    def __init__(self, store_dir: str, max_age_seconds: Optional[float] = _DEFAULT_MAX_AGE):
+        """
+        Args:
+            store_dir: Directory holding ``{fingerprint}.json`` entries.
+            max_age_seconds: Entries older than this are treated as misses;
+                ``None`` or ``0`` keeps entries forever.
+        """
+        self.store_dir = Path(store_dir)
+        self.max_age_seconds = max_age_seconds or None
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.store_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result dict for *key*, or ``None`` on a miss."""
+        path = self._path(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+        except OSError:
+            self.misses += 1
+            return None
+        if self.max_age_seconds is not None and age > self.max_age_seconds:
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key: str, result_dict: Dict[str, Any]) -> None:
+        """Store *result_dict* under *key* (atomic write)."""
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        final_path = self._path(key)
+        tmp_path = final_path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result_dict, f, default=str)
+            tmp_path.replace(final_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> int:
+        """Delete every stored entry; returns the number removed."""
+        removed = 0
+        if self.store_dir.exists():
+            for path in self.store_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
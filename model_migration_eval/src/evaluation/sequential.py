@@ -0,0 +1,229 @@
+"""
+Sequential Early Stopping for Comparisons
+=========================================
+
+Group-sequential monitor used by the adaptive comparison mode: scenarios
+are fed to both models in random mini-batches and, after every batch,
+:meth:`SequentialMonitor.look` decides whether running the rest could
+still change the outcome.
+
+Error control is Lan-DeMets O'Brien-Fleming alpha spending: at
+information fraction ``t = n / N`` the cumulative budget is
+``α(t) = 2 − 2Φ(z₁₋α/₂ / √t)``.  Each look tests at the *increment*
+``α(tₖ) − α(tₖ₋₁)`` (a Bonferroni combination of looks, so the overall
+error stays below ``α``), which makes early looks very strict and
+only stops when the evidence is overwhelming.
+
+A look stops the run when
+
+* the migration-readiness verdict is **locked**: every threshold check's
+  projected full-run value (observed part + interval for the remaining
+  scenarios at the current boundary) lies on one side of its threshold —
+  one locked failing check locks FAIL, all checks locked passing lock
+  PASS; or
+* no acceptance thresholds are configured and the paired accuracy
+  difference (McNemar z) or the paired latency shift (Wilcoxon z) crosses
+  the boundary.
+
+Checks without per-scenario data (consistency, quality scores, …) can
+only lock once every scenario has run.
+"""
+
+import math
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .significance import _category, _wilcoxon, align_by_scenario
+
+_NORMAL = NormalDist()
+
+
+def obrien_fleming_spent(t: float, alpha: float) -> float:
+    """Cumulative two-sided alpha spent at information fraction *t*."""
+    if t <= 0:
+        return 0.0
+    t = min(t, 1.0)
+    z = _NORMAL.inv_cdf(1 - alpha / 2)
+    return 2 - 2 * _NORMAL.cdf(z / math.sqrt(t))
+
+
+@dataclass
+class SequentialLook:
+    """Outcome of one interim analysis."""
+    scenarios: int
+    information: float
+    alpha_level: float
+    z_boundary: float
+    accuracy_z: Optional[float] = None
+    latency_z: Optional[float] = None
+    verdict: str = 'NOT_CONFIGURED'
+    verdict_locked: bool = False
+    clear_difference: List[str] = field(default_factory=list)
+    stop: bool = False
+    reason: str = ''
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'scenarios': self.scenarios,
+            'information': round(self.information, 4),
+            'alpha_level': self.alpha_level,
+            'z_boundary': round(self.z_boundary, 4),
+            'accuracy_z': None if self.accuracy_z is None else round(self.accuracy_z, 4),
+            'latency_z': None if self.latency_z is None else round(self.latency_z, 4),
+            'verdict': self.verdict,
+            'verdict_locked': self.verdict_locked,
+            'clear_difference': self.clear_difference,
+            'stop': self.stop,
+            'reason': self.reason,
+        }
+
+
+class SequentialMonitor:
+    """Alpha-spending monitor over a fixed pool of ``total`` scenarios."""
+
+    def __init__(self, total: int, alpha: float = 0.05):
+        self.total = max(1, int(total))
+        self.alpha = alpha
+        self._spent = 0.0
+        self.looks: List[SequentialLook] = []
+
+    def _boundary(self, n: int) -> Tuple[float, float]:
+        spent = obrien_fleming_spent(n / self.total, self.alpha)
+        level = max(spent - self._spent, 1e-12)
+        self._spent = spent
+        return level, _NORMAL.inv_cdf(1 - level / 2)
+
+    # ── Interval projections ────────────────────────────────────────────
+
+    def _project_proportion(self, successes: float, n: int, z: float) -> Tuple[float, float]:
+        """Bounds on the full-run proportion given *successes* out of *n*."""
+        remaining = self.total - n
+        if n <= 0:
+            return 0.0, 1.0
+        p = successes / n
+        # Wilson score interval for the rate on the remaining scenarios
+        denom = 1 + z * z / n
+        centre = (p + z * z / (2 * n)) / denom
+        half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+        lo, hi = max(0.0, centre - half), min(1.0, centre + half)
+        return (successes + remaining * lo) / self.total, (successes + remaining * hi) / self.total
+
+    def _project_mean(self, values: np.ndarray, z: float) -> Tuple[float, float]:
+        """Bounds on the full-run mean given the observed *values*."""
+        n = values.size
+        remaining = self.total - n
+        if n == 0:
+            return -math.inf, math.inf
+        mean = float(values.mean())
+        if remaining <= 0:
+            return mean, mean
+        if n < 2:
+            return -math.inf, math.inf
+        half = z * float(values.std(ddof=1)) / math.sqrt(n)
+        observed = float(values.sum())
+        return (observed + remaining * (mean - half)) / self.total, (observed + remaining * (mean + half)) / self.total
+
+    # ── Look ────────────────────────────────────────────────────────────
+
+    def look(
+        self,
+        raw_a: Sequence[Dict[str, Any]],
+        raw_b: Sequence[Dict[str, Any]],
+        readiness_b: Dict[str, Any],
+        scenarios_run: int,
+    ) -> SequentialLook:
+        """Analyse the scenarios run so far and decide whether to stop.
+
+        Args:
+            raw_a: Raw results of model A so far
+            raw_b: Raw results of model B so far
+            readiness_b: ``_evaluate_migration_readiness`` of B's interim result
+            scenarios_run: Scenarios dispatched so far (incl. failed ones)
+        """
+        level, z = self._boundary(scenarios_run)
+        look = SequentialLook(
+            scenarios=scenarios_run,
+            information=scenarios_run / self.total,
+            alpha_level=level,
+            z_boundary=z,
+            verdict=readiness_b.get('verdict', 'NOT_CONFIGURED'),
+        )
+
+        rows_a, rows_b = align_by_scenario(raw_a, raw_b)
+        correct_a, correct_b = [], []
+        for ra, rb in zip(rows_a, rows_b):
+            expected = _category(ra, 'expected')
+            if expected is None:
+                continue
+            correct_a.append(_category(ra, 'predicted') == expected)
+            correct_b.append(_category(rb, 'predicted') == expected)
+        if correct_a:
+            ca, cb = np.array(correct_a), np.array(correct_b)
+            discordant = int(np.count_nonzero(ca != cb))
+            if discordant:
+                look.accuracy_z = (int(np.count_nonzero(cb & ~ca)) - int(np.count_nonzero(ca & ~cb))) / math.sqrt(discordant)
+                if abs(look.accuracy_z) >= z:
+                    look.clear_difference.append('accuracy')
+
+        lat_pairs = [
+            (float(ra['latency']), float(rb['latency']))
+            for ra, rb in zip(rows_a, rows_b)
+            if isinstance(ra.get('latency'), (int, float)) and isinstance(rb.get('latency'), (int, float))
+        ]
+        if len(lat_pairs) >= 2:
+            pairs = np.array(lat_pairs)
+            look.latency_z = _wilcoxon(pairs[:, 1] - pairs[:, 0])['z']
+            if abs(look.latency_z) >= z:
+                look.clear_difference.append('latency')
+
+        if look.verdict != 'NOT_CONFIGURED':
+            look.verdict_locked = self._verdict_locked(readiness_b, raw_b, z, scenarios_run)
+            if look.verdict_locked:
+                look.stop = True
+                look.reason = f"migration verdict {look.verdict} can no longer change"
+        elif look.clear_difference:
+            look.stop = True
+            look.reason = f"clear difference in {', '.join(look.clear_difference)}"
+
+        self.looks.append(look)
+        return look
+
+    def _verdict_locked(
+        self,
+        readiness_b: Dict[str, Any],
+        raw_b: Sequence[Dict[str, Any]],
+        z: float,
+        scenarios_run: int,
+    ) -> bool:
+        all_pass_locked = True
+        for check in readiness_b.get('checks', []):
+            actual = check.get('actual')
+            if actual is None:
+                continue        # not part of the verdict
+            threshold = check['threshold']
+            metric = check['metric']
+            lower_better = 'latency' in metric
+            if scenarios_run >= self.total:
+                lo = hi = float(actual)
+            elif metric == 'accuracy':
+                n = len(raw_b)
+                lo, hi = self._project_proportion(float(actual) * n, n, z)
+            elif metric == 'max_latency_ms':
+                lat = np.array([float(r['latency']) for r in raw_b
+                                if isinstance(r.get('latency'), (int, float))]) * 1000
+                lo, hi = self._project_mean(lat, z)
+            else:
+                lo, hi = -math.inf, math.inf
+
+            if lower_better:
+                fail_locked, pass_locked = lo > threshold, hi <= threshold
+            else:
+                fail_locked, pass_locked = hi < threshold, lo >= threshold
+            if fail_locked:
+                return True
+            if not pass_locked:
+                all_pass_locked = False
+        return all_pass_locked and readiness_b.get('verdict') == 'PASS'
@@ -0,0 +1,10 @@
+"""
+Background Job Subsystem
+"""
+from .store import JobStore, JobRecord
+from .worker import JobWorkerPool, JobContext, JobCancelled, JobFailed
+
+__all__ = [
+    'JobStore', 'JobRecord',
+    'JobWorkerPool', 'JobContext', 'JobCancelled', 'JobFailed',
+]
@@ -0,0 +1,376 @@
+"""
+Durable Job Store
+=================
+
+SQLite-backed queue and status table for the web app's background jobs
+(batch evaluations, comparisons, prompt / data generation).  Every web
+replica and worker process opening the same database file sees the same
+jobs, so status endpoints can be answered by any replica and jobs survive
+a restart.
+
+Lifecycle::
+
+    queued ──claim──▶ running ──▶ completed | failed | cancelled
+       └──────────── cancel ─────────────────────────▶ cancelled
+
+Scheduling is fair across users: :meth:`JobStore.claim` picks, among
+users below the per-user running limit, the one with the fewest running
+jobs, then the one served least recently, and takes that user's oldest
+queued job.  One user queueing twenty comparisons therefore cannot starve
+everyone else.
+
+Workers heartbeat their running jobs; jobs whose worker stopped
+heartbeating (crash, redeploy) are re-queued by :meth:`recover_stale`
+up to ``max_attempts`` times — evaluations resume from their checkpoint
+journal, so a retry only re-runs the unfinished scenarios.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        run_id           TEXT PRIMARY KEY,
+        user_id          TEXT NOT NULL,
+        kind             TEXT NOT NULL,
+        params           TEXT NOT NULL,
+        status           TEXT NOT NULL,
+        result           TEXT,
+        error            TEXT,
+        error_type       TEXT,
+        progress         TEXT,
+        attempts         INTEGER NOT NULL DEFAULT 0,
+        cancel_requested INTEGER NOT NULL DEFAULT 0,
+        worker_id        TEXT,
+        created_at       REAL NOT NULL,
+        started_at       REAL,
+        finished_at      REAL,
+        heartbeat_at     REAL
+    );
+    CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs (status, created_at);
+    CREATE INDEX IF NOT EXISTS idx_jobs_user ON jobs (user_id, status);
+    CREATE TABLE IF NOT EXISTS user_turns (
+        user_id    TEXT PRIMARY KEY,
+        last_claim REAL NOT NULL
+    );
+"""
+
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+@dataclass
+class JobRecord:
+    """One row of the ``jobs`` table."""
+    run_id: str
+    user_id: str
+    kind: str
+    params: Dict[str, Any]
+    status: str
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    cancel_requested: bool = False
+    worker_id: Optional[str] = None
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'JobRecord':
+        return cls(
+            run_id=row["run_id"],
+            user_id=row["user_id"],
+            kind=row["kind"],
+            params=json.loads(row["params"] or "{}"),
+            status=row["status"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            error_type=row["error_type"],
+            progress=json.loads(row["progress"] or "{}"),
+            attempts=row["attempts"],
+            cancel_requested=bool(row["cancel_requested"]),
+            worker_id=row["worker_id"],
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'run_id': self.run_id,
+            'kind': self.kind,
+            'status': self.status,
+            'error': self.error,
+            'error_type': self.error_type,
+            'progress': self.progress,
+            'attempts': self.attempts,
+            'cancel_requested': self.cancel_requested,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class JobStore:
+    """SQLite job queue shared by web replicas and worker processes."""
+
+    def __init__(self, db_path: str, max_attempts: int = 2):
+        self.db_path = Path(db_path)
+        self.max_attempts = max(1, max_attempts)
+        with _locks_guard:
+            self._lock = _locks.setdefault(str(self.db_path.resolve()), threading.Lock())
+        with self._lock, closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    # ── Connection ──────────────────────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _write(self, sql: str, params: tuple = ()) -> int:
+        with self._lock, closing(self._connect()) as conn:
+            return conn.execute(sql, params).rowcount
+
+    # ── Submit / read ───────────────────────────────────────────────────
+
+    def submit(self, run_id: str, user_id: str, kind: str, params: Dict[str, Any]) -> JobRecord:
+        """Queue a job.  Re-using the run id of a finished job replaces it.
+
+        Raises:
+            ValueError: if a job with *run_id* is still queued or running
+        """
+        now = time.time()
+        with self._lock, closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT status FROM jobs WHERE run_id = ?", (run_id,)).fetchone()
+                if row is not None and row["status"] not in FINISHED_STATUSES:
+                    raise ValueError(f"Job {run_id} is already {row['status']}")
+                conn.execute(
+                    """INSERT OR REPLACE INTO jobs
+                       (run_id, user_id, kind, params, status, created_at)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    (run_id, user_id, kind, json.dumps(params, default=str), QUEUED, now),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return JobRecord(run_id=run_id, user_id=user_id, kind=kind, params=params,
+                         status=QUEUED, created_at=now)
+
+    def get(self, run_id: str) -> Optional[JobRecord]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE run_id = ?", (run_id,)).fetchone()
+        return JobRecord.from_row(row) if row else None
+
+    def list_for_user(self, user_id: str, limit: int = 50) -> List[JobRecord]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE user_id = ? ORDER BY created_at DESC LIMIT ?",
+                (user_id, int(limit)),
+            ).fetchall()
+        return [JobRecord.from_row(r) for r in rows]
+
+    def count_active(self, user_id: Optional[str] = None) -> int:
+        """Queued + running jobs (for one user, or overall)."""
+        sql = "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)"
+        params: tuple = (QUEUED, RUNNING)
+        if user_id is not None:
+            sql += " AND user_id = ?"
+            params += (user_id,)
+        with closing(self._connect()) as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
+    # ── Worker side ─────────────────────────────────────────────────────
+
+    def claim(self, worker_id: str, per_user_limit: int = 2) -> Optional[JobRecord]:
+        """Atomically move the next fair-share queued job to ``running``."""
+        now = time.time()
+        with self._lock, closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    """SELECT q.run_id, q.user_id FROM jobs q
+                       LEFT JOIN (SELECT user_id, COUNT(*) AS n FROM jobs
+                                  WHERE status = ? GROUP BY user_id) r
+                              ON r.user_id = q.user_id
+                       LEFT JOIN user_turns t ON t.user_id = q.user_id
+                       WHERE q.status = ? AND COALESCE(r.n, 0) < ?
+                       ORDER BY COALESCE(r.n, 0), COALESCE(t.last_claim, 0), q.created_at
+                       LIMIT 1""",
+                    (RUNNING, QUEUED, max(1, per_user_limit)),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    """UPDATE jobs SET status = ?, worker_id = ?, started_at = ?,
+                       heartbeat_at = ?, attempts = attempts + 1 WHERE run_id = ?""",
+                    (RUNNING, worker_id, now, now, row["run_id"]),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO user_turns (user_id, last_claim) VALUES (?, ?)",
+                    (row["user_id"], now),
+                )
+                job = conn.execute("SELECT * FROM jobs WHERE run_id = ?", (row["run_id"],)).fetchone()
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return JobRecord.from_row(job)
+
+    def set_progress(self, run_id: str, progress: Dict[str, Any]) -> None:
+        self._write(
+            "UPDATE jobs SET progress = ?, heartbeat_at = ? WHERE run_id = ?",
+            (json.dumps(progress, default=str), time.time(), run_id),
+        )
+
+    def finish(
+        self,
+        run_id: str,
+        worker_id: str,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None,
+        error_type: Optional[str] = None,
+    ) -> bool:
+        """Record the terminal state of a job *worker_id* is running.
+
+        Only the worker that currently owns the running job can finish
+        it: a worker whose job was re-queued by :meth:`recover_stale` (and
+        possibly claimed and finished elsewhere) must not overwrite it.
+
+        Returns:
+            ``False`` when the job was no longer running under *worker_id*
+        """
+        if status not in FINISHED_STATUSES:
+            raise ValueError(f"Not a terminal status: {status}")
+        updated = self._write(
+            """UPDATE jobs SET status = ?, result = ?, error = ?, error_type = ?,
+               finished_at = ? WHERE run_id = ? AND worker_id = ? AND status = ?""",
+            (status, None if result is None else json.dumps(result, default=str),
+             error, error_type, time.time(), run_id, worker_id, RUNNING),
+        )
+        if not updated:
+            logger.warning(
+                f"Job {run_id}: not recording '{status}' from worker {worker_id} — "
+                f"the job is no longer running under this worker"
+            )
+        return bool(updated)
+
+    def heartbeat(self, worker_id: str) -> None:
+        """Mark every job *worker_id* is running as alive."""
+        self._write(
+            "UPDATE jobs SET heartbeat_at = ? WHERE worker_id = ? AND status = ?",
+            (time.time(), worker_id, RUNNING),
+        )
+
+    def recover_stale(self, stale_after: float) -> int:
+        """Re-queue (or fail) running jobs whose worker stopped heartbeating."""
+        cutoff = time.time() - stale_after
+        with self._lock, closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                failed = conn.execute(
+                    """UPDATE jobs SET status = ?, error = 'worker lost', finished_at = ?
+                       WHERE status = ? AND heartbeat_at < ? AND attempts >= ?""",
+                    (FAILED, time.time(), RUNNING, cutoff, self.max_attempts),
+                ).rowcount
+                requeued = conn.execute(
+                    """UPDATE jobs SET status = ?, worker_id = NULL
+                       WHERE status = ? AND heartbeat_at < ?""",
+                    (QUEUED, RUNNING, cutoff),
+                ).rowcount
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if failed or requeued:
+            logger.warning(f"Job store: re-queued {requeued}, failed {failed} job(s) from lost workers")
+        return requeued
+
+    # ── Cancellation ────────────────────────────────────────────────────
+
+    def request_cancel(self, run_id: str, user_id: Optional[str] = None) -> Optional[str]:
+        """Cancel a job: queued jobs end at once, running ones are flagged.
+
+        Returns the job's resulting status, or ``None`` if no such job
+        (owned by *user_id*, when given) exists.
+        """
+        owner = "" if user_id is None else " AND user_id = ?"
+        owner_params: tuple = () if user_id is None else (user_id,)
+        with self._lock, closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    f"""UPDATE jobs SET status = ?, finished_at = ?, error = 'cancelled before start'
+                        WHERE run_id = ? AND status = ?{owner}""",
+                    (CANCELLED, time.time(), run_id, QUEUED) + owner_params,
+                )
+                conn.execute(
+                    f"UPDATE jobs SET cancel_requested = 1 WHERE run_id = ? AND status = ?{owner}",
+                    (run_id, RUNNING) + owner_params,
+                )
+                row = conn.execute(
+                    f"SELECT status FROM jobs WHERE run_id = ?{owner}", (run_id,) + owner_params,
+                ).fetchone()
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return row["status"] if row else None
+
+    def cancel_requested(self, run_id: str) -> bool:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE run_id = ?", (run_id,)).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def cancel_requested_among(self, run_ids: List[str]) -> Set[str]:
+        """The subset of *run_ids* whose cancellation has been requested."""
+        if not run_ids:
+            return set()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT run_id FROM jobs WHERE cancel_requested = 1 AND run_id IN ({','.join('?' * len(run_ids))})",
+                tuple(run_ids),
+            ).fetchall()
+        return {row["run_id"] for row in rows}
+
+    # ── Housekeeping ────────────────────────────────────────────────────
+
+    def purge(self, older_than: float) -> int:
+        """Delete finished jobs older than *older_than* seconds."""
+        cutoff = time.time() - older_than
+        return self._write(
+            f"DELETE FROM jobs WHERE status IN ({','.join('?' * len(FINISHED_STATUSES))}) AND finished_at < ?",
+            FINISHED_STATUSES + (cutoff,),
+        )
@@ -0,0 +1,291 @@
+"""
+Job Worker Pool
+===============
+
+Bounded pool of worker threads draining a :class:`JobStore`.  The web app
+runs one in-process (``jobs.workers`` in settings.yaml); set that to 0 on
+web replicas and start dedicated worker processes instead::
+
+    python -m src.jobs.worker --config config/settings.yaml --workers 4
+
+or ``python app.py worker``.  Workers build the same evaluators and
+comparators as the web app (via ``create_app``), so a job behaves the
+same wherever it runs.
+
+A job's handler receives a :class:`JobContext`: its parameters, a
+``progress()`` reporter and a cancellation token.  The token is installed
+as the current token while the handler runs (``utils.cancellation``), so
+evaluations started by the handler stop their in-flight scenarios as
+soon as it is cancelled; between stages handlers call
+``ctx.check_cancelled()``, which raises :class:`JobCancelled`.  A handler
+that returns after its job was cancelled has its (partial) result stored
+with status ``cancelled``.
+
+Cancellation requests reach the token immediately when the job runs in
+the process that received ``/api/jobs/<run_id>/cancel`` (:meth:`JobWorkerPool.cancel`)
+and within ``poll_interval`` otherwise (the pool watches the store's
+``cancel_requested`` flags of its running jobs).
+"""
+
+import argparse
+import logging
+import os
+import socket
+import threading
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+from ..utils.cancellation import CancellationToken, OperationCancelled, scope
+from .store import CANCELLED, COMPLETED, FAILED, JobRecord, JobStore
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler when its job was cancelled.
+
+    ``result`` optionally carries the partial result to store.
+    """
+
+    def __init__(self, message: str = "cancelled", result: Any = None):
+        super().__init__(message)
+        self.result = result
+
+
+class JobFailed(Exception):
+    """Handler failure with a machine-readable ``error_type`` for the UI."""
+
+    def __init__(self, message: str, error_type: Optional[str] = None):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+class JobContext:
+    """What a handler sees of its job."""
+
+    def __init__(self, job: JobRecord, store: JobStore):
+        self.job = job
+        self.store = store
+        self.token = CancellationToken()
+        if job.cancel_requested:
+            self.token.cancel()
+
+    @property
+    def run_id(self) -> str:
+        return self.job.run_id
+
+    @property
+    def user_id(self) -> str:
+        return self.job.user_id
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        return self.job.params
+
+    def progress(self, **fields: Any) -> None:
+        """Merge *fields* into the job's stored progress."""
+        self.job.progress.update(fields)
+        self.store.set_progress(self.run_id, self.job.progress)
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancellation was requested."""
+        return self.token.cancelled
+
+    def check_cancelled(self) -> None:
+        if self.cancelled:
+            raise JobCancelled()
+
+
+Runner = Callable[[JobContext], Any]
+
+
+class JobWorkerPool:
+    """Fixed number of worker threads claiming jobs fairly from the store."""
+
+    def __init__(
+        self,
+        store: JobStore,
+        runner: Runner,
+        max_workers: int = 4,
+        per_user_limit: int = 2,
+        poll_interval: float = 1.0,
+        heartbeat_interval: float = 15.0,
+        stale_after: float = 120.0,
+        retention: float = 86400.0,
+        on_finish: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Args:
+            store: Shared job store
+            runner: ``runner(ctx) -> result`` executing one job
+            max_workers: Jobs run concurrently by this pool
+            per_user_limit: Max running jobs per user across all pools
+            poll_interval: Idle wait between queue polls (``notify()``
+                wakes workers early for jobs submitted in-process)
+            heartbeat_interval: Seconds between heartbeats
+            stale_after: Running jobs without a heartbeat for this long
+                are re-queued
+            retention: Finished jobs are purged after this many seconds
+            on_finish: Called with the run id after a job's terminal
+                status is stored
+        """
+        self.store = store
+        self.runner = runner
+        self.max_workers = max(1, max_workers)
+        self.per_user_limit = max(1, per_user_limit)
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.retention = retention
+        self.on_finish = on_finish
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._running: Dict[str, JobContext] = {}
+        self._running_lock = threading.Lock()
+
+    # ── Lifecycle ───────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stop.clear()
+        for i in range(self.max_workers):
+            t = threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        hb = threading.Thread(target=self._heartbeat, name="job-heartbeat", daemon=True)
+        hb.start()
+        self._threads.append(hb)
+        watcher = threading.Thread(target=self._watch_cancellations, name="job-cancel-watch", daemon=True)
+        watcher.start()
+        self._threads.append(watcher)
+        logger.info(f"Job worker pool {self.worker_id} started with {self.max_workers} worker(s)")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        """Wake idle workers (a job was just submitted)."""
+        self._wake.set()
+
+    def cancel(self, run_id: str) -> bool:
+        """Cancel *run_id* now if this pool is running it (True if so)."""
+        with self._running_lock:
+            ctx = self._running.get(run_id)
+        if ctx is None:
+            return False
+        ctx.token.cancel()
+        return True
+
+    def run_forever(self) -> None:
+        """Start and block until interrupted (worker-process entry point)."""
+        self.start()
+        try:
+            while not self._stop.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            logger.info("Job worker interrupted — stopping")
+        finally:
+            self.stop()
+
+    # ── Threads ─────────────────────────────────────────────────────────
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            try:
+                job = self.store.claim(self.worker_id, self.per_user_limit)
+            except Exception as e:
+                logger.error(f"Job claim failed: {e}")
+                job = None
+            if job is None:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+                continue
+            self._execute(job)
+
+    def _execute(self, job: JobRecord) -> None:
+        ctx = JobContext(job, self.store)
+        with self._running_lock:
+            self._running[job.run_id] = ctx
+        logger.info(f"Job {job.run_id} ({job.kind}) started for user {job.user_id}")
+        try:
+            with scope(ctx.token):
+                result = self.runner(ctx)
+            if ctx.cancelled:
+                # Stopped part-way: keep what was completed
+                logger.info(f"Job {job.run_id} cancelled — storing partial result")
+                self.store.finish(job.run_id, self.worker_id, CANCELLED, result=result, error="cancelled")
+            else:
+                self.store.finish(job.run_id, self.worker_id, COMPLETED, result=result)
+        except (JobCancelled, OperationCancelled) as e:
+            logger.info(f"Job {job.run_id} cancelled")
+            self.store.finish(job.run_id, self.worker_id, CANCELLED, result=getattr(e, 'result', None), error=str(e))
+        except JobFailed as e:
+            self.store.finish(job.run_id, self.worker_id, FAILED, error=str(e), error_type=e.error_type)
+        except Exception as e:
+            logger.error(f"Job {job.run_id} ({job.kind}) failed: {e}")
+            self.store.finish(job.run_id, self.worker_id, FAILED, error=str(e))
+        finally:
+            with self._running_lock:
+                self._running.pop(job.run_id, None)
+        if self.on_finish is not None:
+            try:
+                self.on_finish(job.run_id)
+            except Exception as e:
+                logger.debug(f"on_finish hook failed for {job.run_id}: {e}")
+
+    def _watch_cancellations(self) -> None:
+        """Propagate cancel requests made through other processes to tokens."""
+        while not self._stop.wait(self.poll_interval):
+            with self._running_lock:
+                pending = [rid for rid, ctx in self._running.items() if not ctx.cancelled]
+            if not pending:
+                continue
+            try:
+                for run_id in self.store.cancel_requested_among(pending):
+                    logger.info(f"Cancelling job {run_id}")
+                    self.cancel(run_id)
+            except Exception as e:
+                logger.warning(f"Cancellation check failed: {e}")
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                self.store.heartbeat(self.worker_id)
+                if self.store.recover_stale(self.stale_after):
+                    self.notify()
+                self.store.purge(self.retention)
+            except Exception as e:
+                logger.warning(f"Job heartbeat failed: {e}")
+
+
+# ── Worker process entry point ───────────────────────────────────────────
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run background jobs from the shared job store")
+    parser.add_argument("--config", default="config/settings.yaml", help="Config file path")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Concurrent jobs (default: jobs.workers from settings, min 1)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    )
+    from ..web.routes import create_app
+    app = create_app(config_path=args.config, job_workers=0)
+    pool: JobWorkerPool = app.extensions['jobs']['pool']
+    settings_workers = app.config.get('SETTINGS', {}).get('jobs', {}).get('workers', 4)
+    pool.max_workers = max(1, args.workers if args.workers is not None else settings_workers)
+    pool.run_forever()
+
+
+if __name__ == "__main__":
+    main()
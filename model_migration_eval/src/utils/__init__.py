@@ -5,11 +5,16 @@ from .prompt_loader import PromptLoader
 from .prompt_manager import PromptManager
 from .data_loader import DataLoader
 from .category_parser import extract_categories_from_prompt
-from .audio_utils import AudioSegment, TTSAudioCache, pcm16_duration_ms, pcm16_to_wav, wav_to_pcm16
+from .audio_utils import (
+    AudioSegment, TTSAudioCache, pcm16_duration_ms, pcm16_to_wav, wav_to_pcm16,
+    shared_tts_cache, tts_cache_stats,
+)
 from .excel_exporter import ExcelExporter
+from .results_index import ResultsIndex
 
 __all__ = [
     'PromptLoader', 'PromptManager', 'DataLoader', 'extract_categories_from_prompt',
     'AudioSegment', 'TTSAudioCache', 'pcm16_duration_ms', 'pcm16_to_wav', 'wav_to_pcm16',
-    'ExcelExporter',
+    'shared_tts_cache', 'tts_cache_stats',
+    'ExcelExporter', 'ResultsIndex',
 ]
@@ -5,19 +5,34 @@ Audio Utilities for Speech-to-Speech Evaluation
 Provides helpers for PCM16 audio handling, WAV conversion, duration
 calculation, and TTS audio caching.
 
-All audio data flows through this module as raw ``bytes`` in PCM16 LE
-format at 24 kHz mono (the native format of the Azure Realtime API).
+All audio data flows through this module as raw PCM16 LE at 24 kHz mono
+(the native format of the Azure Realtime API), held as ``bytes`` or as a
+``memoryview`` — cached audio is served from memory-mapped files without
+being copied, together with its pre-encoded base64 so WebSocket frames
+can be cut from it directly.
 """
 
+import base64
 import hashlib
 import io
 import json
+import logging
+import mmap
+import os
+import sqlite3
 import struct
+import tempfile
+import threading
 import time
 import wave
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Raw bytes or a zero-copy view (e.g. over a memory-mapped cache file)
+AudioBuffer = Union[bytes, bytearray, memoryview]
 
 # ── Constants ───────────────────────────────────────────────────────────────
 
@@ -26,16 +41,45 @@ CHANNELS = 1               # mono
 SAMPLE_WIDTH = 2           # 16-bit (2 bytes per sample)
 BYTES_PER_SECOND = SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH  # 48 000 B/s
 
+# Audio per ``input_audio_buffer.append`` frame.  A multiple of 3, so the
+# base64 of consecutive frames concatenates to the base64 of the whole
+# buffer — cached audio keeps one encoded copy and frames are slices of it
+# (49 152 raw bytes → 65 536 base64 characters).
+AUDIO_FRAME_BYTES = 49_152
+AUDIO_FRAME_B64_CHARS = AUDIO_FRAME_BYTES // 3 * 4
+
+TTS_INDEX_FILENAME = "index.db"
+_TTS_CACHE_DEFAULT_LIMIT = 2 * 1024 ** 3   # 2 GiB of audio (raw + base64)
+_TOUCH_INTERVAL = 60.0                      # seconds between last_access updates per entry
+
+_TTS_INDEX_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        hash         TEXT PRIMARY KEY,
+        voice        TEXT NOT NULL,
+        text         TEXT NOT NULL,
+        size_bytes   INTEGER NOT NULL,
+        duration_ms  REAL NOT NULL,
+        created      REAL NOT NULL,
+        last_access  REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_entries_access ON entries (last_access);
+"""
+
 
 # ── Dataclasses ─────────────────────────────────────────────────────────────
 
 @dataclass
 class AudioSegment:
-    """Container for a chunk of PCM16 audio with metadata."""
-    data: bytes
+    """Container for a chunk of PCM16 audio with metadata.
+
+    ``encoded`` optionally holds the base64 of ``data`` (ASCII) so it need
+    not be re-encoded for every session.
+    """
+    data: AudioBuffer
     sample_rate: int = SAMPLE_RATE
     channels: int = CHANNELS
     sample_width: int = SAMPLE_WIDTH
+    encoded: Optional[AudioBuffer] = None
 
     @property
     def duration_ms(self) -> float:
@@ -46,11 +90,15 @@ class AudioSegment:
         """Export as in-memory WAV."""
         return pcm16_to_wav(self.data, self.sample_rate, self.channels, self.sample_width)
 
+    def iter_b64_frames(self) -> Iterator[str]:
+        """Base64 payloads for successive ``input_audio_buffer.append`` frames."""
+        return iter_b64_frames(self.data, self.encoded)
+
 
 # ── Pure functions ──────────────────────────────────────────────────────────
 
 def pcm16_duration_ms(
-    data: bytes,
+    data: AudioBuffer,
     sample_rate: int = SAMPLE_RATE,
     channels: int = CHANNELS,
     sample_width: int = SAMPLE_WIDTH,
@@ -63,7 +111,7 @@ def pcm16_duration_ms(
 
 
 def pcm16_to_wav(
-    data: bytes,
+    data: AudioBuffer,
     sample_rate: int = SAMPLE_RATE,
     channels: int = CHANNELS,
     sample_width: int = SAMPLE_WIDTH,
@@ -85,6 +133,85 @@ def wav_to_pcm16(wav_bytes: bytes) -> bytes:
         return wf.readframes(wf.getnframes())
 
 
+def iter_b64_frames(
+    data: AudioBuffer,
+    encoded: Optional[AudioBuffer] = None,
+) -> Iterator[str]:
+    """Yield the base64 payload of each ``AUDIO_FRAME_BYTES`` slice of *data*.
+
+    With *encoded* (the base64 of the whole of *data*) the payloads are
+    slices of it; otherwise each slice is encoded on the fly.
+    """
+    if encoded is not None:
+        view = memoryview(encoded)
+        for i in range(0, len(view), AUDIO_FRAME_B64_CHARS):
+            yield str(view[i:i + AUDIO_FRAME_B64_CHARS], "ascii")
+        return
+    view = memoryview(data)
+    for i in range(0, len(view), AUDIO_FRAME_BYTES):
+        yield base64.b64encode(view[i:i + AUDIO_FRAME_BYTES]).decode("ascii")
+
+
+class PCMBuffer:
+    """Growable receive buffer for streamed audio deltas.
+
+    Deltas are decoded straight into one preallocated ``bytearray``
+    (doubling when full) instead of being collected in a list and joined.
+    """
+
+    __slots__ = ("_buf", "_size")
+
+    def __init__(self, initial_bytes: int = BYTES_PER_SECOND * 10):
+        self._buf = bytearray(max(1, initial_bytes))
+        self._size = 0
+
+    def append_b64(self, delta: str) -> int:
+        """Decode a base64 delta into the buffer; returns the bytes added."""
+        chunk = base64.b64decode(delta)
+        end = self._size + len(chunk)
+        if end > len(self._buf):
+            self._buf.extend(bytes(max(end, 2 * len(self._buf)) - len(self._buf)))
+        self._buf[self._size:end] = chunk
+        self._size = end
+        return len(chunk)
+
+    def view(self) -> memoryview:
+        """The received audio (a view — no copy)."""
+        return memoryview(self._buf)[:self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def _mmap_file(path: Path) -> Optional[memoryview]:
+    """Read-only memory map of *path* as a memoryview (``None`` if missing)."""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b"")
+            # The map stays valid after the file is closed and lives as
+            # long as a view over it does
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    except FileNotFoundError:
+        return None
+
+
+def _write_atomic(path: Path, data: AudioBuffer) -> None:
+    # A unique temp file per writer, so concurrent workers caching the
+    # same clip never write into each other's file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)  # readers with the old file mapped keep their copy
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def text_to_audio_hash(text: str, voice: str = "alloy") -> str:
     """Deterministic hash for a (text, voice) pair — used as cache key."""
     payload = f"{voice}:{text}"
@@ -94,53 +221,245 @@ def text_to_audio_hash(text: str, voice: str = "alloy") -> str:
 # ── TTS Audio Cache ─────────────────────────────────────────────────────────
 
 class TTSAudioCache:
-    """Simple file-system cache for TTS-generated audio.
+    """Size-bounded file-system cache for TTS-generated audio.
 
     Structure::
 
         cache_dir/
-            {hash}.pcm16          # raw audio data
-            {hash}.meta.json      # { text, voice, duration_ms, sample_rate, created }
+            index.db              # SQLite: hash → voice, text, size, duration, last access
+            {hash[:2]}/
+                {hash}.pcm16      # raw audio data
+                {hash}.b64        # base64 of the audio, sliced into WebSocket frames
+
+    Lookups go through the index (no filesystem probe on a miss) and hits
+    are served as memoryviews over memory-mapped files.  Once the cached
+    audio exceeds ``size_limit_bytes`` the least-recently-used entries are
+    evicted.  Entries from the old flat layout (``{hash}.pcm16`` +
+    ``{hash}.meta.json`` directly in ``cache_dir``) are moved into the
+    shards the first time the index is created.
+
+    One connection per cache, guarded by a lock, because lookups come
+    from worker threads; SQLite's own locking covers other processes
+    sharing the directory.
     """
 
-    def __init__(self, cache_dir: str = ".cache/tts_audio"):
+    def __init__(self, cache_dir: str = ".cache/tts_audio", size_limit_bytes: Optional[int] = None):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.size_limit_bytes = size_limit_bytes or _TTS_CACHE_DEFAULT_LIMIT
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_served = 0
+        self.bytes_written = 0
+        self.evictions = 0
+
+    # ── Index ───────────────────────────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        db_path = self.cache_dir / TTS_INDEX_FILENAME
+        fresh = not db_path.exists()
+        try:
+            conn = self._open(db_path)
+        except sqlite3.DatabaseError as e:
+            # Rebuildable: orphaned shard files are simply re-synthesized
+            logger.warning(f"TTS cache index {db_path} unreadable ({e}); recreating")
+            db_path.unlink(missing_ok=True)
+            conn = self._open(db_path)
+        if fresh:
+            self._migrate_flat(conn)
+        return conn
+
+    @staticmethod
+    def _open(db_path: Path) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(db_path), timeout=10, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_TTS_INDEX_SCHEMA)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _paths(self, h: str) -> Tuple[Path, Path]:
+        shard = self.cache_dir / h[:2]
+        return shard / f"{h}.pcm16", shard / f"{h}.b64"
+
+    def _migrate_flat(self, conn: sqlite3.Connection) -> None:
+        """Move entries of the pre-index flat layout into the shards."""
+        moved = 0
+        for pcm_path in self.cache_dir.glob("*.pcm16"):
+            h = pcm_path.stem
+            meta_path = self.cache_dir / f"{h}.meta.json"
+            meta: Dict[str, Any] = {}
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                pass
+            new_pcm, new_b64 = self._paths(h)
+            try:
+                new_pcm.parent.mkdir(exist_ok=True)
+                os.replace(pcm_path, new_pcm)
+                _write_atomic(new_b64, base64.b64encode(new_pcm.read_bytes()))
+            except OSError as e:
+                logger.debug(f"Skipping legacy TTS cache entry {h}: {e}")
+                continue
+            meta_path.unlink(missing_ok=True)
+            pcm_size = new_pcm.stat().st_size
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (h, meta.get("voice", ""), meta.get("text", ""),
+                 pcm_size + new_b64.stat().st_size,
+                 meta.get("duration_ms") or pcm_size / BYTES_PER_SECOND * 1000.0,
+                 meta.get("created", time.time()), time.time()),
+            )
+            moved += 1
+        conn.commit()
+        if moved:
+            logger.info(f"TTS cache: moved {moved} legacy entries into the sharded layout")
+
+    # ── Lookup ──────────────────────────────────────────────────────────
 
     def get(self, text: str, voice: str = "alloy") -> Optional[AudioSegment]:
-        """Return cached AudioSegment or None if not cached."""
+        """Return cached AudioSegment (zero-copy views) or None if not cached."""
         h = text_to_audio_hash(text, voice)
-        pcm_path = self.cache_dir / f"{h}.pcm16"
-        if not pcm_path.exists():
-            return None
-        data = pcm_path.read_bytes()
-        return AudioSegment(data=data)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_access FROM entries WHERE hash = ?", (h,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if now - row[0] > _TOUCH_INTERVAL:
+                # LRU bookkeeping at coarse granularity — avoids a write per hit
+                self._conn.execute("UPDATE entries SET last_access = ? WHERE hash = ?", (now, h))
+                self._conn.commit()
 
-    def put(self, text: str, voice: str, audio: AudioSegment) -> None:
-        """Store an AudioSegment in the cache."""
-        h = text_to_audio_hash(text, voice)
-        pcm_path = self.cache_dir / f"{h}.pcm16"
-        meta_path = self.cache_dir / f"{h}.meta.json"
-        pcm_path.write_bytes(audio.data)
-        meta = {
-            "text": text[:200],  # truncate for readability
-            "voice": voice,
-            "duration_ms": audio.duration_ms,
-            "sample_rate": audio.sample_rate,
-            "created": time.time(),
-        }
-        meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        pcm_path, b64_path = self._paths(h)
+        data = _mmap_file(pcm_path)
+        if data is None:
+            # Removed behind our back (another process evicted it)
+            with self._lock:
+                self._conn.execute("DELETE FROM entries WHERE hash = ?", (h,))
+                self._conn.commit()
+                self.misses += 1
+            return None
+        encoded = _mmap_file(b64_path)
+        if encoded is not None and len(encoded) != (len(data) + 2) // 3 * 4:
+            encoded = None  # stale or partial — encode on the fly instead
+        with self._lock:
+            self.hits += 1
+            self.bytes_served += len(data)
+        return AudioSegment(data=data, encoded=encoded)
 
     def has(self, text: str, voice: str = "alloy") -> bool:
         """Check if the cache has an entry for (text, voice)."""
         h = text_to_audio_hash(text, voice)
-        return (self.cache_dir / f"{h}.pcm16").exists()
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM entries WHERE hash = ?", (h,)
+            ).fetchone() is not None
+
+    # ── Writes ──────────────────────────────────────────────────────────
+
+    def put(self, text: str, voice: str, audio: AudioSegment) -> None:
+        """Store an AudioSegment, evicting LRU entries beyond the size limit."""
+        h = text_to_audio_hash(text, voice)
+        pcm_path, b64_path = self._paths(h)
+        pcm_path.parent.mkdir(exist_ok=True)
+        encoded = audio.encoded or base64.b64encode(audio.data)
+        _write_atomic(b64_path, encoded)
+        _write_atomic(pcm_path, audio.data)
+        size = len(audio.data) + len(encoded)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (h, voice, text[:200], size, audio.duration_ms, now, now),
+            )
+            self.bytes_written += size
+            self._evict(keep=h)
+            self._conn.commit()
+
+    def _evict(self, keep: str) -> None:
+        """Drop least-recently-used entries until under the limit (lock held)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM entries").fetchone()[0]
+        if total <= self.size_limit_bytes:
+            return
+        victims = []
+        for h, size in self._conn.execute(
+            "SELECT hash, size_bytes FROM entries WHERE hash != ? ORDER BY last_access", (keep,)
+        ):
+            if total <= self.size_limit_bytes:
+                break
+            victims.append(h)
+            total -= size
+        for h in victims:
+            for path in self._paths(h):
+                try:
+                    path.unlink(missing_ok=True)  # open maps stay valid
+                except OSError as e:
+                    logger.debug(f"Could not remove evicted TTS audio {path}: {e}")
+        self._conn.executemany("DELETE FROM entries WHERE hash = ?", [(h,) for h in victims])
+        self.evictions += len(victims)
+        if victims:
+            logger.info(f"TTS cache: evicted {len(victims)} entries to stay under {self.size_limit_bytes} bytes")
 
     def clear(self) -> int:
-        """Delete all cached entries. Returns count of files removed."""
-        count = 0
-        for f in self.cache_dir.iterdir():
-            if f.suffix in (".pcm16", ".json"):
-                f.unlink(missing_ok=True)
-                count += 1
-        return count
+        """Delete all cached entries. Returns count of entries removed."""
+        with self._lock:
+            hashes = [r[0] for r in self._conn.execute("SELECT hash FROM entries")]
+            for h in hashes:
+                for path in self._paths(h):
+                    path.unlink(missing_ok=True)
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+        return len(hashes)
+
+    # ── Introspection ───────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for this process plus the index totals."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bytes_served": self.bytes_served,
+                "bytes_written": self.bytes_written,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_bytes": size,
+                "size_limit_bytes": self.size_limit_bytes,
+            }
+
+
+# Every TTSClient pointing at the same directory shares one cache, so the
+# index has one connection and the counters are process-wide.
+_shared_caches: Dict[str, TTSAudioCache] = {}
+_shared_guard = threading.Lock()
+
+
+def shared_tts_cache(cache_dir: str = ".cache/tts_audio", size_limit_bytes: Optional[int] = None) -> TTSAudioCache:
+    """The process-wide :class:`TTSAudioCache` for *cache_dir*."""
+    key = str(Path(cache_dir).resolve())
+    with _shared_guard:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = _shared_caches[key] = TTSAudioCache(cache_dir, size_limit_bytes)
+        elif size_limit_bytes:
+            cache.size_limit_bytes = size_limit_bytes
+        return cache
+
+
+def tts_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """``stats()`` of every shared TTS cache, keyed by directory."""
+    with _shared_guard:
+        caches = list(_shared_caches.values())
+    return {str(c.cache_dir): c.stats() for c in caches}
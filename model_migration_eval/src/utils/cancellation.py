@@ -0,0 +1,175 @@
+"""
+Cooperative Cancellation
+========================
+
+A :class:`CancellationToken` is created for every background job and
+installed in a context variable for the duration of the job
+(:func:`scope`).  ``_run_in_loop`` copies the calling context into the
+evaluation task, so code deep inside the evaluators finds the token with
+:func:`current` without any extra parameters being threaded through.
+
+Cancelling a token (from the job worker, when ``/api/jobs/<run_id>/cancel``
+is called) runs its callbacks immediately.  :func:`gather_partial` uses
+that to cancel the scenario coroutines it is waiting on — aborting their
+in-flight HTTP requests and closing streamed responses — and returns
+``None`` for every scenario that did not finish, so the evaluators can
+still aggregate and save what was completed.  Code between stages calls
+:func:`raise_if_cancelled` (or checks :func:`is_cancelled`) to skip work
+that has not started yet.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class OperationCancelled(Exception):
+    """Raised by :func:`raise_if_cancelled` once the current token is cancelled."""
+
+
+class CancellationToken:
+    """Thread-safe, one-shot cancellation flag with callbacks."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Set the flag and run the registered callbacks (once)."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"Cancellation callback failed: {e}")
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run *callback* on cancellation (now, if already cancelled).
+
+        Returns a function that unregisters the callback.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def _remove(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+
+
+_current: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "cancellation_token", default=None
+)
+
+
+def current() -> Optional[CancellationToken]:
+    """The token of the calling context, or ``None`` outside a job."""
+    return _current.get()
+
+
+def is_cancelled() -> bool:
+    token = _current.get()
+    return token is not None and token.cancelled
+
+
+def raise_if_cancelled() -> None:
+    if is_cancelled():
+        raise OperationCancelled("cancelled")
+
+
+@contextmanager
+def scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Install *token* as the current token for the enclosed block."""
+    reset = _current.set(token)
+    try:
+        yield token
+    finally:
+        _current.reset(reset)
+
+
+def cancel_on(
+    token: Optional[CancellationToken],
+    task: "asyncio.Future",
+    delay: float = 0.0,
+) -> Callable[[], None]:
+    """Cancel *task* (from any thread) *delay* seconds after *token* is cancelled.
+
+    The delay lets code that handles cancellation itself (and still
+    returns partial results) finish first.  Returns the unregister
+    function; a no-op without a token.
+    """
+    if token is None:
+        return lambda: None
+    loop = task.get_loop()
+
+    def _cancel() -> None:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(loop.call_later, delay, task.cancel)
+
+    return token.add_callback(_cancel)
+
+
+async def gather_partial(aws: Iterable[Awaitable[Any]]) -> List[Any]:
+    """``asyncio.gather`` that stops early when the current token is cancelled.
+
+    Without a token this is exactly ``asyncio.gather(*aws)``.  With one,
+    cancelling it cancels every unfinished awaitable; their slots in the
+    returned list are ``None`` and the finished results are kept.  Any
+    other exception propagates as with ``gather``.
+    """
+    token = _current.get()
+    if token is None:
+        return list(await asyncio.gather(*aws))
+
+    if token.cancelled:
+        aws = list(aws)
+        for aw in aws:
+            if asyncio.iscoroutine(aw):
+                aw.close()
+        return [None] * len(aws)
+
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    loop = asyncio.get_running_loop()
+
+    def _cancel_all() -> None:
+        for t in tasks:
+            t.cancel()
+
+    unregister = token.add_callback(lambda: loop.call_soon_threadsafe(_cancel_all))
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        unregister()
+
+    out: List[Any] = []
+    for r in results:
+        if isinstance(r, asyncio.CancelledError):
+            out.append(None)
+        elif isinstance(r, BaseException):
+            raise r
+        else:
+            out.append(r)
+    skipped = sum(1 for t in tasks if t.cancelled())
+    if skipped:
+        logger.info(f"Cancelled {skipped}/{len(tasks)} unfinished task(s)")
+    return out
@@ -261,6 +261,15 @@ _NORMALISERS = {
     "tool_calling": _normalise_tool_calling,
 }
 
+# Scenario file per task, relative to ``data_dir`` (CSV fallback shares the stem)
+_SCENARIO_FILES = {
+    "classification": Path("classification") / "classification_scenarios.json",
+    "dialog": Path("dialog") / "follow_up_scenarios.json",
+    "general": Path("general") / "capability_tests.json",
+    "rag": Path("rag") / "rag_scenarios.json",
+    "tool_calling": Path("tool_calling") / "tool_calling_scenarios.json",
+}
+
 
 def ensure_flat_schema(items: list, task: str) -> list:
     """Normalise *items* to the canonical flat schema.
@@ -341,10 +350,21 @@ class DataLoader:
                 result.append(item)
         return result
 
+    def scenario_file(self, task: str) -> Optional[Path]:
+        """Return the file a task's scenarios are loaded from (JSON, else CSV)."""
+        rel = _SCENARIO_FILES.get(task)
+        if rel is None:
+            return None
+        json_path = self.data_dir / rel
+        if json_path.exists():
+            return json_path
+        csv_path = json_path.with_suffix(".csv")
+        return csv_path if csv_path.exists() else None
+
     # ── Public loaders ────────────────────────────────────────────────
 
     def load_classification_scenarios(self) -> List[ClassificationScenario]:
-        file_path = self.data_dir / "classification" / "classification_scenarios.json"
+        file_path = self.data_dir / _SCENARIO_FILES["classification"]
         items = self._load_and_normalise(file_path, "classification")
         return [
             ClassificationScenario(
@@ -360,7 +380,7 @@ class DataLoader:
         ]
 
     def load_dialog_scenarios(self) -> List[DialogScenario]:
-        file_path = self.data_dir / "dialog" / "follow_up_scenarios.json"
+        file_path = self.data_dir / _SCENARIO_FILES["dialog"]
         items = self._load_and_normalise(file_path, "dialog")
         return [
             DialogScenario(
@@ -375,7 +395,7 @@ class DataLoader:
         ]
 
     def load_general_tests(self) -> List[GeneralTestCase]:
-        file_path = self.data_dir / "general" / "capability_tests.json"
+        file_path = self.data_dir / _SCENARIO_FILES["general"]
         items = self._load_and_normalise(file_path, "general")
         return [
             GeneralTestCase(
@@ -391,7 +411,7 @@ class DataLoader:
         ]
 
     def load_rag_scenarios(self) -> List[RAGScenario]:
-        file_path = self.data_dir / "rag" / "rag_scenarios.json"
+        file_path = self.data_dir / _SCENARIO_FILES["rag"]
         items = self._load_and_normalise(file_path, "rag")
         return [
             RAGScenario(
@@ -404,7 +424,7 @@ class DataLoader:
         ]
 
     def load_tool_calling_scenarios(self) -> List[ToolCallingScenario]:
-        file_path = self.data_dir / "tool_calling" / "tool_calling_scenarios.json"
+        file_path = self.data_dir / _SCENARIO_FILES["tool_calling"]
         items = self._load_and_normalise(file_path, "tool_calling")
         return [
             ToolCallingScenario(
@@ -3,17 +3,27 @@ Excel Exporter for Evaluation and Comparison Results.
 
 Generates .xlsx files with a multi-sheet schema optimised for Power BI
 consumption (star-schema, snake_case columns, long/tidy metrics table).
+
+Workbooks are built in openpyxl **write-only** mode: every sheet is fed
+from a row generator, column widths are estimated from the first
+``_WIDTH_SAMPLE_ROWS`` rows, and rows are flushed to disk as they are
+written, so memory stays flat regardless of the number of raw results.
+``stream_evaluation`` / ``stream_comparison`` yield the finished file in
+chunks for streamed HTTP responses.
 """
 
 from __future__ import annotations
 
 import io
+import itertools
 import logging
+import tempfile
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, numbers
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill
 from openpyxl.utils import get_column_letter
 
 logger = logging.getLogger(__name__)
@@ -39,6 +49,8 @@ _METRIC_UNITS: Dict[str, str] = {
     "p95_latency": "seconds", "p99_latency": "seconds",
     "min_latency": "seconds", "max_latency": "seconds",
     "std_latency": "seconds", "mean_ttft": "seconds",
+    "p50_ttft": "seconds", "p95_ttft": "seconds",
+    "mean_inter_token_latency": "seconds",
     "tokens_per_second": "tokens/s",
     "cost_per_request": "USD", "total_cost": "USD",
     "cache_hit_rate": "%", "reasoning_token_pct": "%",
@@ -61,26 +73,80 @@ _HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _auto_width(ws, min_width: int = 10, max_width: int = 50) -> None:
-    """Auto-fit column widths based on content."""
-    for col_cells in ws.columns:
-        lengths = []
-        for cell in col_cells:
-            val = str(cell.value) if cell.value is not None else ""
-            lengths.append(min(len(val), max_width))
-        best = max(lengths) + 2 if lengths else min_width
-        col_letter = get_column_letter(col_cells[0].column)
-        ws.column_dimensions[col_letter].width = max(best, min_width)
-
-
-def _write_header(ws, headers: List[str]) -> None:
-    """Write a styled header row."""
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_idx, value=header)
+_WIDTH_SAMPLE_ROWS = 200
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _estimate_widths(
+    headers: List[str], sample: List[List[Any]], min_width: int = 10, max_width: int = 50,
+) -> List[int]:
+    """Column widths from the header and a sample of rows."""
+    widths = []
+    for col_idx, header in enumerate(headers):
+        longest = len(str(header))
+        for row in sample:
+            if col_idx < len(row) and row[col_idx] is not None:
+                longest = max(longest, min(len(str(row[col_idx])), max_width))
+        widths.append(max(longest + 2, min_width))
+    return widths
+
+
+def _write_sheet(wb: Workbook, title: str, headers: List[str], rows: Iterable[List[Any]]) -> None:
+    """Create a write-only sheet: widths from a sample, styled header, then rows.
+
+    Only the first ``_WIDTH_SAMPLE_ROWS`` rows are held in memory; the rest
+    are streamed straight from *rows*.
+    """
+    ws = wb.create_sheet(title)
+    row_iter = iter(rows)
+    sample = list(itertools.islice(row_iter, _WIDTH_SAMPLE_ROWS))
+    for col_idx, width in enumerate(_estimate_widths(headers, sample), 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
+    ws.freeze_panes = "A2"
+
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
         cell.font = _HEADER_FONT
         cell.fill = _HEADER_FILL
         cell.alignment = _HEADER_ALIGNMENT
-    ws.freeze_panes = "A2"
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    for row in itertools.chain(sample, row_iter):
+        ws.append(row)
+
+
+def _save_to_buffer(wb: Workbook) -> io.BytesIO:
+    buf = io.BytesIO()
+    wb.save(buf)
+    buf.seek(0)
+    return buf
+
+
+def _stream_workbook(wb: Workbook, chunk_size: int = _STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Save *wb* to a temporary file now and return an iterator of its chunks.
+
+    Saving happens eagerly so errors surface before a response starts;
+    the temp file is closed (and deleted) once the iterator is exhausted.
+    """
+    tmp = tempfile.TemporaryFile()
+    try:
+        wb.save(tmp)
+        tmp.seek(0)
+    except BaseException:
+        tmp.close()
+        raise
+
+    def _chunks() -> Iterator[bytes]:
+        with tmp:
+            while True:
+                chunk = tmp.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    return _chunks()
 
 
 def _safe_value(val: Any) -> Any:
@@ -138,28 +204,84 @@ def _flatten_metric_dict(
 class ExcelExporter:
     """Generates Power BI–ready .xlsx workbooks from result JSON data."""
 
+    # Raw-result keys read by ``_raw_result_rows`` (the columns worth
+    # pulling from a columnar sidecar)
+    RAW_RESULT_KEYS = [
+        "scenario_id", "test_id", "latency", "tokens", "token_detail",
+        "input", "query", "expected", "predicted",
+        "conversation", "responses", "response", "context_gaps", "question_count",
+        "test_type", "complexity", "prompt", "expected_behavior",
+        "context", "ground_truth", "groundedness", "relevance",
+        "available_tools", "expected_tool_calls", "tool_accuracy", "param_accuracy",
+    ]
+
+    RAW_RESULT_COLUMNS = [
+        # common
+        "model_name", "evaluation_type", "scenario_id",
+        "latency_s", "total_tokens",
+        "prompt_tokens", "completion_tokens", "cached_tokens", "reasoning_tokens",
+        # classification
+        "input_text",
+        "expected_category", "expected_subcategory",
+        "expected_priority", "expected_sentiment",
+        "predicted_category", "predicted_subcategory",
+        "predicted_confidence", "predicted_priority", "predicted_sentiment",
+        "category_correct",
+        # dialog
+        "conversation_turns", "conversation_text",
+        "response", "context_gaps", "question_count",
+        # general
+        "test_type", "complexity", "prompt", "expected_behavior", "run_count",
+        # rag
+        "query", "context", "ground_truth",
+        "groundedness_score", "relevance_score",
+        # tool calling
+        "available_tools", "expected_tool_calls",
+        "tool_accuracy", "param_accuracy",
+    ]
+
     # -----------------------------------------------------------------------
     # Evaluation export
     # -----------------------------------------------------------------------
     @staticmethod
-    def export_evaluation(data: Dict[str, Any]) -> io.BytesIO:
-        """Export a single evaluation result to an Excel workbook.
+    def export_evaluation(
+        data: Dict[str, Any],
+        raw_rows: Optional[Iterable[Dict[str, Any]]] = None,
+    ) -> io.BytesIO:
+        """Export a single evaluation result to an in-memory Excel workbook.
 
         Sheets: Metadata, Metrics, RawResults, CategoryAccuracy*, FoundryScores*
         (* = only when data is available)
+
+        Args:
+            data: Result dict as saved by ``EvaluationResult.save``.
+            raw_rows: Optional iterable of raw-result rows (e.g. streamed
+                from a columnar sidecar); defaults to ``data["raw_results"]``.
         """
-        wb = Workbook()
+        return _save_to_buffer(ExcelExporter._build_evaluation(data, raw_rows))
+
+    @staticmethod
+    def stream_evaluation(
+        data: Dict[str, Any],
+        raw_rows: Optional[Iterable[Dict[str, Any]]] = None,
+    ) -> Iterator[bytes]:
+        """Like :meth:`export_evaluation` but yields the file in chunks."""
+        return _stream_workbook(ExcelExporter._build_evaluation(data, raw_rows))
+
+    @staticmethod
+    def _build_evaluation(
+        data: Dict[str, Any],
+        raw_rows: Optional[Iterable[Dict[str, Any]]] = None,
+    ) -> Workbook:
+        wb = Workbook(write_only=True)
         model = data.get("model_name", "unknown")
         eval_type = data.get("evaluation_type", "unknown")
 
         # --- Sheet 1: Metadata ---
-        ws_meta = wb.active
-        ws_meta.title = "Metadata"
-        _write_header(ws_meta, [
+        _write_sheet(wb, "Metadata", [
             "export_timestamp", "model_name", "evaluation_type",
             "eval_timestamp", "scenarios_tested", "error_count", "errors",
-        ])
-        ws_meta.append([
+        ], [[
             datetime.utcnow().isoformat(),
             model,
             eval_type,
@@ -167,92 +289,95 @@ class ExcelExporter:
             data.get("scenarios_tested", 0),
             data.get("error_count", len(data.get("errors", []))),
             "; ".join(data.get("errors", [])) or None,
-        ])
-        _auto_width(ws_meta)
+        ]])
 
         # --- Sheet 2: Metrics (long / tidy) ---
-        ws_metrics = wb.create_sheet("Metrics")
-        _write_header(ws_metrics, [
+        def _metric_rows() -> Iterator[List[Any]]:
+            for category, key in [
+                ("classification", "classification_metrics"),
+                ("quality", "quality_metrics"),
+                ("latency", "latency_metrics"),
+                ("consistency", "consistency_metrics"),
+                ("tool_calling", "tool_calling_metrics"),
+                ("realtime", "realtime_metrics"),
+            ]:
+                for row in _flatten_metric_dict(data.get(key), category, model, eval_type):
+                    yield [
+                        row["model_name"], row["evaluation_type"], row["metric_category"],
+                        row["metric_name"], row["metric_value"], row["metric_unit"],
+                    ]
+
+        _write_sheet(wb, "Metrics", [
             "model_name", "evaluation_type", "metric_category",
             "metric_name", "metric_value", "metric_unit",
-        ])
-        metric_rows: List[Dict[str, Any]] = []
-        for category, key in [
-            ("classification", "classification_metrics"),
-            ("quality", "quality_metrics"),
-            ("latency", "latency_metrics"),
-            ("consistency", "consistency_metrics"),
-            ("tool_calling", "tool_calling_metrics"),
-            ("realtime", "realtime_metrics"),
-        ]:
-            metric_rows.extend(
-                _flatten_metric_dict(data.get(key), category, model, eval_type)
-            )
-        for row in metric_rows:
-            ws_metrics.append([
-                row["model_name"], row["evaluation_type"], row["metric_category"],
-                row["metric_name"], row["metric_value"], row["metric_unit"],
-            ])
-        _auto_width(ws_metrics)
+        ], _metric_rows())
 
         # --- Sheet 3: RawResults (wide, union schema) ---
-        raw = data.get("raw_results") or []
-        if raw:
-            ws_raw = wb.create_sheet("RawResults")
-            ExcelExporter._write_raw_results(ws_raw, raw, model, eval_type)
+        raw_iter = iter(raw_rows if raw_rows is not None else (data.get("raw_results") or []))
+        first = next(raw_iter, None)
+        if first is not None:
+            _write_sheet(
+                wb, "RawResults", ExcelExporter.RAW_RESULT_COLUMNS,
+                ExcelExporter._raw_result_rows(itertools.chain([first], raw_iter), model, eval_type),
+            )
 
         # --- Sheet 4: CategoryAccuracy (optional) ---
         cat_acc = (data.get("classification_metrics") or {}).get("category_accuracy")
         if cat_acc and isinstance(cat_acc, dict):
-            ws_cat = wb.create_sheet("CategoryAccuracy")
-            _write_header(ws_cat, ["model_name", "evaluation_type", "category", "accuracy"])
-            for cat, acc in sorted(cat_acc.items()):
-                ws_cat.append([model, eval_type, cat, _safe_value(acc)])
-            _auto_width(ws_cat)
+            _write_sheet(
+                wb, "CategoryAccuracy",
+                ["model_name", "evaluation_type", "category", "accuracy"],
+                ([model, eval_type, cat, _safe_value(acc)] for cat, acc in sorted(cat_acc.items())),
+            )
 
         # --- Sheet 5: FoundryScores (optional) ---
         foundry = data.get("foundry_scores")
         if foundry:
-            ws_foundry = wb.create_sheet("FoundryScores")
-            ExcelExporter._write_foundry_scores_eval(
-                ws_foundry, foundry, data, model, eval_type
-            )
+            _write_sheet(wb, "FoundryScores", [
+                "model_name", "evaluation_type",
+                "foundry_eval_id", "foundry_run_id", "foundry_report_url",
+                "grader_name", "aggregated_score",
+                "row_index", "row_score", "row_reason",
+            ], ExcelExporter._foundry_score_rows(foundry, data, model, eval_type))
 
-        buf = io.BytesIO()
-        wb.save(buf)
-        buf.seek(0)
-        return buf
+        return wb
 
     # -----------------------------------------------------------------------
     # Comparison export
     # -----------------------------------------------------------------------
     @staticmethod
     def export_comparison(data: Dict[str, Any]) -> io.BytesIO:
-        """Export a comparison report to an Excel workbook.
+        """Export a comparison report to an in-memory Excel workbook.
 
         Sheets: Metadata, Dimensions, Recommendations,
                 StatisticalSignificance*, MigrationReadiness*,
                 FoundryComparison*
         """
-        wb = Workbook()
+        return _save_to_buffer(ExcelExporter._build_comparison(data))
+
+    @staticmethod
+    def stream_comparison(data: Dict[str, Any]) -> Iterator[bytes]:
+        """Like :meth:`export_comparison` but yields the file in chunks."""
+        return _stream_workbook(ExcelExporter._build_comparison(data))
+
+    @staticmethod
+    def _build_comparison(data: Dict[str, Any]) -> Workbook:
+        wb = Workbook(write_only=True)
         model_a = data.get("model_a", "model_a")
         model_b = data.get("model_b", "model_b")
         eval_type = data.get("evaluation_type", "unknown")
         summary = data.get("summary") or {}
 
         # --- Sheet 1: Metadata ---
-        ws_meta = wb.active
-        ws_meta.title = "Metadata"
-        _write_header(ws_meta, [
+        # Try different key patterns for wins
+        a_wins = summary.get(f"{model_a}_wins", summary.get("model_a_wins", 0))
+        b_wins = summary.get(f"{model_b}_wins", summary.get("model_b_wins", 0))
+        _write_sheet(wb, "Metadata", [
             "export_timestamp", "model_a", "model_b", "evaluation_type",
             "comparison_timestamp", "overall_winner",
             "total_dimensions", "model_a_wins", "model_b_wins", "ties",
             "high_impact_dimensions", "batch_id",
-        ])
-        # Try different key patterns for wins
-        a_wins = summary.get(f"{model_a}_wins", summary.get("model_a_wins", 0))
-        b_wins = summary.get(f"{model_b}_wins", summary.get("model_b_wins", 0))
-        ws_meta.append([
+        ], [[
             datetime.utcnow().isoformat(),
             model_a,
             model_b,
@@ -265,154 +390,116 @@ class ExcelExporter:
             summary.get("ties", 0),
             "; ".join(summary.get("high_impact_dimensions", [])),
             data.get("batch_id"),
-        ])
-        _auto_width(ws_meta)
+        ]])
 
         # --- Sheet 2: Dimensions ---
-        ws_dim = wb.create_sheet("Dimensions")
-        _write_header(ws_dim, [
+        _write_sheet(wb, "Dimensions", [
             "model_a", "model_b", "evaluation_type", "dimension",
             "model_a_value", "model_b_value", "difference",
             "percent_change", "better_model", "significance",
-        ])
-        for d in data.get("dimensions") or []:
-            ws_dim.append([
-                model_a, model_b, eval_type,
-                d.get("dimension", ""),
-                _safe_value(d.get("model_a_value")),
-                _safe_value(d.get("model_b_value")),
-                _safe_value(d.get("difference")),
-                _safe_value(d.get("percent_change")),
-                d.get("better_model", ""),
-                d.get("significance", ""),
-            ])
-        _auto_width(ws_dim)
+        ], ([
+            model_a, model_b, eval_type,
+            d.get("dimension", ""),
+            _safe_value(d.get("model_a_value")),
+            _safe_value(d.get("model_b_value")),
+            _safe_value(d.get("difference")),
+            _safe_value(d.get("percent_change")),
+            d.get("better_model", ""),
+            d.get("significance", ""),
+        ] for d in data.get("dimensions") or []))
 
         # --- Sheet 3: Recommendations ---
         recs = data.get("recommendations") or []
         if recs:
-            ws_rec = wb.create_sheet("Recommendations")
-            _write_header(ws_rec, [
+            _write_sheet(wb, "Recommendations", [
                 "model_a", "model_b", "evaluation_type",
                 "recommendation_index", "recommendation_text",
-            ])
-            for idx, text in enumerate(recs, 1):
-                ws_rec.append([model_a, model_b, eval_type, idx, text.strip()])
-            _auto_width(ws_rec)
+            ], ([model_a, model_b, eval_type, idx, text.strip()] for idx, text in enumerate(recs, 1)))
 
         # --- Sheet 4: StatisticalSignificance ---
         stats = data.get("statistical_significance")
         if stats:
-            ws_stat = wb.create_sheet("StatisticalSignificance")
-            _write_header(ws_stat, [
+            def _stat_rows() -> Iterator[List[Any]]:
+                for test_name, test_data in stats.items():
+                    if not isinstance(test_data, dict):
+                        continue
+                    if test_name == "bootstrap":
+                        # One row per metric: difference (B − A) and its CI
+                        for metric, ci in (test_data.get("metrics") or {}).items():
+                            base_row = [model_a, model_b, eval_type, f"bootstrap: {metric}"]
+                            yield base_row + [
+                                _safe_value(ci.get("difference")), None, ci.get("excludes_zero"), None, None,
+                            ]
+                            yield base_row + [None, None, None, "ci_low", _safe_value(ci.get("ci_low"))]
+                            yield base_row + [None, None, None, "ci_high", _safe_value(ci.get("ci_high"))]
+                        continue
+                    base_row = [model_a, model_b, eval_type, test_name]
+                    stat_val = test_data.get("chi2", test_data.get("t_statistic", test_data.get("statistic")))
+                    p_val = test_data.get("p_value")
+                    sig = test_data.get("significant")
+                    # Main row
+                    yield base_row + [
+                        _safe_value(stat_val), _safe_value(p_val), sig, None, None,
+                    ]
+                    # Detail rows (extra keys)
+                    skip = {"chi2", "t_statistic", "statistic", "p_value", "significant"}
+                    for k, v in test_data.items():
+                        if k not in skip:
+                            yield base_row + [None, None, None, k, _safe_value(v)]
+
+            _write_sheet(wb, "StatisticalSignificance", [
                 "model_a", "model_b", "evaluation_type",
                 "test_name", "statistic", "p_value", "significant",
                 "detail_key", "detail_value",
-            ])
-            for test_name, test_data in stats.items():
-                if not isinstance(test_data, dict):
-                    continue
-                base_row = [model_a, model_b, eval_type, test_name]
-                stat_val = test_data.get("chi2", test_data.get("t_statistic"))
-                p_val = test_data.get("p_value")
-                sig = test_data.get("significant")
-                # Main row
-                ws_stat.append(base_row + [
-                    _safe_value(stat_val), _safe_value(p_val), sig, None, None,
-                ])
-                # Detail rows (extra keys)
-                skip = {"chi2", "t_statistic", "p_value", "significant"}
-                for k, v in test_data.items():
-                    if k not in skip:
-                        ws_stat.append(base_row + [
-                            None, None, None, k, _safe_value(v),
-                        ])
-            _auto_width(ws_stat)
+            ], _stat_rows())
 
         # --- Sheet 5: MigrationReadiness ---
         migration = data.get("migration_readiness")
         if migration and migration.get("verdict") != "NOT_CONFIGURED":
-            ws_mig = wb.create_sheet("MigrationReadiness")
-            _write_header(ws_mig, [
+            _write_sheet(wb, "MigrationReadiness", [
                 "model_a", "model_b", "evaluation_type",
                 "verdict", "target_model", "metric",
                 "threshold", "actual", "passed",
-            ])
-            for check in migration.get("checks") or []:
-                ws_mig.append([
-                    model_a, model_b, eval_type,
-                    migration.get("verdict", ""),
-                    migration.get("model", ""),
-                    check.get("metric", ""),
-                    _safe_value(check.get("threshold")),
-                    _safe_value(check.get("actual")),
-                    check.get("passed"),
-                ])
-            _auto_width(ws_mig)
+            ], ([
+                model_a, model_b, eval_type,
+                migration.get("verdict", ""),
+                migration.get("model", ""),
+                check.get("metric", ""),
+                _safe_value(check.get("threshold")),
+                _safe_value(check.get("actual")),
+                check.get("passed"),
+            ] for check in migration.get("checks") or []))
 
         # --- Sheet 6: FoundryComparison ---
         f_a = data.get("foundry_scores_a")
         f_b = data.get("foundry_scores_b")
         f_meta = data.get("foundry_meta") or {}
         if f_a or f_b:
-            ws_fc = wb.create_sheet("FoundryComparison")
-            _write_header(ws_fc, [
+            def _foundry_rows() -> Iterator[List[Any]]:
+                for label, scores, meta_key in [
+                    (model_a, f_a, "model_a"),
+                    (model_b, f_b, "model_b"),
+                ]:
+                    agg = (scores or {}).get("aggregated") or {}
+                    url = (f_meta.get(meta_key) or {}).get("report_url", "")
+                    for grader, score in agg.items():
+                        yield [label, eval_type, grader, _safe_value(score), url]
+
+            _write_sheet(wb, "FoundryComparison", [
                 "model", "evaluation_type", "grader_name",
                 "aggregated_score", "report_url",
-            ])
-            for label, scores, meta_key in [
-                (model_a, f_a, "model_a"),
-                (model_b, f_b, "model_b"),
-            ]:
-                agg = (scores or {}).get("aggregated") or {}
-                url = (f_meta.get(meta_key) or {}).get("report_url", "")
-                for grader, score in agg.items():
-                    ws_fc.append([
-                        label, eval_type, grader,
-                        _safe_value(score), url,
-                    ])
-            _auto_width(ws_fc)
-
-        buf = io.BytesIO()
-        wb.save(buf)
-        buf.seek(0)
-        return buf
+            ], _foundry_rows())
+
+        return wb
 
     # -----------------------------------------------------------------------
     # Internal helpers
     # -----------------------------------------------------------------------
     @staticmethod
-    def _write_raw_results(
-        ws, raw: List[Dict[str, Any]], model: str, eval_type: str
-    ) -> None:
-        """Write the RawResults sheet with a union schema across all task types."""
-        # Define all columns (common + per-type)
-        columns = [
-            # common
-            "model_name", "evaluation_type", "scenario_id",
-            "latency_s", "total_tokens",
-            "prompt_tokens", "completion_tokens", "cached_tokens", "reasoning_tokens",
-            # classification
-            "input_text",
-            "expected_category", "expected_subcategory",
-            "expected_priority", "expected_sentiment",
-            "predicted_category", "predicted_subcategory",
-            "predicted_confidence", "predicted_priority", "predicted_sentiment",
-            "category_correct",
-            # dialog
-            "conversation_turns", "conversation_text",
-            "response", "context_gaps", "question_count",
-            # general
-            "test_type", "complexity", "prompt", "expected_behavior", "run_count",
-            # rag
-            "query", "context", "ground_truth",
-            "groundedness_score", "relevance_score",
-            # tool calling
-            "available_tools", "expected_tool_calls",
-            "tool_accuracy", "param_accuracy",
-        ]
-        _write_header(ws, columns)
-
+    def _raw_result_rows(
+        raw: Iterable[Dict[str, Any]], model: str, eval_type: str
+    ) -> Iterator[List[Any]]:
+        """Yield RawResults rows (``RAW_RESULT_COLUMNS`` union schema)."""
         for item in raw:
             token_detail = item.get("token_detail") or {}
             # Handle list of token_details (general type has list)
@@ -475,7 +562,7 @@ class ExcelExporter:
             tool_acc = item.get("tool_accuracy")
             param_acc = item.get("param_accuracy")
 
-            row = [
+            yield [
                 model, eval_type, scenario_id,
                 _safe_value(latency), _safe_value(tokens),
                 _safe_value(prompt_tok), _safe_value(completion_tok),
@@ -505,22 +592,13 @@ class ExcelExporter:
                 _safe_value(available_tools), _safe_value(expected_tools),
                 _safe_value(tool_acc), _safe_value(param_acc),
             ]
-            ws.append(row)
-
-        _auto_width(ws)
 
     @staticmethod
-    def _write_foundry_scores_eval(
-        ws, foundry: Dict[str, Any], data: Dict[str, Any],
+    def _foundry_score_rows(
+        foundry: Dict[str, Any], data: Dict[str, Any],
         model: str, eval_type: str,
-    ) -> None:
-        """Write FoundryScores sheet for an evaluation result."""
-        _write_header(ws, [
-            "model_name", "evaluation_type",
-            "foundry_eval_id", "foundry_run_id", "foundry_report_url",
-            "grader_name", "aggregated_score",
-            "row_index", "row_score", "row_reason",
-        ])
+    ) -> Iterator[List[Any]]:
+        """Yield FoundryScores rows for an evaluation result."""
         eval_id = data.get("foundry_eval_id", "")
         run_id = data.get("foundry_run_id", "")
         report_url = data.get("foundry_report_url", "")
@@ -529,10 +607,10 @@ class ExcelExporter:
 
         # Aggregated rows (row_index = -1)
         for grader, score in aggregated.items():
-            ws.append([
+            yield [
                 model, eval_type, eval_id, run_id, report_url,
                 grader, _safe_value(score), -1, None, None,
-            ])
+            ]
 
         # Per-row detail
         for row_entry in per_row:
@@ -540,15 +618,14 @@ class ExcelExporter:
             scores = row_entry.get("scores") or {}
             for grader, score_data in scores.items():
                 if isinstance(score_data, dict):
-                    ws.append([
+                    yield [
                         model, eval_type, eval_id, run_id, report_url,
                         grader, None, row_idx,
                         _safe_value(score_data.get("score")),
                         score_data.get("reason", ""),
-                    ])
+                    ]
                 else:
-                    ws.append([
+                    yield [
                         model, eval_type, eval_id, run_id, report_url,
                         grader, None, row_idx, _safe_value(score_data), None,
-                    ])
-        _auto_width(ws)
+                    ]
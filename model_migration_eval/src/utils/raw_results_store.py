@@ -0,0 +1,238 @@
+"""
+Columnar Raw-Results Sidecar
+============================
+
+Stores the per-scenario ``raw_results`` rows of a saved evaluation in an
+Arrow IPC file next to the result JSON (``<name>.raw.arrow``), so the JSON
+only carries the summary metrics and readers can memory-map the sidecar
+and pull just the columns / row ranges they need.
+
+The sidecar is optional: it is written only when ``pyarrow`` is installed
+and the feature is enabled (``evaluation.columnar_raw_results`` in
+settings.yaml).  Otherwise results keep ``raw_results`` inline exactly as
+before, and :func:`load_result` reads both layouts transparently.
+
+Encoding:
+
+* top-level row keys become columns (first-seen order)
+* nested values (dicts / lists) and columns with mixed scalar types are
+  stored as JSON strings and decoded on read (listed in the schema
+  metadata under ``json_columns``)
+* a null cell is read back as an absent key
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_SUFFIX = ".raw.arrow"
+SIDECAR_FORMAT = "arrow-ipc"
+_JSON_COLUMNS_KEY = b"json_columns"
+
+_enabled = True
+
+
+def configure(enabled: bool) -> None:
+    """Turn sidecar writing on or off (reading is always supported)."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    """True when new results should be saved with a columnar sidecar."""
+    return _enabled and _HAS_PYARROW
+
+
+def sidecar_path(json_path: Path) -> Path:
+    """``results/foo.json`` → ``results/foo.raw.arrow``."""
+    json_path = Path(json_path)
+    return json_path.with_name(json_path.stem + SIDECAR_SUFFIX)
+
+
+# ── Write ────────────────────────────────────────────────────────────────
+
+def _build_table(rows: Sequence[Dict[str, Any]]) -> "pa.Table":
+    columns: Dict[str, None] = {}
+    for row in rows:
+        for key in row:
+            columns.setdefault(key, None)
+
+    arrays, json_columns = [], []
+    for name in columns:
+        values = [row.get(name) for row in rows]
+        nested = any(isinstance(v, (dict, list, tuple)) for v in values)
+        array = None
+        if not nested:
+            try:
+                array = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                array = None
+        if array is None:
+            json_columns.append(name)
+            array = pa.array(
+                [None if v is None else json.dumps(v, ensure_ascii=False, default=str) for v in values],
+                type=pa.string(),
+            )
+        arrays.append(array)
+
+    table = pa.Table.from_arrays(arrays, names=list(columns))
+    return table.replace_schema_metadata({_JSON_COLUMNS_KEY: json.dumps(json_columns).encode("utf-8")})
+
+
+def write_sidecar(json_path: Path, rows: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Write *rows* next to *json_path* (atomic) and return its descriptor.
+
+    The descriptor is stored in the result JSON under
+    ``raw_results_sidecar``.
+    """
+    table = _build_table(rows)
+    final_path = sidecar_path(json_path)
+    tmp_path = final_path.with_name(final_path.name + ".tmp")
+    try:
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa_ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=1024)
+        tmp_path.replace(final_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return {
+        "file": final_path.name,
+        "format": SIDECAR_FORMAT,
+        "rows": table.num_rows,
+        "columns": table.column_names,
+    }
+
+
+# ── Read ─────────────────────────────────────────────────────────────────
+
+class RawResultsSidecar:
+    """Memory-mapped reader for a ``.raw.arrow`` sidecar.
+
+    Usage::
+
+        with RawResultsSidecar(path) as sc:
+            rows = sc.read(offset=100, limit=50, columns=["scenario_id", "latency"])
+    """
+
+    def __init__(self, path: Path):
+        if not _HAS_PYARROW:
+            raise RuntimeError(
+                f"pyarrow is required to read the columnar raw results in {Path(path).name}"
+            )
+        self.path = Path(path)
+        self._source = pa.memory_map(str(self.path), "r")
+        self._reader = pa_ipc.open_file(self._source)
+        meta = self._reader.schema.metadata or {}
+        self._json_columns = set(json.loads(meta.get(_JSON_COLUMNS_KEY, b"[]")))
+
+    def __enter__(self) -> "RawResultsSidecar":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._source.close()
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._reader.schema.names)
+
+    @property
+    def num_rows(self) -> int:
+        return sum(self._reader.get_batch(i).num_rows for i in range(self._reader.num_record_batches))
+
+    def _decode(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        out = []
+        for rec in records:
+            row = {}
+            for key, value in rec.items():
+                if value is None:
+                    continue
+                if key in self._json_columns:
+                    value = json.loads(value)
+                row[key] = value
+            out.append(row)
+        return out
+
+    def _select(self, columns: Optional[Sequence[str]]) -> Optional[List[str]]:
+        if columns is None:
+            return None
+        available = set(self._reader.schema.names)
+        return [c for c in columns if c in available]
+
+    def read(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return rows ``[offset, offset + limit)`` restricted to *columns*.
+
+        Only the record batches overlapping the range are touched; with
+        the memory map, unread columns are never paged in.
+        """
+        return list(self.iter_rows(columns=columns, offset=offset, limit=limit))
+
+    def iter_rows(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield decoded rows batch by batch (for exports)."""
+        selected = self._select(columns)
+        remaining = limit
+        skip = max(0, offset)
+        for i in range(self._reader.num_record_batches):
+            if remaining is not None and remaining <= 0:
+                return
+            batch = self._reader.get_batch(i)
+            if skip >= batch.num_rows:
+                skip -= batch.num_rows
+                continue
+            length = batch.num_rows - skip
+            if remaining is not None:
+                length = min(length, remaining)
+            part = batch.slice(skip, length)
+            skip = 0
+            if selected is not None:
+                part = part.select(selected)
+            yield from self._decode(part.to_pylist())
+            if remaining is not None:
+                remaining -= length
+
+
+def load_result(json_path: Path, include_raw: bool = True) -> Dict[str, Any]:
+    """Load a saved result JSON, re-attaching sidecar rows when present.
+
+    With ``include_raw=False`` the sidecar is not opened at all and
+    ``raw_results`` is left as stored (empty for sidecar-backed files).
+    """
+    json_path = Path(json_path)
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    info = data.get("raw_results_sidecar") if isinstance(data, dict) else None
+    if include_raw and info:
+        with RawResultsSidecar(json_path.parent / info["file"]) as sc:
+            data["raw_results"] = sc.read()
+    return data
+
+
+def open_sidecar(json_path: Path) -> Optional[RawResultsSidecar]:
+    """Return a reader for *json_path*'s sidecar, or ``None`` if it has none."""
+    path = sidecar_path(json_path)
+    if not path.exists():
+        return None
+    return RawResultsSidecar(path)
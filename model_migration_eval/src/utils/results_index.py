@@ -0,0 +1,325 @@
+"""
+Results Catalogue
+=================
+
+Per-user SQLite index of the saved result files in a results directory,
+so the Results page can list, filter, sort and paginate with indexed
+queries instead of globbing every ``*.json`` and sniffing its head.
+
+``EvaluationResult.save`` and ``ComparisonReport.save`` record a row as
+soon as the file is written.  Files that reach the directory some other
+way (blob sync, manual copies, results saved before the index existed)
+are picked up by :meth:`ResultsIndex.sync`, which only rescans when the
+directory's mtime has changed and only parses files it has not seen.
+The database lives in the ``.index/`` subdirectory so that its own
+writes do not touch the mtime of the directory being watched.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIRNAME = ".index"
+INDEX_FILENAME = "results_index.db"
+
+_SORT_COLUMNS = {
+    "timestamp": "timestamp",
+    "saved": "saved_at",
+    "model": "model",
+    "type": "evaluation_type",
+}
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS results (
+        filename           TEXT PRIMARY KEY,
+        model              TEXT NOT NULL,
+        model_a            TEXT,
+        model_b            TEXT,
+        evaluation_type    TEXT NOT NULL,
+        timestamp          TEXT,
+        batch_id           TEXT,
+        metrics            TEXT,
+        foundry_report_url TEXT,
+        foundry_urls       TEXT,
+        saved_at           REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_results_saved ON results (saved_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_results_ts ON results (timestamp DESC);
+    CREATE INDEX IF NOT EXISTS idx_results_type ON results (evaluation_type, saved_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_results_model ON results (model, saved_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_results_batch ON results (batch_id);
+    CREATE TABLE IF NOT EXISTS meta (
+        key   TEXT PRIMARY KEY,
+        value TEXT
+    );
+"""
+
+# Serialises writers per database file within this process; SQLite's own
+# locking covers other processes.
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _headline_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the handful of numbers shown in the results list."""
+    out: Dict[str, Any] = {}
+    if "model_a" in data:
+        summary = data.get("summary") or {}
+        readiness = data.get("migration_readiness") or {}
+        if summary.get("overall_winner"):
+            out["overall_winner"] = summary["overall_winner"]
+        if readiness.get("verdict"):
+            out["verdict"] = readiness["verdict"]
+        return out
+
+    cls = data.get("classification_metrics") or {}
+    lat = data.get("latency_metrics") or {}
+    tool = data.get("tool_calling_metrics") or {}
+    for key, src, name in (
+        ("accuracy", cls, "accuracy"),
+        ("combined_accuracy", tool, "combined_accuracy"),
+        ("mean_latency", lat, "mean_latency"),
+        ("p95_latency", lat, "p95_latency"),
+        ("total_cost", lat, "total_cost"),
+    ):
+        if src.get(name) is not None:
+            out[key] = src[name]
+    if data.get("scenarios_tested") is not None:
+        out["scenarios_tested"] = data["scenarios_tested"]
+    if data.get("error_count") is not None:
+        out["error_count"] = data["error_count"]
+    return out
+
+
+def catalogue_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the index row for a result/comparison dict (``to_dict`` output)."""
+    model_a = data.get("model_a") or ""
+    model_b = data.get("model_b") or ""
+    model = data.get("model_name") or (f"{model_a} vs {model_b or '?'}" if model_a else "unknown")
+    fm = data.get("foundry_meta") or {}
+    urls = {}
+    for key in ("model_a", "model_b"):
+        url = (fm.get(key) or {}).get("report_url")
+        if url:
+            urls[key] = url
+    return {
+        "model": model,
+        "model_a": model_a,
+        "model_b": model_b,
+        "evaluation_type": data.get("evaluation_type") or "unknown",
+        "timestamp": data.get("timestamp") or "",
+        "batch_id": data.get("batch_id") or "",
+        "metrics": _headline_metrics(data),
+        "foundry_report_url": data.get("foundry_report_url") or "",
+        "foundry_urls": urls,
+    }
+
+
+class ResultsIndex:
+    """SQLite catalogue of the ``*.json`` results in one directory."""
+
+    def __init__(self, results_dir: str):
+        self.results_dir = Path(results_dir)
+        self.db_path = self.results_dir / INDEX_DIRNAME / INDEX_FILENAME
+        with _locks_guard:
+            self._lock = _locks.setdefault(str(self.db_path.resolve()), threading.Lock())
+
+    # ── Connection ──────────────────────────────────────────────────────
+
+    def _ensure_index_dir(self) -> None:
+        index_dir = self.db_path.parent
+        if index_dir.is_dir():
+            return
+        index_dir.mkdir(parents=True, exist_ok=True)
+        # Older versions kept the database in the results directory itself
+        for name in (INDEX_FILENAME, INDEX_FILENAME + "-journal"):
+            (self.results_dir / name).unlink(missing_ok=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        self._ensure_index_dir()
+        try:
+            return self._open()
+        except sqlite3.DatabaseError as e:
+            # The index is derived data — rebuild it from the files on disk
+            logger.warning(f"Results index {self.db_path} unreadable ({e}); rebuilding")
+            self.db_path.unlink(missing_ok=True)
+            return self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.executescript(_SCHEMA)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, filename: str, entry: Dict[str, Any], saved_at: float) -> None:
+        conn.execute(
+            """INSERT OR REPLACE INTO results
+               (filename, model, model_a, model_b, evaluation_type, timestamp,
+                batch_id, metrics, foundry_report_url, foundry_urls, saved_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                filename, entry["model"], entry["model_a"], entry["model_b"],
+                entry["evaluation_type"], entry["timestamp"], entry["batch_id"],
+                json.dumps(entry["metrics"]), entry["foundry_report_url"],
+                json.dumps(entry["foundry_urls"]), saved_at,
+            ),
+        )
+
+    # ── Writes ──────────────────────────────────────────────────────────
+
+    def record(self, filename: str, data: Dict[str, Any]) -> None:
+        """Add or refresh the row for *filename* from its result dict."""
+        path = self.results_dir / filename
+        try:
+            saved_at = path.stat().st_mtime
+        except OSError:
+            saved_at = 0.0
+        entry = catalogue_entry(data)
+        with self._lock, closing(self._connect()) as conn:
+            self._upsert(conn, filename, entry, saved_at)
+            conn.commit()
+
+    def remove(self, filename: str) -> None:
+        """Drop the row for a deleted result file."""
+        if not self.db_path.exists():
+            return
+        with self._lock, closing(self._connect()) as conn:
+            conn.execute("DELETE FROM results WHERE filename = ?", (filename,))
+            conn.commit()
+
+    def sync(self) -> int:
+        """Reconcile the index with the files on disk.
+
+        Skipped entirely when the directory mtime is unchanged since the
+        last sync.  Otherwise new files are parsed once and rows for
+        vanished files are dropped.  Returns the number of files added.
+        """
+        if not self.results_dir.exists():
+            return 0
+        # Create the index directory before reading the mtime it bumps
+        self._ensure_index_dir()
+        dir_mtime = str(self.results_dir.stat().st_mtime_ns)
+        with self._lock, closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'dir_mtime'").fetchone()
+            if row and row["value"] == dir_mtime:
+                return 0
+
+            on_disk: Dict[str, float] = {}
+            with os.scandir(self.results_dir) as it:
+                for de in it:
+                    if de.is_file() and de.name.endswith(".json"):
+                        on_disk[de.name] = de.stat().st_mtime
+            known = {r["filename"] for r in conn.execute("SELECT filename FROM results")}
+
+            gone = known - on_disk.keys()
+            if gone:
+                conn.executemany("DELETE FROM results WHERE filename = ?", [(n,) for n in gone])
+
+            added = 0
+            for name in on_disk.keys() - known:
+                try:
+                    with open(self.results_dir / name, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Skipping unreadable result file {name}: {e}")
+                    continue
+                if not isinstance(data, dict):
+                    continue
+                self._upsert(conn, name, catalogue_entry(data), on_disk[name])
+                added += 1
+
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('dir_mtime', ?)", (dir_mtime,)
+            )
+            conn.commit()
+        if added or gone:
+            logger.info(f"Results index: +{added} / -{len(gone)} files in {self.results_dir}")
+        return added
+
+    # ── Queries ─────────────────────────────────────────────────────────
+
+    def query(
+        self,
+        evaluation_type: Optional[str] = None,
+        model: Optional[str] = None,
+        batch_id: Optional[str] = None,
+        sort: str = "saved",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Return ``(entries, total)`` for the filtered, sorted page.
+
+        *model* matches the single-model name or either side of a
+        comparison.  Entries use the shape the Results page expects
+        (``filename``, ``model``, ``type``, ``timestamp`` plus optional
+        ``batch_id``, ``foundry_report_url``, ``foundry_urls``,
+        ``metrics``).
+        """
+        where, params = [], []
+        if evaluation_type:
+            where.append("evaluation_type = ?")
+            params.append(evaluation_type)
+        if model:
+            where.append("(model = ? OR model_a = ? OR model_b = ?)")
+            params.extend([model, model, model])
+        if batch_id:
+            where.append("batch_id = ?")
+            params.append(batch_id)
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        order = _SORT_COLUMNS.get(sort, "saved_at")
+        direction = "DESC" if descending else "ASC"
+
+        with closing(self._connect()) as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM results {clause}", params).fetchone()[0]
+            sql = f"SELECT * FROM results {clause} ORDER BY {order} {direction}, filename {direction}"
+            page_params = list(params)
+            if limit is not None:
+                sql += " LIMIT ? OFFSET ?"
+                page_params.extend([int(limit), int(offset)])
+            rows = conn.execute(sql, page_params).fetchall()
+
+        entries = []
+        for r in rows:
+            entry: Dict[str, Any] = {
+                "filename": r["filename"],
+                "model": r["model"],
+                "type": r["evaluation_type"],
+                "timestamp": r["timestamp"] or "",
+            }
+            if r["batch_id"]:
+                entry["batch_id"] = r["batch_id"]
+            if r["foundry_report_url"]:
+                entry["foundry_report_url"] = r["foundry_report_url"]
+            urls = json.loads(r["foundry_urls"] or "{}")
+            if urls:
+                entry["foundry_urls"] = urls
+            metrics = json.loads(r["metrics"] or "{}")
+            if metrics:
+                entry["metrics"] = metrics
+            entries.append(entry)
+        return entries, total
+
+
+def record_saved_result(results_dir: str, filename: str, data: Dict[str, Any]) -> None:
+    """Best-effort index update used by the ``save`` methods.
+
+    A failure here never fails the save itself — the next
+    :meth:`ResultsIndex.sync` picks the file up from disk.
+    """
+    try:
+        ResultsIndex(results_dir).record(filename, data)
+    except Exception as e:
+        logger.warning(f"Could not update results index for {filename}: {e}")
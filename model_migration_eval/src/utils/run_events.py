@@ -0,0 +1,141 @@
+"""
+Run Event Streams
+=================
+
+Per-run, append-only event logs behind the Server-Sent Events endpoint
+(``/api/runs/<run_id>/events``).  Background jobs publish status changes,
+evaluators publish one ``scenario`` event per finished scenario and the
+run-log capture handler publishes every captured ``log`` line; the SSE
+view tails the stream and pushes events to the browser as they happen
+instead of the UI polling the status and log endpoints.
+
+Each event gets a per-run, monotonically increasing id, so a reconnecting
+``EventSource`` resumes from its ``Last-Event-ID``.  Streams keep the most
+recent ``max_events`` events; a client that fell further behind gets a
+``reset`` event telling it how many it missed.
+
+Publishing never blocks on subscribers: it appends under the stream's
+lock and notifies waiting readers.
+
+Code that does not know its run id (the evaluators) calls :func:`emit`,
+which resolves it through the source registered by the web app with
+:func:`set_run_id_source` (the ``_current_run_id`` context variable, which
+``_run_in_loop`` forwards into the evaluation tasks).
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+class _RunStream:
+    __slots__ = ("events", "next_id", "closed", "last_access", "cond")
+
+    def __init__(self, max_events: int):
+        self.events: deque = deque(maxlen=max_events)
+        self.next_id = 1
+        self.closed = False
+        self.last_access = time.time()
+        self.cond = threading.Condition()
+
+
+class RunEventBus:
+    """In-process registry of run event streams."""
+
+    def __init__(self, max_events: int = 5000, ttl_sec: float = 3600):
+        self.max_events = max_events
+        self.ttl_sec = ttl_sec
+        self._streams: Dict[str, _RunStream] = {}
+        self._lock = threading.Lock()
+
+    def _stream(self, run_id: str) -> _RunStream:
+        stream = self._streams.get(run_id)
+        if stream is None:
+            with self._lock:
+                stream = self._streams.setdefault(run_id, _RunStream(self.max_events))
+        return stream
+
+    # ── Publish ─────────────────────────────────────────────────────────
+
+    def publish(self, run_id: str, event: str, data: Dict[str, Any]) -> int:
+        """Append an event to *run_id*'s stream and wake its readers."""
+        stream = self._stream(run_id)
+        with stream.cond:
+            event_id = stream.next_id
+            stream.next_id += 1
+            stream.events.append((event_id, event, data))
+            stream.last_access = time.time()
+            if event == "status" and data.get("status") in TERMINAL_STATUSES:
+                stream.closed = True
+            stream.cond.notify_all()
+        return event_id
+
+    # ── Read ────────────────────────────────────────────────────────────
+
+    def read(
+        self,
+        run_id: str,
+        after_id: int = 0,
+        timeout: float = 15.0,
+    ) -> Tuple[List[Tuple[int, str, Dict[str, Any]]], int, bool]:
+        """Return ``(events, missed, closed)`` newer than *after_id*.
+
+        Blocks up to *timeout* seconds when nothing new is available.
+        *missed* counts events that were already dropped from the
+        bounded history; *closed* is True once a terminal status event
+        has been published.
+        """
+        stream = self._stream(run_id)
+        with stream.cond:
+            if stream.next_id - 1 <= after_id and not stream.closed:
+                stream.cond.wait(timeout)
+            stream.last_access = time.time()
+            events = [e for e in stream.events if e[0] > after_id]
+            oldest = stream.events[0][0] if stream.events else stream.next_id
+            missed = max(0, oldest - after_id - 1)
+            return events, missed, stream.closed
+
+    # ── Housekeeping ────────────────────────────────────────────────────
+
+    def cleanup(self) -> None:
+        """Drop streams nobody has touched for ``ttl_sec``."""
+        cutoff = time.time() - self.ttl_sec
+        with self._lock:
+            expired = [rid for rid, s in self._streams.items() if s.last_access < cutoff]
+            for rid in expired:
+                self._streams.pop(rid, None)
+
+
+def format_sse(event_id: int, event: str, data: Dict[str, Any]) -> str:
+    """Encode one event in ``text/event-stream`` framing."""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n"
+
+
+# ── Process-wide bus ─────────────────────────────────────────────────────
+
+bus = RunEventBus()
+_run_id_source: Callable[[], Optional[str]] = lambda: None
+
+
+def set_run_id_source(source: Callable[[], Optional[str]]) -> None:
+    """Register how :func:`emit` finds the run id of the calling context."""
+    global _run_id_source
+    _run_id_source = source
+
+
+def emit(event: str, data: Dict[str, Any]) -> None:
+    """Publish *event* to the current run's stream (no-op outside a run)."""
+    try:
+        run_id = _run_id_source()
+    except Exception:
+        return
+    if run_id:
+        bus.publish(run_id, event, data)
@@ -8,10 +8,14 @@ import time
 import logging
 import threading
 import contextvars
+from typing import Optional
 from datetime import datetime
 from pathlib import Path
 
-from flask import Flask, render_template, request, jsonify, session, redirect, g, send_file
+from flask import (
+    Flask, Response, render_template, request, jsonify, session, redirect, g,
+    stream_with_context,
+)
 from flask_cors import CORS
 from flask_compress import Compress
 
@@ -25,25 +29,36 @@ from ..utils.prompt_loader import PromptLoader
 from ..utils.prompt_manager import PromptManager
 from ..utils.data_loader import DataLoader, ensure_flat_schema
 from ..utils.excel_exporter import ExcelExporter
+from ..utils.results_index import ResultsIndex, record_saved_result
+from ..utils import raw_results_store, run_events
 from ..evaluation.metrics import MetricsCalculator
 from ..evaluation.evaluator import ModelEvaluator, MissingPromptsError
 from ..evaluation.comparator import ModelComparator
+from ..evaluation.result_store import ResultStore
 from ..evaluation.realtime_evaluator import RealtimeEvaluator
 from ..evaluation.foundry_evaluator import (
     is_foundry_available,
     create_foundry_evaluator_from_config,
+    get_run_poller,
 )
 from ..clients.tts_client import load_tts_config_from_settings
-from ..clients.realtime_client import RealtimeConfig
+from ..clients.realtime_client import RealtimeConfig, load_realtime_pool_config_from_settings
+from ..utils.audio_utils import tts_cache_stats
 from ..utils import blob_sync
+from .user_cache import UserInstanceCache
+from ..jobs import JobStore, JobWorkerPool, JobFailed
 
 
-def create_app(config_path: str = None) -> Flask:
+def create_app(config_path: str = None, job_workers: Optional[int] = None) -> Flask:
     """
     Create and configure the Flask application.
     
     Args:
         config_path: Path to settings.yaml configuration
+        job_workers: Size of the in-process job worker pool.  ``None``
+            uses ``jobs.workers`` from settings and starts the pool;
+            any other value sizes the pool but leaves starting it to
+            the caller (the standalone worker process passes 0).
         
     Returns:
         Configured Flask application
@@ -71,6 +86,10 @@ def create_app(config_path: str = None) -> Flask:
     except Exception:
         app.config['SETTINGS'] = {}
 
+    raw_results_store.configure(
+        app.config['SETTINGS'].get('evaluation', {}).get('columnar_raw_results', True)
+    )
+
     # ── Auth infrastructure ──────────────────────────────────────────
     import os as _os
     import secrets as _secrets
@@ -122,10 +141,12 @@ def create_app(config_path: str = None) -> Flask:
     )
     _email_sender = create_email_sender(app.config['SETTINGS'])
 
-    # Per-user instance cache with LRU eviction  (user_id → instances)
-    _MAX_CACHED_USERS = 50
-    _user_cache: dict = {}          # uid → {"data_loader": ..., "last_access": float, ...}
-    _user_cache_lock = threading.Lock()
+    # Per-user instance cache: O(1) LRU with an idle TTL (user_id → instances)
+    _user_cache_cfg = app.config['SETTINGS'].get('web', {}).get('user_cache', {}) or {}
+    _user_instances = UserInstanceCache(
+        max_users=_user_cache_cfg.get('max_users', 50),
+        ttl_seconds=_user_cache_cfg.get('ttl_seconds', 3600),
+    )
 
     # Lazy-loaded client (shared across all users — same Azure endpoint)
     _client = None
@@ -143,6 +164,10 @@ def create_app(config_path: str = None) -> Flask:
     _run_logs_lock = threading.Lock()
     _run_logs_max_lines = 2000
     _run_logs_ttl_sec = 3600
+    # run_id → (user_id, claimed_at) for runs that have no job (yet):
+    # log streams open before the job is queued, and single/Foundry runs
+    # never become jobs.  Guarded by _run_logs_lock.
+    _run_owners = {}
 
     # Shared thread pool for /api/evaluate/single parallel model dispatch
     from concurrent.futures import ThreadPoolExecutor as _TPE
@@ -167,58 +192,44 @@ def create_app(config_path: str = None) -> Flask:
             msg = pattern.sub(replacement, msg)
         return msg
     _current_run_id = contextvars.ContextVar("current_run_id", default=None)
-
-    # Async comparison jobs storage
-    _compare_jobs = {}
-    _compare_jobs_lock = threading.Lock()
-
-    # Async batch evaluation jobs storage
-    _batch_jobs = {}
-    _batch_jobs_lock = threading.Lock()
-
-    # Async generate jobs storage
-    _generate_jobs = {}
-    _generate_jobs_lock = threading.Lock()
-
-    # Async regenerate jobs storage
-    _regenerate_jobs = {}
-    _regenerate_jobs_lock = threading.Lock()
+    # Evaluators publish per-scenario events to whichever run is current
+    run_events.set_run_id_source(_current_run_id.get)
+
+    # ── Background jobs ──────────────────────────────────────────────
+    # Jobs are queued in a SQLite store shared by every web replica and
+    # worker process; status endpoints read from it.  Handlers are
+    # registered further down (``_job_handlers``).
+    _jobs_cfg = app.config.get('SETTINGS', {}).get('jobs', {}) or {}
+    job_store = JobStore(
+        _jobs_cfg.get('db_path', 'data/jobs.db'),
+        max_attempts=int(_jobs_cfg.get('max_attempts', 2)),
+    )
 
     # ── Topic-safety lock ────────────────────────────────────────────
-    # Tracks the number of running jobs that depend on the active topic
-    # (evaluations, comparisons, generations, regenerations).  While the
-    # count is > 0 the activate_topic endpoint will be rejected.  A
-    # topic switch in progress (_topic_switching flag) blocks new jobs.
-    _active_jobs_lock = threading.Lock()
-    _active_jobs_count = 0
-    _topic_switching = False  # True while activate_topic is executing
-
-    def _register_job():
-        """Mark that a topic-dependent job is starting."""
-        with _active_jobs_lock:
-            if _topic_switching:
+    # A user's topic cannot be switched while any of their jobs are
+    # queued or running (they depend on the active prompts and data),
+    # and no new job is accepted while their switch is in progress.
+    _topic_switch_lock = threading.Lock()
+    _topic_switching = set()  # user ids whose activate_topic is executing
+
+    def _ensure_not_switching(user_id):
+        """Raise if *user_id* is in the middle of a topic switch."""
+        with _topic_switch_lock:
+            if user_id in _topic_switching:
                 raise RuntimeError(
                     'A topic switch is in progress. '
                     'Please wait until the switch completes before starting a new job.'
                 )
-            nonlocal _active_jobs_count
-            _active_jobs_count += 1
-
-    def _unregister_job():
-        """Mark that a topic-dependent job has finished."""
-        nonlocal _active_jobs_count
-        with _active_jobs_lock:
-            _active_jobs_count = max(0, _active_jobs_count - 1)
-
-    def _check_topic_switchable():
-        """Raise if the topic cannot be switched right now."""
-        with _active_jobs_lock:
-            if _active_jobs_count > 0:
-                raise RuntimeError(
-                    f'Cannot switch topic while {_active_jobs_count} job(s) are running '
-                    f'(evaluations, comparisons, or generators). '
-                    f'Wait for them to finish or cancel them first.'
-                )
+
+    def _check_topic_switchable(user_id):
+        """Raise if *user_id*'s topic cannot be switched right now."""
+        active = job_store.count_active(user_id)
+        if active > 0:
+            raise RuntimeError(
+                f'Cannot switch topic while {active} job(s) are running '
+                f'(evaluations, comparisons, or generators). '
+                f'Wait for them to finish or cancel them first.'
+            )
 
     class _RunLogCaptureHandler(logging.Handler):
         """Capture log records for the active run_id context into memory.
@@ -255,6 +266,9 @@ def create_app(config_path: str = None) -> Flask:
                     })
             buff['entries'].append(entry)
             buff['last_access'] = now
+            if _mask_patterns:
+                entry = dict(entry, message=_mask_verbose_message(message))
+            run_events.bus.publish(run_id, 'log', entry)
 
     def _install_run_log_handler_once():
         root = logging.getLogger()
@@ -271,23 +285,49 @@ def create_app(config_path: str = None) -> Flask:
             expired = [rid for rid, data in _run_logs.items() if data.get('last_access', 0) < cutoff]
             for rid in expired:
                 _run_logs.pop(rid, None)
-        # Also clean up old async jobs (compare, batch, generate, regenerate)
-        for lock, store in [
-            (_compare_jobs_lock, _compare_jobs),
-            (_batch_jobs_lock, _batch_jobs),
-            (_generate_jobs_lock, _generate_jobs),
-            (_regenerate_jobs_lock, _regenerate_jobs),
-        ]:
-            with lock:
-                expired = [rid for rid, j in store.items() if j.get('created', 0) < cutoff]
-                for rid in expired:
-                    store.pop(rid, None)
+            for rid in [rid for rid, (_, at) in _run_owners.items() if at < cutoff]:
+                _run_owners.pop(rid, None)
+        run_events.bus.cleanup()
+
+    def _job_status_payload(job):
+        """Status-endpoint / SSE view of a ``JobRecord``."""
+        resp = {'status': job.status, 'run_id': job.run_id}
+        if job.result is not None:
+            resp['result'] = job.result
+        if job.status in ('failed', 'cancelled') and job.error:
+            resp['error'] = job.error
+            if job.error_type:
+                resp['error_type'] = job.error_type
+        if job.progress:
+            resp['progress'] = job.progress
+        return resp
+
+    def _publish_job_status(run_id):
+        """Push the job's current status (and result, once done) to its event stream."""
+        job = job_store.get(run_id)
+        if job is not None:
+            run_events.bus.publish(run_id, 'status', _job_status_payload(job))
 
     def _normalize_run_id(candidate):
         if not candidate:
             return f"run_{datetime.now().strftime('%Y%m%d%H%M%S%f')}"
         return str(candidate)
 
+    def _claim_run(run_id):
+        """Bind *run_id* to the current user; ``False`` if another user owns it.
+
+        An existing job's owner is authoritative.  Otherwise the first user to
+        use the id (subscribing to its events or starting the run) keeps it
+        for the log TTL.
+        """
+        uid = _get_user_context().user_id
+        job = job_store.get(run_id)
+        if job is not None:
+            return job.user_id == uid
+        with _run_logs_lock:
+            owner, _ = _run_owners.setdefault(run_id, (uid, time.time()))
+        return owner == uid
+
     _install_run_log_handler_once()
     
     # ── Helper: get current user context from request ────────────────
@@ -523,31 +563,43 @@ def create_app(config_path: str = None) -> Flask:
 
     # ── Per-user instance factories ──────────────────────────────────
 
-    def _get_user_slot(uid: str) -> dict:
+    def _get_user_slot(uid: str):
         """Return the cache slot for *uid*, creating it if needed.
 
-        Thread-safe.  If the cache exceeds ``_MAX_CACHED_USERS`` the
-        least-recently-accessed entry is evicted.
+        The slot is remembered on ``flask.g`` so the cache lock is taken
+        once per request, not once per getter.
         """
-        now = time.time()
-        with _user_cache_lock:
-            slot = _user_cache.get(uid)
-            if slot is not None:
-                slot["last_access"] = now
-                return slot
-            # Evict oldest entries if over limit
-            while len(_user_cache) >= _MAX_CACHED_USERS:
-                oldest_uid = min(_user_cache, key=lambda k: _user_cache[k]["last_access"])
-                del _user_cache[oldest_uid]
-                app.logger.debug(f"Evicted cached instances for user {oldest_uid}")
-            slot = {"last_access": now}
-            _user_cache[uid] = slot
-            return slot
+        cached = getattr(g, '_user_slot', None)
+        if cached is not None and cached[0] == uid:
+            return cached[1]
+        slot = _user_instances.slot(uid)
+        g._user_slot = (uid, slot)
+        return slot
+
+    def _user_instance(key: str, factory):
+        """The current user's *key* component, built by *factory* on first use."""
+        slot = _get_user_slot(_get_user_context().user_id)
+        return _user_instances.get_or_build(slot, key, factory)
 
     def _invalidate_user(uid: str):
-        """Remove all cached instances for a user (e.g. after topic switch)."""
-        with _user_cache_lock:
-            _user_cache.pop(uid, None)
+        """Make a user's cached components pick up new prompts and data.
+
+        Used after a topic switch or restore.  The loaders are kept and
+        only their file caches are cleared.  The evaluator, comparator and
+        prompt manager reference those same loaders (and directories), so
+        they stay valid.  Derived per-request caches (``_``-prefixed keys)
+        are dropped.
+        """
+        slot = _user_instances.peek(uid)
+        if slot is None:
+            return
+        prompt_loader = slot.get("prompt_loader")
+        if prompt_loader is not None:
+            prompt_loader._cache.clear()
+        data_loader = slot.get("data_loader")
+        if data_loader is not None:
+            data_loader.clear_cache()
+        _user_instances.discard(uid, [k for k in list(slot.items) if k.startswith('_')])
 
     def get_client():
         nonlocal _client
@@ -563,39 +615,31 @@ def create_app(config_path: str = None) -> Flask:
 
     def get_data_loader() -> DataLoader:
         uctx = _get_user_context()
-        uid = uctx.user_id
-        slot = _get_user_slot(uid)
-        if "data_loader" not in slot:
-            slot["data_loader"] = DataLoader(str(uctx.data_dir))
-        return slot["data_loader"]
+        return _user_instance("data_loader", lambda: DataLoader(str(uctx.data_dir)))
 
     def get_prompt_loader() -> PromptLoader:
         uctx = _get_user_context()
-        uid = uctx.user_id
-        slot = _get_user_slot(uid)
-        if "prompt_loader" not in slot:
-            slot["prompt_loader"] = PromptLoader(str(uctx.prompts_dir))
-        return slot["prompt_loader"]
+        return _user_instance("prompt_loader", lambda: PromptLoader(str(uctx.prompts_dir)))
 
     def get_prompt_manager() -> PromptManager:
         uctx = _get_user_context()
-        uid = uctx.user_id
-        slot = _get_user_slot(uid)
-        if "prompt_manager" not in slot:
-            slot["prompt_manager"] = PromptManager(
-                prompts_dir=str(uctx.prompts_dir),
-                data_dir=str(uctx.data_dir),
-                config=app.config.get('SETTINGS', {}),
-            )
-        return slot["prompt_manager"]
+        return _user_instance("prompt_manager", lambda: PromptManager(
+            prompts_dir=str(uctx.prompts_dir),
+            data_dir=str(uctx.data_dir),
+            config=app.config.get('SETTINGS', {}),
+        ))
 
     def get_metrics_calc():
+        """Process-wide ``MetricsCalculator`` — stateless, shared by every user."""
         nonlocal _metrics_calc
         if _metrics_calc is None:
             with _singleton_lock:
                 if _metrics_calc is None:
                     cost_rates = app.config.get('SETTINGS', {}).get('cost_rates', {})
-                    _metrics_calc = MetricsCalculator(cost_rates=cost_rates if cost_rates else None)
+                    _metrics_calc = MetricsCalculator(
+                        cost_rates=cost_rates if cost_rates else None,
+                        log_scenarios=bool(_load_perf_settings().get('log_scenario_results', False)),
+                    )
         return _metrics_calc
 
     def _load_perf_settings() -> dict:
@@ -608,18 +652,22 @@ def create_app(config_path: str = None) -> Flask:
 
     def get_evaluator():
         uctx = _get_user_context()
-        uid = uctx.user_id
         client = get_client()
-        slot = _get_user_slot(uid)
-        if client and "evaluator" not in slot:
+        if not client:
+            return None
+
+        def _build():
             perf = _load_perf_settings()
-            slot["evaluator"] = ModelEvaluator(
+            return ModelEvaluator(
                 client,
                 prompt_loader=get_prompt_loader(),
                 data_loader=get_data_loader(),
                 max_concurrent=perf.get('max_concurrent_requests', 5),
+                streaming=bool(perf.get('streaming', False)),
+                checkpoint_dir=str(uctx.checkpoints_dir),
+                metrics_calc=get_metrics_calc(),
             )
-        return slot.get("evaluator")
+        return _user_instance("evaluator", _build)
 
     def get_realtime_evaluator():
         """Lazy-load the RealtimeEvaluator for voice/realtime models.
@@ -628,11 +676,11 @@ def create_app(config_path: str = None) -> Flask:
         that standalone Evaluate pages route realtime models through
         TTS → WebSocket instead of chat/completions.
         """
-        uctx = _get_user_context()
-        uid = uctx.user_id
         client = get_client()
-        slot = _get_user_slot(uid)
-        if client and "realtime_evaluator" not in slot:
+        if not client:
+            return None
+
+        def _build():
             settings = app.config.get('SETTINGS', {})
             rt_cfg = settings.get('realtime', {})
             raw_ep = rt_cfg.get('endpoint', '')
@@ -645,24 +693,28 @@ def create_app(config_path: str = None) -> Flask:
             tts_endpoint = client._resolve_env_var(raw_tts_ep) if raw_tts_ep else None
             tts_config = load_tts_config_from_settings({'realtime': rt_cfg})
             perf = _load_perf_settings()
-            slot["realtime_evaluator"] = RealtimeEvaluator(
+            return RealtimeEvaluator(
                 azure_client=client,
                 prompt_loader=get_prompt_loader(),
                 data_loader=get_data_loader(),
                 tts_config=tts_config,
-                max_concurrent=min(perf.get('max_concurrent_requests', 5), 2),
+                # Realtime sessions are expensive — tune with tools/benchmark_realtime.py
+                max_concurrent=min(perf.get('max_concurrent_requests', 5), int(rt_cfg.get('max_concurrent', 2))),
                 realtime_endpoint=realtime_endpoint,
                 realtime_api_version=realtime_api_version,
                 tts_endpoint=tts_endpoint,
+                metrics_calc=get_metrics_calc(),
+                session_pool=load_realtime_pool_config_from_settings({'realtime': rt_cfg}),
             )
-        return slot.get("realtime_evaluator")
+        return _user_instance("realtime_evaluator", _build)
 
     def get_comparator():
         uctx = _get_user_context()
-        uid = uctx.user_id
         client = get_client()
-        slot = _get_user_slot(uid)
-        if client and "comparator" not in slot:
+        if not client:
+            return None
+
+        def _build():
             perf = _load_perf_settings()
             settings = app.config.get('SETTINGS', {})
             comp = ModelComparator(
@@ -670,34 +722,38 @@ def create_app(config_path: str = None) -> Flask:
                 evaluator=get_evaluator(),
                 foundry_evaluator=get_foundry_evaluator(),
                 parallel_models=perf.get('parallel_models', True),
+                batch_fan_out=perf.get('batch_fan_out', 3),
+                result_store=ResultStore(
+                    str(uctx.result_store_dir),
+                    max_age_seconds=perf.get('result_reuse_max_age_seconds', 86400),
+                ),
                 acceptance_thresholds=settings.get('evaluation', {}).get('acceptance_thresholds', {}),
+                adaptive=perf.get('adaptive_comparison') or {},
                 prompt_loader=get_prompt_loader(),
                 data_loader=get_data_loader(),
             )
             # Pass realtime/voice endpoint config so the RealtimeEvaluator
             # can use a dedicated endpoint + TTS deployment from settings.
             comp._realtime_settings = settings.get('realtime', {})
-            slot["comparator"] = comp
-        else:
-            comp = slot.get("comparator")
-            if comp is not None:
-                comp.foundry_evaluator = get_foundry_evaluator()
-        return slot.get("comparator")
+            return comp
+        return _user_instance("comparator", _build)
 
     def get_foundry_evaluator():
-        """Lazy-load the Foundry evaluator from settings.yaml config."""
+        """Process-wide Foundry evaluator (no per-user state), built once."""
         nonlocal _foundry_evaluator, _foundry_checked
         if _foundry_checked:
             return _foundry_evaluator
-        _foundry_checked = True
-        if not is_foundry_available():
-            return None
-        try:
-            cfg = app.config.get('SETTINGS', {})
-            _foundry_evaluator = create_foundry_evaluator_from_config(cfg)
-        except Exception as e:
-            app.logger.warning(f'Foundry evaluator init failed: {e}')
-            _foundry_evaluator = None
+        with _singleton_lock:
+            if _foundry_checked:
+                return _foundry_evaluator
+            if is_foundry_available():
+                try:
+                    cfg = app.config.get('SETTINGS', {})
+                    _foundry_evaluator = create_foundry_evaluator_from_config(cfg)
+                except Exception as e:
+                    app.logger.warning(f'Foundry evaluator init failed: {e}')
+                    _foundry_evaluator = None
+            _foundry_checked = True
         return _foundry_evaluator
 
     # =========================================================================
@@ -754,6 +810,8 @@ def create_app(config_path: str = None) -> Flask:
         return jsonify({
             'status': 'healthy',
             'client_ready': client is not None,
+            'user_cache': _user_instances.stats(),
+            'tts_cache': tts_cache_stats(),
             'timestamp': datetime.now().isoformat()
         })
 
@@ -769,6 +827,8 @@ def create_app(config_path: str = None) -> Flask:
             offset = 0
 
         rid = _normalize_run_id(run_id)
+        if not _claim_run(rid):
+            return jsonify({'error': 'Run not found', 'run_id': rid}), 404
         buff = _run_logs.get(rid)
         if buff is None:
             entries_list: list = []
@@ -793,6 +853,68 @@ def create_app(config_path: str = None) -> Flask:
             'next_offset': next_offset,
         })
         
+    @app.route('/api/runs/<run_id>/events')
+    def run_events_stream(run_id: str):
+        """Server-Sent Events stream of a run's progress, scenarios and logs.
+
+        Event types: ``status`` (job status; the terminal one carries the
+        result and ends the stream), ``progress``, ``scenario`` and
+        ``log``.  Resumes after the ``Last-Event-ID`` header (or
+        ``?last_event_id=``) so a reconnecting ``EventSource`` does not
+        miss or repeat events.  ``?types=log,scenario`` limits the stream
+        to those types (``status`` is always sent).  The polling
+        endpoints remain available.
+
+        Jobs executed in another process publish to that process's bus;
+        here only their terminal status arrives, picked up from the job
+        store when the stream is idle.  Only the run's owner may subscribe
+        (see ``_claim_run``).
+        """
+        _cleanup_run_logs()
+        rid = _normalize_run_id(run_id)
+        if not _claim_run(rid):
+            return jsonify({'status': 'not_found', 'run_id': rid}), 404
+        try:
+            after = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or 0)
+        except ValueError:
+            after = 0
+        types = request.args.get('types')
+        wanted = {t.strip() for t in types.split(',') if t.strip()} | {'status'} if types else None
+        heartbeat = 15.0
+
+        def _sync_from_store():
+            # A job run by another process (worker or replica) only
+            # reaches this process's bus through the shared store.
+            job = job_store.get(rid)
+            if job is not None and job.finished:
+                _publish_job_status(rid)
+
+        def _events():
+            last = after
+            # Tell the browser how long to wait before reconnecting
+            yield 'retry: 3000\n\n'
+            _sync_from_store()
+            while True:
+                events, missed, closed = run_events.bus.read(rid, last, timeout=heartbeat)
+                if missed:
+                    yield run_events.format_sse(last + missed, 'reset', {'missed': missed})
+                if not events and not closed:
+                    _sync_from_store()
+                    yield ': keep-alive\n\n'
+                    continue
+                for event_id, event, data in events:
+                    last = event_id
+                    if wanted is None or event in wanted:
+                        yield run_events.format_sse(event_id, event, data)
+                if closed:
+                    return
+
+        return Response(
+            stream_with_context(_events()),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        )
+
     @app.route('/api/models')
     def list_models():
         """List available model configurations"""
@@ -957,6 +1079,8 @@ def create_app(config_path: str = None) -> Flask:
         data = request.get_json() or {}
         run_id = _normalize_run_id(data.get('run_id') if data else None)
         _cleanup_run_logs()
+        if not _claim_run(run_id):
+            return jsonify({'error': f'Run id {run_id} is in use', 'run_id': run_id}), 409
         token = _current_run_id.set(run_id)
         customer_input = data.get('customer_input', '')
         models_to_test = data.get('models', ['gpt4'])
@@ -1036,7 +1160,8 @@ def create_app(config_path: str = None) -> Flask:
                 )
 
                 realtime = rt_eval._ensure_realtime()
-                rt_result = asyncio.run(realtime.send_audio(tts_r.audio.data, rt_config))
+                # One-off loop: pooled connections would outlive it
+                rt_result = asyncio.run(realtime.send_audio(tts_r.audio, rt_config, pooled=False, keep_audio=False))
 
                 result = {
                     'response': rt_result.transcript,
@@ -1053,6 +1178,7 @@ def create_app(config_path: str = None) -> Flask:
                         'ttfa_ms': rt_result.time_to_first_audio_ms,
                         'session_ms': rt_result.session_time_ms,
                         'ws_connect_ms': rt_result.ws_connect_time_ms,
+                        'session_reused': rt_result.session_reused,
                         'tts_latency_ms': tts_r.tts_latency_ms,
                         'tts_cached': tts_r.cached,
                     },
@@ -1133,7 +1259,7 @@ def create_app(config_path: str = None) -> Flask:
 
                 if evaluation_type == 'classification':
                     result['parsed'] = metrics_calc.extract_classification_from_response(
-                        completion.content
+                        completion.parsed
                     )
 
                 return model_name, result
@@ -1154,9 +1280,44 @@ def create_app(config_path: str = None) -> Flask:
         finally:
             _current_run_id.reset(token)
         
+    # ── Background job plumbing ─────────────────────────────────────
+
+    def _submit_job(kind, run_id, params, **extra):
+        """Queue *kind* for the current user and answer 202 (409 if refused)."""
+        uid = _get_user_context().user_id
+        if not _claim_run(run_id):
+            return jsonify({'error': f'Run id {run_id} is in use', 'run_id': run_id}), 409
+        try:
+            _ensure_not_switching(uid)
+            job_store.submit(run_id, uid, kind, params)
+        except (RuntimeError, ValueError) as e:
+            return jsonify({'error': str(e), 'run_id': run_id}), 409
+        _publish_job_status(run_id)
+        job_pool.notify()
+        return jsonify({'status': 'queued', 'run_id': run_id, **extra}), 202
+
+    def _owned_job(run_id):
+        """The current user's job with *run_id*, or ``None``."""
+        job = job_store.get(run_id)
+        if job is None or job.user_id != _get_user_context().user_id:
+            return None
+        return job
+
+    def _load_scenarios(evaluation_type, limit):
+        loader = get_data_loader()
+        if evaluation_type == 'classification':
+            return loader.load_classification_scenarios()[:limit]
+        elif evaluation_type == 'dialog':
+            return loader.load_dialog_scenarios()[:limit]
+        elif evaluation_type == 'rag':
+            return loader.load_rag_scenarios()[:limit]
+        elif evaluation_type == 'tool_calling':
+            return loader.load_tool_calling_scenarios()[:limit]
+        return loader.load_general_tests()[:limit]
+
     @app.route('/api/evaluate/batch', methods=['POST'])
     def evaluate_batch():
-        """Run batch evaluation — runs in background thread, returns 202."""
+        """Queue a batch evaluation — returns 202; poll status or stream events."""
         data = request.get_json() or {}
         run_id = _normalize_run_id(data.get('run_id') if data else None)
         _cleanup_run_logs()
@@ -1164,372 +1325,273 @@ def create_app(config_path: str = None) -> Flask:
         evaluation_type = data.get('type', 'classification')
         limit = min(data.get('limit', 10), 100)  # Cap at 100 to prevent abuse
 
-        try:
-            _register_job()
-        except RuntimeError as e:
-            return jsonify({'error': str(e), 'run_id': run_id}), 409
-
         # Detect realtime models — they route through RealtimeEvaluator
         # (TTS → WebSocket) instead of the text chat/completions path.
         _client = get_client()
         _model_cfg = _client.models.get(model_name) if _client else None
         is_realtime = _model_cfg is not None and _model_cfg.backend == "realtime"
 
+        # Fail fast in the request rather than queueing a job that cannot run
         if is_realtime:
-            rt_evaluator = get_realtime_evaluator()
-            if not rt_evaluator:
-                _unregister_job()
+            if not get_realtime_evaluator():
                 return jsonify({
                     'error': 'Realtime evaluator not available — check realtime settings in settings.yaml',
                     'run_id': run_id,
                 }), 500
         else:
-            evaluator = get_evaluator()
-            if not evaluator:
-                _unregister_job()
+            if not get_evaluator():
                 return jsonify({'error': 'Evaluator not available', 'run_id': run_id}), 500
-
-        # Pre-load data in the request thread (fast, needs user context).
-        # Realtime models load their own data inside RealtimeEvaluator,
-        # so skip pre-loading for them.
-        scenarios = None
-        if not is_realtime:
-            loader = get_data_loader()
             try:
-                if evaluation_type == 'classification':
-                    scenarios = loader.load_classification_scenarios()[:limit]
-                elif evaluation_type == 'dialog':
-                    scenarios = loader.load_dialog_scenarios()[:limit]
-                elif evaluation_type == 'rag':
-                    scenarios = loader.load_rag_scenarios()[:limit]
-                elif evaluation_type == 'tool_calling':
-                    scenarios = loader.load_tool_calling_scenarios()[:limit]
-                else:
-                    scenarios = loader.load_general_tests()[:limit]
+                _load_scenarios(evaluation_type, limit)
             except Exception as e:
-                _unregister_job()
                 return jsonify({'error': str(e), 'run_id': run_id}), 400
 
-        results_dir = str(_get_user_context().results_dir)
-
-        # Register job as running
-        with _batch_jobs_lock:
-            _batch_jobs[run_id] = {
-                'status': 'running',
-                'result': None,
-                'error': None,
-                'error_type': None,
-                'created': time.time(),
-            }
+        return _submit_job('evaluate_batch', run_id, {
+            'model': model_name,
+            'type': evaluation_type,
+            'limit': limit,
+        })
 
-        def _bg_batch():
-            """Background worker — runs evaluation and stores result."""
-            token = _current_run_id.set(run_id)
-            try:
-                if is_realtime:
-                    # Realtime path: TTS → WebSocket (uses RealtimeEvaluator)
-                    import asyncio
-                    result = asyncio.run(
-                        rt_evaluator.evaluate_async(model_name, evaluation_type)
-                    )
-                elif evaluation_type == 'classification':
-                    result = evaluator.evaluate_classification(model_name, scenarios)
-                elif evaluation_type == 'dialog':
-                    result = evaluator.evaluate_dialog(model_name, scenarios)
-                elif evaluation_type == 'rag':
-                    result = evaluator.evaluate_rag(model_name, scenarios)
-                elif evaluation_type == 'tool_calling':
-                    result = evaluator.evaluate_tool_calling(model_name, scenarios)
-                else:
-                    result = evaluator.evaluate_general(model_name, scenarios)
+    def _job_evaluate_batch(ctx):
+        """Job handler — runs the evaluation and saves the result."""
+        model_name = ctx.params['model']
+        evaluation_type = ctx.params['type']
+        client = get_client()
+        model_cfg = client.models.get(model_name) if client else None
 
-                # Auto-save results to disk
-                try:
-                    result.save(results_dir)
-                    logging.getLogger(__name__).info(
-                        f"Auto-saved {evaluation_type} result for {model_name}"
-                    )
-                except Exception as save_err:
-                    logging.getLogger(__name__).warning(f"Failed to auto-save result: {save_err}")
-
-                result_dict = result.to_dict()
-                ts = result.timestamp.replace(':', '-')
-                result_dict['saved_filename'] = f"{model_name}_{evaluation_type}_{ts}.json"
-                result_dict['run_id'] = run_id
-                with _batch_jobs_lock:
-                    _batch_jobs[run_id]['status'] = 'completed'
-                    _batch_jobs[run_id]['result'] = result_dict
-            except MissingPromptsError as exc:
-                logging.getLogger(__name__).warning(
-                    f"Missing prompts for {model_name}/{evaluation_type}: {exc}"
-                )
-                with _batch_jobs_lock:
-                    _batch_jobs[run_id]['status'] = 'failed'
-                    _batch_jobs[run_id]['error'] = str(exc)
-                    _batch_jobs[run_id]['error_type'] = 'missing_prompts'
-            except Exception as exc:
-                logging.getLogger(__name__).error(f"Batch evaluation failed: {exc}")
-                with _batch_jobs_lock:
-                    _batch_jobs[run_id]['status'] = 'failed'
-                    _batch_jobs[run_id]['error'] = str(exc)
-            finally:
-                _unregister_job()
-                _current_run_id.reset(token)
+        if model_cfg is not None and model_cfg.backend == "realtime":
+            # Realtime path: TTS → WebSocket (uses RealtimeEvaluator)
+            rt_evaluator = get_realtime_evaluator()
+            if not rt_evaluator:
+                raise JobFailed('Realtime evaluator not available — check realtime settings in settings.yaml')
+            import asyncio
+            result = asyncio.run(
+                rt_evaluator.evaluate_async(model_name, evaluation_type)
+            )
+        else:
+            evaluator = get_evaluator()
+            if not evaluator:
+                raise JobFailed('Evaluator not available')
+            scenarios = _load_scenarios(evaluation_type, ctx.params.get('limit', 10))
+            ctx.check_cancelled()
+            if evaluation_type == 'classification':
+                result = evaluator.evaluate_classification(model_name, scenarios)
+            elif evaluation_type == 'dialog':
+                result = evaluator.evaluate_dialog(model_name, scenarios)
+            elif evaluation_type == 'rag':
+                result = evaluator.evaluate_rag(model_name, scenarios)
+            elif evaluation_type == 'tool_calling':
+                result = evaluator.evaluate_tool_calling(model_name, scenarios)
+            else:
+                result = evaluator.evaluate_general(model_name, scenarios)
 
-        thread = threading.Thread(target=_bg_batch, daemon=True)
-        thread.start()
+        # Auto-save results to disk
+        try:
+            result.save(str(_get_user_context().results_dir))
+            logging.getLogger(__name__).info(
+                f"Auto-saved {evaluation_type} result for {model_name}"
+            )
+        except Exception as save_err:
+            logging.getLogger(__name__).warning(f"Failed to auto-save result: {save_err}")
 
-        return jsonify({'status': 'running', 'run_id': run_id}), 202
+        result_dict = result.to_dict()
+        ts = result.timestamp.replace(':', '-')
+        result_dict['saved_filename'] = f"{model_name}_{evaluation_type}_{ts}.json"
+        result_dict['run_id'] = ctx.run_id
+        return result_dict
 
     @app.route('/api/evaluate/batch/<run_id>/status')
     def batch_status(run_id: str):
         """Poll batch evaluation job status; returns result payload when complete."""
         rid = _normalize_run_id(run_id)
-        with _batch_jobs_lock:
-            job = _batch_jobs.get(rid)
+        job = _owned_job(rid)
         if not job:
             return jsonify({'status': 'not_found', 'run_id': rid}), 404
-
-        resp = {'status': job['status'], 'run_id': rid}
-        if job['status'] == 'completed':
-            resp['result'] = job['result']
-        elif job['status'] == 'failed':
-            resp['error'] = job['error']
-            if job.get('error_type'):
-                resp['error_type'] = job['error_type']
-        return jsonify(resp)
+        return jsonify(_job_status_payload(job))
             
     @app.route('/api/compare', methods=['POST'])
     def compare_models():
-        """Compare two models — runs in background thread, returns 202."""
+        """Queue a comparison of two models — returns 202."""
         data = request.get_json() or {}
         run_id = _normalize_run_id(data.get('run_id') if data else None)
         _cleanup_run_logs()
-        model_a = data.get('model_a', 'gpt4')
-        model_b = data.get('model_b', 'gpt5')
-        evaluation_type = data.get('type', 'classification')
-        include_foundry = bool(data.get('include_foundry', False))
+        adaptive = data.get('adaptive')
 
-        try:
-            _register_job()
-        except RuntimeError as e:
-            return jsonify({'error': str(e), 'run_id': run_id}), 409
-
-        comparator = get_comparator()
-        if not comparator:
-            _unregister_job()
+        if not get_comparator():
             return jsonify({'error': 'Comparator not available', 'run_id': run_id}), 500
 
-        results_dir = str(_get_user_context().results_dir)
-        # Capture user_id for background thread
-        _bg_user_id = session.get('user_id')
-
-        # Register job as running
-        with _compare_jobs_lock:
-            _compare_jobs[run_id] = {
-                'status': 'running',
-                'result': None,
-                'error': None,
-                'created': time.time(),
-            }
-
-        def _bg_compare():
-            """Background worker — sets run_id context so logs stream correctly."""
-            # Restore user context for this thread
-            _uctx = UserContext(user_id=_bg_user_id, base_dir='data/users')
-            token = _current_run_id.set(run_id)
-            try:
-                report = comparator.compare_models(
-                    model_a=model_a,
-                    model_b=model_b,
-                    evaluation_type=evaluation_type,
-                    include_foundry=include_foundry,
-                )
-                # Auto-save comparison results to disk
-                try:
-                    report.save(results_dir)
-                    logging.getLogger(__name__).info(
-                        f"Auto-saved comparison {model_a} vs {model_b} ({evaluation_type})"
-                    )
-                except Exception as save_err:
-                    logging.getLogger(__name__).warning(
-                        f"Failed to auto-save comparison: {save_err}"
-                    )
-
-                payload = report.to_dict()
-                payload['run_id'] = run_id
-                ts = report.timestamp.replace(':', '-')
-                payload['saved_filename'] = f"comparison_{model_a}_vs_{model_b}_{evaluation_type}_{ts}.json"
-                with _compare_jobs_lock:
-                    _compare_jobs[run_id]['status'] = 'completed'
-                    _compare_jobs[run_id]['result'] = payload
-            except Exception as exc:
-                logging.getLogger(__name__).error(f"Comparison failed: {exc}")
-                with _compare_jobs_lock:
-                    _compare_jobs[run_id]['status'] = 'failed'
-                    _compare_jobs[run_id]['error'] = str(exc)
-            finally:
-                _unregister_job()
-                _current_run_id.reset(token)
+        return _submit_job('compare', run_id, {
+            'model_a': data.get('model_a', 'gpt4'),
+            'model_b': data.get('model_b', 'gpt5'),
+            'type': data.get('type', 'classification'),
+            'include_foundry': bool(data.get('include_foundry', False)),
+            'force_fresh': bool(data.get('force_fresh', False)),
+            'adaptive': None if adaptive is None else bool(adaptive),
+        })
 
-        thread = threading.Thread(target=_bg_compare, daemon=True)
-        thread.start()
+    def _job_compare(ctx):
+        """Job handler — runs the comparison and saves the report."""
+        p = ctx.params
+        model_a, model_b, evaluation_type = p['model_a'], p['model_b'], p['type']
+        comparator = get_comparator()
+        if not comparator:
+            raise JobFailed('Comparator not available')
+        report = comparator.compare_models(
+            model_a=model_a,
+            model_b=model_b,
+            evaluation_type=evaluation_type,
+            include_foundry=p.get('include_foundry', False),
+            force_fresh=p.get('force_fresh', False),
+            adaptive=p.get('adaptive'),
+        )
+        # Auto-save comparison results to disk
+        try:
+            report.save(str(_get_user_context().results_dir))
+            logging.getLogger(__name__).info(
+                f"Auto-saved comparison {model_a} vs {model_b} ({evaluation_type})"
+            )
+        except Exception as save_err:
+            logging.getLogger(__name__).warning(
+                f"Failed to auto-save comparison: {save_err}"
+            )
 
-        return jsonify({'status': 'running', 'run_id': run_id}), 202
+        payload = report.to_dict()
+        payload['run_id'] = ctx.run_id
+        ts = report.timestamp.replace(':', '-')
+        payload['saved_filename'] = f"comparison_{model_a}_vs_{model_b}_{evaluation_type}_{ts}.json"
+        return payload
 
     @app.route('/api/compare/<run_id>/status')
     def compare_status(run_id: str):
         """Poll comparison job status; returns result payload when complete."""
         rid = _normalize_run_id(run_id)
-        with _compare_jobs_lock:
-            job = _compare_jobs.get(rid)
+        job = _owned_job(rid)
         if not job:
             return jsonify({'status': 'not_found', 'run_id': rid}), 404
-
-        resp = {'status': job['status'], 'run_id': rid}
-        if job['status'] == 'completed':
-            resp['result'] = job['result']
-        elif job['status'] == 'failed':
-            resp['error'] = job['error']
-        return jsonify(resp)
+        return jsonify(_job_status_payload(job))
 
     # ── Batch comparison (Model A vs multiple Model B's) ─────────────
 
     @app.route('/api/compare/batch', methods=['POST'])
     def compare_models_batch():
-        """Compare model_a against a list of model_b's — background thread, returns 202.
+        """Queue model_a against a list of model_b's — returns 202.
 
         Request body:
             model_a:        str
             model_b_list:   list[str]   (≥1 models)
             type:           str         evaluation type
             include_foundry: bool
+            force_fresh:    bool        re-run even if inputs are unchanged
             run_id:         str|null
         """
         data = request.get_json() or {}
         run_id = _normalize_run_id(data.get('run_id'))
         _cleanup_run_logs()
-        model_a = data.get('model_a', 'gpt4')
         model_b_list = data.get('model_b_list', [])
-        evaluation_type = data.get('type', 'classification')
-        include_foundry = bool(data.get('include_foundry', False))
 
         if not model_b_list or not isinstance(model_b_list, list):
             return jsonify({'error': 'model_b_list must be a non-empty list', 'run_id': run_id}), 400
 
-        try:
-            _register_job()
-        except RuntimeError as e:
-            return jsonify({'error': str(e), 'run_id': run_id}), 409
-
-        comparator = get_comparator()
-        if not comparator:
-            _unregister_job()
+        if not get_comparator():
             return jsonify({'error': 'Comparator not available', 'run_id': run_id}), 500
 
-        results_dir = str(_get_user_context().results_dir)
-        _bg_user_id = session.get('user_id')
-
-        # Register batch job
-        with _compare_jobs_lock:
-            _compare_jobs[run_id] = {
-                'status': 'running',
-                'mode': 'batch',
-                'total': len(model_b_list),
-                'completed': 0,
-                'current_model_b': None,
-                'results': {mb: {'status': 'pending'} for mb in model_b_list},
-                'error': None,
-                'created': time.time(),
-            }
+        return _submit_job('compare_batch', run_id, {
+            'model_a': data.get('model_a', 'gpt4'),
+            'model_b_list': model_b_list,
+            'type': data.get('type', 'classification'),
+            'include_foundry': bool(data.get('include_foundry', False)),
+            'force_fresh': bool(data.get('force_fresh', False)),
+        }, mode='batch', total=len(model_b_list))
 
-        def _bg_batch_compare():
-            _uctx = UserContext(user_id=_bg_user_id, base_dir='data/users')
-            token = _current_run_id.set(run_id)
-            try:
-                def _progress(completed_idx, total, current_mb, report, *, starting=False):
-                    with _compare_jobs_lock:
-                        job = _compare_jobs.get(run_id)
-                        if not job:
-                            return
-                        job['current_model_b'] = current_mb
-                        if starting:
-                            # Only update which model is being compared;
-                            # don't touch completed count or results yet.
-                            return
-                        job['completed'] = completed_idx
-                        if report is not None:
-                            try:
-                                report.save(results_dir)
-                                logging.getLogger(__name__).info(
-                                    f"Auto-saved batch comparison {model_a} vs {current_mb} ({evaluation_type})"
-                                )
-                            except Exception as save_err:
-                                logging.getLogger(__name__).warning(
-                                    f"Failed to auto-save batch comparison: {save_err}"
-                                )
-                            rdict = report.to_dict()
-                            ts_b = report.timestamp.replace(':', '-')
-                            rdict['saved_filename'] = f"comparison_{model_a}_vs_{current_mb}_{evaluation_type}_{ts_b}.json"
-                            job['results'][current_mb] = {
-                                'status': 'completed',
-                                'report': rdict,
-                            }
-                        else:
-                            job['results'][current_mb] = {
-                                'status': 'failed',
-                            }
+    def _job_compare_batch(ctx):
+        """Job handler — compares each candidate, saving reports as they finish.
 
-                reports = comparator.compare_models_batch(
-                    model_a=model_a,
-                    model_b_list=model_b_list,
-                    evaluation_type=evaluation_type,
-                    include_foundry=include_foundry,
-                    progress_callback=_progress,
-                )
-
-                with _compare_jobs_lock:
-                    _compare_jobs[run_id]['status'] = 'completed'
-            except Exception as exc:
-                logging.getLogger(__name__).error(f"Batch comparison failed: {exc}")
-                with _compare_jobs_lock:
-                    _compare_jobs[run_id]['status'] = 'failed'
-                    _compare_jobs[run_id]['error'] = str(exc)
-            finally:
-                _unregister_job()
-                _current_run_id.reset(token)
+        Per-candidate progress is kept in the job's ``progress`` so any
+        replica can answer the batch status endpoint.
+        """
+        p = ctx.params
+        model_a, model_b_list, evaluation_type = p['model_a'], p['model_b_list'], p['type']
+        comparator = get_comparator()
+        if not comparator:
+            raise JobFailed('Comparator not available')
+        results_dir = str(_get_user_context().results_dir)
+        progress_lock = threading.Lock()
+        ctx.progress(
+            mode='batch',
+            total=len(model_b_list),
+            completed=0,
+            current_model_b=None,
+            results={mb: {'status': 'pending'} for mb in model_b_list},
+        )
 
-        thread = threading.Thread(target=_bg_batch_compare, daemon=True)
-        thread.start()
+        def _progress(completed_idx, total, current_mb, report, *, starting=False):
+            with progress_lock:
+                results = ctx.job.progress['results']
+                if starting:
+                    # Only update which model is being compared;
+                    # don't touch completed count or results yet.
+                    ctx.progress(current_model_b=current_mb)
+                    return
+                if report is not None:
+                    try:
+                        report.save(results_dir)
+                        logging.getLogger(__name__).info(
+                            f"Auto-saved batch comparison {model_a} vs {current_mb} ({evaluation_type})"
+                        )
+                    except Exception as save_err:
+                        logging.getLogger(__name__).warning(
+                            f"Failed to auto-save batch comparison: {save_err}"
+                        )
+                    rdict = report.to_dict()
+                    ts_b = report.timestamp.replace(':', '-')
+                    rdict['saved_filename'] = f"comparison_{model_a}_vs_{current_mb}_{evaluation_type}_{ts_b}.json"
+                    results[current_mb] = {
+                        'status': report.status,  # 'cancelled' for a partial report
+                        'report': rdict,
+                    }
+                else:
+                    results[current_mb] = {
+                        'status': 'cancelled' if ctx.cancelled else 'failed',
+                    }
+                ctx.progress(current_model_b=current_mb, completed=completed_idx, results=results)
+            run_events.bus.publish(ctx.run_id, 'progress', {
+                'model_b': current_mb,
+                'completed': completed_idx,
+                'total': total,
+                'status': results[current_mb]['status'],
+            })
 
-        return jsonify({
-            'status': 'running',
-            'run_id': run_id,
-            'mode': 'batch',
-            'total': len(model_b_list),
-        }), 202
+        comparator.compare_models_batch(
+            model_a=model_a,
+            model_b_list=model_b_list,
+            evaluation_type=evaluation_type,
+            include_foundry=p.get('include_foundry', False),
+            progress_callback=_progress,
+            force_fresh=p.get('force_fresh', False),
+        )
+        return None
 
     @app.route('/api/compare/batch/<run_id>/status')
     def compare_batch_status(run_id: str):
         """Poll batch comparison job status with per-model progress."""
         rid = _normalize_run_id(run_id)
-        with _compare_jobs_lock:
-            job = _compare_jobs.get(rid)
+        job = _owned_job(rid)
         if not job:
             return jsonify({'status': 'not_found', 'run_id': rid}), 404
-        if job.get('mode') != 'batch':
+        if job.kind != 'compare_batch':
             return jsonify({'status': 'not_found', 'run_id': rid, 'error': 'Not a batch job'}), 404
 
+        progress = job.progress or {}
         resp = {
-            'status': job['status'],
+            'status': job.status,
             'run_id': rid,
-            'total': job.get('total', 0),
-            'completed': job.get('completed', 0),
-            'current_model_b': job.get('current_model_b'),
-            'results': job.get('results', {}),
+            'total': progress.get('total', len(job.params.get('model_b_list', []))),
+            'completed': progress.get('completed', 0),
+            'current_model_b': progress.get('current_model_b'),
+            'results': progress.get('results', {}),
         }
-        if job['status'] == 'failed' and job.get('error'):
-            resp['error'] = job['error']
+        if job.status in ('failed', 'cancelled') and job.error:
+            resp['error'] = job.error
         return jsonify(resp)
             
     @app.route('/api/prompts/<model>/<prompt_type>')
@@ -1677,103 +1739,64 @@ def create_app(config_path: str = None) -> Flask:
 
     @app.route('/api/prompts/generate', methods=['POST'])
     def generate_prompts():
-        """AI-generate prompts + test data — runs in background thread, returns 202."""
+        """Queue AI generation of prompts + test data — returns 202."""
         data = request.get_json() or {}
         run_id = _normalize_run_id(data.get('run_id'))
         _cleanup_run_logs()
         topic = data.get('topic', '')
-        generator_model = data.get('generator_model', 'gpt5')
-        target_models = data.get('target_models')  # Optional list of model keys
-        data_counts = data.get('data_counts')       # Optional {type: int} overrides
-        instructions = data.get('instructions', '')  # Optional custom instructions
         scope = data.get('scope', 'all')            # "all" | "prompts_only" | "data_only"
         if scope not in ('all', 'prompts_only', 'data_only'):
             scope = 'all'
         if not topic:
             return jsonify({'error': 'topic is required'}), 400
-        try:
-            _register_job()
-        except RuntimeError as e:
-            return jsonify({'error': str(e), 'run_id': run_id}), 409
-
-        client = get_client()
-        if not client:
-            _unregister_job()
+        if not get_client():
             return jsonify({'error': 'Client not configured'}), 500
 
-        # Capture user references for background thread
-        _bg_user_id_gen = session.get('user_id')
-        _bg_user_data_dir = str(_get_user_context().data_dir)
-        _bg_prompt_manager = get_prompt_manager()
-        _bg_prompt_loader = get_prompt_loader()
-        _bg_data_loader = get_data_loader()
-
-        with _generate_jobs_lock:
-            _generate_jobs[run_id] = {
-                'status': 'running',
-                'result': None,
-                'error': None,
-                'created': time.time(),
-            }
-
-        def _bg_generate():
-            """Background worker for prompt + test data generation."""
-            token = _current_run_id.set(run_id)
-            try:
-                manager = _bg_prompt_manager
-                results = manager.generate_prompts(
-                    topic=topic,
-                    client=client,
-                    generator_model=generator_model,
-                    data_dir=_bg_user_data_dir,
-                    target_models=target_models,
-                    data_counts=data_counts,
-                    scope=scope,
-                    instructions=instructions,
-                )
-                # Invalidate caches so new content is picked up
-                _bg_prompt_loader._cache.clear()
-                _bg_data_loader.clear_cache()
-                payload = {
-                    'status': 'generated',
-                    'topic': topic,
-                    'scope': scope,
-                    'prompts': results.get('prompts', {}),
-                    'data': results.get('data', {}),
-                    'run_id': run_id,
-                }
-                with _generate_jobs_lock:
-                    _generate_jobs[run_id]['status'] = 'completed'
-                    _generate_jobs[run_id]['result'] = payload
-            except Exception as exc:
-                logging.getLogger(__name__).error(f"Generation failed: {exc}")
-                with _generate_jobs_lock:
-                    _generate_jobs[run_id]['status'] = 'failed'
-                    _generate_jobs[run_id]['error'] = str(exc)
-            finally:
-                _unregister_job()
-                _current_run_id.reset(token)
-
-        thread = threading.Thread(target=_bg_generate, daemon=True)
-        thread.start()
+        return _submit_job('generate', run_id, {
+            'topic': topic,
+            'generator_model': data.get('generator_model', 'gpt5'),
+            'target_models': data.get('target_models'),  # Optional list of model keys
+            'data_counts': data.get('data_counts'),      # Optional {type: int} overrides
+            'instructions': data.get('instructions', ''),  # Optional custom instructions
+            'scope': scope,
+        })
 
-        return jsonify({'status': 'running', 'run_id': run_id}), 202
+    def _job_generate(ctx):
+        """Job handler for prompt + test data generation."""
+        p = ctx.params
+        client = get_client()
+        if not client:
+            raise JobFailed('Client not configured')
+        results = get_prompt_manager().generate_prompts(
+            topic=p['topic'],
+            client=client,
+            generator_model=p.get('generator_model', 'gpt5'),
+            data_dir=str(_get_user_context().data_dir),
+            target_models=p.get('target_models'),
+            data_counts=p.get('data_counts'),
+            scope=p.get('scope', 'all'),
+            instructions=p.get('instructions', ''),
+        )
+        # Invalidate caches so new content is picked up
+        get_prompt_loader()._cache.clear()
+        get_data_loader().clear_cache()
+        return {
+            'status': 'generated',
+            'topic': p['topic'],
+            'scope': p.get('scope', 'all'),
+            'prompts': results.get('prompts', {}),
+            'data': results.get('data', {}),
+            'run_id': ctx.run_id,
+        }
 
     @app.route('/api/prompts/generate/<run_id>/status')
     def generate_status(run_id: str):
         """Poll generation job status; returns result payload when complete."""
         rid = _normalize_run_id(run_id)
-        with _generate_jobs_lock:
-            job = _generate_jobs.get(rid)
+        job = _owned_job(rid)
         if not job:
             return jsonify({'status': 'not_found', 'run_id': rid}), 404
-
-        resp = {'status': job['status'], 'run_id': rid}
-        if job['status'] == 'completed':
-            resp['result'] = job['result']
-        elif job['status'] == 'failed':
-            resp['error'] = job['error']
-        return jsonify(resp)
+        return jsonify(_job_status_payload(job))
             
     # =========================================================================
     # Data Sync (auto-review synthetic data when topic changes)
@@ -1791,185 +1814,159 @@ def create_app(config_path: str = None) -> Flask:
 
     @app.route('/api/data/regenerate', methods=['POST'])
     def regenerate_test_data():
-        """Regenerate synthetic test data — runs in background thread, returns 202."""
+        """Queue regeneration of synthetic test data — returns 202."""
         data = request.get_json() or {}
         run_id = _normalize_run_id(data.get('run_id'))
         _cleanup_run_logs()
-        topic = data.get('topic')
-        generator_model = data.get('generator_model', 'gpt5')
-        data_counts = data.get('data_counts')  # Optional {type: int} overrides
+        if not get_client():
+            return jsonify({'error': 'Client not configured'}), 500
 
-        try:
-            _register_job()
-        except RuntimeError as e:
-            return jsonify({'error': str(e), 'run_id': run_id}), 409
+        return _submit_job('regenerate', run_id, {
+            'topic': data.get('topic'),
+            'generator_model': data.get('generator_model', 'gpt5'),
+            'data_counts': data.get('data_counts'),  # Optional {type: int} overrides
+        })
 
+    def _job_regenerate(ctx):
+        """Job handler for test data regeneration."""
+        p = ctx.params
         client = get_client()
         if not client:
-            _unregister_job()
-            return jsonify({'error': 'Client not configured'}), 500
-
-        # Capture user references for background thread
-        _bg_user_id_regen = session.get('user_id')
-        _bg_user_data_dir_regen = str(_get_user_context().data_dir)
-        _bg_prompt_manager_regen = get_prompt_manager()
-        _bg_data_loader_regen = get_data_loader()
-
-        # Register job as running
-        with _regenerate_jobs_lock:
-            _regenerate_jobs[run_id] = {
-                'status': 'running',
-                'result': None,
-                'error': None,
-                'created': time.time(),
-            }
-
-        def _bg_regenerate():
-            """Background worker for test data regeneration."""
-            token = _current_run_id.set(run_id)
-            try:
-                manager = _bg_prompt_manager_regen
-                result = manager.regenerate_test_data(
-                    client=client,
-                    generator_model=generator_model,
-                    data_dir=_bg_user_data_dir_regen,
-                    topic=topic,
-                    data_counts=data_counts,
-                )
-                if 'error' in result and isinstance(result.get('error'), str):
-                    with _regenerate_jobs_lock:
-                        _regenerate_jobs[run_id]['status'] = 'failed'
-                        _regenerate_jobs[run_id]['error'] = result['error']
-                    return
-                # Invalidate data loader cache
-                _bg_data_loader_regen.clear_cache()
-                payload = {'status': 'regenerated', 'data': result, 'run_id': run_id}
-                with _regenerate_jobs_lock:
-                    _regenerate_jobs[run_id]['status'] = 'completed'
-                    _regenerate_jobs[run_id]['result'] = payload
-            except Exception as exc:
-                logging.getLogger(__name__).error(f"Regeneration failed: {exc}")
-                with _regenerate_jobs_lock:
-                    _regenerate_jobs[run_id]['status'] = 'failed'
-                    _regenerate_jobs[run_id]['error'] = str(exc)
-            finally:
-                _unregister_job()
-                _current_run_id.reset(token)
-
-        thread = threading.Thread(target=_bg_regenerate, daemon=True)
-        thread.start()
-
-        return jsonify({'status': 'running', 'run_id': run_id}), 202
+            raise JobFailed('Client not configured')
+        result = get_prompt_manager().regenerate_test_data(
+            client=client,
+            generator_model=p.get('generator_model', 'gpt5'),
+            data_dir=str(_get_user_context().data_dir),
+            topic=p.get('topic'),
+            data_counts=p.get('data_counts'),
+        )
+        if 'error' in result and isinstance(result.get('error'), str):
+            raise JobFailed(result['error'])
+        # Invalidate data loader cache
+        get_data_loader().clear_cache()
+        return {'status': 'regenerated', 'data': result, 'run_id': ctx.run_id}
 
     @app.route('/api/data/regenerate/<run_id>/status')
     def regenerate_status(run_id: str):
         """Poll regeneration job status; returns result payload when complete."""
         rid = _normalize_run_id(run_id)
-        with _regenerate_jobs_lock:
-            job = _regenerate_jobs.get(rid)
+        job = _owned_job(rid)
         if not job:
             return jsonify({'status': 'not_found', 'run_id': rid}), 404
+        return jsonify(_job_status_payload(job))
+
+    # ── Job queue: runner, worker pool, listing, cancellation ────────
+
+    _job_handlers = {
+        'evaluate_batch': _job_evaluate_batch,
+        'compare': _job_compare,
+        'compare_batch': _job_compare_batch,
+        'generate': _job_generate,
+        'regenerate': _job_regenerate,
+    }
+
+    def _run_job(ctx):
+        """Execute a claimed job as its owner (same getters as a request)."""
+        handler = _job_handlers.get(ctx.job.kind)
+        if handler is None:
+            raise JobFailed(f"Unknown job kind: {ctx.job.kind}")
+        with app.test_request_context():
+            g._user_context = UserContext(user_id=ctx.user_id, base_dir='data/users')
+            token = _current_run_id.set(ctx.run_id)
+            try:
+                _publish_job_status(ctx.run_id)
+                ctx.check_cancelled()
+                return handler(ctx)
+            except MissingPromptsError as exc:
+                logging.getLogger(__name__).warning(f"Missing prompts for job {ctx.run_id}: {exc}")
+                raise JobFailed(str(exc), error_type='missing_prompts')
+            finally:
+                _current_run_id.reset(token)
 
-        resp = {'status': job['status'], 'run_id': rid}
-        if job['status'] == 'completed':
-            resp['result'] = job['result']
-        elif job['status'] == 'failed':
-            resp['error'] = job['error']
-        return jsonify(resp)
+    job_pool = JobWorkerPool(
+        job_store,
+        _run_job,
+        max_workers=int(_jobs_cfg.get('workers', 4)) if job_workers is None else max(1, job_workers),
+        per_user_limit=int(_jobs_cfg.get('per_user_limit', 2)),
+        stale_after=float(_jobs_cfg.get('stale_after_seconds', 120)),
+        retention=float(_jobs_cfg.get('retention_seconds', 86400)),
+        on_finish=_publish_job_status,
+    )
+    app.extensions['jobs'] = {'store': job_store, 'pool': job_pool}
+    if job_workers is None and int(_jobs_cfg.get('workers', 4)) > 0:
+        job_pool.start()
+
+    @app.route('/api/jobs')
+    def list_jobs():
+        """The current user's recent jobs (newest first)."""
+        try:
+            limit = min(int(request.args.get('limit', 50)), 200)
+        except ValueError:
+            limit = 50
+        jobs = job_store.list_for_user(_get_user_context().user_id, limit=limit)
+        return jsonify({'jobs': [j.to_dict() for j in jobs]})
+
+    @app.route('/api/jobs/<run_id>/cancel', methods=['POST'])
+    def cancel_job(run_id: str):
+        """Cancel a job.
+
+        A queued job is cancelled at once.  A running job's scenario
+        requests are cancelled (streams closed) and whatever finished is
+        saved with status ``cancelled``; the job's final status arrives
+        on its status endpoint / event stream shortly after.
+        """
+        rid = _normalize_run_id(run_id)
+        status = job_store.request_cancel(rid, user_id=_get_user_context().user_id)
+        if status is None:
+            return jsonify({'status': 'not_found', 'run_id': rid}), 404
+        if status == 'cancelled':
+            _publish_job_status(rid)
+        elif status == 'running':
+            # Immediate when this process runs it; other workers poll the flag
+            job_pool.cancel(rid)
+        return jsonify({'status': status, 'run_id': rid, 'cancel_requested': status == 'running'})
 
     @app.route('/api/results')
     def list_results():
         """List saved evaluation results.
 
-        Optional query params for pagination:
-          ``?page=1&per_page=20``
-        When *page* is supplied, only that page of results is returned
-        along with ``total``, ``page``, ``per_page``, and ``pages``
-        metadata.  Without pagination params, **all** results are
-        returned (backward-compatible).
+        Served from the per-user results index
+        (``.index/results_index.db``), so filtering, sorting and
+        pagination are indexed queries rather than a scan of every JSON
+        file.
+
+        Optional query params:
+          ``?page=1&per_page=20`` — pagination; when *page* is supplied,
+          only that page is returned along with ``total``, ``page``,
+          ``per_page``, and ``pages`` metadata.  Without it, **all**
+          results are returned (backward-compatible).
+          ``?type=…&model=…&batch_id=…`` — filters
+          ``?sort=saved|timestamp|model|type&order=desc|asc`` — ordering
+          (default: newest saved first)
         """
         results_dir = Path(str(_get_user_context().results_dir))
         if not results_dir.exists():
             return jsonify({'results': [], 'total': 0})
 
-        # Collect JSON result files sorted newest-first by filesystem mtime
-        # (avoids reading every JSON just to sort by timestamp).
-        json_files = sorted(
-            results_dir.glob('*.json'),
-            key=lambda f: f.stat().st_mtime,
-            reverse=True,
-        )
-        total = len(json_files)
+        index = ResultsIndex(str(results_dir))
+        try:
+            index.sync()
+        except Exception as e:
+            app.logger.warning(f"Results index sync failed: {e}")
 
-        # Pagination (optional)
         page_str = request.args.get('page')
         per_page = min(int(request.args.get('per_page', 50)), 200)
-        if page_str is not None:
-            page = max(int(page_str), 1)
-            start = (page - 1) * per_page
-            json_files = json_files[start:start + per_page]
-        else:
-            page = None
-
-        results = []
-        for file in json_files:
-            try:
-                # Read only the first 3 KB — metadata fields (model_name,
-                # evaluation_type, timestamp, model_a/b, foundry URLs) are
-                # always at the top of the JSON, so we avoid parsing the
-                # potentially large raw_results arrays.
-                with open(file, 'rb') as f:
-                    head = f.read(3072)
-                # Complete the truncated JSON so it can be parsed
-                text = head.decode('utf-8', errors='replace')
-                # Try to parse. If the file is small enough, this works directly.
-                # For large files, we'll get a decode error; fall back to regex.
-                try:
-                    data = json.loads(text)
-                except json.JSONDecodeError:
-                    # Extract top-level fields from the partial JSON via simple parsing
-                    import re as _re_local
-                    def _extract(key):
-                        m = _re_local.search(rf'"{key}"\s*:\s*"([^"]*)"', text)
-                        return m.group(1) if m else ''
-                    data = {
-                        'model_name': _extract('model_name'),
-                        'model_a': _extract('model_a'),
-                        'model_b': _extract('model_b'),
-                        'evaluation_type': _extract('evaluation_type'),
-                        'timestamp': _extract('timestamp'),
-                        'foundry_report_url': _extract('foundry_report_url'),
-                        'batch_id': _extract('batch_id'),
-                    }
-
-                model_display = data.get('model_name', 'unknown')
-                if model_display == 'unknown' and 'model_a' in data and data.get('model_a'):
-                    model_display = f"{data['model_a']} vs {data.get('model_b', '?')}"
-                entry = {
-                    'filename': file.name,
-                    'model': model_display,
-                    'type': data.get('evaluation_type', 'unknown'),
-                    'timestamp': data.get('timestamp', ''),
-                }
-                # Include batch_id when available (batch comparisons)
-                bid = data.get('batch_id')
-                if bid:
-                    entry['batch_id'] = bid
-                # Include Foundry report URLs when available
-                if data.get('foundry_report_url'):
-                    entry['foundry_report_url'] = data['foundry_report_url']
-                fm = data.get('foundry_meta') or {}
-                urls = {}
-                for key in ('model_a', 'model_b'):
-                    url = (fm.get(key) or {}).get('report_url')
-                    if url:
-                        urls[key] = url
-                if urls:
-                    entry['foundry_urls'] = urls
-                results.append(entry)
-            except (json.JSONDecodeError, OSError) as e:
-                app.logger.debug(f"Skipping unreadable result file {file.name}: {e}")
-                continue
+        page = max(int(page_str), 1) if page_str is not None else None
+
+        results, total = index.query(
+            evaluation_type=request.args.get('type') or None,
+            model=request.args.get('model') or None,
+            batch_id=request.args.get('batch_id') or None,
+            sort=request.args.get('sort', 'saved'),
+            descending=request.args.get('order', 'desc') != 'asc',
+            limit=per_page if page is not None else None,
+            offset=(page - 1) * per_page if page is not None else 0,
+        )
 
         response: dict = {'results': results, 'total': total}
         if page is not None:
@@ -1990,6 +1987,8 @@ def create_app(config_path: str = None) -> Flask:
             return jsonify({'error': 'Result not found'}), 404
         try:
             file_path.unlink()
+            raw_results_store.sidecar_path(file_path).unlink(missing_ok=True)
+            ResultsIndex(str(results_dir)).remove(safe_name)
             return jsonify({'status': 'deleted', 'filename': safe_name})
         except Exception as e:
             return jsonify({'error': str(e)}), 500
@@ -2008,16 +2007,62 @@ def create_app(config_path: str = None) -> Flask:
         if not file_path.exists() or not file_path.suffix == '.json':
             return jsonify({'error': 'Result not found'}), 404
             
+        # ``?raw=0`` skips per-scenario rows (use /rows to page through them)
+        include_raw = request.args.get('raw', '1') != '0'
         try:
-            with open(file_path, encoding='utf-8') as f:
-                data = json.load(f)
+            data = raw_results_store.load_result(file_path, include_raw=include_raw)
             return jsonify(data)
         except Exception as e:
             return jsonify({'error': str(e)}), 500
 
+    @app.route('/api/results/<filename>/rows')
+    def get_result_rows(filename: str):
+        """Page through a result's per-scenario rows.
+
+        Query params: ``offset`` (default 0), ``limit`` (default 50, max
+        500) and ``columns`` (comma-separated; default all).  Rows come
+        from the columnar sidecar when the result has one, so only the
+        requested columns and row range are read.
+        """
+        safe_name = Path(filename).name
+        if safe_name != filename or '..' in filename:
+            return jsonify({'error': 'Invalid filename'}), 400
+
+        results_dir = Path(str(_get_user_context().results_dir))
+        file_path = results_dir / safe_name
+        if not file_path.exists() or not file_path.suffix == '.json':
+            return jsonify({'error': 'Result not found'}), 404
+
+        offset = max(int(request.args.get('offset', 0)), 0)
+        limit = min(max(int(request.args.get('limit', 50)), 1), 500)
+        columns_arg = request.args.get('columns')
+        columns = [c.strip() for c in columns_arg.split(',') if c.strip()] if columns_arg else None
+
+        try:
+            sidecar = raw_results_store.open_sidecar(file_path)
+            if sidecar is not None:
+                with sidecar:
+                    total = sidecar.num_rows
+                    rows = sidecar.read(offset=offset, limit=limit, columns=columns)
+            else:
+                data = raw_results_store.load_result(file_path)
+                raw = data.get('raw_results') or []
+                total = len(raw)
+                rows = raw[offset:offset + limit]
+                if columns is not None:
+                    rows = [{k: r[k] for k in columns if k in r} for r in rows]
+            return jsonify({'rows': rows, 'total': total, 'offset': offset, 'limit': limit})
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+
     @app.route('/api/results/export/<filename>')
     def export_result(filename: str):
-        """Export a result file as a Power BI-ready .xlsx workbook."""
+        """Export a result file as a Power BI-ready .xlsx workbook.
+
+        The workbook is built in write-only mode (rows flushed to a temp
+        file as they are generated) and streamed to the client in chunks,
+        so memory stays flat regardless of the number of raw results.
+        """
         safe_name = Path(filename).name
         if safe_name != filename or '..' in filename:
             return jsonify({'error': 'Invalid filename'}), 400
@@ -2029,24 +2074,30 @@ def create_app(config_path: str = None) -> Flask:
             return jsonify({'error': 'Result not found'}), 404
 
         try:
-            with open(file_path, encoding='utf-8') as f:
-                data = json.load(f)
+            data = raw_results_store.load_result(file_path, include_raw=False)
 
             is_comparison = safe_name.startswith('comparison_')
             if is_comparison:
-                buf = ExcelExporter.export_comparison(data)
+                chunks = ExcelExporter.stream_comparison(data)
             else:
-                buf = ExcelExporter.export_evaluation(data)
+                sidecar = raw_results_store.open_sidecar(file_path)
+                if sidecar is not None:
+                    with sidecar:
+                        chunks = ExcelExporter.stream_evaluation(
+                            data,
+                            raw_rows=sidecar.iter_rows(columns=ExcelExporter.RAW_RESULT_KEYS),
+                        )
+                else:
+                    chunks = ExcelExporter.stream_evaluation(data)
 
             xlsx_name = safe_name.replace('.json', '.xlsx')
-            return send_file(
-                buf,
+            return Response(
+                stream_with_context(chunks),
                 mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                as_attachment=True,
-                download_name=xlsx_name,
+                headers={'Content-Disposition': f'attachment; filename="{xlsx_name}"'},
             )
         except Exception as e:
-            logger.exception('Excel export failed for %s', safe_name)
+            app.logger.exception('Excel export failed for %s', safe_name)
             return jsonify({'error': str(e)}), 500
 
     # =========================================================================
@@ -2567,10 +2618,11 @@ def create_app(config_path: str = None) -> Flask:
 
     @app.route('/api/topics/lock-status')
     def topic_lock_status():
-        """Return whether the topic can be switched (no running jobs)."""
-        with _active_jobs_lock:
-            running = _active_jobs_count
-            switching = _topic_switching
+        """Return whether the topic can be switched (no queued or running jobs)."""
+        uid = _get_user_context().user_id
+        running = job_store.count_active(uid)
+        with _topic_switch_lock:
+            switching = uid in _topic_switching
         return jsonify({
             'locked': running > 0 or switching,
             'active_jobs': running,
@@ -2580,21 +2632,22 @@ def create_app(config_path: str = None) -> Flask:
     @app.route('/api/topics/activate', methods=['POST'])
     def activate_topic():
         """Switch to a previously archived topic."""
-        nonlocal _topic_switching
         data = request.get_json()
         slug = data.get('slug', '')
         if not slug:
             return jsonify({'error': 'slug is required'}), 400
+        uid = _get_user_context().user_id
+        with _topic_switch_lock:
+            if uid in _topic_switching:
+                return jsonify({'error': 'A topic switch is already in progress.'}), 409
+            # Mark first so no job can be queued between the check and the switch
+            _topic_switching.add(uid)
         try:
-            _check_topic_switchable()
-            with _active_jobs_lock:
-                _topic_switching = True
+            _check_topic_switchable(uid)
             manager = get_prompt_manager()
             meta = manager.activate_topic(slug)
             # Invalidate per-user caches so new content is picked up
-            uid = session.get('user_id')
-            if uid:
-                _invalidate_user(uid)
+            _invalidate_user(uid)
             return jsonify({'status': 'activated', 'topic': meta})
         except RuntimeError as e:
             return jsonify({'error': str(e)}), 409
@@ -2603,8 +2656,8 @@ def create_app(config_path: str = None) -> Flask:
         except Exception as e:
             return jsonify({'error': str(e)}), 500
         finally:
-            with _active_jobs_lock:
-                _topic_switching = False
+            with _topic_switch_lock:
+                _topic_switching.discard(uid)
 
     @app.route('/api/topics/archive', methods=['POST'])
     def archive_topic():
@@ -2647,6 +2700,7 @@ def create_app(config_path: str = None) -> Flask:
         return jsonify({
             'sdk_installed': sdk_available,
             'configured': evaluator is not None,
+            'outstanding_runs': get_run_poller().outstanding() if sdk_available else 0,
             'message': (
                 'Ready' if evaluator
                 else 'SDK not installed — pip install azure-ai-projects>=2.0.0b2'
@@ -2665,10 +2719,16 @@ def create_app(config_path: str = None) -> Flask:
           - raw_results: list of raw result dicts
           - evaluation_type: 'classification' | 'dialog' | 'general'
           - model_name: e.g. 'gpt4'
+          - wait: bool (default true).  When false, returns 202 with
+            eval_id / run_id as soon as the run is created; the shared
+            poller persists the scores into the result file (and results
+            index) when the run finishes.
         """
         data = request.get_json()
         run_id = _normalize_run_id(data.get('run_id') if data else None)
         _cleanup_run_logs()
+        if not _claim_run(run_id):
+            return jsonify({'error': f'Run id {run_id} is in use', 'run_id': run_id}), 409
         token = _current_run_id.set(run_id)
 
         fe = get_foundry_evaluator()
@@ -2685,8 +2745,7 @@ def create_app(config_path: str = None) -> Flask:
                 _current_run_id.reset(token)
                 return jsonify({'error': f'Result file not found: {safe_name}', 'run_id': run_id}), 404
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    result_data = json.load(f)
+                result_data = raw_results_store.load_result(file_path)
                 raw_results = result_data.get('raw_results', [])
                 evaluation_type = result_data.get('evaluation_type', 'classification')
                 model_name = result_data.get('model_name', 'unknown')
@@ -2702,33 +2761,53 @@ def create_app(config_path: str = None) -> Flask:
             _current_run_id.reset(token)
             return jsonify({'error': 'No raw_results to evaluate', 'run_id': run_id}), 400
 
+        wait = bool(data.get('wait', True))
+        fpath = (
+            Path(str(_get_user_context().results_dir)) / Path(result_filename).name
+            if result_filename else None
+        )
+
+        def _persist_scores(result: dict) -> None:
+            """Persist Foundry scores alongside the local result file."""
+            if fpath is None or not result.get('foundry_scores'):
+                return
+            try:
+                if fpath.exists():
+                    with open(fpath, 'r', encoding='utf-8') as f:
+                        saved = json.load(f)
+                    saved['foundry_scores'] = result['foundry_scores']
+                    saved['foundry_eval_id'] = result.get('eval_id')
+                    saved['foundry_run_id'] = result.get('run_id')
+                    saved['foundry_report_url'] = result.get('report_url')
+                    tmp_path = fpath.with_suffix('.json.tmp')
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        json.dump(saved, f, ensure_ascii=False, indent=2)
+                    tmp_path.replace(fpath)
+                    record_saved_result(str(fpath.parent), fpath.name, saved)
+                    app.logger.info(f'Foundry scores persisted to {fpath.name}')
+            except Exception as e:
+                app.logger.warning(f'Failed to persist Foundry scores: {e}')
+
         try:
+            if not wait:
+                submission = fe.start_evaluation(
+                    raw_results=raw_results,
+                    evaluation_type=evaluation_type,
+                    model_name=model_name,
+                    on_complete=_persist_scores,
+                )
+                payload = submission.to_dict()
+                payload['foundry_run_id'] = payload.pop('run_id')
+                payload['run_id'] = run_id
+                return jsonify(payload), 202
+
             result = fe.submit_evaluation(
                 raw_results=raw_results,
                 evaluation_type=evaluation_type,
                 model_name=model_name,
                 poll=True,
             )
-
-            # Persist Foundry scores alongside the local result file
-            if result_filename and result.get('foundry_scores'):
-                try:
-                    safe = Path(result_filename).name
-                    fpath = Path(str(_get_user_context().results_dir)) / safe
-                    if fpath.exists():
-                        with open(fpath, 'r', encoding='utf-8') as f:
-                            saved = json.load(f)
-                        saved['foundry_scores'] = result['foundry_scores']
-                        saved['foundry_eval_id'] = result.get('eval_id')
-                        saved['foundry_run_id'] = result.get('run_id')
-                        saved['foundry_report_url'] = result.get('report_url')
-                        tmp_path = fpath.with_suffix('.json.tmp')
-                        with open(tmp_path, 'w', encoding='utf-8') as f:
-                            json.dump(saved, f, ensure_ascii=False, indent=2)
-                        tmp_path.replace(fpath)
-                        app.logger.info(f'Foundry scores persisted to {safe}')
-                except Exception as e:
-                    app.logger.warning(f'Failed to persist Foundry scores: {e}')
+            _persist_scores(result)
 
             result['run_id'] = run_id
             return jsonify(result)
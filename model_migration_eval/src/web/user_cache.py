@@ -0,0 +1,152 @@
+"""
+Per-User Instance Cache
+=======================
+
+Holds each signed-in user's loaders, evaluator and comparator between
+requests.  Entries live in an ``OrderedDict`` kept in access order, so a
+hit is a ``move_to_end`` and evicting the least-recently-used user is a
+``popitem(last=False)`` — both O(1), with the lock held only for that.
+Users idle for longer than ``ttl_seconds`` are dropped as well (expired
+entries sit at the front of the order, so they are pruned from there).
+
+Components are built outside the cache lock, under a per-user lock, so a
+slow constructor for one user never blocks lookups for another.
+
+Counters (``stats()``): ``hits`` / ``misses`` on user lookups,
+``evictions`` (capacity), ``expirations`` (TTL) and ``rebuilds`` —
+components constructed lazily, which climbs whenever a user's instances
+had to be recreated after eviction, expiry or invalidation.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class UserSlot:
+    """One user's cached components."""
+
+    __slots__ = ("items", "last_access", "lock")
+
+    def __init__(self, now: float):
+        self.items: Dict[str, Any] = {}
+        self.last_access = now
+        self.lock = threading.RLock()  # builders may build other keys of the slot
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.items.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.items
+
+    def __getitem__(self, key: str) -> Any:
+        return self.items[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.items[key] = value
+
+
+class UserInstanceCache:
+    """Bounded LRU of :class:`UserSlot` objects with an idle TTL."""
+
+    def __init__(self, max_users: int = 50, ttl_seconds: Optional[float] = 3600.0):
+        """
+        Args:
+            max_users: Users kept at most; the least recently used is
+                evicted beyond that
+            ttl_seconds: Drop users idle for this long (``None``/0 disables)
+        """
+        self.max_users = max(1, int(max_users))
+        self.ttl_seconds = float(ttl_seconds) if ttl_seconds else None
+        self._slots: "OrderedDict[str, UserSlot]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "rebuilds": 0}
+
+    # ── Lookup ──────────────────────────────────────────────────────────
+
+    def slot(self, uid: str) -> UserSlot:
+        """Return *uid*'s slot, creating it (and evicting) if needed."""
+        now = time.monotonic()
+        with self._lock:
+            slot = self._slots.get(uid)
+            if slot is not None and not self._expired(slot, now):
+                self._slots.move_to_end(uid)
+                slot.last_access = now
+                self._stats["hits"] += 1
+                return slot
+            if slot is not None:
+                del self._slots[uid]
+                self._stats["expirations"] += 1
+            self._prune_expired(now)
+            while len(self._slots) >= self.max_users:
+                self._slots.popitem(last=False)
+                self._stats["evictions"] += 1
+            slot = UserSlot(now)
+            self._slots[uid] = slot
+            self._stats["misses"] += 1
+            return slot
+
+    def get_or_build(self, slot: UserSlot, key: str, factory: Callable[[], Any]) -> Any:
+        """Return ``slot[key]``, building it with *factory* on first use.
+
+        A ``None`` from *factory* is not cached (the next call retries).
+        """
+        value = slot.items.get(key)
+        if value is not None:
+            return value
+        with slot.lock:
+            value = slot.items.get(key)
+            if value is None:
+                value = factory()
+                if value is not None:
+                    slot.items[key] = value
+                    with self._lock:
+                        self._stats["rebuilds"] += 1
+        return value
+
+    # ── Invalidation ────────────────────────────────────────────────────
+
+    def invalidate(self, uid: str) -> None:
+        """Forget everything cached for *uid*."""
+        with self._lock:
+            self._slots.pop(uid, None)
+
+    def discard(self, uid: str, keys: Iterable[str]) -> None:
+        """Drop only *keys* from *uid*'s slot (if cached)."""
+        with self._lock:
+            slot = self._slots.get(uid)
+        if slot is None:
+            return
+        with slot.lock:
+            for key in keys:
+                slot.items.pop(key, None)
+
+    def peek(self, uid: str) -> Optional[UserSlot]:
+        """*uid*'s slot without touching LRU order or counters."""
+        with self._lock:
+            return self._slots.get(uid)
+
+    # ── Introspection ───────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, users=len(self._slots), max_users=self.max_users,
+                        ttl_seconds=self.ttl_seconds)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # ── Internals (caller holds ``_lock``) ──────────────────────────────
+
+    def _expired(self, slot: UserSlot, now: float) -> bool:
+        return self.ttl_seconds is not None and now - slot.last_access > self.ttl_seconds
+
+    def _prune_expired(self, now: float) -> None:
+        # Access order means the stalest users are at the front
+        while self._slots:
+            uid, oldest = next(iter(self._slots.items()))
+            if not self._expired(oldest, now):
+                break
+            del self._slots[uid]
+            self._stats["expirations"] += 1
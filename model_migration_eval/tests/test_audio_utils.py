@@ -0,0 +1,52 @@
+"""Tests for ``src.utils.audio_utils``."""
+
+import base64
+import threading
+
+import pytest
+
+from src.utils import audio_utils
+from src.utils.audio_utils import AudioSegment, TTSAudioCache, _write_atomic
+
+
+def test_concurrent_writers_do_not_share_a_temp_file(tmp_path):
+    path = tmp_path / "clip.pcm16"
+    payloads = [bytes([i]) * 200_000 for i in range(8)]
+    start = threading.Barrier(len(payloads))
+    errors = []
+
+    def _write(data):
+        start.wait()
+        try:
+            for _ in range(20):
+                _write_atomic(path, data)
+        except Exception as exc:  # pragma: no cover - the failure being tested
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_write, args=(p,)) for p in payloads]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert path.read_bytes() in payloads
+    assert [p.name for p in tmp_path.iterdir()] == ["clip.pcm16"]
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    def _fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(audio_utils.os, "replace", _fail)
+    with pytest.raises(OSError):
+        _write_atomic(tmp_path / "clip.b64", b"AAAA")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_round_trip(tmp_path):
+    cache = TTSAudioCache(str(tmp_path / "tts"))
+    cache.put("hello", "alloy", AudioSegment(data=b"\x01\x00" * 2400))
+    hit = cache.get("hello", "alloy")
+    assert bytes(hit.data) == b"\x01\x00" * 2400
+    assert bytes(hit.encoded) == base64.b64encode(b"\x01\x00" * 2400)
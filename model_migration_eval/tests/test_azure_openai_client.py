@@ -0,0 +1,181 @@
+"""Tests for ``src.clients.azure_openai``.
+
+The SDK clients are replaced with in-memory fakes, so no request ever
+leaves the process; ``FakeSDK.calls`` counts what would have been sent.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+
+from src.clients import azure_openai  # noqa: E402
+from src.clients.azure_openai import AzureOpenAIClient, ModelConfig  # noqa: E402
+from src.clients.response_cache import CacheMissError  # noqa: E402
+
+MESSAGES = [{"role": "user", "content": "Classify: my card was charged twice"}]
+
+
+class _Raw:
+    headers: dict = {}
+
+    def __init__(self, content):
+        self._content = content
+
+    def parse(self):
+        usage = SimpleNamespace(
+            prompt_tokens=10, completion_tokens=5, total_tokens=15,
+            prompt_tokens_details=None, completion_tokens_details=None,
+        )
+        message = SimpleNamespace(content=self._content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+class FakeSDK:
+    """Stands in for ``(Async)AzureOpenAI``: counts calls, optionally blocks."""
+
+    def __init__(self, is_async=True):
+        self.calls = []
+        self.gate = None          # asyncio.Event the async create waits on
+        create = self._create_async if is_async else self._create
+        self.chat = SimpleNamespace(completions=SimpleNamespace(
+            with_raw_response=SimpleNamespace(create=create),
+        ))
+
+    def _create(self, **params):
+        self.calls.append(params)
+        return _Raw(f'{{"call": {len(self.calls)}}}')
+
+    async def _create_async(self, **params):
+        self.calls.append(params)
+        number = len(self.calls)
+        if self.gate is not None:
+            await self.gate.wait()
+        return _Raw(f'{{"call": {number}}}')
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(azure_openai, "_HAS_AZURE_IDENTITY", False)
+    c = AzureOpenAIClient(endpoint="https://example.openai.azure.com", api_key="test-key")
+    c.client = FakeSDK(is_async=False)
+    c.async_client = FakeSDK()
+    c.register_model("det", ModelConfig(deployment_name="det", model_version="1", temperature=0, seed=7))
+    c.register_model("sampled", ModelConfig(deployment_name="sampled", model_version="1", temperature=0.7))
+    return c
+
+
+# ── Replay-only cache ───────────────────────────────────────────────────
+
+def test_replay_only_makes_no_network_calls(client, tmp_path):
+    client.enable_caching(str(tmp_path / "cache"))
+    recorded = asyncio.run(client.complete_async(MESSAGES, model_name="det", use_cache=True))
+    assert len(client.async_client.calls) == 1
+
+    client.enable_caching(str(tmp_path / "cache"), replay_only=True)
+    client.async_client = FakeSDK()
+    client.client = FakeSDK(is_async=False)
+
+    async def _rescore():
+        hit = await client.complete_async(MESSAGES, model_name="det", use_cache=True)
+        refused = await asyncio.gather(
+            client.complete_async(MESSAGES, model_name="det", dedupe=False),        # consistency repeat
+            client.complete_async(MESSAGES, model_name="sampled"),                  # multi-run sample
+            client.stream_complete_async(MESSAGES, model_name="det", use_cache=False),
+            client.complete_async([{"role": "user", "content": "new"}], model_name="det", use_cache=True),
+            return_exceptions=True,
+        )
+        return hit, refused
+
+    hit, refused = asyncio.run(_rescore())
+    assert hit.content == recorded.content
+    assert all(isinstance(e, CacheMissError) for e in refused)
+    with pytest.raises(CacheMissError):
+        client.complete(MESSAGES, model_name="det")
+    with pytest.raises(CacheMissError):
+        next(client.stream_complete(MESSAGES, model_name="det"))
+
+    assert client.async_client.calls == []
+    assert client.client.calls == []
+
+
+def test_without_replay_only_uncached_calls_reach_the_api(client, tmp_path):
+    client.enable_caching(str(tmp_path / "cache"))
+    assert not client.replay_only
+    asyncio.run(client.complete_async(MESSAGES, model_name="det", dedupe=False))
+    client.complete(MESSAGES, model_name="det")
+    assert len(client.async_client.calls) == 1
+    assert len(client.client.calls) == 1
+
+
+# ── Single-flight ───────────────────────────────────────────────────────
+
+async def _until(condition, spins=200):
+    """Yield to the loop until *condition()* holds (fails if it never does)."""
+    for _ in range(spins):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+def test_identical_deterministic_calls_share_one_request(client):
+    sdk = client.async_client
+
+    async def _run():
+        sdk.gate = asyncio.Event()
+        tasks = [asyncio.create_task(client.complete_async(MESSAGES, model_name="det")) for _ in range(5)]
+        await _until(lambda: client._deduplicated_requests == 4)
+        sdk.gate.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(_run())
+    assert len(sdk.calls) == 1
+    assert {r.content for r in results} == {'{"call": 1}'}
+    assert client._inflight == {}
+
+
+def test_cancelled_leader_hands_over_to_a_follower(client):
+    sdk = client.async_client
+
+    async def _run():
+        sdk.gate = asyncio.Event()
+        leader = asyncio.create_task(client.complete_async(MESSAGES, model_name="det"))
+        await _until(lambda: len(sdk.calls) == 1)
+        followers = [asyncio.create_task(client.complete_async(MESSAGES, model_name="det")) for _ in range(3)]
+        await _until(lambda: client._deduplicated_requests == 3)
+
+        leader.cancel()
+        # One follower re-issues the request, the others join it
+        await _until(lambda: len(sdk.calls) == 2)
+        sdk.gate.set()
+        results = await asyncio.gather(*followers)
+        return leader, followers, results
+
+    leader, followers, results = asyncio.run(_run())
+    assert leader.cancelled()
+    assert not any(t.cancelled() for t in followers)
+    assert len(sdk.calls) == 2
+    assert {r.content for r in results} == {'{"call": 2}'}
+    assert client._deduplicated_requests == 3
+
+
+@pytest.mark.parametrize("model_name, dedupe", [("sampled", True), ("det", False)])
+def test_non_deterministic_requests_are_not_coalesced(client, model_name, dedupe):
+    sdk = client.async_client
+
+    async def _run():
+        sdk.gate = asyncio.Event()
+        tasks = [
+            asyncio.create_task(client.complete_async(MESSAGES, model_name=model_name, dedupe=dedupe))
+            for _ in range(3)
+        ]
+        await _until(lambda: len(sdk.calls) == 3)
+        sdk.gate.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(_run())
+    assert sorted(r.content for r in results) == ['{"call": 1}', '{"call": 2}', '{"call": 3}']
+    assert client._deduplicated_requests == 0
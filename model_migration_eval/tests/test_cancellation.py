@@ -0,0 +1,224 @@
+"""Tests for ``src.utils.cancellation``."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.utils import cancellation
+from src.utils.cancellation import (
+    CancellationToken,
+    OperationCancelled,
+    cancel_on,
+    gather_partial,
+    scope,
+)
+
+
+# ── Token ───────────────────────────────────────────────────────────────
+
+def test_token_runs_callbacks_once():
+    token = CancellationToken()
+    calls = []
+    token.add_callback(lambda: calls.append("a"))
+    token.add_callback(lambda: calls.append("b"))
+    token.cancel()
+    token.cancel()
+    assert token.cancelled
+    assert calls == ["a", "b"]
+
+
+def test_callback_added_after_cancel_runs_immediately():
+    token = CancellationToken()
+    token.cancel()
+    calls = []
+    token.add_callback(lambda: calls.append(1))()
+    assert calls == [1]
+
+
+def test_unregistered_callback_does_not_run():
+    token = CancellationToken()
+    calls = []
+    unregister = token.add_callback(lambda: calls.append(1))
+    unregister()
+    unregister()
+    token.cancel()
+    assert calls == []
+
+
+def test_failing_callback_does_not_stop_the_others():
+    token = CancellationToken()
+    calls = []
+
+    def _boom():
+        raise RuntimeError("boom")
+
+    token.add_callback(_boom)
+    token.add_callback(lambda: calls.append(1))
+    token.cancel()
+    assert calls == [1]
+
+
+# ── Scope ───────────────────────────────────────────────────────────────
+
+def test_scope_installs_and_restores_the_token():
+    outer, inner = CancellationToken(), CancellationToken()
+    assert cancellation.current() is None
+    with scope(outer):
+        assert cancellation.current() is outer
+        with scope(inner):
+            assert cancellation.current() is inner
+        assert cancellation.current() is outer
+    assert cancellation.current() is None
+
+
+def test_scope_restores_the_token_on_error():
+    with pytest.raises(KeyError):
+        with scope(CancellationToken()):
+            raise KeyError("x")
+    assert cancellation.current() is None
+
+
+def test_raise_if_cancelled_follows_the_current_token():
+    cancellation.raise_if_cancelled()       # no token: no-op
+    token = CancellationToken()
+    with scope(token):
+        assert not cancellation.is_cancelled()
+        cancellation.raise_if_cancelled()
+        token.cancel()
+        assert cancellation.is_cancelled()
+        with pytest.raises(OperationCancelled):
+            cancellation.raise_if_cancelled()
+    assert not cancellation.is_cancelled()
+
+
+def test_scope_is_visible_in_tasks_and_threads_started_inside_it():
+    token = CancellationToken()
+
+    async def _seen():
+        return cancellation.current()
+
+    async def _main():
+        return await asyncio.ensure_future(_seen()), await asyncio.to_thread(cancellation.current)
+
+    with scope(token):
+        assert asyncio.run(_main()) == (token, token)
+
+
+def test_scopes_do_not_leak_between_concurrent_tasks():
+    tokens = [CancellationToken(), CancellationToken()]
+
+    async def _job(token):
+        with scope(token):
+            await asyncio.sleep(0)
+            return cancellation.current()
+
+    async def _main():
+        return await asyncio.gather(*(_job(t) for t in tokens))
+
+    assert asyncio.run(_main()) == tokens
+
+
+# ── gather_partial ──────────────────────────────────────────────────────
+
+async def _value(v, delay=0.0):
+    await asyncio.sleep(delay)
+    return v
+
+
+async def _fail():
+    raise ValueError("bad scenario")
+
+
+def test_gather_partial_without_token_is_gather():
+    async def _main():
+        return await gather_partial([_value(1), _value(2, 0.01), _value(3)])
+
+    assert asyncio.run(_main()) == [1, 2, 3]
+
+
+def test_gather_partial_propagates_errors():
+    async def _main():
+        return await gather_partial([_value(1), _fail()])
+
+    with pytest.raises(ValueError):
+        asyncio.run(_main())
+    with scope(CancellationToken()), pytest.raises(ValueError):
+        asyncio.run(_main())
+
+
+def test_gather_partial_keeps_finished_results_when_cancelled():
+    token = CancellationToken()
+    interrupted = []
+
+    async def _slow(i):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            interrupted.append(i)
+            raise
+        return i
+
+    async def _main():
+        # Cancel from another thread, as the job worker does
+        asyncio.get_running_loop().call_later(0.05, lambda: threading.Thread(target=token.cancel).start())
+        return await gather_partial([_value("fast"), _slow(1), _value("quick", 0.01), _slow(2)])
+
+    with scope(token):
+        assert asyncio.run(asyncio.wait_for(_main(), timeout=5)) == ["fast", None, "quick", None]
+    assert sorted(interrupted) == [1, 2]
+
+
+def test_gather_partial_with_cancelled_token_starts_nothing():
+    token = CancellationToken()
+    token.cancel()
+    started = []
+
+    async def _track(i):
+        started.append(i)
+        return i
+
+    async def _main():
+        return await gather_partial([_track(1), _track(2)])
+
+    with scope(token):
+        assert asyncio.run(_main()) == [None, None]
+    assert started == []
+
+
+def test_gather_partial_unregisters_its_callback():
+    token = CancellationToken()
+
+    async def _main():
+        return await gather_partial([_value(1)])
+
+    with scope(token):
+        assert asyncio.run(_main()) == [1]
+    assert token._callbacks == []
+
+
+# ── cancel_on ───────────────────────────────────────────────────────────
+
+def test_cancel_on_cancels_the_task_after_the_delay():
+    token = CancellationToken()
+
+    async def _main():
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(asyncio.sleep(30))
+        cancel_on(token, task, delay=0.05)
+        threading.Thread(target=token.cancel).start()
+        start = loop.time()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return loop.time() - start
+
+    assert 0.04 <= asyncio.run(asyncio.wait_for(_main(), timeout=5)) < 5
+
+
+def test_cancel_on_without_token_is_a_no_op():
+    async def _main():
+        task = asyncio.ensure_future(_value(7, 0.01))
+        cancel_on(None, task)()
+        return await task
+
+    assert asyncio.run(_main()) == 7
@@ -0,0 +1,40 @@
+"""Tests for ``src.evaluation.checkpoint``."""
+
+from src.evaluation.checkpoint import CheckpointJournal, fingerprint
+
+
+def test_remove_keeps_other_runs_entries(tmp_path):
+    journal = CheckpointJournal(str(tmp_path), "gpt", "classification")
+    ours = [("C-1", "run-a", "d1"), ("C-2", "run-a", "d2")]
+    theirs = ("C-1", "run-b", "d1")
+    for key in ours:
+        journal.append(key, {"id": key[0]})
+    journal.append(theirs, {"id": "other"})
+
+    journal.remove(ours)
+    assert journal.load() == {theirs: {"id": "other"}}
+
+    journal.remove([theirs])
+    assert not journal.exists()
+
+
+def test_remove_tolerates_missing_file_and_torn_lines(tmp_path):
+    journal = CheckpointJournal(str(tmp_path), "gpt", "dialog")
+    journal.remove([("x", "y", "z")])
+    journal.append(("D-1", "h", "d"), {"ok": True})
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"model": "gpt", "eval_type": "dia')      # crash mid-write
+    assert journal.load() == {("D-1", "h", "d"): {"ok": True}}
+
+    journal.remove([("D-9", "h", "d")])
+    assert journal.load() == {("D-1", "h", "d"): {"ok": True}}
+    journal.append(("D-2", "h", "d"), {"ok": False})
+    assert set(journal.load()) == {("D-1", "h", "d"), ("D-2", "h", "d")}
+
+
+def test_journals_are_scoped_to_model_and_type(tmp_path):
+    a = CheckpointJournal(str(tmp_path), "gpt", "classification")
+    b = CheckpointJournal(str(tmp_path), "gpt", "rag")
+    a.append(("C-1", "h", "d"), {"a": 1})
+    assert b.load() == {}
+    assert fingerprint({"b": 1, "a": 2}) == fingerprint({"a": 2, "b": 1})
@@ -0,0 +1,199 @@
+"""Tests for ``src.jobs.store``."""
+
+import time
+
+import pytest
+
+from src.jobs.store import CANCELLED, COMPLETED, FAILED, QUEUED, RUNNING, JobStore
+
+
+class _WallClock:
+    """``time.time`` replacement: ticks 1 ms per call, jumps on demand."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        self.now += 0.001
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def wall(monkeypatch) -> _WallClock:
+    clock = _WallClock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def store(tmp_path, wall) -> JobStore:
+    return JobStore(str(tmp_path / "jobs.db"), max_attempts=2)
+
+
+def _claim_users(store, worker="w", limit=2, count=10):
+    users = []
+    for _ in range(count):
+        job = store.claim(worker, limit)
+        if job is None:
+            break
+        users.append(job.user_id)
+    return users
+
+
+# ── Claim fairness ──────────────────────────────────────────────────────
+
+def test_claim_takes_oldest_job_and_marks_it_running(store):
+    store.submit("r1", "alice", "compare", {"x": 1})
+    store.submit("r2", "alice", "compare", {"x": 2})
+    job = store.claim("w1")
+    assert job.run_id == "r1"
+    assert job.status == RUNNING
+    assert job.worker_id == "w1"
+    assert job.attempts == 1
+    assert job.params == {"x": 1}
+
+
+def test_claim_round_robins_between_users(store):
+    for i in range(4):
+        store.submit(f"a{i}", "alice", "compare", {})
+    store.submit("b0", "bob", "compare", {})
+    store.submit("c0", "carol", "compare", {})
+    # Alice queued first, but bob and carol get a turn before her second job
+    assert _claim_users(store, limit=5, count=3) == ["alice", "bob", "carol"]
+
+
+def test_claim_respects_the_per_user_running_limit(store):
+    for i in range(5):
+        store.submit(f"a{i}", "alice", "compare", {})
+    assert _claim_users(store, limit=2) == ["alice", "alice"]
+    assert store.claim("w", 2) is None
+
+    store.finish("a0", "w", COMPLETED)
+    assert store.claim("w", 2).run_id == "a2"
+
+
+def test_user_with_fewer_running_jobs_goes_first(store):
+    store.submit("a0", "alice", "compare", {})
+    store.submit("a1", "alice", "compare", {})
+    assert store.claim("w", 3).user_id == "alice"
+    store.submit("b0", "bob", "compare", {})
+    store.submit("b1", "bob", "compare", {})
+    # Alice has one running, Bob none → Bob, then the least recently served
+    assert _claim_users(store, limit=3, count=3) == ["bob", "alice", "bob"]
+
+
+def test_submit_rejects_active_duplicates_and_replaces_finished(store):
+    store.submit("r1", "alice", "compare", {})
+    with pytest.raises(ValueError):
+        store.submit("r1", "alice", "compare", {})
+    store.claim("w")
+    store.finish("r1", "w", FAILED, error="boom")
+    store.submit("r1", "alice", "compare", {"retry": True})
+    job = store.get("r1")
+    assert job.status == QUEUED and job.params == {"retry": True} and job.error is None
+
+
+# ── Finish ──────────────────────────────────────────────────────────────
+
+def test_finish_requires_the_owning_worker(store):
+    store.submit("r1", "alice", "compare", {})
+    store.claim("w1")
+    assert not store.finish("r1", "w2", COMPLETED, result={"ok": False})
+    assert store.get("r1").status == RUNNING
+    assert store.finish("r1", "w1", COMPLETED, result={"ok": True})
+    assert store.get("r1").result == {"ok": True}
+    # A finished job cannot be finished again
+    assert not store.finish("r1", "w1", FAILED)
+    assert store.get("r1").status == COMPLETED
+
+
+def test_finish_rejects_non_terminal_status(store):
+    with pytest.raises(ValueError):
+        store.finish("r1", "w", RUNNING)
+
+
+# ── Recovery ────────────────────────────────────────────────────────────
+
+def test_recover_stale_requeues_jobs_of_lost_workers(store, wall):
+    store.submit("r1", "alice", "compare", {})
+    store.submit("r2", "bob", "compare", {})
+    store.claim("dead")
+    store.claim("alive")
+    wall.advance(120)
+    store.heartbeat("alive")
+
+    assert store.recover_stale(stale_after=60) == 1
+    lost = store.get("r1")
+    assert lost.status == QUEUED and lost.worker_id is None
+    assert store.get("r2").status == RUNNING
+
+    # The re-queued job is claimed again; the lost worker can no longer finish it
+    again = store.claim("new")
+    assert again.run_id == "r1" and again.attempts == 2
+    assert not store.finish("r1", "dead", COMPLETED)
+    assert store.finish("r1", "new", COMPLETED)
+
+
+def test_recover_stale_fails_jobs_out_of_attempts(store, wall):
+    store.submit("r1", "alice", "compare", {})
+    for _ in range(2):
+        store.claim("w")
+        wall.advance(120)
+        store.recover_stale(stale_after=60)
+    job = store.get("r1")
+    assert job.status == FAILED
+    assert job.error == "worker lost"
+    assert job.attempts == 2
+
+
+def test_progress_counts_as_heartbeat(store, wall):
+    store.submit("r1", "alice", "compare", {})
+    store.claim("w")
+    wall.advance(120)
+    store.set_progress("r1", {"completed": 3})
+    assert store.recover_stale(stale_after=60) == 0
+    assert store.get("r1").progress == {"completed": 3}
+
+
+# ── Cancellation ────────────────────────────────────────────────────────
+
+def test_cancel_queued_ends_it_and_running_flags_it(store):
+    store.submit("q", "alice", "compare", {})
+    store.submit("r", "alice", "compare", {})
+    store.claim("w")    # takes "q"
+    assert store.request_cancel("r") == CANCELLED
+    assert store.request_cancel("q") == RUNNING
+    assert store.cancel_requested("q")
+    assert store.cancel_requested_among(["q", "r", "missing"]) == {"q"}
+    assert store.finish("q", "w", CANCELLED, error="cancelled")
+
+
+def test_cancel_checks_the_owner(store):
+    store.submit("r1", "alice", "compare", {})
+    assert store.request_cancel("r1", user_id="bob") is None
+    assert store.get("r1").status == QUEUED
+
+
+# ── Purge ───────────────────────────────────────────────────────────────
+
+def test_purge_deletes_only_old_finished_jobs(store, wall):
+    for run_id in ("old-done", "old-running", "old-queued"):
+        store.submit(run_id, "alice", "compare", {})
+    store.claim("w", 5)
+    store.claim("w", 5)
+    store.finish("old-done", "w", COMPLETED)
+    wall.advance(3600)
+    store.submit("new", "bob", "compare", {})
+    store.claim("w", 5)
+    store.finish("new", "w", COMPLETED)
+
+    assert store.purge(older_than=1800) == 1
+    assert store.get("old-done") is None
+    assert store.get("old-running").status == RUNNING
+    assert store.get("old-queued").status == QUEUED
+    assert store.get("new").status == COMPLETED
+    assert store.count_active() == 2
+    assert store.count_active("bob") == 0
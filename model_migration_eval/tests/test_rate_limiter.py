@@ -0,0 +1,196 @@
+"""Tests for ``src.clients.rate_limiter``."""
+
+import asyncio
+import gc
+
+import pytest
+
+from src.clients.rate_limiter import AdaptiveRateLimiter, estimate_request_tokens
+
+
+# ── Refill ──────────────────────────────────────────────────────────────
+
+def test_requests_refill_continuously(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.configure("gpt", rpm=60)
+
+    for _ in range(60):
+        assert limiter._try_reserve("gpt", 0) == 0.0
+    assert limiter._try_reserve("gpt", 0) == pytest.approx(1.0)
+
+    clock.advance(0.5)
+    assert limiter._try_reserve("gpt", 0) == pytest.approx(0.5)
+    clock.advance(0.5)
+    assert limiter._try_reserve("gpt", 0) == 0.0
+
+
+def test_refill_never_exceeds_capacity(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.configure("gpt", rpm=10)
+    clock.advance(3600)
+    assert limiter.snapshot()["gpt"]["requests_available"] == pytest.approx(10)
+
+
+def test_token_budget_is_settled_against_actual_usage(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.configure("gpt", tpm=1000)
+
+    assert limiter._try_reserve("gpt", 800) == 0.0
+    # 200 left, 400 needed → 200 tokens at 1000/min
+    assert limiter._try_reserve("gpt", 400) == pytest.approx(12.0)
+
+    limiter.settle("gpt", estimated=800, actual=300)
+    assert limiter._try_reserve("gpt", 400) == 0.0
+    assert limiter.snapshot()["gpt"]["tokens_available"] == pytest.approx(300)
+
+
+def test_oversized_request_waits_for_a_full_bucket_only(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.configure("gpt", tpm=1000)
+    assert limiter._try_reserve("gpt", 5000) == 0.0
+    assert limiter.snapshot()["gpt"]["tokens_available"] == pytest.approx(0)
+
+
+def test_unconfigured_deployment_is_unlimited(clock):
+    limiter = AdaptiveRateLimiter()
+    for _ in range(1000):
+        assert limiter._try_reserve("new", 10_000) == 0.0
+
+
+def test_acquire_sync_waits_until_budget_is_available(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.configure("gpt", rpm=60)
+    for _ in range(60):
+        limiter.acquire_sync("gpt")
+    start = clock.now
+    limiter.acquire_sync("gpt")
+    assert clock.now - start == pytest.approx(1.0)
+    assert limiter.snapshot()["gpt"]["waited_seconds"] == pytest.approx(1.0)
+
+
+# ── Penalty ─────────────────────────────────────────────────────────────
+
+def test_penalize_pauses_and_backs_off(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.configure("gpt", rpm=100, tpm=10_000)
+
+    limiter.penalize("gpt", retry_after=5.0)
+    snap = limiter.snapshot()["gpt"]
+    assert snap["throttled"] == 1
+    assert snap["rpm_limit"] == pytest.approx(90)
+    assert snap["tpm_limit"] == pytest.approx(9000)
+    assert limiter._try_reserve("gpt", 0) == pytest.approx(5.0)
+
+    # Buckets restart empty at the penalty and refill at the reduced rate
+    clock.advance(5.0)
+    assert limiter.snapshot()["gpt"]["requests_available"] == pytest.approx(5.0 * 90 / 60)
+    for _ in range(7):
+        assert limiter._try_reserve("gpt", 0) == 0.0
+    assert limiter._try_reserve("gpt", 0) == pytest.approx(0.5 * 60 / 90)
+
+
+def test_penalize_keeps_the_longest_pause(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.penalize("gpt", retry_after=10.0)
+    limiter.penalize("gpt", retry_after=2.0)
+    assert limiter._try_reserve("gpt", 0) == pytest.approx(10.0)
+    assert limiter.snapshot()["gpt"]["throttled"] == 2
+
+
+def test_repeated_penalties_never_drop_capacity_below_one(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.configure("gpt", rpm=2)
+    for _ in range(50):
+        limiter.penalize("gpt", retry_after=0.0)
+    assert limiter.snapshot()["gpt"]["rpm_limit"] == pytest.approx(1.0)
+
+
+# ── Learning from headers ───────────────────────────────────────────────
+
+def test_limit_headers_set_capacity(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.update_from_headers("gpt", {
+        "x-ratelimit-limit-requests": "120",
+        "x-ratelimit-limit-tokens": "50000",
+        "x-ratelimit-remaining-requests": "100",
+        "x-ratelimit-remaining-tokens": "45000",
+    })
+    snap = limiter.snapshot()["gpt"]
+    assert snap["rpm_limit"] == 120
+    assert snap["tpm_limit"] == 50000
+    # The level follows what the server says is left
+    assert snap["requests_available"] == pytest.approx(100)
+    assert snap["tokens_available"] == pytest.approx(45000)
+
+
+def test_remaining_headers_learn_the_largest_value_seen(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.update_from_headers("gpt", {"x-ratelimit-remaining-requests": "40"})
+    limiter.update_from_headers("gpt", {"x-ratelimit-remaining-requests": "55"})
+    limiter.update_from_headers("gpt", {"x-ratelimit-remaining-requests": "10"})
+    snap = limiter.snapshot()["gpt"]
+    assert snap["rpm_limit"] == 55
+    assert snap["requests_available"] == pytest.approx(10)
+
+
+def test_headers_clamp_but_never_raise_the_level(clock):
+    limiter = AdaptiveRateLimiter()
+    limiter.configure("gpt", rpm=100)
+    for _ in range(90):
+        limiter._try_reserve("gpt", 0)
+    limiter.update_from_headers("gpt", {"x-ratelimit-remaining-requests": "80"})
+    assert limiter.snapshot()["gpt"]["requests_available"] == pytest.approx(10)
+
+
+@pytest.mark.parametrize("headers", [None, {}, {"x-ratelimit-limit-requests": "n/a"},
+                                     {"x-ratelimit-remaining-tokens": ""}])
+def test_missing_or_malformed_headers_are_ignored(clock, headers):
+    limiter = AdaptiveRateLimiter()
+    limiter.update_from_headers("gpt", headers)
+    snap = limiter.snapshot().get("gpt", {})
+    assert snap.get("rpm_limit") is None
+    assert snap.get("tpm_limit") is None
+
+
+# ── Shared semaphores ───────────────────────────────────────────────────
+
+def test_semaphore_is_shared_per_loop_and_uses_the_largest_limit():
+    limiter = AdaptiveRateLimiter()
+
+    async def _main():
+        first = limiter.semaphore("gpt", 2)
+        second = limiter.semaphore("gpt", 5)
+        third = limiter.semaphore("gpt", 3)
+        other = limiter.semaphore("mini", 1)
+        return first, second, third, other
+
+    first, second, third, other = asyncio.run(_main())
+    assert first is second is third
+    assert first._value == 5
+    assert other is not first
+
+
+def test_semaphores_are_dropped_with_their_loop():
+    limiter = AdaptiveRateLimiter()
+
+    async def _get():
+        return limiter.semaphore("gpt", 2)
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+    assert first is not second
+    gc.collect()
+    assert len(limiter._semaphores) == 0
+
+
+# ── Estimates ───────────────────────────────────────────────────────────
+
+def test_estimate_counts_prompt_chars_and_output_cap():
+    params = {
+        "messages": [
+            {"role": "system", "content": "x" * 400},
+            {"role": "user", "content": [{"type": "text", "text": "y" * 40}]},
+        ],
+        "max_completion_tokens": 256,
+    }
+    assert estimate_request_tokens(params) == 110 + 256
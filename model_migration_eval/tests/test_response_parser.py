@@ -0,0 +1,128 @@
+"""Tests for ``src.clients.response_parser``."""
+
+import json
+
+import pytest
+
+from src.clients.response_parser import (
+    DIRECT,
+    EMBEDDED,
+    FENCED,
+    NATIVE,
+    NONE,
+    REPAIRED,
+    ParsedResponse,
+    ensure_parsed,
+    parse_response,
+    scan_json,
+    summarise_parse_costs,
+)
+
+
+# ── scan_json: prose around the JSON ────────────────────────────────────
+
+@pytest.mark.parametrize("text, expected", [
+    ('Sure! Here is the result: {"category": "billing"} Hope that helps.', {"category": "billing"}),
+    ('Result:\n[1, 2, 3]\nDone.', [1, 2, 3]),
+    ('{"a": 1} and then {"b": 2}', {"a": 1}),
+    ('closing first } ] then {"ok": true}', {"ok": True}),
+    ('a "quoted" word before {"ok": true}', {"ok": True}),
+])
+def test_scan_json_finds_the_first_json_span_in_prose(text, expected):
+    assert scan_json(text) == (expected, EMBEDDED)
+
+
+def test_scan_json_skips_a_balanced_span_that_does_not_decode():
+    text = 'set {x: 1} then {"x": 1}'
+    assert scan_json(text) == ({"x": 1}, EMBEDDED)
+
+
+def test_scan_json_without_json_returns_none():
+    assert scan_json("no structure here") == (None, NONE)
+    assert scan_json("{not json}") == (None, NONE)
+
+
+# ── scan_json: nested braces ────────────────────────────────────────────
+
+def test_scan_json_handles_nested_containers():
+    payload = {"a": {"b": [1, {"c": [2, 3]}], "d": {}}, "e": []}
+    text = f"before {json.dumps(payload)} after {{ignored}}"
+    assert scan_json(text) == (payload, EMBEDDED)
+
+
+def test_scan_json_ignores_braces_inside_strings():
+    payload = {"note": "use {curly} and [square] ] } brackets", "n": 1}
+    assert scan_json(f"x {json.dumps(payload)} y") == (payload, EMBEDDED)
+
+
+# ── scan_json: escapes ──────────────────────────────────────────────────
+
+@pytest.mark.parametrize("value", [
+    'say \\"hi\\" }',            # escaped quote followed by a closer
+    'path C:\\\\temp\\\\',        # escaped backslashes right before the quote
+    'tab\\tnewline\\n{',          # non-structural escapes
+    'unicode \\u007b',            # escaped "{"
+])
+def test_scan_json_respects_escapes(value):
+    text = 'Answer: {"v": "' + value + '", "k": 2} end'
+    parsed, strategy = scan_json(text)
+    assert strategy == EMBEDDED
+    assert parsed == json.loads('{"v": "' + value + '", "k": 2}')
+
+
+# ── scan_json: truncated output ─────────────────────────────────────────
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"category": "billing", "tags": ["a", "b"', {"category": "billing", "tags": ["a", "b"]}),
+    ('Here: {"reason": "cut off mid-str', {"reason": "cut off mid-str"}),
+    ('[{"a": 1}, {"b": {"c": 2', [{"a": 1}, {"b": {"c": 2}}]),
+])
+def test_scan_json_repairs_truncated_json(text, expected):
+    assert scan_json(text) == (expected, REPAIRED)
+
+
+def test_scan_json_gives_up_when_repair_does_not_decode():
+    assert scan_json('{"a": 1, "b":') == (None, NONE)
+
+
+# ── parse_response ──────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("content, data, strategy", [
+    ('{"a": 1}', {"a": 1}, DIRECT),
+    ('  [1, 2]  ', [1, 2], DIRECT),
+    ('```json\n{"a": 1}\n```', {"a": 1}, FENCED),
+    ('```\n{"a": 1}\n```', {"a": 1}, FENCED),
+    ('The answer is {"a": 1}.', {"a": 1}, EMBEDDED),
+    ('plain text', None, NONE),
+    ('', None, NONE),
+    (None, None, NONE),
+])
+def test_parse_response_strategies(content, data, strategy):
+    parsed = parse_response(content)
+    assert parsed.data == data
+    assert parsed.strategy == strategy
+    assert parsed.is_json == (strategy != NONE)
+    assert parsed.parse_ms >= 0
+
+
+def test_parse_response_keeps_native_payloads():
+    payload = {"category": "billing", "confidence": 0.9}
+    parsed = parse_response(payload)
+    assert parsed.strategy == NATIVE
+    assert parsed.data is payload
+    assert json.loads(parsed.text) == payload
+
+
+def test_parsed_response_round_trips_and_is_not_reparsed():
+    parsed = parse_response('{"a": 1}')
+    restored = ParsedResponse.from_dict(parsed.to_dict())
+    assert restored == parsed
+    assert ensure_parsed(parsed) is parsed
+    assert ensure_parsed('{"a": 1}').data == {"a": 1}
+
+
+def test_summarise_parse_costs_counts_strategies():
+    parsed = [parse_response('{"a": 1}'), parse_response("text"), parse_response('{"b": 2}')]
+    summary = summarise_parse_costs(parsed)
+    assert summary["parse_strategies"] == {DIRECT: 2, NONE: 1}
+    assert summary["parse_time_ms"] == pytest.approx(sum(p.parse_ms for p in parsed))
@@ -0,0 +1,73 @@
+"""Tests for ``src.utils.results_index``."""
+
+import json
+import os
+
+import pytest
+
+from src.utils import results_index
+from src.utils.results_index import INDEX_FILENAME, ResultsIndex
+
+
+def _save(results_dir, name, model, evaluation_type="classification"):
+    data = {"model_name": model, "evaluation_type": evaluation_type, "timestamp": name}
+    (results_dir / name).write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Count the directory scans made by ``ResultsIndex.sync``."""
+    calls = []
+    real = os.scandir
+
+    def _scandir(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(results_index.os, "scandir", _scandir)
+    return calls
+
+
+def test_sync_skips_unchanged_directory(tmp_path, scans):
+    _save(tmp_path, "a.json", "gpt")
+    index = ResultsIndex(str(tmp_path))
+
+    assert index.sync() == 1
+    assert len(scans) == 1
+    for _ in range(3):
+        assert index.sync() == 0
+    assert len(scans) == 1
+
+
+def test_sync_picks_up_added_and_removed_files(tmp_path, scans):
+    _save(tmp_path, "a.json", "gpt")
+    index = ResultsIndex(str(tmp_path))
+    index.sync()
+
+    _save(tmp_path, "b.json", "o4")
+    (tmp_path / "a.json").unlink()
+    assert index.sync() == 1
+    entries, total = index.query()
+    assert total == 1 and entries[0]["model"] == "o4"
+    assert len(scans) == 2
+
+
+def test_record_does_not_invalidate_the_scan(tmp_path, scans):
+    index = ResultsIndex(str(tmp_path))
+    index.sync()
+    index.record("missing.json", {"model_name": "gpt", "evaluation_type": "rag"})
+    index.sync()
+    assert len(scans) == 1
+    assert index.query(evaluation_type="rag")[1] == 1
+
+
+def test_database_lives_outside_the_results_directory(tmp_path):
+    (tmp_path / INDEX_FILENAME).write_bytes(b"old index")
+    _save(tmp_path, "a.json", "gpt")
+    index = ResultsIndex(str(tmp_path))
+    index.sync()
+
+    assert index.db_path.parent != tmp_path
+    assert index.db_path.exists()
+    # The index from before the move is cleaned up
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".index", "a.json"]
@@ -0,0 +1,158 @@
+"""Tests for ``src.evaluation.sequential``."""
+
+import math
+
+import pytest
+
+from src.evaluation.sequential import SequentialMonitor, obrien_fleming_spent
+
+NOT_CONFIGURED = {'verdict': 'NOT_CONFIGURED', 'checks': []}
+
+
+def _rows(correct, latency=1.0, start=0):
+    """Raw results with expected 'a'; ``correct[i]`` picks the prediction."""
+    return [
+        {
+            'scenario_id': start + i,
+            'expected': {'category': 'a'},
+            'predicted': {'category': 'a' if ok else 'b'},
+            'latency': latency,
+        }
+        for i, ok in enumerate(correct)
+    ]
+
+
+def _readiness(verdict, *checks):
+    return {'verdict': verdict, 'checks': [
+        {'metric': metric, 'threshold': threshold, 'actual': actual}
+        for metric, threshold, actual in checks
+    ]}
+
+
+# ── Alpha spending ──────────────────────────────────────────────────────
+
+def test_spending_function_boundaries():
+    assert obrien_fleming_spent(0.0, 0.05) == 0.0
+    assert obrien_fleming_spent(-1.0, 0.05) == 0.0
+    assert obrien_fleming_spent(1.0, 0.05) == pytest.approx(0.05)
+    assert obrien_fleming_spent(2.0, 0.05) == pytest.approx(0.05)
+    # 2 − 2Φ(1.95996 / √0.5)
+    assert obrien_fleming_spent(0.5, 0.05) == pytest.approx(0.005575, abs=1e-6)
+
+
+def test_spending_function_is_increasing():
+    spent = [obrien_fleming_spent(t / 20, 0.05) for t in range(21)]
+    assert all(b >= a for a, b in zip(spent, spent[1:]))
+    # Practically nothing is spent on very early looks
+    assert spent[1] < 1e-15
+    assert all(b > a for a, b in zip(spent[4:], spent[5:]))
+
+
+def test_looks_spend_exactly_alpha_and_start_strict():
+    monitor = SequentialMonitor(total=100, alpha=0.05)
+    looks = [monitor.look([], [], NOT_CONFIGURED, n) for n in (20, 40, 60, 80, 100)]
+
+    assert sum(look.alpha_level for look in looks) == pytest.approx(0.05)
+    assert looks[0].z_boundary > 4.0
+    assert looks[0].z_boundary > looks[1].z_boundary > looks[-1].z_boundary
+    assert [look.information for look in looks] == [0.2, 0.4, 0.6, 0.8, 1.0]
+    assert len(monitor.looks) == 5
+
+
+def test_single_final_look_uses_the_whole_alpha():
+    look = SequentialMonitor(total=50, alpha=0.05).look([], [], NOT_CONFIGURED, 50)
+    assert look.alpha_level == pytest.approx(0.05)
+    assert look.z_boundary == pytest.approx(1.959964, abs=1e-6)
+
+
+# ── Stop decisions without thresholds ───────────────────────────────────
+
+def test_clear_accuracy_difference_stops():
+    raw_a = _rows([False] * 40)
+    raw_b = _rows([True] * 40)
+    look = SequentialMonitor(total=100).look(raw_a, raw_b, NOT_CONFIGURED, 40)
+    assert look.accuracy_z == pytest.approx(math.sqrt(40))
+    assert look.clear_difference == ['accuracy']
+    assert look.stop
+    assert 'accuracy' in look.reason
+
+
+def test_moderate_difference_waits_for_more_information():
+    # 12 discordant pairs all favour B: z ≈ 3.46, below the first boundary
+    raw_a = _rows([False] * 12 + [True] * 8)
+    raw_b = _rows([True] * 20)
+    early = SequentialMonitor(total=100).look(raw_a, raw_b, NOT_CONFIGURED, 20)
+    assert not early.stop
+    assert early.clear_difference == []
+
+    final = SequentialMonitor(total=20).look(raw_a, raw_b, NOT_CONFIGURED, 20)
+    assert final.stop
+
+
+def test_latency_shift_stops():
+    raw_a = [dict(r, latency=1.0 + i / 100) for i, r in enumerate(_rows([True] * 60))]
+    raw_b = [dict(r, latency=3.0 + i / 100) for i, r in enumerate(_rows([True] * 60))]
+    look = SequentialMonitor(total=80).look(raw_a, raw_b, NOT_CONFIGURED, 60)
+    assert look.latency_z > look.z_boundary
+    assert look.clear_difference == ['latency']
+    assert look.stop
+
+
+def test_identical_runs_never_stop_early():
+    rows = _rows([True, False] * 25)
+    look = SequentialMonitor(total=100).look(rows, rows, NOT_CONFIGURED, 50)
+    assert look.accuracy_z is None
+    assert not look.stop
+
+
+# ── Stop decisions with thresholds ──────────────────────────────────────
+
+def test_failing_accuracy_locks_fail():
+    raw_b = _rows([True] * 15 + [False] * 35)
+    readiness = _readiness('FAIL', ('accuracy', 0.9, 0.3))
+    look = SequentialMonitor(total=100).look(_rows([True] * 50), raw_b, readiness, 50)
+    assert look.verdict == 'FAIL'
+    assert look.verdict_locked and look.stop
+    assert 'FAIL' in look.reason
+
+
+def test_borderline_accuracy_keeps_running():
+    raw_b = _rows([True] * 44 + [False] * 6)
+    readiness = _readiness('PASS', ('accuracy', 0.85, 0.88))
+    look = SequentialMonitor(total=100).look(raw_b, raw_b, readiness, 50)
+    assert not look.verdict_locked
+    assert not look.stop
+
+
+def test_pass_locks_only_when_every_check_is_locked():
+    raw_b = _rows([True] * 80, latency=0.2)
+    monitor = SequentialMonitor(total=100)
+    readiness = _readiness('PASS', ('accuracy', 0.5, 1.0), ('max_latency_ms', 5000, 200))
+    assert monitor.look(raw_b, raw_b, readiness, 80).stop
+
+    # A check that cannot be projected per scenario blocks the lock ...
+    with_consistency = _readiness('PASS', ('accuracy', 0.5, 1.0), ('consistency', 0.9, 0.95))
+    assert not SequentialMonitor(total=100).look(raw_b, raw_b, with_consistency, 80).stop
+    # ... until every scenario has run
+    assert SequentialMonitor(total=80).look(raw_b, raw_b, with_consistency, 80).stop
+
+
+def test_latency_threshold_locks_fail():
+    raw_b = _rows([True] * 40, latency=4.0)
+    readiness = _readiness('FAIL', ('max_latency_ms', 1000, 4000))
+    look = SequentialMonitor(total=100).look(raw_b, raw_b, readiness, 40)
+    assert look.verdict_locked and look.stop
+
+
+def test_checks_without_actual_values_are_ignored():
+    raw_b = _rows([True] * 80)
+    readiness = _readiness('PASS', ('accuracy', 0.5, 1.0), ('groundedness', 4.0, None))
+    assert SequentialMonitor(total=100).look(raw_b, raw_b, readiness, 80).verdict_locked
+
+
+def test_look_serialises():
+    look = SequentialMonitor(total=10).look(_rows([True] * 10), _rows([False] * 10), NOT_CONFIGURED, 10)
+    payload = look.to_dict()
+    assert payload['scenarios'] == 10
+    assert payload['stop'] is True
+    assert payload['accuracy_z'] == pytest.approx(-math.sqrt(10), abs=1e-4)
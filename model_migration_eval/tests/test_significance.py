@@ -0,0 +1,208 @@
+"""Tests for ``src.evaluation.significance``."""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.evaluation.significance import (
+    ACCURACY,
+    F1_SCORE,
+    MEAN_LATENCY,
+    MEDIAN_LATENCY,
+    P95_LATENCY,
+    _CountProducts,
+    _mcnemar,
+    _resample_counts,
+    _SortedValues,
+    _wilcoxon,
+    align_by_scenario,
+    paired_significance,
+)
+
+# Fisher's Zea mays height differences (cross − self fertilised), the
+# classic signed-rank example: W− = 10 + 14 = 24
+ZEA_MAYS = np.array([6, 8, 14, 16, 23, 24, 28, 29, 41, -48, 49, 56, 60, -67, 75], dtype=float)
+
+
+def _row(sid, expected, predicted, latency):
+    return {
+        'scenario_id': sid,
+        'expected': {'category': expected},
+        'predicted': {'category': predicted},
+        'latency': latency,
+    }
+
+
+# ── McNemar ─────────────────────────────────────────────────────────────
+
+def test_mcnemar_small_fixture():
+    # 10 scenarios only A got right, 2 only B got right, 8 both / neither
+    correct_a = np.array([True] * 10 + [False] * 2 + [True] * 5 + [False] * 3)
+    correct_b = np.array([False] * 10 + [True] * 2 + [True] * 5 + [False] * 3)
+    result = _mcnemar(correct_a, correct_b)
+    assert result['a_correct_b_wrong'] == 10
+    assert result['a_wrong_b_correct'] == 2
+    assert result['chi2'] == pytest.approx((8 - 1) ** 2 / 12)
+    assert result['p_value'] == pytest.approx(0.04331, abs=1e-5)
+    assert result['significant']
+
+
+def test_mcnemar_without_discordant_pairs():
+    same = np.array([True, False, True])
+    assert _mcnemar(same, same)['p_value'] == 1.0
+
+
+@pytest.mark.parametrize("a_only, b_only", [(10, 2), (3, 4), (0, 7), (25, 11)])
+def test_mcnemar_matches_scipy(a_only, b_only):
+    stats = pytest.importorskip("scipy.stats")
+    correct_a = np.array([True] * a_only + [False] * b_only + [True, False])
+    correct_b = np.array([False] * a_only + [True] * b_only + [True, False])
+    result = _mcnemar(correct_a, correct_b)
+    chi2 = (abs(a_only - b_only) - 1) ** 2 / (a_only + b_only)
+    assert result['p_value'] == pytest.approx(stats.chi2.sf(chi2, 1), rel=1e-9)
+
+
+# ── Wilcoxon ────────────────────────────────────────────────────────────
+
+def test_wilcoxon_small_fixture():
+    result = _wilcoxon(ZEA_MAYS)
+    assert result['statistic'] == 24.0
+    assert result['n_pairs'] == 15
+    # Normal approximation with continuity correction: mean 60, var 310
+    z = (96 - 60 - 0.5) / math.sqrt(310)
+    assert result['z'] == pytest.approx(z)
+    assert result['p_value'] == pytest.approx(math.erfc(z / math.sqrt(2)))
+    assert result['p_value'] == pytest.approx(0.0438, abs=1e-4)
+
+
+def test_wilcoxon_drops_zero_differences():
+    result = _wilcoxon(np.array([0.0, 0.0, 1.0, 2.0, -0.5]))
+    assert result['n_pairs'] == 3
+    assert _wilcoxon(np.zeros(4))['p_value'] == 1.0
+
+
+@pytest.mark.parametrize("diff", [
+    ZEA_MAYS,
+    np.array([1.0, 1.0, 1.0, -1.0, 2.0, 2.0, -2.0, 3.0, 3.0, 3.0, 4.0, -4.0]),   # ties
+    np.array([0.0, 0.3, -0.1, 0.25, 0.0, 0.7, -0.2, 0.45, 0.3, 0.5, 0.6]),       # zeros
+])
+def test_wilcoxon_matches_scipy(diff):
+    stats = pytest.importorskip("scipy.stats")
+    ref = stats.wilcoxon(diff, zero_method='wilcox', correction=True, method='approx')
+    result = _wilcoxon(diff)
+    assert result['statistic'] == pytest.approx(ref.statistic)
+    assert result['p_value'] == pytest.approx(ref.pvalue, rel=1e-9)
+
+
+# ── Pairing ─────────────────────────────────────────────────────────────
+
+def test_align_by_scenario_pairs_by_id_not_position():
+    a = [{'scenario_id': 'x', 'v': 1}, {'scenario_id': 'y', 'v': 2}, {'scenario_id': 'z', 'v': 3}]
+    b = [{'scenario_id': 'z', 'v': 30}, {'scenario_id': 'x', 'v': 10}, {'scenario_id': 'w', 'v': 0}]
+    rows_a, rows_b = align_by_scenario(a, b)
+    assert [r['v'] for r in rows_a] == [1, 3]
+    assert [r['v'] for r in rows_b] == [10, 30]
+
+
+def test_align_by_scenario_falls_back_to_position_without_ids():
+    rows_a, rows_b = align_by_scenario([{'v': 1}, {'v': 2}, {'v': 3}], [{'v': 4}, {'v': 5}])
+    assert [r['v'] for r in rows_a] == [1, 2]
+    assert [r['v'] for r in rows_b] == [4, 5]
+
+
+# ── Bootstrap ───────────────────────────────────────────────────────────
+
+def _quantiles_full(counts, values, qs):
+    order = np.argsort(values, kind='stable')
+    cum = np.cumsum(counts[:, order], axis=1)
+    total = cum[:, -1:]
+    return np.array([values[order][np.minimum((cum < q * total).sum(axis=1), values.size - 1)] for q in qs])
+
+
+@pytest.mark.parametrize("sigmas, pad", [(8.0, 32), (0.2, 0), (0.0, 0)])
+@pytest.mark.parametrize("n", [2, 7, 50, 501, 3000])
+def test_windowed_quantiles_are_exact(sigmas, pad, n, monkeypatch):
+    # Narrow windows force the full-range fallback for most resamples
+    monkeypatch.setattr(_SortedValues, '_WINDOW_SIGMAS', sigmas)
+    monkeypatch.setattr(_SortedValues, '_WINDOW_PAD', pad)
+    rng = np.random.default_rng(n)
+    values = rng.integers(0, 20, n).astype(float) if n % 2 else rng.normal(size=n)
+    counts = _resample_counts(rng, 40, n)
+    qs = (0.05, 0.50, 0.95)
+    products = _CountProducts(n)
+    sorted_values = _SortedValues(values, qs, products)
+    np.testing.assert_array_equal(
+        sorted_values.quantiles(counts, products(counts)), _quantiles_full(counts, values, qs),
+    )
+
+
+@pytest.mark.parametrize('n', [1, 7, 1000])
+def test_count_products_unpack_masks_exactly(n):
+    rng = np.random.default_rng(n)
+    masks = (rng.random((n, 40)) < 0.5).astype(float)
+    values = rng.normal(size=(n, 3))
+    products = _CountProducts(n)
+    mask_cols = products.add(masks[:, :25], masks=True)
+    value_cols = products.add(values)
+    rest = products.add(masks[:, 25:], masks=True)
+
+    counts = _resample_counts(rng, 50, n)
+    sums = products(counts)
+    np.testing.assert_array_equal(sums[:, mask_cols], counts @ masks[:, :25])
+    np.testing.assert_array_equal(sums[:, rest], counts @ masks[:, 25:])
+    np.testing.assert_allclose(sums[:, value_cols], counts @ values)
+
+
+def test_paired_significance_detects_a_clear_difference():
+    rng = np.random.default_rng(1)
+    a, b = [], []
+    for i in range(300):
+        a.append(_row(i, 'billing', 'billing' if i % 2 else 'other', 1.0 + rng.random()))
+        b.append(_row(i, 'billing', 'billing', 2.0 + rng.random()))
+    out = paired_significance(a, b, n_resamples=500)
+    metrics = out['bootstrap']['metrics']
+
+    assert out['aligned_scenarios'] == 300
+    assert out['mcnemar']['significant']
+    assert out['latency_wilcoxon']['significant']
+    assert metrics[ACCURACY]['difference'] == pytest.approx(0.5)
+    for name in (ACCURACY, F1_SCORE, MEAN_LATENCY, MEDIAN_LATENCY, P95_LATENCY):
+        m = metrics[name]
+        assert m['ci_low'] <= m['difference'] <= m['ci_high']
+        assert m['excludes_zero'] and m['ci_low'] > 0
+
+
+def test_paired_significance_identical_runs_do_not_differ():
+    rows = [_row(i, 'a' if i % 3 else 'b', 'a', 1.0 + (i % 7) / 10) for i in range(60)]
+    metrics = paired_significance(rows, rows, n_resamples=200)['bootstrap']['metrics']
+    for m in metrics.values():
+        assert m['difference'] == 0.0
+        assert not m['excludes_zero']
+
+
+def _noisy_runs(n=80):
+    rng = np.random.default_rng(2)
+    a = [_row(i, 'x', 'x' if rng.random() < 0.7 else 'y', rng.random()) for i in range(n)]
+    b = [_row(i, 'x', 'x' if rng.random() < 0.8 else 'y', rng.random()) for i in range(n)]
+    return a, b
+
+
+def test_paired_significance_is_reproducible():
+    a, b = _noisy_runs()
+    assert paired_significance(a, b, n_resamples=300, seed=7) == paired_significance(a, b, n_resamples=300, seed=7)
+
+
+def test_small_chunks_fill_every_resample(monkeypatch):
+    import src.evaluation.significance as significance
+    monkeypatch.setattr(significance, '_CHUNK_CELLS', 80 * 7)    # 43 chunks of ≤ 7 resamples
+    a, b = _noisy_runs()
+    metrics = paired_significance(a, b, n_resamples=300, seed=7)['bootstrap']['metrics']
+    assert set(metrics) == {ACCURACY, F1_SCORE, MEAN_LATENCY, MEDIAN_LATENCY, P95_LATENCY}
+    for m in metrics.values():
+        assert math.isfinite(m['ci_low']) and math.isfinite(m['ci_high'])
+        assert m['ci_low'] <= m['ci_high']
+
+
+def test_paired_significance_without_overlap():
+    assert paired_significance([_row('a', 'x', 'x', 1.0)], [_row('b', 'x', 'x', 1.0)]) == {'aligned_scenarios': 0}
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+"""
+Benchmark the Realtime client path against the offline emulator.
+
+Starts ``src.clients.realtime_emulator`` in a subprocess (so its work does
+not show up in this process's loop lag or memory), then for each
+concurrency level runs a fixed number of sessions through
+``RealtimeClient.send_audio`` and reports:
+
+  • sessions per second and session time p50 / p95
+  • mean WebSocket connect time and session reuse (pooled mode)
+  • event-loop lag p50 / p99 / max, sampled every 10 ms
+  • traced Python memory per concurrent session (peak above baseline)
+  • errors (injected ones included)
+
+Use the results to choose ``realtime.max_concurrent`` in settings.yaml.
+
+Usage:
+    # Defaults: concurrency 1,2,4,8,16 × 40 sessions, pooled sessions
+    python tools/benchmark_realtime.py
+
+    # Slower model, audio output, no pooling
+    python tools/benchmark_realtime.py --first-token-ms 800 --modalities audio --no-pool
+
+    # Inject failures and save the table as JSON
+    python tools/benchmark_realtime.py --error-rate 0.05 --disconnect-rate 0.02 --json bench.json
+
+    # Use an emulator (or endpoint) that is already running
+    python tools/benchmark_realtime.py --endpoint http://127.0.0.1:8765
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+# ── Make sure project root is on sys.path ────────────────────────────
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.clients.realtime_client import (          # noqa: E402
+    RealtimeClient,
+    RealtimeConfig,
+    RealtimePoolConfig,
+    RealtimeSessionPool,
+)
+from src.clients.realtime_emulator import add_profile_arguments   # noqa: E402
+from src.utils.audio_utils import AudioSegment, BYTES_PER_SECOND   # noqa: E402
+
+_LAG_INTERVAL = 0.010
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def start_emulator(args: argparse.Namespace) -> "tuple[subprocess.Popen, str]":
+    """Spawn the emulator on a free port and return (process, endpoint)."""
+    cmd = [sys.executable, "-m", "src.clients.realtime_emulator", "--port", "0"]
+    for name in ("latency_kind", "handshake_ms", "first_token_ms", "tokens_per_second",
+                 "output_tokens", "handshake_error_rate", "error_rate",
+                 "disconnect_rate", "incomplete_rate", "seed"):
+        value = getattr(args, name)
+        if value is not None:
+            cmd += ["--" + name.replace("_", "-"), str(value)]
+    proc = subprocess.Popen(cmd, cwd=str(ROOT), stdout=subprocess.PIPE, text=True)
+    for line in proc.stdout:
+        if line.startswith("listening on "):
+            return proc, line.split("listening on ", 1)[1].strip()
+    proc.wait()
+    raise RuntimeError(f"Emulator exited with code {proc.returncode}")
+
+
+async def _monitor_lag(samples: List[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        t0 = loop.time()
+        await asyncio.sleep(_LAG_INTERVAL)
+        samples.append(max(0.0, (loop.time() - t0 - _LAG_INTERVAL) * 1000))
+
+
+async def run_level(args: argparse.Namespace, endpoint: str, concurrency: int) -> Dict[str, Any]:
+    """Run ``args.sessions`` sessions with *concurrency* in flight."""
+    pool = None if args.no_pool else RealtimeSessionPool(
+        RealtimePoolConfig(max_idle_per_deployment=concurrency)
+    )
+    client = RealtimeClient(endpoint, api_key="emulator", session_pool=pool)
+    pcm = bytes(int(args.audio_ms / 1000 * BYTES_PER_SECOND) // 2 * 2)
+    audio = AudioSegment(data=pcm, encoded=base64.b64encode(pcm))   # as served by the TTS cache
+    config = RealtimeConfig(
+        deployment_name="emulated",
+        modalities=["text"] if args.modalities == "text" else ["text", "audio"],
+        instructions="You are a helpful assistant. " * 20,
+    )
+
+    sem = asyncio.Semaphore(concurrency)
+    session_ms: List[float] = []
+    connect_ms: List[float] = []
+    reused = 0
+    errors: Dict[str, int] = {}
+
+    async def _one() -> None:
+        nonlocal reused
+        async with sem:
+            try:
+                r = await client.send_audio(audio, config, keep_audio=args.keep_audio, max_retries=2)
+            except Exception as e:
+                key = type(e).__name__
+                errors[key] = errors.get(key, 0) + 1
+                return
+            session_ms.append(r.session_time_ms)
+            connect_ms.append(r.ws_connect_time_ms)
+            reused += r.session_reused
+
+    lag: List[float] = []
+    stop = asyncio.Event()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    monitor = asyncio.ensure_future(_monitor_lag(lag, stop))
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(args.sessions)))
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    await monitor
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if pool is not None:
+        await pool.close()
+
+    done = len(session_ms)
+    return {
+        "concurrency": concurrency,
+        "sessions": args.sessions,
+        "completed": done,
+        "sessions_per_s": done / elapsed if elapsed else 0.0,
+        "session_p50_ms": _percentile(session_ms, 50),
+        "session_p95_ms": _percentile(session_ms, 95),
+        "mean_connect_ms": statistics.fmean(connect_ms) if connect_ms else 0.0,
+        "reuse_rate": reused / done * 100 if done else 0.0,
+        "loop_lag_p50_ms": _percentile(lag, 50),
+        "loop_lag_p99_ms": _percentile(lag, 99),
+        "loop_lag_max_ms": max(lag) if lag else 0.0,
+        "memory_per_session_kb": (peak - baseline) / concurrency / 1024,
+        "errors": errors,
+    }
+
+
+def print_table(rows: List[Dict[str, Any]]) -> None:
+    header = (f"{'conc':>5} {'done':>5} {'sess/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'conn ms':>8} "
+              f"{'reuse%':>7} {'lag p99':>8} {'lag max':>8} {'KB/sess':>8}  errors")
+    print(header)
+    print("─" * len(header))
+    for r in rows:
+        errs = ", ".join(f"{k}={v}" for k, v in r["errors"].items()) or "-"
+        print(f"{r['concurrency']:>5} {r['completed']:>5} {r['sessions_per_s']:>8.2f} "
+              f"{r['session_p50_ms']:>8.0f} {r['session_p95_ms']:>8.0f} {r['mean_connect_ms']:>8.1f} "
+              f"{r['reuse_rate']:>7.0f} {r['loop_lag_p99_ms']:>8.1f} {r['loop_lag_max_ms']:>8.1f} "
+              f"{r['memory_per_session_kb']:>8.0f}  {errs}")
+
+
+async def main_async(args: argparse.Namespace, endpoint: str) -> List[Dict[str, Any]]:
+    rows = []
+    for concurrency in args.concurrency:
+        rows.append(await run_level(args, endpoint, concurrency))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Realtime client against the offline emulator")
+    parser.add_argument("--endpoint", help="Use this endpoint instead of spawning the emulator")
+    parser.add_argument("--concurrency", type=lambda s: [int(x) for x in s.split(",")],
+                        default=[1, 2, 4, 8, 16], help="Comma-separated levels (default 1,2,4,8,16)")
+    parser.add_argument("--sessions", type=int, default=40, help="Sessions per level")
+    parser.add_argument("--audio-ms", type=float, default=3000.0, help="Input audio per session")
+    parser.add_argument("--modalities", choices=["text", "audio"], default="text")
+    parser.add_argument("--keep-audio", action="store_true", help="Keep response audio (default: count only)")
+    parser.add_argument("--no-pool", action="store_true", help="Open a new WebSocket per session")
+    parser.add_argument("--max-lag-ms", type=float, default=50.0,
+                        help="Loop-lag p99 budget used for the recommendation")
+    parser.add_argument("--json", help="Also write the results to this file")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    proc = None
+    endpoint = args.endpoint
+    if not endpoint:
+        proc, endpoint = start_emulator(args)
+        print(f"Emulator: {endpoint}")
+    try:
+        rows = asyncio.run(main_async(args, endpoint))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    print_table(rows)
+    ok = [r for r in rows if not r["errors"] and r["loop_lag_p99_ms"] <= args.max_lag_ms]
+    if ok:
+        best = max(ok, key=lambda r: r["sessions_per_s"])
+        print(f"\nHighest throughput within {args.max_lag_ms:.0f} ms loop lag and no errors: "
+              f"concurrency {best['concurrency']} ({best['sessions_per_s']:.2f} sessions/s)")
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
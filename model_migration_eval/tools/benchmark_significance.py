@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Benchmark ``paired_significance`` on synthetic paired runs.
+
+Builds two classification runs with the given number of paired
+scenarios and labels (model B slightly more accurate, log-normal
+latencies), times ``paired_significance`` over a few repeats and exits
+non-zero when the first (cold) call exceeds ``--budget`` seconds, so the
+performance claim in ``src/evaluation/significance.py`` can be checked.
+The first call is what a comparison pays, so warm repeats are reported
+but not used for the check.
+
+Usage:
+    # Defaults: 10k scenarios, 15 labels, 2000 resamples, 1 s budget
+    python tools/benchmark_significance.py
+
+    # Larger run, profile the slowest parts
+    python tools/benchmark_significance.py --scenarios 50000 --budget 5 --profile
+"""
+
+import argparse
+import cProfile
+import pstats
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# ── Make sure project root is on sys.path ────────────────────────────
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.evaluation.significance import paired_significance   # noqa: E402
+
+
+def make_runs(scenarios: int, labels: int, seed: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Two paired ``raw_results`` lists (A at 80 %, B at 82 % accuracy)."""
+    rnd = random.Random(seed)
+    names = [f"category_{i}" for i in range(labels)]
+    runs: Tuple[List[Dict[str, Any]], List[Dict[str, Any]]] = ([], [])
+    for i in range(scenarios):
+        expected = rnd.choice(names)
+        for run, accuracy in zip(runs, (0.80, 0.82)):
+            run.append({
+                'scenario_id': f"S-{i:06d}",
+                'expected': {'category': expected},
+                'predicted': {'category': expected if rnd.random() < accuracy else rnd.choice(names)},
+                'latency': rnd.lognormvariate(0.0, 0.5),
+                'token_detail': {'prompt': rnd.randint(200, 800), 'completion': rnd.randint(20, 200)},
+            })
+    return runs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark paired bootstrap significance")
+    parser.add_argument("--scenarios", type=int, default=10_000)
+    parser.add_argument("--labels", type=int, default=15)
+    parser.add_argument("--resamples", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=1.0, help="Seconds allowed for the first call")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--profile", action="store_true", help="Print the top functions by cumulative time")
+    args = parser.parse_args()
+
+    runs_a, runs_b = make_runs(args.scenarios, args.labels, args.seed)
+    rates = {'input': 0.002, 'cached_input': 0.0005, 'output': 0.008}
+    kwargs = dict(cost_rates_a=rates, cost_rates_b=rates, n_resamples=args.resamples)
+
+    timings = []
+    for _ in range(max(1, args.repeats)):
+        t0 = time.perf_counter()
+        result = paired_significance(runs_a, runs_b, **kwargs)
+        timings.append(time.perf_counter() - t0)
+
+    first, best = timings[0], min(timings)
+    print(f"{args.scenarios} scenarios × {args.labels} labels × {args.resamples} resamples: "
+          f"first {first:.3f} s, best {best:.3f} s, runs {', '.join(f'{t:.3f}' for t in timings)} s")
+    for name, m in result.get('bootstrap', {}).get('metrics', {}).items():
+        print(f"  {name:<20} {m['difference']:+.5f}  [{m['ci_low']:+.5f}, {m['ci_high']:+.5f}]")
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(paired_significance, runs_a, runs_b, **kwargs)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+    if first > args.budget:
+        print(f"Over budget: first call {first:.3f} s > {args.budget:.3f} s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()